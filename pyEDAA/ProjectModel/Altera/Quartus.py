@@ -31,14 +31,33 @@
 """Specific file types and attributes for Altera Quartus."""
 from pyTooling.Decorators import export
 
-from pyEDAA.ProjectModel import ConstraintFile, ProjectFile, SDCContent, TCLContent
+from pyEDAA.ProjectModel.Intel.QuartusPrime import QuartusProjectFile as QuartusPrime_QuartusProjectFile
+from pyEDAA.ProjectModel.Intel.QuartusPrime import QuartusSettingsFile as QuartusPrime_QuartusSettingsFile
+from pyEDAA.ProjectModel.Intel.QuartusPrime import QIPFile as QuartusPrime_QIPFile
+from pyEDAA.ProjectModel.Intel.QuartusPrime import QIPResolver as QuartusPrime_QIPResolver
+from pyEDAA.ProjectModel.Intel.QuartusPrime import SDCConstraintFile as QuartusPrime_SDCConstraintFile
 
 
 @export
-class QuartusProjectFile(ProjectFile, TCLContent):
+class QuartusProjectFile(QuartusPrime_QuartusProjectFile):
 	"""A Quartus project file (``*.qpf``)."""
 
 
 @export
-class SDCConstraintFile(ConstraintFile, SDCContent):
+class QuartusSettingsFile(QuartusPrime_QuartusSettingsFile):
+	"""A Quartus settings file (``*.qsf``)."""
+
+
+@export
+class QIPFile(QuartusPrime_QIPFile):
+	"""A Quartus IP file (``*.qip``)."""
+
+
+@export
+class QIPResolver(QuartusPrime_QIPResolver):
+	"""Resolves Quartus IP files (``*.qip``, ``*.sip``) recursively into nested filesets."""
+
+
+@export
+class SDCConstraintFile(QuartusPrime_SDCConstraintFile):
 	"""A Quartus constraint file (Synopsys Design Constraints; ``*.sdc``)."""
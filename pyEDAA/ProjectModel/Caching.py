@@ -0,0 +1,361 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Content-addressed caching of analysis results.
+
+Each analysis job is identified by a key derived from the analyzed file's content, its VHDL library and VHDL version,
+the tool version and the keys of all jobs it depends on. Thus, a key changes if the file or any of its transitive
+dependencies changes. The files produced by a job are stored per key in a :class:`CacheBackend`, so an unchanged job
+can be skipped by restoring its outputs.
+"""
+from collections import OrderedDict
+from hashlib     import sha256
+from os          import utime
+from pathlib     import Path
+from shutil      import copy2, rmtree
+from threading   import Lock
+from time        import time
+from typing      import Dict, Optional as Nullable, Sequence
+from uuid        import uuid4
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType, abstractmethod
+
+from pyEDAA.ProjectModel.Execution import AnalysisJob, ContentHash
+
+
+@export
+class CacheBackend(metaclass=ExtendedType, slots=True):
+	"""
+	Base class of all cache backends.
+
+	A backend stores a set of files (artifacts) per key. Artifact paths are relative to a directory given when storing or
+	loading an entry.
+	"""
+
+	@abstractmethod
+	def Load(self, key: str, directory: Path) -> bool:
+		"""
+		Restore the artifacts of a cache entry.
+
+		:arg key:       Key of the cache entry.
+		:arg directory: Directory to restore the artifacts to.
+		:returns:       ``True``, if the entry was found and restored.
+		"""
+
+	@abstractmethod
+	def Save(self, key: str, directory: Path, artifacts: Sequence[Path]) -> None:
+		"""
+		Store artifacts as a cache entry.
+
+		:arg key:       Key of the cache entry.
+		:arg directory: Directory containing the artifacts.
+		:arg artifacts: Paths of the artifacts relative to *directory*.
+		"""
+
+
+@export
+class LocalCacheBackend(CacheBackend):
+	"""
+	A cache backend storing entries in a local directory.
+
+	Each entry is a subdirectory named by its key containing the artifacts and a ``MANIFEST`` file. If the total size of
+	all entries exceeds the maximum size, least recently used entries are evicted. The last use of an entry is recorded
+	as the entry's modification time, thus the LRU order survives restarts.
+
+	Entries are written to a temporary directory (``tmp-<uuid>``) first. Temporary directories left by interrupted saves
+	are removed when the backend is initialized, if they weren't modified for :attr:`TEMPORARY_GRACE_PERIOD` seconds.
+	Younger ones might belong to a save in progress of another process sharing the cache directory.
+	"""
+
+	_MANIFEST = "MANIFEST"
+	TEMPORARY_GRACE_PERIOD = 3600  #: Minimum age in seconds of a temporary directory before it's removed.
+
+	_directory: Path
+	_maxSize:   int
+	_entries:   OrderedDict  # key -> size, ordered from least to most recently used
+	_size:      int
+	_lock:      Lock
+
+	def __init__(self, directory: Path, maxSize: int = 4 * 1024**3) -> None:
+		"""
+		Initializes a local cache backend.
+
+		:arg directory: Cache directory. It's created if it doesn't exist.
+		:arg maxSize:   Maximum total size of all cache entries in bytes.
+		"""
+		self._directory = directory
+		self._maxSize =   maxSize
+		self._lock =      Lock()
+
+		directory.mkdir(parents=True, exist_ok=True)
+		entries = []
+		staleTime = time() - self.TEMPORARY_GRACE_PERIOD
+		for prefixDirectory in directory.iterdir():
+			if not prefixDirectory.is_dir():
+				continue
+			elif prefixDirectory.name.startswith("tmp-"):
+				if prefixDirectory.stat().st_mtime < staleTime:
+					rmtree(prefixDirectory, ignore_errors=True)
+				continue
+
+			for entryDirectory in prefixDirectory.iterdir():
+				if (entryDirectory / self._MANIFEST).exists():
+					size = sum(path.stat().st_size for path in entryDirectory.rglob("*") if path.is_file())
+					entries.append((entryDirectory.stat().st_mtime_ns, entryDirectory.name, size))
+				elif entryDirectory.is_dir():
+					# Entries are renamed into place including their manifest, thus this is a damaged entry.
+					rmtree(entryDirectory, ignore_errors=True)
+
+		entries.sort()
+		self._entries = OrderedDict((key, size) for _, key, size in entries)
+		self._size =    sum(self._entries.values())
+
+	@property
+	def Directory(self) -> Path:
+		return self._directory
+
+	@property
+	def MaxSize(self) -> int:
+		return self._maxSize
+
+	@property
+	def Size(self) -> int:
+		"""Read-only property to access the total size of all cache entries in bytes."""
+		return self._size
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def __contains__(self, key: str) -> bool:
+		return key in self._entries
+
+	def _EntryDirectory(self, key: str) -> Path:
+		return self._directory / key[:2] / key
+
+	def Load(self, key: str, directory: Path) -> bool:
+		with self._lock:
+			if key not in self._entries:
+				return False
+			self._entries.move_to_end(key)
+
+		entryDirectory = self._EntryDirectory(key)
+		try:
+			artifacts = (entryDirectory / self._MANIFEST).read_text(encoding="utf-8").splitlines()
+			for artifact in artifacts:
+				target = directory / artifact
+				target.parent.mkdir(parents=True, exist_ok=True)
+				copy2(entryDirectory / artifact, target)
+			utime(entryDirectory)
+		except FileNotFoundError:
+			# The entry was evicted meanwhile (e.g. by another process).
+			with self._lock:
+				self._size -= self._entries.pop(key, 0)
+			return False
+
+		return True
+
+	def Save(self, key: str, directory: Path, artifacts: Sequence[Path]) -> None:
+		for artifact in artifacts:
+			if artifact.is_absolute():
+				raise Exception(f"Artifact '{artifact!s}' must be a relative path.")
+
+		with self._lock:
+			if key in self._entries:
+				return
+
+		# Write to a temporary directory first and rename it, so readers never see incomplete entries.
+		entryDirectory = self._EntryDirectory(key)
+		temporaryDirectory = self._directory / f"tmp-{uuid4().hex}"
+		try:
+			size = 0
+			for artifact in artifacts:
+				target = temporaryDirectory / artifact
+				target.parent.mkdir(parents=True, exist_ok=True)
+				copy2(directory / artifact, target)
+				size += target.stat().st_size
+			manifest = temporaryDirectory / self._MANIFEST
+			manifest.write_text("".join(f"{artifact.as_posix()}\n" for artifact in artifacts), encoding="utf-8")
+			size += manifest.stat().st_size
+
+			entryDirectory.parent.mkdir(exist_ok=True)
+			temporaryDirectory.rename(entryDirectory)
+		except OSError:
+			# Missing artifacts or a concurrently stored entry: nothing is cached.
+			rmtree(temporaryDirectory, ignore_errors=True)
+			return
+
+		with self._lock:
+			self._entries[key] = size
+			self._size += size
+			self._Evict()
+
+	def _Evict(self) -> None:
+		"""Remove least recently used entries until the cache size is within its limit (except the newest entry)."""
+		while self._size > self._maxSize and len(self._entries) > 1:
+			key, size = self._entries.popitem(last=False)
+			self._size -= size
+			rmtree(self._EntryDirectory(key), ignore_errors=True)
+
+
+@export
+class AnalysisCache(metaclass=ExtendedType, slots=True):
+	"""
+	A content-addressed cache for the outputs of analysis jobs.
+
+	A job's key is computed from the SHA-256 hash of the analyzed file's content, the file name, its VHDL library and
+	VHDL version, the tool version and the keys of all jobs it depends on. The tool version should include all settings
+	changing a tool's output (e.g. relevant command line options). Only jobs with declared outputs
+	(see :attr:`AnalysisJob.Outputs`) are cached.
+
+	The cache is shared by all workers of a :class:`~pyEDAA.ProjectModel.Execution.ParallelExecutor`, thus computed keys
+	and statistics are guarded by a lock.
+	"""
+
+	_backend:     CacheBackend
+	_toolVersion: str
+	_keys:        Dict[AnalysisJob, str]
+	_hits:        int
+	_misses:      int
+	_lock:        Lock
+
+	def __init__(self, backend: CacheBackend, toolVersion: str) -> None:
+		"""
+		Initializes an analysis cache.
+
+		:arg backend:     Backend storing the cache entries.
+		:arg toolVersion: Version of the analyzing tool (incl. relevant settings).
+		"""
+		self._backend =     backend
+		self._toolVersion = toolVersion
+		self._keys =        {}
+		self._hits =        0
+		self._misses =      0
+		self._lock =        Lock()
+
+	@property
+	def Backend(self) -> CacheBackend:
+		return self._backend
+
+	@property
+	def ToolVersion(self) -> str:
+		return self._toolVersion
+
+	@property
+	def Hits(self) -> int:
+		return self._hits
+
+	@property
+	def Misses(self) -> int:
+		return self._misses
+
+	def Key(self, job: AnalysisJob) -> str:
+		"""
+		Return the cache key of a job.
+
+		Keys are computed once per job. As a job's key includes its dependencies' keys, the key reflects the content of
+		all transitive dependencies.
+
+		:arg job: Job to compute the key for.
+		:returns: Hexadecimal SHA-256 digest.
+		"""
+		with self._lock:
+			return self._Key(job)
+
+	def _Key(self, job: AnalysisJob) -> str:
+		if (key := self._keys.get(job)) is not None:
+			return key
+
+		# Compute keys of dependencies first (iterative post-order traversal).
+		stack = [(job, iter(job.Dependencies))]
+		visiting = {job}
+		while len(stack) > 0:
+			current, dependencies = stack[-1]
+			for dependency in dependencies:
+				if dependency in self._keys:
+					continue
+				if dependency in visiting:
+					raise Exception(f"Cyclic dependency between analysis jobs for '{current.Path}' and '{dependency.Path}'.")
+				visiting.add(dependency)
+				stack.append((dependency, iter(dependency.Dependencies)))
+				break
+			else:
+				stack.pop()
+				self._keys[current] = self._ComputeKey(current)
+
+		return self._keys[job]
+
+	def _ComputeKey(self, job: AnalysisJob) -> str:
+		hash = sha256()
+		hash.update(ContentHash(job.Path).encode())
+		hash.update(b"\0")
+		hash.update(job.Path.name.encode("utf-8"))
+		hash.update(b"\0")
+		hash.update(("" if job.VHDLLibrary is None else job.VHDLLibrary.Name.lower()).encode("utf-8"))
+		hash.update(b"\0")
+		hash.update(("" if job.VHDLVersion is None else str(job.VHDLVersion.value)).encode())
+		hash.update(b"\0")
+		hash.update(self._toolVersion.encode("utf-8"))
+		for dependencyKey in sorted(self._keys[dependency] for dependency in job.Dependencies):
+			hash.update(b"\0")
+			hash.update(dependencyKey.encode())
+
+		return hash.hexdigest()
+
+	def Restore(self, job: AnalysisJob, directory: Path) -> bool:
+		"""
+		Restore a job's outputs from the cache.
+
+		:arg job:       Job to restore.
+		:arg directory: Directory the job's outputs are relative to.
+		:returns:       ``True``, if the outputs were restored and the job can be skipped.
+		"""
+		if len(job.Outputs) == 0:
+			return False
+
+		restored = self._backend.Load(self.Key(job), directory)
+		with self._lock:
+			if restored:
+				self._hits += 1
+			else:
+				self._misses += 1
+
+		return restored
+
+	def Store(self, job: AnalysisJob, directory: Path) -> None:
+		"""
+		Store a job's outputs in the cache.
+
+		:arg job:       A passed job.
+		:arg directory: Directory the job's outputs are relative to.
+		"""
+		if len(job.Outputs) > 0:
+			self._backend.Save(self.Key(job), directory, job.Outputs)
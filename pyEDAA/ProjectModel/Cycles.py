@@ -0,0 +1,251 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Detection and reporting of dependency cycles in :attr:`Design._vhdlLibraryDependencyGraph` and
+:attr:`Design._fileDependencyGraph`.
+
+Cycles are found as strongly connected components in linear time. For each cyclic component, a short cycle witness is
+reported, which names the involved libraries or files. A :class:`CycleDetector` checks edges incrementally when they
+are added, so the check can run on every model update.
+"""
+from collections import deque
+from typing      import Callable, Dict, Iterable, List, Optional as Nullable, Union
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Graph       import Graph, Vertex
+
+from pyEDAA.ProjectModel              import Design, File, VHDLLibrary, VHDLSourceFile
+from pyEDAA.ProjectModel.Reachability import IterateStronglyConnectedComponents, ReachabilityIndex
+
+
+@export
+class DependencyCycle(metaclass=ExtendedType, slots=True):
+	"""
+	A witness for a cycle in a dependency graph.
+
+	The witness is a closed path of vertices, where each vertex depends on the next one and the last vertex depends on
+	the first one. Additionally, the strongly connected component containing the cycle is recorded.
+	"""
+
+	_vertices:  List[Vertex]
+	_component: List[Vertex]
+
+	def __init__(self, vertices: Iterable[Vertex], component: Nullable[Iterable[Vertex]] = None) -> None:
+		"""
+		Initializes a cycle witness.
+
+		:arg vertices:  Vertices of the cycle in dependency order (without repeating the first vertex).
+		:arg component: Vertices of the strongly connected component containing the cycle. Default: the cycle's vertices.
+		"""
+		self._vertices = list(vertices)
+		if len(self._vertices) == 0:
+			raise ValueError(f"Parameter 'vertices' is empty.")
+		self._component = list(self._vertices) if component is None else list(component)
+
+	@property
+	def Vertices(self) -> List[Vertex]:
+		"""Vertices of the cycle in dependency order."""
+		return self._vertices
+
+	@property
+	def Values(self) -> List:
+		"""Model objects (e.g. files or VHDL libraries) of the cycle in dependency order."""
+		return [vertex.Value for vertex in self._vertices]
+
+	@property
+	def Component(self) -> List[Vertex]:
+		"""Vertices of the strongly connected component containing the cycle."""
+		return self._component
+
+	def __len__(self) -> int:
+		"""Returns the number of vertices (edges) in the cycle."""
+		return len(self._vertices)
+
+	def __str__(self) -> str:
+		names = [_VertexName(vertex) for vertex in self._vertices]
+		names.append(names[0])
+		return " -> ".join(names)
+
+
+def _VertexName(vertex: Vertex) -> str:
+	value = vertex.Value
+	if isinstance(value, VHDLLibrary):
+		return value.Name
+	elif isinstance(value, VHDLSourceFile):
+		try:
+			return f"{value._path!s} ({value.VHDLLibrary.Name})"
+		except Exception:
+			return str(value._path)
+	elif isinstance(value, File):
+		return str(value._path)
+	elif value is not None:
+		return str(value)
+	return str(vertex.ID)
+
+
+def _ShortestPath(start: Vertex, goal: Vertex, isAllowed: Callable[[Vertex], bool]) -> Nullable[List[Vertex]]:
+	"""
+	Breadth-first search along dependency edges from *start* to *goal*, visiting allowed vertices only.
+
+	:returns: Vertices of the path from *start* up to (excl.) *goal*, or ``None``.
+	"""
+	parents: Dict[Vertex, Nullable[Vertex]] = {start: None}
+	queue = deque((start, ))
+	while len(queue) > 0:
+		vertex = queue.popleft()
+		for successor in vertex.IterateSuccessorVertices():
+			if successor is goal:
+				path = []
+				while vertex is not None:
+					path.append(vertex)
+					vertex = parents[vertex]
+				path.reverse()
+				return path
+			elif successor not in parents and isAllowed(successor):
+				parents[successor] = vertex
+				queue.append(successor)
+
+	return None
+
+
+@export
+def FindCycles(graph: Graph) -> List[DependencyCycle]:
+	"""
+	Find all cyclic strongly connected components of a dependency graph and return a witness for each.
+
+	Components are found in linear time. The witness of a component is a shortest cycle through one of its vertices.
+
+	:arg graph: The dependency graph (e.g. :attr:`Design._vhdlLibraryDependencyGraph`).
+	:returns:   List of cycle witnesses, one per cyclic component (dependencies first).
+	"""
+	cycles = []
+	for component in IterateStronglyConnectedComponents(graph.IterateVertices(), Vertex.IterateSuccessorVertices):
+		if len(component) == 1:
+			if component[0].HasEdgeToDestination(component[0]):
+				cycles.append(DependencyCycle(component))
+			continue
+
+		members = set(component)
+		# The component's root (first visited vertex) is popped last.
+		start = component[-1]
+		path = _ShortestPath(start, start, members.__contains__)
+		cycles.append(DependencyCycle(path, component))
+
+	return cycles
+
+
+@export
+def FindDesignCycles(design: Design) -> List[DependencyCycle]:
+	"""
+	Find all cycles in a design's VHDL library dependency graph and file dependency graph.
+
+	:arg design: The design to check.
+	:returns:    List of cycle witnesses (library cycles first).
+	"""
+	return FindCycles(design._vhdlLibraryDependencyGraph) + FindCycles(design._fileDependencyGraph)
+
+
+@export
+class CycleDetector(metaclass=ExtendedType, slots=True):
+	"""
+	An incremental cycle check for a dependency graph.
+
+	A new edge from *source* to *destination* closes a cycle, if *destination* already (transitively) depends on
+	*source*. This is answered by a :class:`~pyEDAA.ProjectModel.Reachability.ReachabilityIndex`, which is updated
+	incrementally for each edge added via :meth:`AddEdge`.
+	"""
+
+	_index: ReachabilityIndex
+
+	def __init__(self, graph: Graph) -> None:
+		"""
+		Initializes a cycle detector.
+
+		:arg graph: The dependency graph to check.
+		"""
+		self._index = ReachabilityIndex(graph)
+
+	@property
+	def Graph(self) -> Graph:
+		return self._index.Graph
+
+	@property
+	def Index(self) -> ReachabilityIndex:
+		return self._index
+
+	def WouldCreateCycle(self, source: Union[Vertex, object], destination: Union[Vertex, object]) -> Nullable[DependencyCycle]:
+		"""
+		Check if adding an edge from *source* to *destination* would close a cycle.
+
+		:arg source:      The dependent vertex or model object.
+		:arg destination: The vertex or model object *source* would depend on.
+		:returns:         The cycle witness (starting with *source*), or ``None``.
+		"""
+		sourceVertex = source if isinstance(source, Vertex) else source._dependencyNode
+		destinationVertex = destination if isinstance(destination, Vertex) else destination._dependencyNode
+		for vertex in (sourceVertex, destinationVertex):
+			if vertex.Graph is not self._index.Graph:
+				raise Exception(f"Vertex '{vertex}' is not part of the checked graph.")
+
+		if sourceVertex is destinationVertex:
+			return DependencyCycle((sourceVertex, ))
+		elif not self._index.DependsOn(destinationVertex, sourceVertex):
+			return None
+
+		path = _ShortestPath(destinationVertex, sourceVertex, lambda vertex: self._index.DependsOn(vertex, sourceVertex))
+		# After adding the edge, the component consists of all dependents of source reachable from destination.
+		component = [sourceVertex] + [
+			vertex for vertex in self._index.Dependents(sourceVertex)
+			if vertex is not sourceVertex and (vertex is destinationVertex or self._index.DependsOn(destinationVertex, vertex))
+		]
+		return DependencyCycle([sourceVertex] + path, component)
+
+	def AddEdge(self, source: Union[Vertex, object], destination: Union[Vertex, object], rejectCycles: bool = False) -> Nullable[DependencyCycle]:
+		"""
+		Add a dependency edge to the graph and check if it closes a cycle.
+
+		:arg source:       The dependent vertex or model object.
+		:arg destination:  The vertex or model object *source* depends on.
+		:arg rejectCycles: If ``True``, an edge closing a cycle isn't added and an exception is raised.
+		:returns:          The witness of the cycle closed by the new edge, or ``None``.
+		:raises Exception: If *rejectCycles* is set and the edge would close a cycle.
+		"""
+		cycle = self.WouldCreateCycle(source, destination)
+		if cycle is not None and rejectCycles:
+			raise Exception(f"Dependency would create a cycle: {cycle!s}")
+
+		self._index.AddEdge(source, destination)
+		return cycle
+
+	def FindCycles(self) -> List[DependencyCycle]:
+		"""Find all cycles in the graph (see :func:`FindCycles`)."""
+		return FindCycles(self._index.Graph)
@@ -0,0 +1,255 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Top-level detection and dead-file analysis.
+
+Root files (files no other file depends on) are detected from :attr:`Design._fileDependencyGraph` and reconciled with
+the declared top-levels (:attr:`Design.TopLevel`, :attr:`FileSet.TopLevel` and testbenches). HDL source files, which
+aren't reachable from the selected top-levels, are reported as dead files and can be pruned from the compile order.
+"""
+from collections import deque
+from pathlib     import Path
+from typing      import Dict, Generator, Iterable, List, Optional as Nullable, Set, Tuple
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+from pyVHDLModel           import VHDLVersion
+
+from pyEDAA.ProjectModel            import Design, FileSet, File, HDLSourceFile, VHDLLibrary, VHDLSourceFile, _IterateFileSets
+from pyEDAA.ProjectModel.TestImpact import _IdentifyTestbenches
+from pyEDAA.ProjectModel.VHDL       import ScanEntities
+
+
+@export
+class DeadFileAnalysis(metaclass=ExtendedType, slots=True):
+	"""
+	Analysis of the HDL source files reachable from a design's top-levels.
+
+	Top-level names are resolved to files by scanning the design's VHDL files for entity declarations. Names not
+	declared as VHDL entity (e.g. Verilog modules) are resolved by file name (e.g. ``top.v`` for module ``top``). A
+	fileset's top-level is resolved against the files of this fileset (incl. sub-filesets) first, thus filesets may
+	declare top-levels of the same name. Otherwise, and for the design's top-level, all files of the design declaring
+	the name are selected.
+
+	By default, the selected top-levels are the design's top-level, all fileset top-levels and all testbenches. If no
+	top-level is declared at all, all root files are selected.
+
+	Nothing gets pruned, if the dependencies of a top-level are unknown. This is the case, if a declared top-level can't
+	be resolved (see :attr:`UnresolvedTopLevels`), or if the design's file dependency graph has no edges at all (e.g.
+	dependencies weren't scanned).
+
+	Only HDL source files are subject to the analysis. Other files (e.g. constraint files) are always kept.
+	"""
+
+	_design:              Design
+	_topLevels:           Dict[str, List[File]]
+	_unresolvedTopLevels: List[str]
+	_rootFiles:           List[File]
+	_reachable:           Set[File]
+	_unreachableFiles:    List[File]
+
+	def __init__(self, design: Design, topLevels: Nullable[Iterable[str]] = None, includeTestbenches: bool = True) -> None:
+		"""
+		Initializes and runs the analysis.
+
+		:arg design:             Design to analyze.
+		:arg topLevels:          Names of the top-levels to select. Default: the declared top-levels.
+		:arg includeTestbenches: If true and *topLevels* isn't given, testbenches are selected as top-levels, too.
+		:raises ValueError:      If a top-level given by *topLevels* isn't found in any file.
+		"""
+		self._design = design
+
+		hdlFiles = list(design.Files(HDLSourceFile))
+		declarations, entities, portLess = _ScanDeclarations(design, hdlFiles)
+
+		# Selected top-levels as tuples of name, fileset declaring the name (if any) and file (if known).
+		selection: List[Tuple[str, Nullable[FileSet], Nullable[File]]] = []
+		if topLevels is None:
+			if design.TopLevel is not None:
+				selection.append((design.TopLevel, None, None))
+			for fileSet in _IterateFileSets(design.FileSets.values()):
+				if fileSet.TopLevel is not None:
+					selection.append((fileSet.TopLevel, fileSet, None))
+			if includeTestbenches:
+				for testbench in _IdentifyTestbenches(design, entities, portLess):
+					selection.append((testbench.Name, testbench.FileSet, testbench.File))
+		else:
+			selection.extend((name, None, None) for name in topLevels)
+
+		self._topLevels = {}
+		self._unresolvedTopLevels = []
+		for name, fileSet, file in selection:
+			files = [file] if file is not None else _Resolve(name, fileSet, declarations)
+			if len(files) == 0:
+				if name not in self._unresolvedTopLevels:
+					self._unresolvedTopLevels.append(name)
+				continue
+
+			topLevelFiles = self._topLevels.setdefault(name, [])
+			topLevelFiles.extend(file for file in files if file not in topLevelFiles)
+
+		if topLevels is not None and len(self._unresolvedTopLevels) > 0:
+			raise ValueError(f"Top-level(s) '{', '.join(self._unresolvedTopLevels)}' not found in design '{design.Name}'.")
+
+		self._rootFiles = [
+			file for file in hdlFiles
+			if file._dependencyNode is None or file._dependencyNode.InboundEdgeCount == 0
+		]
+
+		if design._fileDependencyGraph.EdgeCount == 0 or len(self._unresolvedTopLevels) > 0:
+			# Dependencies are unknown, thus every file might be used.
+			self._reachable = set(hdlFiles)
+		elif len(selection) == 0:
+			self._reachable = _GetReachable(self._rootFiles)
+		else:
+			self._reachable = _GetReachable(file for files in self._topLevels.values() for file in files)
+		self._unreachableFiles = [file for file in hdlFiles if file not in self._reachable]
+
+	@property
+	def Design(self) -> Design:
+		return self._design
+
+	@property
+	def TopLevels(self) -> Dict[str, List[File]]:
+		"""Read-only property returning the selected top-levels and the files declaring them."""
+		return self._topLevels
+
+	@property
+	def UnresolvedTopLevels(self) -> List[str]:
+		"""Read-only property returning the names of declared top-levels, which weren't found in any file (disables pruning)."""
+		return self._unresolvedTopLevels
+
+	@property
+	def RootFiles(self) -> List[File]:
+		"""Read-only property returning HDL source files, which no other file depends on."""
+		return self._rootFiles
+
+	@property
+	def UndeclaredRootFiles(self) -> List[File]:
+		"""Read-only property returning root files, which don't contain a selected top-level (e.g. stale files)."""
+		topLevelFiles = {file for files in self._topLevels.values() for file in files}
+		return [file for file in self._rootFiles if file not in topLevelFiles]
+
+	@property
+	def ReachableFiles(self) -> List[File]:
+		"""Read-only property returning HDL source files reachable from the selected top-levels (in design order)."""
+		return [file for file in self._design.Files(HDLSourceFile) if file in self._reachable]
+
+	@property
+	def UnreachableFiles(self) -> List[File]:
+		"""Read-only property returning HDL source files not reachable from the selected top-levels (dead files)."""
+		return self._unreachableFiles
+
+	def IsReachable(self, file: File) -> bool:
+		"""
+		Check if a file is kept by the analysis.
+
+		:arg file: The file to check.
+		:returns:  ``True``, if *file* is reachable from a selected top-level or isn't an HDL source file.
+		"""
+		return file in self._reachable or not isinstance(file, HDLSourceFile)
+
+	def IterateCompileOrder(
+		self,
+		fileSet: Nullable[FileSet] = None,
+		prune: bool = True
+	) -> Generator[Tuple[File, Path, Nullable[VHDLLibrary], Nullable[VHDLVersion]], None, None]:
+		"""
+		Method returning the files of the design in compile order (see :meth:`Design.IterateCompileOrder`).
+
+		:arg fileSet: Fileset (incl. sub-filesets) to iterate. Default: all filesets of the design.
+		:arg prune:   If true, dead files are skipped.
+		:returns:     A generator of tuples of file, resolved path, VHDL library and VHDL version.
+		"""
+		for entry in self._design.IterateCompileOrder(fileSet):
+			if not prune or self.IsReachable(entry[0]):
+				yield entry
+
+
+def _ScanDeclarations(
+	design: Design,
+	hdlFiles: List[File]
+) -> Tuple[Dict[str, List[File]], Dict[str, VHDLSourceFile], List[str]]:
+	"""
+	Scan all VHDL files of a design for entity declarations.
+
+	:arg design:   The design.
+	:arg hdlFiles: HDL source files of the design.
+	:returns:      A map of lower-case top-level names (VHDL entity names, otherwise file stems) to declaring files, a map
+	               of entity names to the first declaring file and the names of port-less entities.
+	"""
+	declarations: Dict[str, List[File]] = {}
+	portLess: List[str] = []
+	for file in design.Files(VHDLSourceFile):
+		try:
+			entities = ScanEntities(file.ResolvedPath)
+		except OSError:
+			continue
+
+		for entity in entities:
+			declarations.setdefault(entity.Name, []).append(file)
+			if not entity.HasPorts:
+				portLess.append(entity.Name)
+
+	entities = {name: files[0] for name, files in declarations.items()}
+
+	stems: Dict[str, List[File]] = {}
+	for file in hdlFiles:
+		stems.setdefault(file.Path.stem.lower(), []).append(file)
+	for name, files in stems.items():
+		declarations.setdefault(name, files)
+
+	return declarations, entities, portLess
+
+
+def _Resolve(name: str, fileSet: Nullable[FileSet], declarations: Dict[str, List[File]]) -> List[File]:
+	"""Return the files declaring *name*, preferring the files of *fileSet*."""
+	files = declarations.get(name.lower(), [])
+	if fileSet is not None:
+		fileSetFiles = set(fileSet.Files())
+		if len(local := [file for file in files if file in fileSetFiles]) > 0:
+			return local
+
+	return files
+
+
+def _GetReachable(files: Iterable[File]) -> Set[File]:
+	"""Return all files reachable from *files* along dependency edges (incl. *files*)."""
+	reachable = set(files)
+	queue = deque(file._dependencyNode for file in reachable if file._dependencyNode is not None)
+	while len(queue) > 0:
+		vertex = queue.popleft()
+		for successor in vertex.IterateSuccessorVertices():
+			if successor.Value not in reachable:
+				reachable.add(successor.Value)
+				queue.append(successor)
+
+	return reachable
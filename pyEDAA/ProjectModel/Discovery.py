@@ -0,0 +1,254 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Discovery of simulation top-levels (testbenches) in VHDL, (System)Verilog and cocotb source files.
+
+Testbenches are port-less VHDL entities, port-less (System)Verilog modules and cocotb test modules (Python files
+containing functions decorated with ``@cocotb.test``). Files are scanned in a process pool and scan results are cached
+per file content hash, so re-discovery only scans modified files.
+"""
+from ast                import parse as ast_parse, walk as ast_walk, AsyncFunctionDef, FunctionDef, Attribute, Call, Name, Import, ImportFrom
+from concurrent.futures import Executor, ProcessPoolExecutor
+from json               import load as json_load, dump as json_dump
+from pathlib            import Path
+from typing             import Dict, List, Optional as Nullable, Set, Tuple
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.ProjectModel            import Design, FileSet, File, Testbench, VHDLSourceFile, VerilogBaseFile, VerilogHeaderFile
+from pyEDAA.ProjectModel            import SystemVerilogHeaderFile, CocotbPythonFile, _IterateFileSets
+from pyEDAA.ProjectModel.Execution  import ContentHash
+from pyEDAA.ProjectModel.TestImpact import _RegisterTestbench
+from pyEDAA.ProjectModel.VHDL       import ScanEntities
+from pyEDAA.ProjectModel.Verilog    import ScanModules
+
+
+@export
+class TestbenchDiscovery(metaclass=ExtendedType, slots=True):
+	"""
+	Discovers testbenches of a design and registers them in the filesets owning the declaring files.
+
+	Scan results (names of port-less entities and modules, or names of cocotb tests) are cached by file content hash. If
+	a cache file is given, the cache is loaded on creation and written by :meth:`Save`.
+
+	A cocotb test module is recorded as a testbench named like the Python module. The names of its tests are returned by
+	:meth:`TestCases`.
+	"""
+
+	CACHE_VERSION = 2
+
+	_cacheFile:    Nullable[Path]
+	_entries:      Dict[str, List[str]]
+	_testCases:    Dict[Testbench, List[str]]
+	_scannedFiles: int
+	_cachedFiles:  int
+
+	def __init__(self, cacheFile: Nullable[Path] = None) -> None:
+		"""
+		Initializes a testbench discovery.
+
+		:arg cacheFile: Optional path of a JSON file to persist scan results.
+		"""
+		self._cacheFile =    cacheFile
+		self._entries =      {}
+		self._testCases =    {}
+		self._scannedFiles = 0
+		self._cachedFiles =  0
+
+		if cacheFile is not None:
+			self._Load()
+
+	@property
+	def ScannedFiles(self) -> int:
+		"""Read-only property returning the number of files scanned by the last discovery."""
+		return self._scannedFiles
+
+	@property
+	def CachedFiles(self) -> int:
+		"""Read-only property returning the number of files, whose scan result was taken from the cache by the last discovery."""
+		return self._cachedFiles
+
+	def TestCases(self, testbench: Testbench) -> List[str]:
+		"""
+		Return the names of the tests of a discovered cocotb testbench.
+
+		:arg testbench: The testbench.
+		:returns:       List of test function names (empty for HDL testbenches).
+		"""
+		return self._testCases.get(testbench, [])
+
+	def Discover(self, design: Design, executor: Nullable[Executor] = None, maxWorkers: Nullable[int] = None) -> List[Testbench]:
+		"""
+		Discover the testbenches of a design.
+
+		Discovered testbenches are added to the fileset directly containing the declaring file, unless this fileset
+		already contains a testbench of that name. In this case, the existing testbench is returned (and its file is set,
+		if unknown).
+
+		:arg design:     Design to scan.
+		:arg executor:   Optional executor to run the scanners in. If ``None`` and files need to be scanned, a process
+		                 pool is created.
+		:arg maxWorkers: Number of worker processes, if a process pool is created.
+		:returns:        List of discovered testbenches in design order.
+		"""
+		files: List[Tuple[FileSet, File, str]] = []
+		pending: Dict[str, Tuple[str, str]] = {}
+		for fileSet in _IterateFileSets(design.FileSets.values()):
+			for file in fileSet.Files(fileSet=False):
+				if (kind := _GetKind(file)) is None:
+					continue
+
+				path = file.ResolvedPath
+				try:
+					key = f"{kind}:{ContentHash(path)}"
+				except OSError:
+					continue
+
+				files.append((fileSet, file, key))
+				if key not in self._entries and key not in pending:
+					pending[key] = (kind, str(path))
+
+		self._scannedFiles = len(pending)
+		self._cachedFiles = len(files) - len(pending)
+		if len(pending) > 0:
+			ownsExecutor = executor is None
+			if ownsExecutor:
+				executor = ProcessPoolExecutor(max_workers=maxWorkers)
+
+			try:
+				futures = {key: executor.submit(_ScanFile, kind, path) for key, (kind, path) in pending.items()}
+				for key, future in futures.items():
+					self._entries[key] = future.result()
+			finally:
+				if ownsExecutor:
+					executor.shutdown()
+
+		testbenches: List[Testbench] = []
+		for fileSet, file, key in files:
+			names = self._entries[key]
+			if isinstance(file, CocotbPythonFile):
+				if len(names) > 0:
+					testbench = _RegisterTestbench(fileSet, file.Path.stem, file)
+					self._testCases[testbench] = names
+					testbenches.append(testbench)
+			else:
+				testbenches.extend(_RegisterTestbench(fileSet, name, file) for name in names)
+
+		return testbenches
+
+	def Save(self) -> None:
+		"""Write the cached scan results to the cache file."""
+		if self._cacheFile is None:
+			raise Exception("Testbench discovery has no cache file.")
+
+		with self._cacheFile.open("w", encoding="utf-8") as file:
+			json_dump({"Version": self.CACHE_VERSION, "Entries": self._entries}, file)
+
+	def _Load(self) -> None:
+		if not self._cacheFile.exists():
+			return
+
+		try:
+			with self._cacheFile.open("r", encoding="utf-8") as file:
+				cache = json_load(file)
+		except Exception:
+			# A corrupted cache is rebuilt by the next discovery.
+			return
+
+		if cache.get("Version") == self.CACHE_VERSION:
+			self._entries = cache["Entries"]
+
+
+def _GetKind(file: File) -> Nullable[str]:
+	if isinstance(file, VHDLSourceFile):
+		return "vhdl"
+	elif isinstance(file, VerilogBaseFile) and not isinstance(file, (VerilogHeaderFile, SystemVerilogHeaderFile)):
+		return "verilog"
+	elif isinstance(file, CocotbPythonFile):
+		return "cocotb"
+	return None
+
+
+def _ScanFile(kind: str, path: str) -> List[str]:
+	"""
+	Scan a file for testbenches (executed in a worker process).
+
+	:arg kind: ``vhdl``, ``verilog`` or ``cocotb``.
+	:arg path: Path of the file.
+	:returns:  Names of port-less entities or modules, or names of cocotb tests.
+	"""
+	if kind == "vhdl":
+		return [entity.Name for entity in ScanEntities(Path(path)) if not entity.HasPorts]
+	elif kind == "verilog":
+		return [module.Name for module in ScanModules(Path(path))[0] if module.Kind in ("module", "macromodule") and not module.HasPorts]
+	else:
+		return FindCocotbTests(Path(path).read_text(encoding="utf-8", errors="replace"))
+
+
+@export
+def FindCocotbTests(source: str) -> List[str]:
+	"""
+	Find cocotb tests in Python source code.
+
+	A test is a function decorated with ``cocotb.test`` (with or without arguments). Aliased imports like
+	``import cocotb as cb`` or ``from cocotb import test`` are recognized.
+
+	:arg source: Python source code.
+	:returns:    Names of test functions in order of appearance (empty, if the source has syntax errors).
+	"""
+	try:
+		module = ast_parse(source)
+	except SyntaxError:
+		return []
+
+	moduleNames: Set[str] = set()
+	decoratorNames: Set[str] = set()
+	for node in ast_walk(module):
+		if isinstance(node, Import):
+			moduleNames.update(alias.asname or alias.name for alias in node.names if alias.name == "cocotb")
+		elif isinstance(node, ImportFrom) and node.module == "cocotb":
+			decoratorNames.update(alias.asname or alias.name for alias in node.names if alias.name == "test")
+
+	tests = []
+	for node in ast_walk(module):
+		if isinstance(node, (FunctionDef, AsyncFunctionDef)):
+			for decorator in node.decorator_list:
+				if isinstance(decorator, Call):
+					decorator = decorator.func
+				if (
+					(isinstance(decorator, Attribute) and decorator.attr == "test" and isinstance(decorator.value, Name) and decorator.value.id in moduleNames) or
+					(isinstance(decorator, Name) and decorator.id in decoratorNames)
+				):
+					tests.append(node.name)
+					break
+
+	return tests
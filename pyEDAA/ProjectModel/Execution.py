@@ -0,0 +1,441 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Direct execution of analysis jobs for a design.
+
+For each file of a design an :class:`AnalysisJob` is created from a command template. The :class:`ParallelExecutor`
+launches these jobs as subprocesses on multiple workers, while a job is only started after all jobs it depends on
+finished successfully. Optionally, outputs of jobs are restored from and stored in an
+:class:`~pyEDAA.ProjectModel.Caching.AnalysisCache`.
+"""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from enum               import Enum
+from hashlib            import sha256
+from heapq              import heappop, heappush
+from os                 import cpu_count
+from pathlib            import Path
+from shlex              import split as shlex_split
+from subprocess         import PIPE, STDOUT, Popen
+from threading          import Lock
+from time               import perf_counter
+from typing             import Callable, Dict, Iterable, List, Mapping, Optional as Nullable, Sequence, Set, Tuple, Type, Union
+from typing             import TYPE_CHECKING
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+from pyVHDLModel           import VHDLVersion
+
+from pyEDAA.ProjectModel import Design, FileSet, File, VHDLLibrary, VHDLSourceFile
+
+if TYPE_CHECKING:  # pragma: no cover
+	from pyEDAA.ProjectModel.Caching import AnalysisCache
+
+
+_CONTENT_HASHES: Dict[Path, Tuple[int, int, str]] = {}
+
+
+@export
+def ContentHash(path: Path) -> str:
+	"""
+	Compute the SHA-256 hash of a file's content.
+
+	Hashes are cached per path and revalidated by modification time and size, so unchanged files are read only once.
+
+	:arg path: Path of the file.
+	:returns:  Hexadecimal SHA-256 digest.
+	"""
+	stat = path.stat()
+	try:
+		mtime, size, digest = _CONTENT_HASHES[path]
+		if mtime == stat.st_mtime_ns and size == stat.st_size:
+			return digest
+	except KeyError:
+		pass
+
+	hash = sha256()
+	with path.open("rb") as file:
+		while chunk := file.read(1024 * 1024):
+			hash.update(chunk)
+
+	digest = hash.hexdigest()
+	_CONTENT_HASHES[path] = (stat.st_mtime_ns, stat.st_size, digest)
+	return digest
+
+
+@export
+class JobState(Enum):
+	"""State of an :class:`AnalysisJob`."""
+	Pending = 0
+	Running = 1
+	Passed =  2
+	Failed =  3
+	Skipped = 4
+	Cached =  5
+
+
+@export
+class AnalysisJob(metaclass=ExtendedType, slots=True):
+	"""An analysis job for a single file."""
+
+	_file:         File
+	_path:         Path
+	_library:      Nullable[VHDLLibrary]
+	_vhdlVersion:  Nullable[VHDLVersion]
+	_command:      List[str]
+	_outputs:      List[Path]
+	_dependencies: List['AnalysisJob']
+	_dependents:   List['AnalysisJob']
+	_state:        JobState
+	_returnCode:   Nullable[int]
+	_output:       List[str]
+	_startTime:    Nullable[float]
+	_duration:     Nullable[float]
+
+	def __init__(
+		self,
+		file: File,
+		path: Path,
+		command: Sequence[str],
+		library: Nullable[VHDLLibrary] = None,
+		vhdlVersion: Nullable[VHDLVersion] = None,
+		outputs: Iterable[Path] = ()
+	) -> None:
+		self._file =         file
+		self._path =         path
+		self._library =      library
+		self._vhdlVersion =  vhdlVersion
+		self._command =      list(command)
+		self._outputs =      list(outputs)
+		self._dependencies = []
+		self._dependents =   []
+		self._state =        JobState.Pending
+		self._returnCode =   None
+		self._output =       []
+		self._startTime =    None
+		self._duration =     None
+
+	@property
+	def File(self) -> File:
+		return self._file
+
+	@property
+	def Path(self) -> Path:
+		return self._path
+
+	@property
+	def VHDLLibrary(self) -> Nullable[VHDLLibrary]:
+		return self._library
+
+	@property
+	def VHDLVersion(self) -> Nullable[VHDLVersion]:
+		return self._vhdlVersion
+
+	@property
+	def Command(self) -> List[str]:
+		return self._command
+
+	@property
+	def Outputs(self) -> List[Path]:
+		"""Read-only property to access the list of files produced by the job (relative to the working directory)."""
+		return self._outputs
+
+	@property
+	def Dependencies(self) -> List['AnalysisJob']:
+		"""Read-only property to access the list of jobs, which need to finish before this job can start."""
+		return self._dependencies
+
+	@property
+	def Dependents(self) -> List['AnalysisJob']:
+		"""Read-only property to access the list of jobs, which depend on this job."""
+		return self._dependents
+
+	@property
+	def State(self) -> JobState:
+		return self._state
+
+	@property
+	def ReturnCode(self) -> Nullable[int]:
+		return self._returnCode
+
+	@property
+	def Output(self) -> List[str]:
+		"""Read-only property to access the output lines (stdout and stderr) of the job's process."""
+		return self._output
+
+	@property
+	def StartTime(self) -> Nullable[float]:
+		"""Read-only property to access the start time relative to the start of the executor (in seconds)."""
+		return self._startTime
+
+	@property
+	def Duration(self) -> Nullable[float]:
+		"""Read-only property to access the job's wall-clock duration (in seconds)."""
+		return self._duration
+
+	def AddDependency(self, job: 'AnalysisJob') -> None:
+		if job not in self._dependencies:
+			self._dependencies.append(job)
+			job._dependents.append(self)
+
+	def __repr__(self) -> str:
+		return f"AnalysisJob({self._path.as_posix()}, {self._state.name})"
+
+
+@export
+def CreateAnalysisJobs(
+	design: Design,
+	commands: Mapping[Type[File], Union[str, Sequence[str]]],
+	fileSet: Nullable[FileSet] = None,
+	outputs: Nullable[Mapping[Type[File], Sequence[str]]] = None
+) -> List[AnalysisJob]:
+	"""
+	Create analysis jobs for all files of a design in compile order.
+
+	Commands are selected per file by the first matching file class in *commands*. Files without matching command are
+	skipped. A command is either a sequence of arguments or a string, which is split like a shell command line. Each
+	argument is formatted with :meth:`str.format` using the fields ``{path}``, ``{stem}`` (file name without suffix),
+	``{library}`` (VHDL library, default ``work``), ``{vhdlversion}`` (e.g. ``2008``) and ``{std}`` (e.g. ``08``).
+	Optional output templates describing the files produced by a job (e.g. for caching) are formatted the same way.
+
+	A job depends on the jobs of all files it depends on according to the design's file dependency graph. VHDL files
+	without vertex in that graph depend on the previous file of the same VHDL library and on the last file of each VHDL
+	library their library depends on.
+
+	:arg design:   Design to create jobs for.
+	:arg commands: A dictionary of file classes to command templates.
+	:arg fileSet:  Fileset (incl. sub-filesets) to create jobs for. Default: all filesets of the design.
+	:arg outputs:  A dictionary of file classes to output path templates (relative to the working directory).
+	:returns:      List of analysis jobs in compile order.
+	"""
+	templates = {fileClass: shlex_split(command) if isinstance(command, str) else list(command) for fileClass, command in commands.items()}
+	outputTemplates = {} if outputs is None else outputs
+
+	jobs: List[AnalysisJob] = []
+	jobsByFile: Dict[File, AnalysisJob] = {}
+	lastJobs: Dict[VHDLLibrary, AnalysisJob] = {}
+	for file, path, library, vhdlVersion in design.IterateCompileOrder(fileSet):
+		for fileClass, template in templates.items():
+			if isinstance(file, fileClass):
+				break
+		else:
+			continue
+
+		year = None if vhdlVersion is None else (vhdlVersion.value if vhdlVersion.value >= 1000 else 1900 + vhdlVersion.value)
+		fields = {
+			"path":        str(path),
+			"stem":        path.stem,
+			"library":     "work" if library is None else library.Name,
+			"vhdlversion": "" if year is None else str(year),
+			"std":         "" if year is None else f"{year % 100:02d}"
+		}
+		command = [argument.format(**fields) for argument in template]
+		outputPaths = [Path(output.format(**fields)) for output in outputTemplates.get(fileClass, ())]
+		job = AnalysisJob(file, path, command, library, vhdlVersion, outputPaths)
+		jobs.append(job)
+		jobsByFile[file] = job
+
+		if isinstance(file, VHDLSourceFile) and file._dependencyNode is None:
+			if (previousJob := lastJobs.get(library)) is not None:
+				job.AddDependency(previousJob)
+			if library is not None and library._dependencyNode is not None:
+				for dependencyJob in _IterateLibraryJobs(library, lastJobs, set()):
+					job.AddDependency(dependencyJob)
+		if library is not None:
+			lastJobs[library] = job
+
+	for job in jobs:
+		if job._file._dependencyNode is not None:
+			for vertex in job._file._dependencyNode.IterateSuccessorVertices():
+				if (dependencyJob := jobsByFile.get(vertex.Value)) is not None:
+					job.AddDependency(dependencyJob)
+
+	return jobs
+
+
+def _IterateLibraryJobs(library: VHDLLibrary, lastJobs: Dict[VHDLLibrary, AnalysisJob], visited: Set[VHDLLibrary]) -> Iterable[AnalysisJob]:
+	"""Yield the last job of each library *library* depends on. Libraries without jobs are looked through."""
+	for vertex in library._dependencyNode.IterateSuccessorVertices():
+		dependency = vertex.Value
+		if dependency in visited:
+			continue
+		visited.add(dependency)
+
+		if (job := lastJobs.get(dependency)) is not None:
+			yield job
+		elif dependency._dependencyNode is not None:
+			yield from _IterateLibraryJobs(dependency, lastJobs, visited)
+
+
+@export
+class ParallelExecutor(metaclass=ExtendedType, slots=True):
+	"""
+	Execute analysis jobs as subprocesses on multiple workers.
+
+	Jobs are started in the order of the given job list, as soon as all their dependencies passed. If a job fails, no
+	further jobs are started, unless *keepGoing* is set. In that case, only the (transitive) dependents of a failed job
+	are skipped.
+
+	If a cache is given, a job's outputs are restored from the cache instead of running the job, if possible. Such jobs
+	finish with state :attr:`JobState.Cached`. Outputs of passed jobs are stored in the cache.
+	"""
+
+	_workers:          int
+	_keepGoing:        bool
+	_workingDirectory: Nullable[Path]
+	_outputHandler:    Nullable[Callable[[AnalysisJob, str], None]]
+	_cache:            Nullable['AnalysisCache']
+	_outputLock:       Lock
+	_startTime:        float
+
+	def __init__(
+		self,
+		workers: Nullable[int] = None,
+		keepGoing: bool = False,
+		workingDirectory: Nullable[Path] = None,
+		outputHandler: Nullable[Callable[[AnalysisJob, str], None]] = None,
+		cache: Nullable['AnalysisCache'] = None
+	) -> None:
+		"""
+		Initializes a parallel executor.
+
+		:arg workers:          Number of parallel jobs. Default: number of CPUs.
+		:arg keepGoing:        If true, continue with independent jobs after a job failed.
+		:arg workingDirectory: Working directory of the launched processes. Default: current working directory.
+		:arg outputHandler:    Callback receiving each output line of a job, while the job is running.
+		:arg cache:            Optional cache for job outputs.
+		"""
+		self._workers =          (cpu_count() or 1) if workers is None else workers
+		self._keepGoing =        keepGoing
+		self._workingDirectory = workingDirectory
+		self._outputHandler =    outputHandler
+		self._cache =            cache
+		self._outputLock =       Lock()
+		self._startTime =        0.0
+
+	@property
+	def Workers(self) -> int:
+		return self._workers
+
+	@property
+	def KeepGoing(self) -> bool:
+		return self._keepGoing
+
+	def Run(self, jobs: Sequence[AnalysisJob]) -> Dict[AnalysisJob, float]:
+		"""
+		Run all jobs.
+
+		:arg jobs: Jobs to run. Dependencies outside of this list are considered as satisfied.
+		:returns:  A dictionary of executed jobs (passed or failed) and their durations in seconds, in order of completion.
+		           Jobs restored from the cache are not included.
+		"""
+		jobSet = set(jobs)
+		remaining = {job: sum(1 for dependency in job._dependencies if dependency in jobSet) for job in jobs}
+		# Ready jobs are kept in a heap, ordered by their position in the job list. Jobs skipped by a failed dependency
+		# aren't removed from the heap, but dropped when popped.
+		ready = [(index, job) for index, job in enumerate(jobs) if remaining[job] == 0]
+		order = {job: index for index, job in enumerate(jobs)}
+
+		timings: Dict[AnalysisJob, float] = {}
+		running: Dict[Future, AnalysisJob] = {}
+		stopped = False
+		self._startTime = perf_counter()
+		with ThreadPoolExecutor(max_workers=self._workers) as executor:
+			while True:
+				while not stopped and len(ready) > 0 and len(running) < self._workers:
+					_, job = heappop(ready)
+					if job._state is not JobState.Pending:
+						continue
+
+					job._state = JobState.Running
+					running[executor.submit(self._Execute, job)] = job
+
+				if len(running) == 0:
+					break
+
+				done, _ = wait(running, return_when=FIRST_COMPLETED)
+				for future in done:
+					job = running.pop(future)
+					future.result()
+					if job._state is not JobState.Cached:
+						timings[job] = job._duration
+
+					if job._state is JobState.Passed or job._state is JobState.Cached:
+						for dependent in job._dependents:
+							if dependent in remaining:
+								remaining[dependent] -= 1
+								if remaining[dependent] == 0 and dependent._state is JobState.Pending:
+									heappush(ready, (order[dependent], dependent))
+					elif self._keepGoing:
+						_SkipDependents(job)
+					else:
+						stopped = True
+
+		for job in jobs:
+			if job._state is JobState.Pending:
+				job._state = JobState.Skipped
+
+		return timings
+
+	def _Execute(self, job: AnalysisJob) -> None:
+		job._startTime = perf_counter() - self._startTime
+		workingDirectory = Path.cwd() if self._workingDirectory is None else self._workingDirectory
+		if self._cache is not None and self._cache.Restore(job, workingDirectory):
+			job._duration = perf_counter() - self._startTime - job._startTime
+			job._state = JobState.Cached
+			return
+
+		try:
+			with Popen(job._command, stdout=PIPE, stderr=STDOUT, cwd=self._workingDirectory, text=True, errors="replace") as process:
+				for line in process.stdout:
+					line = line.rstrip("\r\n")
+					job._output.append(line)
+					if self._outputHandler is not None:
+						with self._outputLock:
+							self._outputHandler(job, line)
+
+			job._returnCode = process.returncode
+		except OSError as ex:
+			job._output.append(f"Couldn't launch '{job._command[0]}': {ex}")
+			job._returnCode = None
+
+		job._duration = perf_counter() - self._startTime - job._startTime
+		job._state = JobState.Passed if job._returnCode == 0 else JobState.Failed
+		if job._state is JobState.Passed and self._cache is not None:
+			self._cache.Store(job, workingDirectory)
+
+
+def _SkipDependents(job: AnalysisJob) -> None:
+	stack = list(job._dependents)
+	while len(stack) > 0:
+		dependent = stack.pop()
+		if dependent._state is JobState.Pending:
+			dependent._state = JobState.Skipped
+			stack.extend(dependent._dependents)
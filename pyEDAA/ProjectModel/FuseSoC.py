@@ -0,0 +1,329 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Import of `FuseSoC <https://github.com/olofk/fusesoc>`__ core files (``*.core``) and export of Edalize's EDA metadata
+(EDAM) description.
+
+Reading core files requires the optional dependency ``PyYAML`` (``pip install pyEDAA.ProjectModel[fusesoc]``).
+"""
+from json    import dumps as json_dumps
+from os.path import relpath
+from pathlib import Path
+from typing  import Any, Dict, List, Optional as Nullable, TextIO, Tuple
+
+from pyTooling.Decorators import export
+from pyVHDLModel          import VHDLVersion
+
+from pyEDAA.ProjectModel import ProjectFile, YAMLContent, Project, Design, FileSet, File
+from pyEDAA.ProjectModel import VHDLSourceFile, VerilogSourceFile, VerilogHeaderFile, SystemVerilogSourceFile
+from pyEDAA.ProjectModel import SystemVerilogHeaderFile, TCLSourceFile, ConstraintFile, CSourceFile, CppSourceFile
+from pyEDAA.ProjectModel import PythonSourceFile, SDCContent
+
+try:
+	from yaml import load as yaml_load
+	try:
+		from yaml import CSafeLoader as YAMLLoader
+	except ImportError:  # pragma: no cover
+		from yaml import SafeLoader as YAMLLoader
+
+	withYAML = True
+except (ImportError, ModuleNotFoundError):  # pragma: no cover
+	withYAML = False
+
+
+@export
+class XDCConstraintFile(ConstraintFile, SDCContent):
+	"""A Xilinx Design Constraint file (``*.xdc``) referenced by a core file."""
+
+
+@export
+class SDCConstraintFile(ConstraintFile, SDCContent):
+	"""A Synopsys Design Constraint file (``*.sdc``) referenced by a core file."""
+
+
+@export
+class FuseSoCCoreFile(ProjectFile, YAMLContent):
+	"""
+	A FuseSoC core file (``*.core``, CAPI2).
+
+	Each core fileset is mapped to a :class:`~pyEDAA.ProjectModel.FileSet` of the same name. The fileset's and file's
+	``file_type`` select the file class and VHDL version, ``logical_name`` selects the VHDL library.
+	"""
+
+	_coreProject: Nullable[Project]
+	_coreName:    Nullable[str]
+	_targets:     Dict[str, Tuple[List[str], Nullable[str]]]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Nullable[Project] = None,
+		design:  Nullable[Design] =  None,
+		fileSet: Nullable[FileSet] = None
+	) -> None:
+		super().__init__(path, project, design, fileSet)
+
+		self._coreProject = None
+		self._coreName =    None
+		self._targets =     {}
+
+	@property
+	def ProjectModel(self) -> Project:
+		return self._coreProject
+
+	@property
+	def CoreName(self) -> Nullable[str]:
+		"""Read-only property returning the core's name (VLNV)."""
+		return self._coreName
+
+	@property
+	def Targets(self) -> Dict[str, Tuple[List[str], Nullable[str]]]:
+		"""Read-only property returning a dictionary of target names to a tuple of fileset names and toplevel."""
+		return self._targets
+
+	def Parse(self) -> None:
+		if not withYAML:  # pragma: no cover
+			raise Exception("Package 'PyYAML' is required to read FuseSoC core files.")
+
+		path = self._path
+		if not path.exists():
+			raise Exception(f"FuseSoC core file '{path!s}' not found.") from FileNotFoundError(f"File '{path!s}' not found.")
+
+		try:
+			with path.open("r", encoding="utf-8") as file:
+				core = yaml_load(file, Loader=YAMLLoader)
+		except Exception as ex:
+			raise Exception(f"Error while reading FuseSoC core file '{path!s}'.") from ex
+
+		if not isinstance(core, dict):
+			raise Exception(f"FuseSoC core file '{path!s}' doesn't contain a CAPI2 description.")
+
+		self._coreName = core.get("name")
+		self._coreProject = Project(path.stem, rootDirectory=path.parent)
+		design = self._coreProject.DefaultDesign
+
+		for fileSetName, fileSetDescription in (core.get("filesets") or {}).items():
+			self._ParseFileSet(fileSetName, fileSetDescription or {}, design)
+
+		for targetName, targetDescription in (core.get("targets") or {}).items():
+			targetDescription = targetDescription or {}
+			toplevel = targetDescription.get("toplevel")
+			if isinstance(toplevel, list):
+				toplevel = toplevel[0] if len(toplevel) > 0 else None
+			self._targets[targetName] = (list(targetDescription.get("filesets") or []), toplevel)
+
+		if (defaultTarget := self._targets.get("default")) is not None and defaultTarget[1] is not None:
+			design.TopLevel = defaultTarget[1]
+
+	def _ParseFileSet(self, name: str, description: Dict[str, Any], design: Design) -> None:
+		fileSet = FileSet(name, design=design)
+
+		defaultFileType = description.get("file_type")
+		defaultLogicalName = description.get("logical_name")
+
+		files = []
+		libraries = []
+		for entry in description.get("files") or []:
+			if isinstance(entry, dict):
+				(filePath, attributes), = entry.items()
+				attributes = attributes or {}
+			else:
+				filePath, attributes = entry, {}
+
+			fileType = attributes.get("file_type", defaultFileType)
+			file = _CreateFile(Path(filePath), fileType, attributes.get("is_include_file", False))
+			files.append(file)
+			if isinstance(file, VHDLSourceFile) and (logicalName := attributes.get("logical_name", defaultLogicalName)) is not None:
+				libraries.append((file, logicalName))
+
+		fileSet.AddFiles(files)
+		for file, logicalName in libraries:
+			file.VHDLLibrary = fileSet.GetOrCreateVHDLLibrary(logicalName)
+
+
+def _CreateFile(path: Path, fileType: Nullable[str], isIncludeFile: bool) -> File:
+	if fileType is None:
+		return File(path)
+
+	baseType, _, version = fileType.partition("-")
+	if isIncludeFile:
+		baseType = _INCLUDE_FILE_TYPES.get(baseType, baseType)
+
+	if baseType == "vhdlSource":
+		file = VHDLSourceFile(path)
+		if version != "":
+			try:
+				file.VHDLVersion = _VHDL_VERSIONS[version]
+			except KeyError as ex:
+				raise Exception(f"Unknown VHDL version in file type '{fileType}' of file '{path!s}'.") from ex
+		return file
+
+	try:
+		return _FILE_TYPES[baseType](path)
+	except KeyError:
+		return File(path)
+
+
+@export
+def WriteEDAM(
+	stream: TextIO,
+	design: Design,
+	name: Nullable[str] = None,
+	toplevel: Nullable[str] = None,
+	fileSet: Nullable[FileSet] = None,
+	relativeTo: Nullable[Path] = None
+) -> None:
+	"""
+	Write an Edalize EDAM description of a design as JSON (a subset of YAML).
+
+	Files are written one by one in fileset order, so no intermediate data structure is built. File types, logical
+	names and fileset directories are computed once per fileset and VHDL library.
+
+	:arg stream:     Text stream to write to.
+	:arg design:     Design to export.
+	:arg name:       Name of the EDAM description. Default: the design's name.
+	:arg toplevel:   Toplevel of the EDAM description. Default: the fileset's or design's toplevel.
+	:arg fileSet:    Fileset to export (incl. sub-filesets). Default: all filesets of the design.
+	:arg relativeTo: Directory (e.g. of the EDAM file), file paths are written relative to. Default: resolved paths.
+	"""
+	name = design.Name if name is None else name
+	if toplevel is None:
+		toplevel = fileSet.TopLevel if fileSet is not None else design.TopLevel
+	fileSets = design.FileSets.values() if fileSet is None else (fileSet, )
+
+	write = stream.write
+	write(f'{{\n  "name": {json_dumps(name)},\n')
+	if toplevel is not None:
+		write(f'  "toplevel": {json_dumps(toplevel)},\n')
+	write('  "files": [')
+
+	separator = "\n"
+	fileTypes: Dict[Tuple[type, Nullable[int], FileSet], str] = {}
+	logicalNames: Dict[Any, str] = {}
+	directories: Dict[FileSet, Path] = {}
+	for currentFileSet in fileSets:
+		for file in currentFileSet.Files():
+			# a file type only depends on the file's class and locally set or inherited (fileset) VHDL version
+			# (VHDLVersion isn't hashable, thus its value is used)
+			vhdlVersion = file._vhdlVersion if isinstance(file, VHDLSourceFile) else None
+			key = (type(file), None if vhdlVersion is None else vhdlVersion.value, file._fileSet)
+			try:
+				fileType = fileTypes[key]
+			except KeyError:
+				fileType = fileTypes[key] = _EDAMFileType(file)
+
+			path = file._path
+			if not path.is_absolute():
+				try:
+					directory = directories[file._fileSet]
+				except KeyError:
+					directory = directories[file._fileSet] = file._fileSet.ResolvedPath
+				path = directory / path
+			if relativeTo is not None:
+				path = Path(relpath(path, relativeTo))
+
+			entry = f'    {{"name": {json_dumps(path.as_posix())}, "file_type": "{fileType}"'
+			if isinstance(file, VHDLSourceFile) and (library := file._vhdlLibrary) is not None:
+				try:
+					logicalName = logicalNames[library]
+				except KeyError:
+					logicalName = logicalNames[library] = json_dumps(str(library))
+				entry += f', "logical_name": {logicalName}'
+			if isinstance(file, (VerilogHeaderFile, SystemVerilogHeaderFile)):
+				entry += ', "is_include_file": true'
+
+			write(separator)
+			write(entry)
+			write("}")
+			separator = ",\n"
+
+	write("\n  ],\n")
+	write('  "parameters": {},\n  "tool_options": {}\n}\n')
+
+
+def _EDAMFileType(file: File) -> str:
+	if isinstance(file, VHDLSourceFile):
+		try:
+			version = file.VHDLVersion
+		except Exception:
+			return "vhdlSource"
+
+		for name, vhdlVersion in _VHDL_VERSIONS.items():
+			if vhdlVersion is version:
+				return f"vhdlSource-{name}"
+		return "vhdlSource"
+
+	for fileClass, fileType in _EDAM_FILE_TYPES:
+		if isinstance(file, fileClass):
+			return fileType
+
+	return "user"
+
+
+_VHDL_VERSIONS = {
+	"87":   VHDLVersion.VHDL87,
+	"93":   VHDLVersion.VHDL93,
+	"2008": VHDLVersion.VHDL2008,
+	"2019": VHDLVersion.VHDL2019
+}
+
+_FILE_TYPES = {
+	"verilogSource":       VerilogSourceFile,
+	"verilogHeader":       VerilogHeaderFile,
+	"systemVerilogSource": SystemVerilogSourceFile,
+	"systemVerilogHeader": SystemVerilogHeaderFile,
+	"tclSource":           TCLSourceFile,
+	"xdc":                 XDCConstraintFile,
+	"SDC":                 SDCConstraintFile,
+	"sdc":                 SDCConstraintFile,
+	"cSource":             CSourceFile,
+	"cppSource":           CppSourceFile,
+	"pythonSource":        PythonSourceFile
+}
+
+_INCLUDE_FILE_TYPES = {
+	"verilogSource":       "verilogHeader",
+	"systemVerilogSource": "systemVerilogHeader"
+}
+
+# more specific classes first (header before source classes of the same language)
+_EDAM_FILE_TYPES = (
+	(SystemVerilogHeaderFile, "systemVerilogSource"),
+	(SystemVerilogSourceFile, "systemVerilogSource"),
+	(VerilogHeaderFile,       "verilogSource"),
+	(VerilogSourceFile,       "verilogSource"),
+	(TCLSourceFile,           "tclSource"),
+	(XDCConstraintFile,       "xdc"),
+	(SDCConstraintFile,       "SDC"),
+	(CSourceFile,             "cSource"),
+	(CppSourceFile,           "cppSource"),
+	(PythonSourceFile,        "pythonSource")
+)
@@ -29,11 +29,76 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for `GHDL <https://github.com/ghdl>`__."""
+from shlex   import quote
+from typing  import Iterable, Optional as Nullable, TextIO
+
 from pyTooling.Decorators import export
+from pyVHDLModel          import VHDLVersion
 
-from pyEDAA.ProjectModel import WaveformExchangeFile
+from pyEDAA.ProjectModel import WaveformExchangeFile, Design, FileSet, VHDLSourceFile
 
 
 @export
 class GHDLWaveformFile(WaveformExchangeFile):
 	"""GHDL's waveform file (``*.ghw``) supporting VHDL and Verilog simulation results."""
+
+
+@export
+def WriteAnalysisScript(
+	stream: TextIO,
+	design: Design,
+	fileSet: Nullable[FileSet] = None,
+	executable: str = "ghdl",
+	options: Iterable[str] = ()
+) -> None:
+	"""
+	Write a shell script analyzing all VHDL source files of a design with GHDL.
+
+	Files are written in compile order (see :meth:`~pyEDAA.ProjectModel.Design.IterateCompileOrder`) with one
+	``ghdl -a`` command per file. Non-VHDL files are skipped.
+
+	:arg stream:     Text stream to write to.
+	:arg design:     Design to export.
+	:arg fileSet:    Fileset (incl. sub-filesets) to export. Default: all filesets of the design.
+	:arg executable: Name or path of the GHDL executable.
+	:arg options:    Additional options passed to each analysis command.
+	"""
+	write = stream.write
+	write("#! /usr/bin/env bash\nset -e\n\n")
+
+	prefix = " ".join(quote(item) for item in (executable, "-a", *options))
+	lastVersion = None
+	lastLibrary = None
+	flags = None
+	for file, path, library, vhdlVersion in design.IterateCompileOrder(fileSet):
+		if not isinstance(file, VHDLSourceFile):
+			continue
+
+		# options are only recomputed when VHDL version or library changes
+		if flags is None or vhdlVersion is not lastVersion or library is not lastLibrary:
+			lastVersion = vhdlVersion
+			lastLibrary = library
+			flags = f"{prefix}{_StandardOption(vhdlVersion)} --work={quote('work' if library is None else library.Name)}"
+
+		write(f"{flags} {quote(path.as_posix())}\n")
+
+
+def _StandardOption(vhdlVersion: Nullable[VHDLVersion]) -> str:
+	if vhdlVersion is None:
+		return ""
+
+	for version, option in _STANDARD_OPTIONS:
+		if vhdlVersion is version:
+			return f" --std={option}"
+
+	raise Exception(f"VHDL version '{vhdlVersion}' is not supported by GHDL.")
+
+
+_STANDARD_OPTIONS = (
+	(VHDLVersion.VHDL87,   "87"),
+	(VHDLVersion.VHDL93,   "93"),
+	(VHDLVersion.VHDL2000, "00"),
+	(VHDLVersion.VHDL2002, "02"),
+	(VHDLVersion.VHDL2008, "08"),
+	(VHDLVersion.VHDL2019, "19")
+)
@@ -29,16 +29,393 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for Intel FPGA Quartus Prime."""
-from pyTooling.Decorators import export
+from hashlib import sha256
+from pathlib import Path
+from typing  import Dict, Iterable, List, Optional as Nullable, Set, Tuple
 
-from pyEDAA.ProjectModel import ConstraintFile, ProjectFile, SDCContent, TCLContent
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+from pyVHDLModel           import VHDLVersion
+
+from pyEDAA.ProjectModel     import ConstraintFile, ProjectFile, SDCContent, TCLContent, Project, Design, FileSet, Attribute
+from pyEDAA.ProjectModel     import File, VHDLSourceFile, VerilogSourceFile, SystemVerilogSourceFile
+from pyEDAA.ProjectModel.TCL import TCLEvaluator, SplitList
 
 
 @export
 class QuartusProjectFile(ProjectFile, TCLContent):
-	"""A Quartus project file (``*.qpf``)."""
+	"""
+	A Quartus project file (``*.qpf``).
+
+	Each ``PROJECT_REVISION`` is read from its settings file (``<revision>.qsf``) into a design of the same name.
+	"""
+
+	_qpfProject: Nullable[Project]
+	_revisions:  List[str]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Nullable[Project] = None,
+		design:  Nullable[Design] =  None,
+		fileSet: Nullable[FileSet] = None
+	) -> None:
+		super().__init__(path, project, design, fileSet)
+
+		self._qpfProject = None
+		self._revisions =  []
+
+	@property
+	def ProjectModel(self) -> Project:
+		return self._qpfProject
+
+	@property
+	def Revisions(self) -> List[str]:
+		"""Read-only property returning the list of revision names."""
+		return self._revisions
+
+	def Parse(self) -> None:
+		if not self._path.exists():
+			raise Exception(f"Quartus project file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
+
+		self._qpfProject = Project(self._path.stem, rootDirectory=self._path.parent)
+
+		with self._path.open("r", encoding="utf-8") as file:
+			for line in file:
+				name, _, value = line.partition("=")
+				if name.strip() == "PROJECT_REVISION":
+					self._revisions.append(value.strip().strip('"'))
+
+		for revision in self._revisions:
+			design = Design(revision, project=self._qpfProject)
+			settingsFile = QuartusSettingsFile(self._path.parent / f"{revision}.qsf", project=self._qpfProject, design=design)
+			settingsFile.Parse(design)
+
+
+@export
+class SearchPathsAttribute(Attribute):
+	"""User library directories (``SEARCH_PATH``) searched for design files, include files and IP files."""
+	KEY = "SearchPaths"
+	VALUE_TYPE = List[Path]
+
+
+@export
+class QuartusSettingsFile(ProjectFile, TCLContent):
+	"""
+	A Quartus settings file (``*.qsf``).
+
+	Global assignments are tokenized while reading. Source files, ``SEARCH_PATH`` (as :class:`SearchPathsAttribute` of
+	the default fileset) and ``TOP_LEVEL_ENTITY`` assignments are added to the model. Instance and location (pin)
+	assignments are only kept as lines and indexed on first access.
+	"""
+
+	_qsfProject:          Nullable[Project]
+	_globalAssignments:   Dict[str, str]
+	_searchPaths:         List[Path]
+	_instanceLines:       List[str]
+	_instanceAssignments: Nullable[Dict[str, Dict[str, str]]]
+	_pinAssignments:      Nullable[Dict[str, str]]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Nullable[Project] = None,
+		design:  Nullable[Design] =  None,
+		fileSet: Nullable[FileSet] = None
+	) -> None:
+		super().__init__(path, project, design, fileSet)
+
+		self._qsfProject =          None
+		self._globalAssignments =   {}
+		self._searchPaths =         []
+		self._instanceLines =       []
+		self._instanceAssignments = None
+		self._pinAssignments =      None
+
+	@property
+	def ProjectModel(self) -> Project:
+		return self._qsfProject
+
+	@property
+	def GlobalAssignments(self) -> Dict[str, str]:
+		"""Read-only property returning global assignments, which are not source files (last assignment wins)."""
+		return self._globalAssignments
+
+	@property
+	def SearchPaths(self) -> List[Path]:
+		"""Read-only property returning the list of ``SEARCH_PATH`` directories."""
+		return self._searchPaths
+
+	@property
+	def InstanceAssignments(self) -> Dict[str, Dict[str, str]]:
+		"""Read-only property returning instance assignments as a dictionary of targets (``-to``) to assignments."""
+		if self._instanceAssignments is None:
+			self._IndexInstanceAssignments()
+		return self._instanceAssignments
+
+	@property
+	def PinAssignments(self) -> Dict[str, str]:
+		"""Read-only property returning location assignments as a dictionary of signals to locations (pins)."""
+		if self._pinAssignments is None:
+			self._IndexInstanceAssignments()
+		return self._pinAssignments
+
+	def Parse(self, design: Nullable[Design] = None, resolver: Nullable["QIPResolver"] = None) -> None:
+		"""
+		Read the settings file in a single pass.
+
+		Referenced ``*.qip`` files are resolved into nested filesets of the design's default fileset.
+
+		:arg design:   Design to add files to. If ``None``, a new project is created and its default design is used.
+		:arg resolver: Resolver (and cache) for Quartus IP files. If ``None``, a new resolver is used.
+		"""
+		if not self._path.exists():
+			raise Exception(f"Quartus settings file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
+
+		if design is None:
+			self._qsfProject = Project(self._path.stem, rootDirectory=self._path.parent)
+			design = self._qsfProject.DefaultDesign
+		else:
+			self._qsfProject = design.Project
+
+		files: List[File] = []
+		libraries: Dict[File, str] = {}
+		with self._path.open("r", encoding="utf-8") as file:
+			for lineNumber, line in enumerate(file, start=1):
+				if line.startswith("set_global_assignment"):
+					try:
+						name, value, options = _ParseAssignment(SplitList(line))
+					except Exception as ex:
+						raise Exception(f"Error in Quartus settings file '{self._path!s}' at line {lineNumber}.") from ex
+
+					if (sourceFile := _CreateFile(name, Path(value), options)) is not None:
+						files.append(sourceFile)
+						if isinstance(sourceFile, VHDLSourceFile):
+							libraries[sourceFile] = options.get("-library", "work")
+					elif name == "SEARCH_PATH":
+						self._searchPaths.append(Path(value))
+					else:
+						self._globalAssignments[name] = value
+				elif line.startswith(("set_instance_assignment", "set_location_assignment")):
+					self._instanceLines.append(line)
+
+		fileSet = design.DefaultFileSet
+		fileSet.AddFiles(files)
+		if len(self._searchPaths) > 0:
+			fileSet[SearchPathsAttribute] = self._searchPaths
+		for sourceFile, libraryName in libraries.items():
+			sourceFile.VHDLLibrary = fileSet.GetOrCreateVHDLLibrary(libraryName)
+
+		resolver = QIPResolver() if resolver is None else resolver
+		for sourceFile in files:
+			if isinstance(sourceFile, QIPFile):
+				resolver.Resolve(sourceFile)
+
+		if (topLevel := self._globalAssignments.get("TOP_LEVEL_ENTITY")) is not None:
+			fileSet.TopLevel = topLevel
+		if (vhdlVersion := self._globalAssignments.get("VHDL_INPUT_VERSION")) is not None:
+			design.VHDLVersion = _ParseVHDLVersion(vhdlVersion)
+
+	def _IndexInstanceAssignments(self) -> None:
+		instanceAssignments: Dict[str, Dict[str, str]] = {}
+		pinAssignments: Dict[str, str] = {}
+		for line in self._instanceLines:
+			name, value, options = _ParseAssignment(SplitList(line))
+			target = options.get("-to")
+			if name is None:
+				pinAssignments[target] = value
+			else:
+				try:
+					instanceAssignments[target][name] = value
+				except KeyError:
+					instanceAssignments[target] = {name: value}
+
+		self._instanceAssignments = instanceAssignments
+		self._pinAssignments = pinAssignments
+
+
+@export
+class QIPFile(ProjectFile, TCLContent):
+	"""A Quartus IP file (``*.qip``) or simulation IP file (``*.sip``)."""
+
+
+@export
+class QIPResolver(metaclass=ExtendedType, slots=True):
+	"""
+	Resolves Quartus IP files (``*.qip``, ``*.sip``) recursively into nested filesets.
+
+	Each IP file becomes a fileset named after its path, which is a child of the fileset of the referencing file.
+	Path expressions like ``[file join $::quartus(qip_path) ...]`` are evaluated relative to the IP file. Read IP
+	files are memoized by resolved path and by content hash, so a resolver can be shared between designs and projects.
+	An IP file referenced multiple times within a design is expanded only once.
+	"""
+
+	_byPath:   Dict[Path, Tuple[str, List[Tuple[str, str, Dict[str, str]]]]]
+	_byHash:   Dict[str, List[Tuple[str, str, Dict[str, str]]]]
+	_expanded: Dict[Design, Set[Path]]
+
+	def __init__(self) -> None:
+		self._byPath =   {}
+		self._byHash =   {}
+		self._expanded = {}
+
+	@property
+	def CachedFileCount(self) -> int:
+		"""Read-only property returning the number of distinct IP file contents read so far."""
+		return len(self._byHash)
+
+	def Resolve(self, qipFile: QIPFile) -> Nullable[FileSet]:
+		"""
+		Resolve an IP file, which is part of a fileset, into a nested fileset.
+
+		:arg qipFile: IP file to resolve.
+		:returns:     The created fileset or ``None``, if the IP file was already expanded in this design.
+		"""
+		parent = qipFile.FileSet
+		if parent is None:
+			raise Exception(f"Quartus IP file '{qipFile.Path!s}' is not part of a fileset.")
+
+		return self._Expand(qipFile.Path, parent, [])
+
+	def _Expand(self, path: Path, parent: FileSet, stack: List[Path]) -> Nullable[FileSet]:
+		directory = parent.ResolvedPath
+		resolvedPath = (directory / path).resolve()
+		if resolvedPath in stack:
+			chain = " -> ".join(str(item) for item in (*stack[stack.index(resolvedPath):], resolvedPath))
+			raise Exception(f"Cyclic reference between Quartus IP files: {chain}")
+
+		expanded = self._expanded.setdefault(parent.Design, set())
+		if resolvedPath in expanded:
+			return None
+		expanded.add(resolvedPath)
+
+		fileSet = FileSet(str(path), directory=path.parent)
+		parent.AddFileSet(fileSet)
+		fileSet.Design = parent.Design
+
+		files = []
+		libraries = {}
+		nested = []
+		for name, value, options in self._Read(resolvedPath):
+			if (file := _CreateFile(name, Path(value), options)) is None:
+				continue
+
+			files.append(file)
+			if isinstance(file, VHDLSourceFile):
+				libraries[file] = options.get("-library", "work")
+			elif isinstance(file, QIPFile):
+				nested.append(file)
+
+		fileSet.AddFiles(files)
+		for file, libraryName in libraries.items():
+			file.VHDLLibrary = fileSet.GetOrCreateVHDLLibrary(libraryName)
+
+		stack.append(resolvedPath)
+		for file in nested:
+			self._Expand(file.Path, fileSet, stack)
+		stack.pop()
+
+		return fileSet
+
+	def _Read(self, path: Path) -> List[Tuple[str, str, Dict[str, str]]]:
+		if not path.exists():
+			raise Exception(f"Quartus IP file '{path!s}' not found.") from FileNotFoundError(f"File '{path!s}' not found.")
+
+		content = path.read_bytes()
+		contentHash = sha256(content).hexdigest()
+		try:
+			cachedHash, assignments = self._byPath[path]
+			if cachedHash == contentHash:
+				return assignments
+		except KeyError:
+			pass
+
+		try:
+			assignments = self._byHash[contentHash]
+		except KeyError:
+			assignments = []
+			evaluator = TCLEvaluator(path.parent, {"quartus(qip_path)": "."})
+			try:
+				for line, words in evaluator.IterateCommands(content.decode("utf-8").splitlines(keepends=True)):
+					if words[0] == "set_global_assignment":
+						try:
+							name, value, options = _ParseAssignment([evaluator.Evaluate(word) for word in words])
+						except Exception as ex:
+							raise Exception(f"Error in Quartus IP file '{path!s}' at line {line}.") from ex
+
+						if name in _FILE_ASSIGNMENTS:
+							assignments.append((name, value, options))
+			except Exception as ex:
+				raise Exception(f"Error while reading Quartus IP file '{path!s}'.") from ex
+
+			self._byHash[contentHash] = assignments
+
+		self._byPath[path] = (contentHash, assignments)
+		return assignments
 
 
 @export
 class SDCConstraintFile(ConstraintFile, SDCContent):
 	"""A Quartus constraint file (Synopsys Design Constraints; ``*.sdc``)."""
+
+
+_FILE_ASSIGNMENTS =   ("VHDL_FILE", "VERILOG_FILE", "SYSTEMVERILOG_FILE", "SDC_FILE", "QIP_FILE", "SIP_FILE")
+_OPTIONS_WITH_VALUE = ("-name", "-to", "-from", "-section_id", "-library", "-hdl_version", "-entity", "-tag", "-comment")
+
+
+def _ParseAssignment(words: List[str]) -> Tuple[Nullable[str], str, Dict[str, str]]:
+	"""
+	Split the words of a ``set_*_assignment`` command.
+
+	:arg words: Words of the command.
+	:returns:   A tuple of assignment name (``None`` for location assignments), value and options.
+	"""
+	options = {}
+	value = ""
+	i = 1
+	count = len(words)
+	while i < count:
+		word = words[i]
+		if word in _OPTIONS_WITH_VALUE:
+			options[word] = words[i + 1]
+			i += 2
+		else:
+			if not word.startswith("-"):
+				value = word
+			i += 1
+
+	return options.get("-name"), value, options
+
+
+def _CreateFile(name: str, path: Path, options: Dict[str, str]) -> Nullable[File]:
+	if name == "VHDL_FILE":
+		file = VHDLSourceFile(path)
+		if (hdlVersion := options.get("-hdl_version")) is not None:
+			file.VHDLVersion = _ParseVHDLVersion(hdlVersion)
+	elif name == "VERILOG_FILE":
+		file = VerilogSourceFile(path)
+	elif name == "SYSTEMVERILOG_FILE":
+		file = SystemVerilogSourceFile(path)
+	elif name == "SDC_FILE":
+		file = SDCConstraintFile(path)
+	elif name in ("QIP_FILE", "SIP_FILE"):
+		file = QIPFile(path)
+	else:
+		return None
+
+	return file
+
+
+def _ParseVHDLVersion(value: str) -> VHDLVersion:
+	try:
+		return _VHDL_VERSIONS[value]
+	except KeyError as ex:
+		raise Exception(f"Unknown Quartus VHDL version '{value}'.") from ex
+
+
+_VHDL_VERSIONS = {
+	"VHDL_1987": VHDLVersion.VHDL87,
+	"VHDL_1993": VHDLVersion.VHDL93,
+	"VHDL_2008": VHDLVersion.VHDL2008,
+	"VHDL_2019": VHDLVersion.VHDL2019
+}
@@ -0,0 +1,207 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Inference of VHDL library dependencies from file dependencies.
+
+Each edge in :attr:`Design._fileDependencyGraph` between files of different VHDL libraries implies a dependency between
+these libraries. A :class:`LibraryDependencyInference` collapses file edges onto library edges in
+:attr:`Design._vhdlLibraryDependencyGraph` and keeps them up-to-date when files or file dependencies change. Inferred
+library edges carry the inference as edge value. Library dependencies declared by hand (e.g. via
+:meth:`VHDLLibrary.AddDependency`) are preserved.
+"""
+from itertools import chain
+from typing    import Dict, List, Optional as Nullable, Tuple
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Graph       import Edge
+
+from pyEDAA.ProjectModel import Design, File, VHDLLibrary, VHDLSourceFile
+
+
+_LibraryPair = Tuple[VHDLLibrary, VHDLLibrary]
+
+
+@export
+class LibraryDependencyInference(metaclass=ExtendedType, slots=True):
+	"""
+	Derives a design's VHDL library dependency graph from its file dependency graph.
+
+	For each library edge, the number of supporting file edges is counted. A library edge is created when its first
+	supporting file edge appears and removed when its last supporting file edge disappears, unless the library edge
+	existed before or was declared by hand in the meantime (:meth:`VHDLLibrary.AddDependency` resets the edge value).
+
+	A file's effective VHDL library is the library set on the file, otherwise the library of its fileset. Files without
+	a VHDL library (e.g. Verilog files) don't contribute library edges.
+	"""
+
+	_design:        Design
+	_fileLibraries: Dict[File, Nullable[VHDLLibrary]]
+	_contributions: Dict[Edge, _LibraryPair]
+	_supportCounts: Dict[_LibraryPair, int]
+	_inferredEdges: Dict[_LibraryPair, Edge]
+
+	def __init__(self, design: Design) -> None:
+		"""
+		Initializes the inference and derives the library dependencies of a design.
+
+		:arg design: The design.
+		"""
+		self._design =        design
+		self._fileLibraries = {}
+		self._contributions = {}
+		self._supportCounts = {}
+		self._inferredEdges = {}
+
+		self.Update()
+
+	@property
+	def Design(self) -> Design:
+		return self._design
+
+	@property
+	def Dependencies(self) -> List[_LibraryPair]:
+		"""List of library dependencies (dependent, dependency) supported by at least one file dependency."""
+		return list(self._supportCounts.keys())
+
+	def SupportingFileDependencies(self, library: VHDLLibrary, dependency: VHDLLibrary) -> List[Tuple[File, File]]:
+		"""
+		Return the file dependencies causing a library dependency.
+
+		:arg library:    The dependent VHDL library.
+		:arg dependency: The VHDL library *library* depends on.
+		:returns:        List of file pairs (dependent file, dependency).
+		"""
+		return [
+			(edge.Source.Value, edge.Destination.Value) for edge, (source, destination) in self._contributions.items()
+			if source is library and destination is dependency
+		]
+
+	def Update(self) -> None:
+		"""
+		Resynchronize the library dependencies with the file dependency graph.
+
+		All effective libraries and file edges are re-evaluated in linear time, but only library edges, whose support
+		changed, are created or removed.
+		"""
+		self._fileLibraries = {}
+
+		current: Dict[Edge, _LibraryPair] = {}
+		for edge in self._design._fileDependencyGraph.IterateEdges():
+			if (pair := self._GetLibraryPair(edge)) is not None:
+				current[edge] = pair
+
+		for edge, pair in list(self._contributions.items()):
+			if (newPair := current.get(edge)) is None or newPair[0] is not pair[0] or newPair[1] is not pair[1]:
+				self._RemoveContribution(edge)
+		for edge, pair in current.items():
+			if edge not in self._contributions:
+				self._AddContribution(edge, pair)
+
+	def AddFileDependency(self, file: File, dependency: File) -> None:
+		"""
+		Add a dependency between two files to the design and update the library dependencies incrementally.
+
+		:arg file:       The dependent file.
+		:arg dependency: The file *file* depends on.
+		"""
+		self._design.AddFileDependency(file, dependency)
+		for edge in file._dependencyNode.IterateOutboundEdges():
+			if edge.Destination is dependency._dependencyNode:
+				self._UpdateContribution(edge)
+				break
+
+	def UpdateFile(self, file: File) -> None:
+		"""
+		Update the library dependencies incrementally after a file's VHDL library changed.
+
+		:arg file: The changed file.
+		"""
+		self._fileLibraries.pop(file, None)
+		if (vertex := file._dependencyNode) is None:
+			return
+
+		for edge in chain(vertex.IterateOutboundEdges(), vertex.IterateInboundEdges()):
+			self._UpdateContribution(edge)
+
+	def _GetLibrary(self, file: File) -> Nullable[VHDLLibrary]:
+		try:
+			return self._fileLibraries[file]
+		except KeyError:
+			pass
+
+		library = None
+		if isinstance(file, VHDLSourceFile):
+			try:
+				library = file.VHDLLibrary
+			except Exception:
+				pass
+			# Libraries of other designs (or not assigned to a design) have no vertex in this design's library graph.
+			if library is not None and (library._dependencyNode is None or library._dependencyNode.Graph is not self._design._vhdlLibraryDependencyGraph):
+				library = None
+
+		self._fileLibraries[file] = library
+		return library
+
+	def _GetLibraryPair(self, edge: Edge) -> Nullable[_LibraryPair]:
+		source = self._GetLibrary(edge.Source.Value)
+		destination = self._GetLibrary(edge.Destination.Value)
+		if source is None or destination is None or source is destination:
+			return None
+
+		return source, destination
+
+	def _UpdateContribution(self, edge: Edge) -> None:
+		pair = self._GetLibraryPair(edge)
+		oldPair = self._contributions.get(edge)
+		if oldPair is not None:
+			if pair is not None and pair[0] is oldPair[0] and pair[1] is oldPair[1]:
+				return
+			self._RemoveContribution(edge)
+		if pair is not None:
+			self._AddContribution(edge, pair)
+
+	def _AddContribution(self, edge: Edge, pair: _LibraryPair) -> None:
+		self._contributions[edge] = pair
+		count = self._supportCounts.get(pair, 0)
+		self._supportCounts[pair] = count + 1
+		if count == 0:
+			source, destination = pair[0]._dependencyNode, pair[1]._dependencyNode
+			if not source.HasEdgeToDestination(destination):
+				self._inferredEdges[pair] = source.EdgeToVertex(destination, edgeValue=self)
+
+	def _RemoveContribution(self, edge: Edge) -> None:
+		pair = self._contributions.pop(edge)
+		count = self._supportCounts.pop(pair) - 1
+		if count > 0:
+			self._supportCounts[pair] = count
+		elif (libraryEdge := self._inferredEdges.pop(pair, None)) is not None and libraryEdge.Value is self:
+			libraryEdge.Delete()
@@ -29,21 +29,327 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for Mentor Graphics ModelSim."""
+from os.path import expandvars
+from pathlib import Path
+from typing  import Dict, Generator, List, Optional as Nullable, TextIO, Tuple
+
 from pyTooling.Decorators import export
+from pyVHDLModel          import VHDLVersion
 
-from pyEDAA.ProjectModel import ProjectFile, SettingFile, INIContent, WaveformConfigFile, TCLContent
+from pyEDAA.ProjectModel     import ProjectFile, SettingFile, INIContent, WaveformConfigFile, TCLContent, Project, Design, FileSet
+from pyEDAA.ProjectModel     import File, VHDLSourceFile, VerilogSourceFile, SystemVerilogSourceFile, ExternalVHDLLibrary
+from pyEDAA.ProjectModel.TCL import SplitList, FormatList
 
 
 @export
-class ModelSimProjectFile(ProjectFile):
-	pass
+class ModelSimProjectFile(ProjectFile, INIContent):
+	"""
+	A ModelSim project file (``*.mpf``).
+
+	Files listed in section ``[Project]`` are added in compile order to the default fileset. Library mappings of
+	section ``[Library]``, which are not compiled by the project, are added as external VHDL libraries.
+	"""
+
+	_mpfProject:      Nullable[Project]
+	_libraryMappings: Nullable[Dict[str, Path]]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Nullable[Project] = None,
+		design:  Nullable[Design] =  None,
+		fileSet: Nullable[FileSet] = None
+	) -> None:
+		super().__init__(path, project, design, fileSet)
+
+		self._mpfProject =      None
+		self._libraryMappings = None
+
+	@property
+	def ProjectModel(self) -> Project:
+		return self._mpfProject
+
+	@property
+	def LibraryMappings(self) -> Dict[str, Path]:
+		"""Read-only property returning the library mappings (incl. chained ``others`` mappings) read by :meth:`Parse`."""
+		return self._libraryMappings
+
+	def Parse(self) -> None:
+		"""Read the project file in a single streaming pass and create a project model."""
+		path = self._path
+		if not path.exists():
+			raise Exception(f"ModelSim project file '{path!s}' not found.") from FileNotFoundError(f"File '{path!s}' not found.")
+
+		mappings = {}
+		others = None
+		defaultLibrary = "work"
+		filePaths: Dict[str, str] = {}
+		fileProperties: Dict[str, str] = {}
+		for section, key, value in _IterateINI(path):
+			if section == "Library":
+				if key == "others":
+					others = value
+				else:
+					mappings[key] = value
+			elif section == "Project":
+				if key.startswith("Project_File_P_"):
+					fileProperties[key[15:]] = value
+				elif key.startswith("Project_File_"):
+					filePaths[key[13:]] = value
+				elif key == "Project_DefaultLib":
+					defaultLibrary = value
+
+		self._libraryMappings = _ResolveLibraryMappings(path.resolve(), mappings, others, [])
+
+		self._mpfProject = Project(path.stem, rootDirectory=path.parent)
+		design = self._mpfProject.DefaultDesign
+		fileSet = design.DefaultFileSet
+
+		entries: List[Tuple[int, File, Nullable[str]]] = []
+		for index, filePath in filePaths.items():
+			properties = _ParseFileProperties(fileProperties.get(index, ""))
+			file, libraryName = self._CreateFile(Path(expandvars(filePath)), properties, defaultLibrary)
+			entries.append((int(properties.get("compile_order", index)), file, libraryName))
+		entries.sort(key=lambda entry: entry[0])
+
+		fileSet.AddFiles(file for _, file, _ in entries)
+		for _, file, libraryName in entries:
+			if libraryName is not None:
+				file.VHDLLibrary = fileSet.GetOrCreateVHDLLibrary(libraryName)
+
+		AddExternalVHDLLibraries(design, self._libraryMappings)
+
+	@staticmethod
+	def _CreateFile(path: Path, properties: Dict[str, str], defaultLibrary: str) -> Tuple[File, Nullable[str]]:
+		fileType = properties.get("file_type")
+		if fileType == "vhdl":
+			file = VHDLSourceFile(path)
+			if (version := properties.get("vhdl_use93")) is not None:
+				try:
+					file.VHDLVersion = _VHDL_VERSIONS[version]
+				except KeyError as ex:
+					raise Exception(f"Unknown VHDL version '{version}' for file '{path!s}'.") from ex
+			return file, properties.get("compile_to", defaultLibrary)
+		elif fileType == "verilog":
+			if path.suffix in (".sv", ".svh"):
+				return SystemVerilogSourceFile(path), None
+			return VerilogSourceFile(path), None
+		elif fileType == "systemverilog":
+			return SystemVerilogSourceFile(path), None
+
+		return File(path), None
 
 
 @export
 class ModelSimINIFile(SettingFile, INIContent):
-	pass
+	"""
+	A ModelSim settings file (``modelsim.ini``).
+
+	Library mappings in section ``[Library]`` are resolved on first access including ``others`` chaining, where mappings
+	of the referencing file take precedence. Resolved mappings are cached per file and reused until a file in the chain
+	changes.
+	"""
+
+	_libraryMappings: Nullable[Dict[str, Path]]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Nullable[Project] = None,
+		design:  Nullable[Design] =  None,
+		fileSet: Nullable[FileSet] = None
+	) -> None:
+		super().__init__(path, project, design, fileSet)
+
+		self._libraryMappings = None
+
+	@property
+	def LibraryMappings(self) -> Dict[str, Path]:
+		"""Read-only property returning the resolved library mappings (incl. chained ``others`` mappings)."""
+		if self._libraryMappings is None:
+			if not self._path.exists():
+				raise Exception(f"ModelSim settings file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
+
+			self._libraryMappings = _ReadLibraryMappings(self._path.resolve(), [])
+		return self._libraryMappings
+
+	def AddExternalVHDLLibraries(self, design: Design) -> None:
+		"""
+		Add all mapped libraries, which are not compiled by the design, as external VHDL libraries to a design.
+
+		:arg design: The design to add external VHDL libraries to.
+		"""
+		AddExternalVHDLLibraries(design, self.LibraryMappings)
 
 
 @export
 class WaveDoFile(WaveformConfigFile, TCLContent):
 	pass
+
+
+@export
+def AddExternalVHDLLibraries(design: Design, mappings: Dict[str, Path]) -> None:
+	"""
+	Add library mappings as external VHDL libraries to a design.
+
+	Mappings of libraries compiled by the design itself and libraries already added as external VHDL libraries are
+	skipped.
+
+	:arg design:   The design to add external VHDL libraries to.
+	:arg mappings: A dictionary of library names to library paths.
+	"""
+	knownLibraries = set(design.VHDLLibraries.keys())
+	knownLibraries.update(library.Name for library in design.ExternalVHDLLibraries)
+	design.ExternalVHDLLibraries.extend(
+		ExternalVHDLLibrary(name, path) for name, path in mappings.items() if name not in knownLibraries
+	)
+
+
+@export
+def WriteCompileScript(stream: TextIO, design: Design, fileSet: Nullable[FileSet] = None, mapLibraries: bool = True) -> None:
+	"""
+	Write a ModelSim/QuestaSim do-file (TCL) compiling all source files of a design.
+
+	Files are written in compile order (see :meth:`~pyEDAA.ProjectModel.Design.IterateCompileOrder`). Each library is
+	created by ``vlib`` (and ``vmap``) before its first file. VHDL files are compiled by ``vcom``, Verilog and
+	SystemVerilog files by ``vlog`` into library ``work``. Other files are skipped.
+
+	:arg stream:       Text stream to write to.
+	:arg design:       Design to export.
+	:arg fileSet:      Fileset (incl. sub-filesets) to export. Default: all filesets of the design.
+	:arg mapLibraries: If true, emit a ``vmap`` command per library.
+	"""
+	write = stream.write
+	libraries = set()
+	lastVersion = None
+	lastLibrary = None
+	command = None
+	for file, path, library, vhdlVersion in design.IterateCompileOrder(fileSet):
+		if isinstance(file, VHDLSourceFile):
+			libraryName = "work" if library is None else library.Name
+			if command is None or vhdlVersion is not lastVersion or library is not lastLibrary:
+				lastVersion = vhdlVersion
+				lastLibrary = library
+				command = f"vcom{_VersionOption(vhdlVersion)} -work {FormatList((libraryName, ))}"
+			fileCommand = command
+		elif isinstance(file, SystemVerilogSourceFile):
+			libraryName = "work"
+			fileCommand = "vlog -sv -work work"
+		elif isinstance(file, VerilogSourceFile):
+			libraryName = "work"
+			fileCommand = "vlog -work work"
+		else:
+			continue
+
+		if libraryName not in libraries:
+			libraries.add(libraryName)
+			quotedName = FormatList((libraryName, ))
+			write(f"vlib {quotedName}\n")
+			if mapLibraries:
+				write(f"vmap {quotedName} {quotedName}\n")
+
+		write(f"{fileCommand} {FormatList((path.as_posix(), ))}\n")
+
+
+def _VersionOption(vhdlVersion: Nullable[VHDLVersion]) -> str:
+	if vhdlVersion is None:
+		return ""
+
+	for option, version in _VHDL_VERSIONS.items():
+		if vhdlVersion is version:
+			return f" -{option}"
+
+	raise Exception(f"VHDL version '{vhdlVersion}' is not supported by ModelSim.")
+
+
+_VHDL_VERSIONS = {
+	"87":   VHDLVersion.VHDL87,
+	"93":   VHDLVersion.VHDL93,
+	"2002": VHDLVersion.VHDL2002,
+	"2008": VHDLVersion.VHDL2008,
+	"2019": VHDLVersion.VHDL2019
+}
+
+#: Cache of resolved library mappings per file: modification times of all files in the ``others`` chain and mappings.
+_LIBRARY_MAPPINGS: Dict[Path, Tuple[Tuple[Tuple[Path, int], ...], Dict[str, Path]]] = {}
+
+
+def _IterateINI(path: Path) -> Generator[Tuple[str, str, str], None, None]:
+	"""
+	Read an INI-style file line by line.
+
+	:arg path: Path to the INI file.
+	:returns:  A generator of tuples of section, key and value.
+	"""
+	section = ""
+	with path.open("r", encoding="utf-8", errors="replace") as file:
+		for line in file:
+			line = line.strip()
+			if line == "" or line[0] in ";#":
+				continue
+			elif line[0] == "[":
+				section = line[1:line.find("]")]
+			else:
+				key, separator, value = line.partition("=")
+				if separator != "":
+					yield section, key.strip(), value.strip()
+
+
+def _ParseFileProperties(value: str) -> Dict[str, str]:
+	items = SplitList(value)
+	return {items[i]: items[i + 1] for i in range(0, len(items) - 1, 2)}
+
+
+def _ReadLibraryMappings(path: Path, stack: List[Path]) -> Dict[str, Path]:
+	try:
+		dependencies, mappings = _LIBRARY_MAPPINGS[path]
+		if all(dependency.stat().st_mtime_ns == mtime for dependency, mtime in dependencies):
+			return mappings
+	except (KeyError, FileNotFoundError):
+		pass
+
+	localMappings = {}
+	others = None
+	for section, key, value in _IterateINI(path):
+		if section == "Library":
+			if key == "others":
+				others = value
+			else:
+				localMappings[key] = value
+
+	return _ResolveLibraryMappings(path, localMappings, others, stack)
+
+
+def _ResolveLibraryMappings(path: Path, localMappings: Dict[str, str], others: Nullable[str], stack: List[Path]) -> Dict[str, Path]:
+	"""
+	Resolve library mappings of an INI file and cache them.
+
+	:arg path:          Resolved path of the INI file.
+	:arg localMappings: Unresolved mappings of the INI file.
+	:arg others:        Unresolved path of the chained INI file or ``None``.
+	:arg stack:         INI files currently being resolved (for cycle detection).
+	:returns:           A dictionary of library names to library paths.
+	"""
+	if path in stack:
+		chain = " -> ".join(str(item) for item in (*stack[stack.index(path):], path))
+		raise Exception(f"Cyclic 'others' reference between ModelSim settings files: {chain}")
+
+	dependencies = [(path, path.stat().st_mtime_ns)]
+	mappings = {}
+	if others is not None and "$" not in (othersValue := expandvars(others)):
+		othersPath = (path.parent / othersValue).resolve()
+		if not othersPath.exists():
+			raise Exception(f"ModelSim settings file '{othersPath!s}' referenced by '{path!s}' not found.") from FileNotFoundError(f"File '{othersPath!s}' not found.")
+
+		stack.append(path)
+		mappings.update(_ReadLibraryMappings(othersPath, stack))
+		stack.pop()
+		dependencies.extend(_LIBRARY_MAPPINGS[othersPath][0])
+
+	for name, value in localMappings.items():
+		value = expandvars(value)
+		# keep mappings with unresolved variables (e.g. $MODEL_TECH) as they are
+		mappings[name] = Path(value) if "$" in value else path.parent / value
+
+	_LIBRARY_MAPPINGS[path] = (tuple(dependencies), mappings)
+	return mappings
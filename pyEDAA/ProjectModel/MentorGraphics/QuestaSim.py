@@ -31,19 +31,22 @@
 """Specific file types and attributes for Mentor Graphics QuestaSim."""
 from pyTooling.Decorators import export
 
-from pyEDAA.ProjectModel import ProjectFile, SettingFile, INIContent, WaveformConfigFile, TCLContent
+from pyEDAA.ProjectModel.MentorGraphics.ModelSim import ModelSimProjectFile as ModelSim_ModelSimProjectFile
+from pyEDAA.ProjectModel.MentorGraphics.ModelSim import ModelSimINIFile as ModelSim_ModelSimINIFile
+from pyEDAA.ProjectModel.MentorGraphics.ModelSim import WaveDoFile as ModelSim_WaveDoFile
+from pyEDAA.ProjectModel.MentorGraphics.ModelSim import WriteCompileScript
 
 
 @export
-class ModelSimProjectFile(ProjectFile):
-	pass
+class ModelSimProjectFile(ModelSim_ModelSimProjectFile):
+	"""A QuestaSim project file (``*.mpf``)."""
 
 
 @export
-class ModelSimINIFile(SettingFile, INIContent):
-	pass
+class ModelSimINIFile(ModelSim_ModelSimINIFile):
+	"""A QuestaSim settings file (``modelsim.ini``)."""
 
 
 @export
-class WaveDoFile(WaveformConfigFile, TCLContent):
+class WaveDoFile(ModelSim_WaveDoFile):
 	pass
@@ -0,0 +1,161 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Generation of `Ninja <https://ninja-build.org/>`__ build files for incremental and parallel analysis of a design.
+
+Each file becomes one build edge producing a stamp file. An edge depends on the stamp files of all files it depends on
+according to the design's file dependency graph. Files without vertex in that graph depend on the VHDL libraries their
+VHDL library depends on (see the design's VHDL library dependency graph) and on the previous file of the same VHDL
+library (compile order).
+"""
+from hashlib import sha1
+from pathlib import Path
+from typing  import Dict, List, Optional as Nullable, Set, TextIO, Tuple, Type
+
+from pyTooling.Decorators import export
+from pyVHDLModel          import VHDLVersion
+
+from pyEDAA.ProjectModel import Design, FileSet, File, VHDLLibrary, VHDLSourceFile
+
+
+@export
+def WriteNinjaFile(
+	stream: TextIO,
+	design: Design,
+	rules: Dict[Type[File], str],
+	fileSet: Nullable[FileSet] = None,
+	stampDirectory: Path = Path("stamps")
+) -> None:
+	"""
+	Write a Ninja build file analyzing all files of a design.
+
+	Rules are selected per file by the first matching file class in *rules*. Files without matching rule are skipped.
+	A command template can use Ninja's variables ``$in`` (the source file) and ``$out`` (the stamp file) as well as
+	the per-file variables ``$library`` (VHDL library, default ``work``), ``$vhdlversion`` (e.g. ``2008``) and ``$std``
+	(e.g. ``08``). A command must update ``$out`` on success. All rules are declared with ``restat = 1``, so a command
+	which keeps ``$out`` unchanged (e.g. because the analysis result didn't change) stops the propagation to dependent
+	files.
+
+	:arg stream:         Text stream to write to.
+	:arg design:         Design to export.
+	:arg rules:          A dictionary of file classes to command templates.
+	:arg fileSet:        Fileset (incl. sub-filesets) to export. Default: all filesets of the design.
+	:arg stampDirectory: Directory for stamp files.
+	"""
+	ruleNames: Dict[Type[File], str] = {}
+	write = stream.write
+	write("# Generated by pyEDAA.ProjectModel\nninja_required_version = 1.5\n\n")
+	for fileClass, command in rules.items():
+		ruleName = ruleNames[fileClass] = f"analyze_{fileClass.__name__}"
+		write(f"rule {ruleName}\n  command = {command}\n  description = {fileClass.__name__} $in\n  restat = 1\n\n")
+
+	# First pass: select rule and stamp file per file (only references are kept).
+	entries: List[Tuple[File, str, str, Nullable[VHDLLibrary], Nullable[VHDLVersion]]] = []
+	stamps: Dict[File, str] = {}
+	emittedLibraries: Set[VHDLLibrary] = set()
+	for file, path, library, vhdlVersion in design.IterateCompileOrder(fileSet):
+		for fileClass, ruleName in ruleNames.items():
+			if isinstance(file, fileClass):
+				break
+		else:
+			continue
+
+		posixPath = path.as_posix()
+		stamps[file] = _Escape(_StampPath(stampDirectory, posixPath, library))
+		if isinstance(file, VHDLSourceFile) and library is not None:
+			emittedLibraries.add(library)
+		entries.append((file, ruleName, posixPath, library, vhdlVersion))
+
+	# Second pass: stream one build edge per file.
+	libraryStamps: Dict[Nullable[VHDLLibrary], List[str]] = {}
+	previousStamps: Dict[Nullable[VHDLLibrary], str] = {}
+	for file, ruleName, posixPath, library, vhdlVersion in entries:
+		stamp = stamps[file]
+		isVHDL = isinstance(file, VHDLSourceFile)
+
+		if file._dependencyNode is not None:
+			inputs = [stamps[dependency] for dependency in _IterateDependencies(file) if dependency in stamps]
+		else:
+			inputs = []
+			if isVHDL:
+				if (previousStamp := previousStamps.get(library)) is not None:
+					inputs.append(previousStamp)
+				if library is not None and library._dependencyNode is not None:
+					# Libraries without exported files (e.g. filtered by fileset) are expected to be analyzed already.
+					inputs.extend(
+						_LibraryTarget(dependency.Value) for dependency in library._dependencyNode.IterateSuccessorVertices()
+						if dependency.Value in emittedLibraries
+					)
+
+		write(f"build {stamp}: {ruleName} {_Escape(posixPath)}")
+		if len(inputs) > 0:
+			write(" | ")
+			write(" ".join(inputs))
+		write("\n")
+		if isVHDL:
+			write(f"  library = {'work' if library is None else library.Name}\n")
+			if vhdlVersion is not None:
+				year = vhdlVersion.value if vhdlVersion.value >= 1000 else 1900 + vhdlVersion.value
+				write(f"  vhdlversion = {year}\n  std = {year % 100:02d}\n")
+
+			previousStamps[library] = stamp
+			try:
+				libraryStamps[library].append(stamp)
+			except KeyError:
+				libraryStamps[library] = [stamp]
+
+	write("\n")
+	for library, libraryStampList in libraryStamps.items():
+		if library is not None:
+			write(f"build {_LibraryTarget(library)}: phony {' '.join(libraryStampList)}\n")
+	write(f"\nbuild all: phony {' '.join(stamps.values())}\ndefault all\n")
+
+
+def _IterateDependencies(file: File):
+	for vertex in file._dependencyNode.IterateSuccessorVertices():
+		yield vertex.Value
+
+
+def _LibraryTarget(library: VHDLLibrary) -> str:
+	return _Escape(f"library_{library.Name}")
+
+
+def _StampPath(stampDirectory: Path, posixPath: str, library: Nullable[VHDLLibrary]) -> str:
+	"""Return a stamp file path, which is stable across runs and unique per source file."""
+	name = posixPath.rpartition("/")[2]
+	digest = sha1(posixPath.encode("utf-8")).hexdigest()[:12]
+	libraryName = "work" if library is None else library.Name
+	return (stampDirectory / libraryName / f"{name}.{digest}.stamp").as_posix()
+
+
+def _Escape(path: str) -> str:
+	"""Escape a path for use in a Ninja build statement."""
+	return path.replace("$", "$$").replace(" ", "$ ").replace(":", "$:")
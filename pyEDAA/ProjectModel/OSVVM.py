@@ -34,7 +34,7 @@ from pathlib import Path
 from pyTooling.Decorators import export
 from typing import Optional as Nullable, List
 
-from pyEDAA.ProjectModel import ProjectFile, TCLContent, Project, Design, FileSet, VHDLLibrary, VHDLSourceFile
+from pyEDAA.ProjectModel import ProjectFile, TCLContent, Project, Design, FileSet, VHDLLibrary, VHDLSourceFile, Testbench
 
 
 @export
@@ -90,6 +90,28 @@ class OSVVMProjectFile(ProjectFile, TCLContent):
 		def VHDLSourceFile(self) -> VHDLSourceFile:
 			return self._vhdlSourceFile
 
+	class RunTest(Analyze):
+		"""Analyze a testbench file and simulate the entity named like the file."""
+
+		@property
+		def Testbench(self) -> Testbench:
+			return Testbench(self._vhdlSourceFile.Path.stem, self._vhdlSourceFile)
+
+	class Simulate(Instruction):
+		_testbenchName: str
+
+		def __init__(self, line: int, parameterText: str):
+			super().__init__(line)
+			parameters = parameterText.split()
+			if len(parameters) == 0:
+				raise ValueError(f"Missing testbench name in 'simulate' instruction in line {line}.")
+
+			self._testbenchName = parameters[0]
+
+		@property
+		def Testbench(self) -> Testbench:
+			return Testbench(self._testbenchName)
+
 	class Library(Instruction):
 		_vhdlLibrary: VHDLLibrary
 
@@ -126,6 +148,10 @@ class OSVVMProjectFile(ProjectFile, TCLContent):
 					instruction.Parse(self._fileSet)
 				elif isinstance(instruction, OSVVMProjectFile.Analyze):
 					self._fileSet.AddFile(instruction.VHDLSourceFile)
+					if isinstance(instruction, OSVVMProjectFile.RunTest):
+						_AddTestbench(self._fileSet, instruction.Testbench)
+				elif isinstance(instruction, OSVVMProjectFile.Simulate):
+					_AddTestbench(self._fileSet, instruction.Testbench)
 				elif isinstance(instruction, OSVVMProjectFile.Library):
 					self._fileSet.Design.AddVHDLLibrary(instruction.VHDLLibrary)
 #				elif isinstance(instruction, OSVVMProjectFile.Build):
@@ -144,6 +170,10 @@ class OSVVMProjectFile(ProjectFile, TCLContent):
 				instruction.Parse(fileSet)
 			elif isinstance(instruction, OSVVMProjectFile.Analyze):
 				fileSet.AddFile(instruction.VHDLSourceFile)
+				if isinstance(instruction, OSVVMProjectFile.RunTest):
+					_AddTestbench(fileSet, instruction.Testbench)
+			elif isinstance(instruction, OSVVMProjectFile.Simulate):
+				_AddTestbench(fileSet, instruction.Testbench)
 			elif not isinstance(instruction, (OSVVMProjectFile.Empty, OSVVMProjectFile.Comment)):
 				raise Exception(f"Unknown instruction '{instruction.__class__.__name__}' in OSVVM project file '{self.ResolvedPath}'")
 
@@ -175,6 +205,17 @@ class OSVVMProjectFile(ProjectFile, TCLContent):
 					include = OSVVMProjectFile.Include(i, path.parent, line[8:])
 					instructions.append(include)
 
+				elif line.startswith("RunTest"):
+					runTest = OSVVMProjectFile.RunTest(i, line[8:])
+					instructions.append(runTest)
+
+				elif line.startswith("simulate"):
+					try:
+						simulate = OSVVMProjectFile.Simulate(i, line[9:])
+					except ValueError as ex:
+						raise Exception(f"Syntax error in OSVVM project file '{path}'.") from ex
+					instructions.append(simulate)
+
 				elif line.startswith("build"):
 					parameter = line[6:]
 					print(f"BUILD: {parameter}")
@@ -190,3 +231,9 @@ class OSVVMProjectFile(ProjectFile, TCLContent):
 				i += 1
 
 		return instructions
+
+
+def _AddTestbench(fileSet: FileSet, testbench: Testbench) -> None:
+	# A test simulated multiple times (e.g. with different generics) is recorded once.
+	if testbench.Name not in fileSet.Testbenches:
+		fileSet.AddTestbench(testbench)
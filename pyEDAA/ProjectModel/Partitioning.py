@@ -0,0 +1,524 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Partitioning of a design for distributed compilation.
+
+A design is split into *units*: each VHDL library is a unit, and each file not compiled into a VHDL library (e.g. a
+Verilog file) is a unit of its own. Units are connected by the edges of the VHDL library dependency graph and by the
+file dependency graph's edges collapsed onto units. :func:`PartitionDesign` assigns units to K partitions, so the
+partitions are balanced by weight, the number of cross-partition edges is small, and the partitions can be compiled in
+a dependency order (the partition graph is acyclic).
+"""
+from pathlib import Path
+from typing  import Dict, Iterable, List, Mapping, Optional as Nullable, Set, Tuple, Union
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.ProjectModel import Design, File, VHDLLibrary, VHDLSourceFile, ExternalVHDLLibrary
+
+
+Unit = Union[VHDLLibrary, File]
+
+
+@export
+class Partition(metaclass=ExtendedType, slots=True):
+	"""A subset of a design's VHDL libraries and files to be compiled on one machine."""
+
+	_index:     int
+	_design:    Design
+	_units:     List[Unit]
+	_weight:    float
+	_imports:   List[Unit]
+	_dependsOn: List[int]
+
+	def __init__(self, index: int, design: Design) -> None:
+		self._index =     index
+		self._design =    design
+		self._units =     []
+		self._weight =    0.0
+		self._imports =   []
+		self._dependsOn = []
+
+	@property
+	def Index(self) -> int:
+		"""Read-only property returning the partition's index (starting at 0)."""
+		return self._index
+
+	@property
+	def Units(self) -> List[Unit]:
+		"""Read-only property returning the partition's units (VHDL libraries and files without VHDL library)."""
+		return self._units
+
+	@property
+	def VHDLLibraries(self) -> List[VHDLLibrary]:
+		"""Read-only property returning the VHDL libraries compiled in this partition."""
+		return [unit for unit in self._units if isinstance(unit, VHDLLibrary)]
+
+	@property
+	def Files(self) -> List[File]:
+		"""Read-only property returning all files compiled in this partition (in design order)."""
+		units = set(self._units)
+		return [file for file in self._design.Files() if _GetUnit(file, self._design) in units]
+
+	@property
+	def Weight(self) -> float:
+		return self._weight
+
+	@property
+	def Imports(self) -> List[Unit]:
+		"""Read-only property returning the units (transitively) needed from other partitions."""
+		return self._imports
+
+	@property
+	def DependsOn(self) -> List[int]:
+		"""Read-only property returning the indices of partitions, which need to be compiled before this partition."""
+		return self._dependsOn
+
+	def CreateDesign(self, name: Nullable[str] = None, importDirectory: Nullable[Path] = None) -> Design:
+		"""
+		Export this partition as an independent design.
+
+		The new design contains copies of the partition's files (with resolved paths) in its default fileset, copies of
+		the partition's VHDL libraries and all dependency edges between them. Imported VHDL libraries are registered as
+		external VHDL libraries.
+
+		:arg name:            Name of the new design. Default: ``<design>_<index>``.
+		:arg importDirectory: Directory containing precompiled VHDL libraries of other partitions (one subdirectory per
+		                      library). Default: the current directory.
+		:returns:             A new design not associated to a project.
+		"""
+		design = Design(
+			f"{self._design.Name}_{self._index}" if name is None else name,
+			directory=self._design.ResolvedPath,
+			vhdlVersion=_GetOrNone(lambda: self._design.VHDLVersion),
+			verilogVersion=_GetOrNone(lambda: self._design.VerilogVersion),
+			svVersion=_GetOrNone(lambda: self._design.SVVersion)
+		)
+
+		libraries: Dict[VHDLLibrary, VHDLLibrary] = {}
+		for library in self.VHDLLibraries:
+			libraries[library] = VHDLLibrary(library.Name, design=design, vhdlVersion=library._vhdlVersion)
+		for library, copy in libraries.items():
+			for vertex in library._dependencyNode.IterateSuccessorVertices():
+				if (dependency := libraries.get(vertex.Value)) is not None:
+					copy._dependencyNode.EdgeToVertex(dependency._dependencyNode)
+
+		files: Dict[File, File] = {}
+		for file in self.Files:
+			if isinstance(file, VHDLSourceFile):
+				copy = file.__class__(file.ResolvedPath, vhdlVersion=_GetOrNone(lambda: file.VHDLVersion))
+				if (library := libraries.get(_GetUnit(file, self._design))) is not None:
+					copy.VHDLLibrary = library
+			else:
+				copy = file.__class__(file.ResolvedPath)
+			design.DefaultFileSet.AddFile(copy)
+			files[file] = copy
+		for file, copy in files.items():
+			if file._dependencyNode is not None:
+				for vertex in file._dependencyNode.IterateSuccessorVertices():
+					if (dependency := files.get(vertex.Value)) is not None:
+						design.AddFileDependency(copy, dependency)
+
+		importDirectory = Path(".") if importDirectory is None else importDirectory
+		for unit in self._imports:
+			if isinstance(unit, VHDLLibrary):
+				design.ExternalVHDLLibraries.append(ExternalVHDLLibrary(unit.Name, importDirectory / unit.Name))
+
+		return design
+
+	def __repr__(self) -> str:
+		return f"Partition({self._index}, units={len(self._units)}, weight={self._weight:.1f})"
+
+
+def _GetOrNone(getter):
+	try:
+		return getter()
+	except Exception:
+		return None
+
+
+def _GetUnit(file: File, design: Design) -> Unit:
+	"""Return the effective VHDL library of a file (set on the file or inherited from its fileset), otherwise the file."""
+	if isinstance(file, VHDLSourceFile):
+		library = _GetOrNone(lambda: file.VHDLLibrary)
+		# Libraries of other designs (or not assigned to a design) aren't units of this design.
+		if library is not None and library._dependencyNode is not None:
+			if library._dependencyNode.Graph is design._vhdlLibraryDependencyGraph:
+				return library
+	return file
+
+
+@export
+def PartitionDesign(
+	design: Design,
+	partitionCount: int,
+	weights: Nullable[Mapping[File, float]] = None,
+	imbalance: float = 0.1,
+	refinementPasses: int = 8
+) -> List[Partition]:
+	"""
+	Partition a design into *partitionCount* balanced partitions with few cross-partition edges.
+
+	Units are assigned greedily in dependency order to the partition with the strongest connection to the unit, as long as
+	the partition's weight stays within ``(1 + imbalance)`` times the average weight. Afterwards, units are moved between
+	partitions while this reduces the number of cross-partition edges (Kernighan-Lin/Fiduccia-Mattheyses style
+	refinement). Assignments creating a cyclic dependency between partitions are rejected.
+
+	:arg design:           Design to partition.
+	:arg partitionCount:   Number of partitions.
+	:arg weights:          Optional dictionary of files and weights (e.g. estimated durations). Default: file sizes.
+	:arg imbalance:        Allowed relative deviation from the average partition weight.
+	:arg refinementPasses: Maximum number of refinement passes.
+	:returns:              List of partitions.
+	"""
+	if partitionCount < 1:
+		raise ValueError("Parameter 'partitionCount' must be at least 1.")
+
+	# Collect units and weights
+	unitWeights: Dict[Unit, float] = {}
+	for library in design.VHDLLibraries.values():
+		unitWeights[library] = 0.0
+	for file in design.Files():
+		unit = _GetUnit(file, design)
+		if weights is not None and file in weights:
+			weight = weights[file]
+		else:
+			try:
+				weight = float(file.ResolvedPath.stat().st_size)
+			except OSError:
+				weight = 1.0
+		unitWeights[unit] = unitWeights.get(unit, 0.0) + weight
+
+	# Collect directed edges between units (dependent -> dependency) with multiplicity
+	successors: Dict[Unit, Dict[Unit, int]] = {unit: {} for unit in unitWeights}
+	predecessors: Dict[Unit, Dict[Unit, int]] = {unit: {} for unit in unitWeights}
+
+	def addEdge(unit: Unit, dependency: Unit) -> None:
+		if unit is not dependency and unit in successors and dependency in successors:
+			successors[unit][dependency] = successors[unit].get(dependency, 0) + 1
+			predecessors[dependency][unit] = predecessors[dependency].get(unit, 0) + 1
+
+	for library in design.VHDLLibraries.values():
+		for vertex in library._dependencyNode.IterateSuccessorVertices():
+			addEdge(library, vertex.Value)
+	for file in design.Files():
+		if file._dependencyNode is not None:
+			for vertex in file._dependencyNode.IterateSuccessorVertices():
+				addEdge(_GetUnit(file, design), _GetUnit(vertex.Value, design))
+
+	partitioner = _Partitioner(partitionCount, unitWeights, successors, predecessors, imbalance)
+	partitioner.Assign(_DependencyOrder(unitWeights, successors))
+	partitioner.Refine(refinementPasses)
+
+	partitions = [Partition(index, design) for index in range(partitionCount)]
+	for unit in unitWeights:
+		partition = partitions[partitioner.Assignment[unit]]
+		partition._units.append(unit)
+		partition._weight += unitWeights[unit]
+
+	for partition in partitions:
+		imports: List[Unit] = []
+		visited: Set[Unit] = set(partition._units)
+		stack = list(partition._units)
+		while len(stack) > 0:
+			for dependency in successors[stack.pop()]:
+				if dependency not in visited:
+					visited.add(dependency)
+					stack.append(dependency)
+					if partitioner.Assignment[dependency] != partition._index:
+						imports.append(dependency)
+		partition._imports = imports
+		partition._dependsOn = sorted({partitioner.Assignment[unit] for unit in imports})
+
+	return partitions
+
+
+def _DependencyOrder(units: Iterable[Unit], successors: Dict[Unit, Dict[Unit, int]]) -> List[Unit]:
+	"""Return units in depth-first post-order along dependencies, i.e. dependencies first (cycles are broken)."""
+	order = []
+	visited = set()
+	for root in units:
+		if root in visited:
+			continue
+		visited.add(root)
+		stack = [(root, iter(successors[root]))]
+		while len(stack) > 0:
+			unit, iterator = stack[-1]
+			for dependency in iterator:
+				if dependency not in visited:
+					visited.add(dependency)
+					stack.append((dependency, iter(successors[dependency])))
+					break
+			else:
+				stack.pop()
+				order.append(unit)
+
+	return order
+
+
+class _Partitioner(metaclass=ExtendedType, slots=True):
+	"""
+	Greedy assignment and refinement of units to partitions, keeping the partition graph acyclic.
+
+	For each unit, the number of edges to each partition is kept up-to-date, so the gain of a move is available in
+	constant time. During refinement, assigned units are additionally kept in gain buckets per pair of partitions
+	(Fiduccia-Mattheyses style), so swap candidates are visited best first. The partition graph is only searched for a
+	cycle, if a move creates a new edge between partitions.
+	"""
+
+	_count:        int
+	_weights:      Dict[Unit, float]
+	_successors:   Dict[Unit, Dict[Unit, int]]
+	_predecessors: Dict[Unit, Dict[Unit, int]]
+	_capacity:     float
+	_loads:        List[float]
+	_assignment:   Dict[Unit, int]
+	_connections:  Dict[Unit, List[int]]                  # _connections[u][p] counts edges between unit u and assigned units in partition p
+	_edges:        List[List[int]]                        # _edges[p][q] counts unit edges from partition p to partition q (p != q)
+	_targets:      List[Set[int]]                         # _targets[p] contains all partitions q with _edges[p][q] > 0
+	_newEdges:     List[Tuple[int, int]]                  # partition edges created since the last check for cycles
+	_buckets:      List[List[Dict[int, Dict[Unit, None]]]]  # _buckets[p][q][gain] contains units in p gaining *gain* if moved to q
+
+	def __init__(
+		self,
+		count: int,
+		weights: Dict[Unit, float],
+		successors: Dict[Unit, Dict[Unit, int]],
+		predecessors: Dict[Unit, Dict[Unit, int]],
+		imbalance: float
+	) -> None:
+		self._count =        count
+		self._weights =      weights
+		self._successors =   successors
+		self._predecessors = predecessors
+		self._capacity =     sum(weights.values()) / count * (1.0 + imbalance)
+		self._loads =        [0.0] * count
+		self._assignment =   {}
+		self._connections =  {unit: [0] * count for unit in weights}
+		self._edges =        [[0] * count for _ in range(count)]
+		self._targets =      [set() for _ in range(count)]
+		self._newEdges =     []
+		self._buckets =      []
+
+	@property
+	def Assignment(self) -> Dict[Unit, int]:
+		return self._assignment
+
+	def _Bucket(self, unit: Unit) -> None:
+		partition = self._assignment[unit]
+		connections = self._connections[unit]
+		buckets = self._buckets[partition]
+		for target in range(self._count):
+			if target != partition:
+				buckets[target].setdefault(connections[target] - connections[partition], {})[unit] = None
+
+	def _Unbucket(self, unit: Unit) -> None:
+		partition = self._assignment[unit]
+		connections = self._connections[unit]
+		buckets = self._buckets[partition]
+		for target in range(self._count):
+			if target != partition:
+				gain = connections[target] - connections[partition]
+				bucket = buckets[target][gain]
+				del bucket[unit]
+				if len(bucket) == 0:
+					del buckets[target][gain]
+
+	def _Connect(self, unit: Unit, partition: int, n: int) -> None:
+		"""Add *n* edges between *unit* and *partition*."""
+		bucketed = len(self._buckets) > 0 and unit in self._assignment
+		if bucketed:
+			self._Unbucket(unit)
+		self._connections[unit][partition] += n
+		if bucketed:
+			self._Bucket(unit)
+
+	def _AddPartitionEdges(self, source: int, destination: int, n: int) -> None:
+		count = self._edges[source][destination] + n
+		self._edges[source][destination] = count
+		if count == n:
+			self._targets[source].add(destination)
+			self._newEdges.append((source, destination))
+		elif count == 0:
+			self._targets[source].discard(destination)
+
+	def _UpdateEdges(self, unit: Unit, partition: int, sign: int) -> None:
+		assignment = self._assignment
+		for other, n in self._successors[unit].items():
+			self._Connect(other, partition, sign * n)
+			if (otherPartition := assignment.get(other)) is not None and otherPartition != partition:
+				self._AddPartitionEdges(partition, otherPartition, sign * n)
+		for other, n in self._predecessors[unit].items():
+			self._Connect(other, partition, sign * n)
+			if (otherPartition := assignment.get(other)) is not None and otherPartition != partition:
+				self._AddPartitionEdges(otherPartition, partition, sign * n)
+
+	def _Reaches(self, source: int, destination: int) -> bool:
+		visited = {source}
+		stack = [source]
+		while len(stack) > 0:
+			for target in self._targets[stack.pop()]:
+				if target == destination:
+					return True
+				elif target not in visited:
+					visited.add(target)
+					stack.append(target)
+
+		return False
+
+	def _IsAcyclic(self) -> bool:
+		"""Check if the partition graph is still acyclic. Only cycles through partition edges created since the last check are searched."""
+		newEdges = self._newEdges
+		self._newEdges = []
+		return not any(self._edges[source][destination] > 0 and self._Reaches(destination, source) for source, destination in newEdges)
+
+	def _Add(self, unit: Unit, partition: int) -> None:
+		self._UpdateEdges(unit, partition, +1)
+		self._assignment[unit] = partition
+		self._loads[partition] += self._weights[unit]
+		if len(self._buckets) > 0:
+			self._Bucket(unit)
+
+	def _Remove(self, unit: Unit) -> int:
+		if len(self._buckets) > 0:
+			self._Unbucket(unit)
+		partition = self._assignment.pop(unit)
+		self._UpdateEdges(unit, partition, -1)
+		self._loads[partition] -= self._weights[unit]
+		return partition
+
+	def _Place(self, unit: Unit, partition: int) -> bool:
+		"""Assign *unit* to *partition*, if this keeps the partition graph acyclic."""
+		self._Add(unit, partition)
+		if self._IsAcyclic():
+			return True
+
+		self._Remove(unit)
+		self._newEdges.clear()
+		return False
+
+	def _Move(self, units: List[Unit], targets: List[int]) -> bool:
+		"""Move *units* to *targets*, if this keeps the partition graph acyclic."""
+		sources = [self._Remove(unit) for unit in units]
+		for unit, target in zip(units, targets):
+			self._Add(unit, target)
+		if self._IsAcyclic():
+			return True
+
+		for unit in units:
+			self._Remove(unit)
+		for unit, source in zip(units, sources):
+			self._Add(unit, source)
+		self._newEdges.clear()
+		return False
+
+	def Assign(self, units: Iterable[Unit]) -> None:
+		for unit in units:
+			weight = self._weights[unit]
+			connections = self._connections[unit]
+			candidates = sorted(
+				range(self._count),
+				key=lambda partition: (
+					self._loads[partition] + weight > self._capacity,  # partitions with enough capacity first
+					-connections[partition],
+					self._loads[partition],
+					partition
+				)
+			)
+			for partition in candidates:
+				if self._Place(unit, partition):
+					break
+			else:  # pragma: no cover
+				raise Exception(f"Couldn't assign unit '{unit}' to a partition.")
+
+	def Refine(self, passes: int) -> None:
+		"""Improve the assignment by moving single units, then by swapping pairs of units between partitions."""
+		self._buckets = [[{} for _ in range(self._count)] for _ in range(self._count)]
+		for unit in self._assignment:
+			self._Bucket(unit)
+
+		for _ in range(passes):
+			if not (self._RefineByMoves() or self._RefineBySwaps()):
+				break
+
+		self._buckets = []
+
+	def _RefineByMoves(self) -> bool:
+		improved = False
+		for unit in list(self._assignment):
+			weight = self._weights[unit]
+			source = self._assignment[unit]
+			connections = self._connections[unit]
+			best = max(
+				(partition for partition in range(self._count) if partition != source and self._loads[partition] + weight <= self._capacity),
+				key=lambda partition: (connections[partition], -self._loads[partition]),
+				default=None
+			)
+			if best is not None and connections[best] > connections[source] and self._Move([unit], [best]):
+				improved = True
+
+		return improved
+
+	def _RefineBySwaps(self) -> bool:
+		improved = False
+		for unit in list(self._assignment):
+			source = self._assignment[unit]
+			connections = self._connections[unit]
+			# Only partitions containing a neighbor of *unit* are considered.
+			for target in range(self._count):
+				if target != source and connections[target] > 0 and self._Swap(unit, source, target):
+					improved = True
+					break
+
+		return improved
+
+	def _Swap(self, unit: Unit, source: int, target: int) -> bool:
+		"""Swap *unit* with a unit in partition *target*, if this reduces the cut. Candidates are visited by descending gain."""
+		connections = self._connections[unit]
+		unitGain = connections[target] - connections[source]
+		buckets = self._buckets[target][source]
+		for candidateGain in sorted(buckets, reverse=True):
+			if unitGain + candidateGain <= 0:
+				break
+
+			for candidate in list(buckets[candidateGain]):
+				shared = self._successors[unit].get(candidate, 0) + self._predecessors[unit].get(candidate, 0)
+				delta = self._weights[candidate] - self._weights[unit]
+				if (
+					unitGain + candidateGain - 2 * shared > 0 and
+					self._loads[source] + delta <= self._capacity and
+					self._loads[target] - delta <= self._capacity and
+					self._Move([unit, candidate], [target, source])
+				):
+					return True
+
+		return False
@@ -0,0 +1,294 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Reachability (transitive closure) index for dependency graphs.
+
+A :class:`ReachabilityIndex` stores for each vertex of a dependency graph (e.g. :attr:`Design._fileDependencyGraph` or
+:attr:`Design._vhdlLibraryDependencyGraph`) the set of its transitive dependencies (descendants) and transitive
+dependents (ancestors) as bitsets. Bitsets are Python integers, thus set operations are implemented in C and bitsets of
+sparse vertices stay small.
+"""
+from typing import Callable, Dict, Generator, Hashable, Iterable, List, TypeVar, Union
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Graph       import Graph, Vertex
+
+
+_Node = TypeVar("_Node", bound=Hashable)
+
+
+@export
+def IterateStronglyConnectedComponents(
+	nodes: Iterable[_Node],
+	successors: Callable[[_Node], Iterable[_Node]]
+) -> Generator[List[_Node], None, None]:
+	"""
+	Yield the strongly connected components of a directed graph (iterative Tarjan algorithm).
+
+	Components are yielded in reverse topological order: a component is yielded after all components reachable from it.
+	Only components reachable from *nodes* are visited. The runtime is linear in the number of visited nodes and edges.
+
+	:arg nodes:      Nodes to start from (e.g. all nodes of the graph).
+	:arg successors: Function returning the successors of a node.
+	:returns:        A generator of components, each a list of nodes.
+	"""
+	index: Dict[_Node, int] = {}
+	lowLink: Dict[_Node, int] = {}
+	onStack = set()
+	stack: List[_Node] = []
+
+	for root in nodes:
+		if root in index:
+			continue
+
+		index[root] = lowLink[root] = len(index)
+		stack.append(root)
+		onStack.add(root)
+		work = [(root, iter(successors(root)))]
+		while len(work) > 0:
+			node, iterator = work[-1]
+			for successor in iterator:
+				if successor not in index:
+					index[successor] = lowLink[successor] = len(index)
+					stack.append(successor)
+					onStack.add(successor)
+					work.append((successor, iter(successors(successor))))
+					break
+				elif successor in onStack:
+					lowLink[node] = min(lowLink[node], index[successor])
+			else:
+				work.pop()
+				if len(work) > 0:
+					parent = work[-1][0]
+					lowLink[parent] = min(lowLink[parent], lowLink[node])
+
+				if lowLink[node] == index[node]:
+					component = []
+					while True:
+						member = stack.pop()
+						onStack.discard(member)
+						component.append(member)
+						if member is node:
+							break
+					yield component
+
+
+def _IterateBits(bits: int) -> Generator[int, None, None]:
+	"""Yield the positions of all set bits (lowest first)."""
+	while bits != 0:
+		lowest = bits & -bits
+		yield lowest.bit_length() - 1
+		bits ^= lowest
+
+
+@export
+class ReachabilityIndex(metaclass=ExtendedType, slots=True):
+	"""
+	A transitive closure index of a dependency graph (edges point from a dependent to its dependency).
+
+	The index is built in linear time per bitset word using the graph's strongly connected components. Edges added via
+	:meth:`AddEdge` update the index incrementally. If the graph was modified otherwise (detected by changed vertex or
+	edge counts), the index is rebuilt on the next query.
+
+	Vertices can be passed as :class:`~pyTooling.Graph.Vertex` or as model objects having a dependency vertex (e.g.
+	:class:`~pyEDAA.ProjectModel.File` or :class:`~pyEDAA.ProjectModel.VHDLLibrary`).
+	"""
+
+	_graph:       Graph
+	_vertices:    List[Vertex]
+	_ids:         Dict[Vertex, int]
+	_descendants: List[int]
+	_ancestors:   List[int]
+	_edgeCount:   int
+
+	def __init__(self, graph: Graph) -> None:
+		"""
+		Initializes and builds a reachability index.
+
+		:arg graph: The dependency graph to index.
+		"""
+		self._graph = graph
+		self.Rebuild()
+
+	@property
+	def Graph(self) -> Graph:
+		return self._graph
+
+	def Rebuild(self) -> None:
+		"""Rebuild the index from the graph."""
+		vertices = list(self._graph.IterateVertices())
+		ids = {vertex: id for id, vertex in enumerate(vertices)}
+		descendants = [0] * len(vertices)
+		ancestors =   [0] * len(vertices)
+
+		components = list(IterateStronglyConnectedComponents(vertices, Vertex.IterateSuccessorVertices))
+		# Dependencies first: a component's descendants are its successors and their descendants.
+		for component in components:
+			_CombineComponent(component, ids, descendants, Vertex.IterateSuccessorVertices)
+		# Dependents first: a component's ancestors are its predecessors and their ancestors.
+		for component in reversed(components):
+			_CombineComponent(component, ids, ancestors, Vertex.IteratePredecessorVertices)
+
+		self._vertices =    vertices
+		self._ids =         ids
+		self._descendants = descendants
+		self._ancestors =   ancestors
+		self._edgeCount =   self._graph.EdgeCount
+
+	def _Update(self) -> None:
+		if self._graph.EdgeCount != self._edgeCount or self._graph.VertexCount != len(self._vertices):
+			self.Rebuild()
+
+	def _GetID(self, vertex: Union[Vertex, object]) -> int:
+		if not isinstance(vertex, Vertex):
+			vertex = vertex._dependencyNode
+		try:
+			return self._ids[vertex]
+		except KeyError as ex:
+			raise Exception(f"Vertex '{vertex}' is not part of the indexed graph.") from ex
+
+	def _GetVertex(self, vertex: Union[Vertex, object]) -> Vertex:
+		return vertex if isinstance(vertex, Vertex) else vertex._dependencyNode
+
+	def AddEdge(self, source: Union[Vertex, object], destination: Union[Vertex, object]) -> None:
+		"""
+		Add a dependency edge to the graph and update the index incrementally.
+
+		Only bitsets of the source's ancestors and of the destination's descendants are updated.
+
+		:arg source:      The dependent vertex.
+		:arg destination: The vertex *source* depends on.
+		"""
+		self._Update()
+		sourceVertex, destinationVertex = self._GetVertex(source), self._GetVertex(destination)
+		for vertex in (sourceVertex, destinationVertex):
+			if vertex not in self._ids:
+				if vertex.Graph is not self._graph:
+					raise Exception(f"Vertex '{vertex}' is not part of the indexed graph.")
+				self._ids[vertex] = len(self._vertices)
+				self._vertices.append(vertex)
+				self._descendants.append(0)
+				self._ancestors.append(0)
+
+		if not sourceVertex.HasEdgeToDestination(destinationVertex):
+			sourceVertex.EdgeToVertex(destinationVertex)
+		self._edgeCount = self._graph.EdgeCount
+
+		sourceID = self._ids[sourceVertex]
+		destinationID = self._ids[destinationVertex]
+		newDescendants = (1 << destinationID) | self._descendants[destinationID]
+		if newDescendants & ~self._descendants[sourceID] == 0:
+			return
+
+		newAncestors = (1 << sourceID) | self._ancestors[sourceID]
+		for id in _IterateBits(newAncestors):
+			self._descendants[id] |= newDescendants
+		for id in _IterateBits(newDescendants):
+			self._ancestors[id] |= newAncestors
+
+	def DependsOn(self, source: Union[Vertex, object], destination: Union[Vertex, object]) -> bool:
+		"""
+		Check if *source* transitively depends on *destination* (*destination* is a descendant of *source*).
+
+		:arg source:      The potentially dependent vertex.
+		:arg destination: The potential dependency.
+		:returns:         ``True``, if a path from *source* to *destination* exists.
+		"""
+		self._Update()
+		return (self._descendants[self._GetID(source)] >> self._GetID(destination)) & 1 == 1
+
+	def Dependencies(self, vertex: Union[Vertex, object]) -> List[Vertex]:
+		"""
+		Return all transitive dependencies (descendants) of a vertex.
+
+		A vertex is its own dependency only, if it's part of a cycle.
+
+		:arg vertex: The vertex.
+		:returns:    List of vertices.
+		"""
+		self._Update()
+		return [self._vertices[id] for id in _IterateBits(self._descendants[self._GetID(vertex)])]
+
+	def Dependents(self, vertex: Union[Vertex, object]) -> List[Vertex]:
+		"""
+		Return all transitive dependents (ancestors) of a vertex.
+
+		:arg vertex: The vertex.
+		:returns:    List of vertices.
+		"""
+		self._Update()
+		return [self._vertices[id] for id in _IterateBits(self._ancestors[self._GetID(vertex)])]
+
+	def DependencyCount(self, vertex: Union[Vertex, object]) -> int:
+		"""Return the number of transitive dependencies of a vertex."""
+		self._Update()
+		return self._descendants[self._GetID(vertex)].bit_count()
+
+	def DependentCount(self, vertex: Union[Vertex, object]) -> int:
+		"""Return the number of transitive dependents of a vertex."""
+		self._Update()
+		return self._ancestors[self._GetID(vertex)].bit_count()
+
+	def DependentsOfAny(self, vertices: Iterable[Union[Vertex, object]]) -> List[Vertex]:
+		"""
+		Return all vertices transitively depending on any of the given vertices (e.g. files affected by changed files).
+
+		:arg vertices: The vertices.
+		:returns:      List of vertices (excl. the given vertices, unless they depend on each other).
+		"""
+		self._Update()
+		bits = 0
+		for vertex in vertices:
+			bits |= self._ancestors[self._GetID(vertex)]
+		return [self._vertices[id] for id in _IterateBits(bits)]
+
+
+def _CombineComponent(component: List[Vertex], ids: Dict[Vertex, int], closures: List[int], neighbors) -> None:
+	"""Compute the closure of a strongly connected component from its neighbors' closures."""
+	members = 0
+	for vertex in component:
+		members |= 1 << ids[vertex]
+
+	closure = 0
+	cyclic = len(component) > 1
+	for vertex in component:
+		for neighbor in neighbors(vertex):
+			neighborID = ids[neighbor]
+			if (members >> neighborID) & 1 == 0:
+				closure |= (1 << neighborID) | closures[neighborID]
+			elif neighbor is vertex:
+				cyclic = True
+
+	if cyclic:
+		closure |= members
+	for vertex in component:
+		closures[ids[vertex]] = closure
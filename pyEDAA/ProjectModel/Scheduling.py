@@ -0,0 +1,301 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Duration-based scheduling of analysis jobs and tests.
+
+Durations of analysis jobs and tests are recorded in a :class:`DurationDatabase` (SQLite) keyed by the content hash of
+the files involved. These historical durations (or estimates based on the file size for new files) are used to order
+jobs critical-path-first and to balance work across multiple workers.
+"""
+from heapq   import heapify, heapreplace
+from pathlib import Path
+from sqlite3 import connect, Connection
+from typing  import Dict, Iterable, List, Mapping, Optional as Nullable, Sequence, TypeVar
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.ProjectModel.Execution import AnalysisJob, JobState, ContentHash
+
+
+_Item = TypeVar("_Item")
+
+#: Estimated analysis duration per byte of source code (in seconds), if no historical duration is known.
+DEFAULT_SECONDS_PER_BYTE = 1e-5
+
+
+@export
+class DurationDatabase(metaclass=ExtendedType, slots=True):
+	"""
+	A persistent store of analysis and test durations.
+
+	File durations are keyed by the file's content hash, thus renamed or moved files keep their history, while modified
+	files start a new one. Test durations are keyed by the test's name and (optionally) the content hash of the file
+	containing the test. Repeated measurements are combined into a moving average.
+	"""
+
+	_MAX_SAMPLES = 8
+
+	_path:       Nullable[Path]
+	_connection: Connection
+
+	def __init__(self, path: Nullable[Path] = None) -> None:
+		"""
+		Initializes a duration database.
+
+		:arg path: Path of the SQLite database file. It's created if it doesn't exist. Default: an in-memory database.
+		"""
+		self._path = path
+		self._connection = connect(":memory:" if path is None else str(path))
+		self._connection.execute(
+			"CREATE TABLE IF NOT EXISTS durations ("
+			"kind TEXT NOT NULL, name TEXT NOT NULL, hash TEXT NOT NULL, duration REAL NOT NULL, samples INTEGER NOT NULL, "
+			"PRIMARY KEY (kind, name, hash))"
+		)
+
+	@property
+	def Path(self) -> Nullable[Path]:
+		return self._path
+
+	def __enter__(self) -> 'DurationDatabase':
+		return self
+
+	def __exit__(self, excType, excValue, traceback) -> None:
+		self.Close()
+
+	def Close(self) -> None:
+		"""Commit all recorded durations and close the database."""
+		self._connection.commit()
+		self._connection.close()
+
+	def Commit(self) -> None:
+		self._connection.commit()
+
+	def GetFileDuration(self, path: Path) -> Nullable[float]:
+		"""
+		Return the average analysis duration of a file's current content.
+
+		:arg path: Path of the file.
+		:returns:  Duration in seconds, or ``None`` if unknown.
+		"""
+		return self._Get("file", "", ContentHash(path))
+
+	def AddFileDuration(self, path: Path, duration: float) -> None:
+		"""
+		Record an analysis duration for a file's current content.
+
+		:arg path:     Path of the file.
+		:arg duration: Duration in seconds.
+		"""
+		self._Add("file", "", ContentHash(path), duration)
+
+	def GetTestDuration(self, name: str, path: Nullable[Path] = None) -> Nullable[float]:
+		"""
+		Return the average duration of a test.
+
+		:arg name: Name of the test.
+		:arg path: Optional path of the file containing the test (e.g. the testbench).
+		:returns:  Duration in seconds, or ``None`` if unknown.
+		"""
+		return self._Get("test", name, "" if path is None else ContentHash(path))
+
+	def AddTestDuration(self, name: str, duration: float, path: Nullable[Path] = None) -> None:
+		"""
+		Record a duration for a test.
+
+		:arg name:     Name of the test.
+		:arg duration: Duration in seconds.
+		:arg path:     Optional path of the file containing the test (e.g. the testbench).
+		"""
+		self._Add("test", name, "" if path is None else ContentHash(path), duration)
+
+	def AddTimings(self, timings: Mapping[AnalysisJob, float]) -> None:
+		"""
+		Record the durations of passed analysis jobs, as returned by :meth:`ParallelExecutor.Run`.
+
+		:arg timings: A dictionary of jobs and their durations.
+		"""
+		for job, duration in timings.items():
+			if job.State is JobState.Passed:
+				self.AddFileDuration(job.Path, duration)
+		self._connection.commit()
+
+	def _Get(self, kind: str, name: str, hash: str) -> Nullable[float]:
+		row = self._connection.execute(
+			"SELECT duration FROM durations WHERE kind = ? AND name = ? AND hash = ?", (kind, name, hash)
+		).fetchone()
+		return None if row is None else row[0]
+
+	def _Add(self, kind: str, name: str, hash: str, duration: float) -> None:
+		row = self._connection.execute(
+			"SELECT duration, samples FROM durations WHERE kind = ? AND name = ? AND hash = ?", (kind, name, hash)
+		).fetchone()
+		if row is None:
+			self._connection.execute("INSERT INTO durations VALUES (?, ?, ?, ?, 1)", (kind, name, hash, duration))
+		else:
+			average, samples = row
+			samples = min(samples + 1, self._MAX_SAMPLES)
+			self._connection.execute(
+				"UPDATE durations SET duration = ?, samples = ? WHERE kind = ? AND name = ? AND hash = ?",
+				(average + (duration - average) / samples, samples, kind, name, hash)
+			)
+
+
+@export
+def EstimateDurations(
+	jobs: Iterable[AnalysisJob],
+	database: Nullable[DurationDatabase] = None,
+	secondsPerByte: float = DEFAULT_SECONDS_PER_BYTE
+) -> Dict[AnalysisJob, float]:
+	"""
+	Estimate the duration of analysis jobs.
+
+	Historical durations from *database* are used if available, otherwise the duration is estimated from the file size.
+	Jobs for non-existing files are estimated as ``0.0``.
+
+	:arg jobs:           Jobs to estimate.
+	:arg database:       Optional database of historical durations.
+	:arg secondsPerByte: Estimated duration per byte of a file without history.
+	:returns:            A dictionary of jobs and their estimated durations in seconds.
+	"""
+	durations = {}
+	for job in jobs:
+		try:
+			duration = None if database is None else database.GetFileDuration(job.Path)
+			durations[job] = job.Path.stat().st_size * secondsPerByte if duration is None else duration
+		except FileNotFoundError:
+			durations[job] = 0.0
+
+	return durations
+
+
+def _BottomLevels(jobs: Sequence[AnalysisJob], durations: Mapping[AnalysisJob, float]) -> Dict[AnalysisJob, float]:
+	"""Compute the longest duration from each job's start to the end of its last transitive dependent."""
+	levels: Dict[AnalysisJob, float] = {}
+	for root in jobs:
+		if root in levels:
+			continue
+
+		# Iterative post-order traversal along dependents; ``None`` marks a job being visited.
+		stack = [(root, iter(root.Dependents))]
+		levels[root] = None
+		while len(stack) > 0:
+			job, dependents = stack[-1]
+			for dependent in dependents:
+				if dependent not in durations:
+					continue
+				if dependent not in levels:
+					levels[dependent] = None
+					stack.append((dependent, iter(dependent.Dependents)))
+					break
+				elif levels[dependent] is None:
+					raise Exception(f"Cyclic dependency between analysis jobs for '{job.Path}' and '{dependent.Path}'.")
+			else:
+				stack.pop()
+				levels[job] = durations[job] + max((levels[dependent] for dependent in job.Dependents if dependent in durations), default=0.0)
+
+	return levels
+
+
+@export
+def CriticalPathOrder(jobs: Sequence[AnalysisJob], durations: Mapping[AnalysisJob, float]) -> List[AnalysisJob]:
+	"""
+	Order jobs critical-path-first.
+
+	Jobs are sorted by the longest chain of durations starting with the job (the job's own duration and its transitive
+	dependents). Jobs with equal priority keep their relative order. As a job's priority is larger than each dependent's
+	priority, the result is also a valid compile order, if all durations are positive. Passing the result to
+	:meth:`ParallelExecutor.Run` starts the jobs on the critical path first.
+
+	:arg jobs:      Jobs to order. Dependents not in *durations* are ignored.
+	:arg durations: A dictionary of jobs and their (estimated) durations.
+	:returns:       Jobs in critical-path-first order.
+	"""
+	levels = _BottomLevels(jobs, durations)
+	return sorted(jobs, key=lambda job: -levels[job])
+
+
+@export
+def CriticalPath(jobs: Sequence[AnalysisJob], durations: Mapping[AnalysisJob, float]) -> List[AnalysisJob]:
+	"""
+	Return the chain of jobs with the longest total duration.
+
+	:arg jobs:      Jobs to analyze.
+	:arg durations: A dictionary of jobs and their (estimated) durations.
+	:returns:       Jobs on the critical path, starting with the first job to execute.
+	"""
+	if len(jobs) == 0:
+		return []
+
+	levels = _BottomLevels(jobs, durations)
+	job = max(jobs, key=lambda job: levels[job])
+	path = [job]
+	while True:
+		dependents = [dependent for dependent in job.Dependents if dependent in durations]
+		if len(dependents) == 0:
+			return path
+		job = max(dependents, key=lambda dependent: levels[dependent])
+		path.append(job)
+
+
+@export
+def PackBins(items: Iterable[_Item], binCount: int, durations: Mapping[_Item, float]) -> List[List[_Item]]:
+	"""
+	Distribute items to *binCount* bins with balanced total durations.
+
+	Items are assigned longest-first to the bin with the smallest total duration (LPT heuristic). The assignment is
+	deterministic for the same items and durations. Within each bin, items keep their relative input order.
+
+	:arg items:     Items (e.g. analysis jobs or tests) to distribute.
+	:arg binCount:  Number of bins (e.g. workers or cores).
+	:arg durations: A dictionary of items and their (estimated) durations.
+	:returns:       A list of bins, each a list of items.
+	"""
+	if binCount < 1:
+		raise ValueError("Parameter 'binCount' must be at least 1.")
+
+	items = list(items)
+	order = sorted(range(len(items)), key=lambda index: -durations[items[index]])
+
+	# A heap of (total duration, bin index) tuples
+	heap = [(0.0, binIndex) for binIndex in range(binCount)]
+	heapify(heap)
+	assignment = [0] * len(items)
+	for index in order:
+		load, binIndex = heap[0]
+		assignment[index] = binIndex
+		heapreplace(heap, (load + durations[items[index]], binIndex))
+
+	bins: List[List[_Item]] = [[] for _ in range(binCount)]
+	for index, item in enumerate(items):
+		bins[assignment[index]].append(item)
+
+	return bins
@@ -0,0 +1,181 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Deterministic sharding of testbenches across multiple CI nodes.
+
+Testbenches are distributed to shards balanced by their (estimated) durations. Each shard also provides its minimal
+compile set: the union of the transitive inputs of its testbenches.
+"""
+from hashlib import sha256
+from typing  import Dict, Iterable, List, Mapping, Optional as Nullable, Sequence
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.ProjectModel            import Design, File, Testbench
+from pyEDAA.ProjectModel.Scheduling import DEFAULT_SECONDS_PER_BYTE
+from pyEDAA.ProjectModel.TestImpact import TestImpactIndex
+
+
+@export
+class Shard(metaclass=ExtendedType, slots=True):
+	"""A subset of testbenches to be run on one node."""
+
+	_index:       int
+	_testbenches: List[Testbench]
+	_duration:    float
+	_files:       List[File]
+
+	def __init__(self, index: int, testbenches: Iterable[Testbench], duration: float, files: Iterable[File]) -> None:
+		self._index =       index
+		self._testbenches = list(testbenches)
+		self._duration =    duration
+		self._files =       list(files)
+
+	@property
+	def Index(self) -> int:
+		"""Read-only property returning the shard's index (starting at 0)."""
+		return self._index
+
+	@property
+	def Testbenches(self) -> List[Testbench]:
+		"""Read-only property returning the shard's testbenches sorted by name."""
+		return self._testbenches
+
+	@property
+	def Duration(self) -> float:
+		"""Read-only property returning the sum of the (estimated) durations of the shard's testbenches."""
+		return self._duration
+
+	@property
+	def Files(self) -> List[File]:
+		"""Read-only property returning the files to compile for this shard (in design order)."""
+		return self._files
+
+	def IterateCompileOrder(self, design: Design):
+		"""
+		Iterate the shard's files in compile order.
+
+		:arg design: The design containing the shard's files.
+		:returns:    A generator of tuples like :meth:`Design.IterateCompileOrder`.
+		"""
+		files = set(self._files)
+		for entry in design.IterateCompileOrder():
+			if entry[0] in files:
+				yield entry
+
+	def __repr__(self) -> str:
+		return f"Shard({self._index}, testbenches={len(self._testbenches)}, duration={self._duration:.1f})"
+
+
+@export
+def ShardTestbenches(
+	index: TestImpactIndex,
+	shardCount: int,
+	testbenches: Nullable[Sequence[Testbench]] = None,
+	durations: Nullable[Mapping[str, float]] = None,
+	secondsPerByte: float = DEFAULT_SECONDS_PER_BYTE,
+	tolerance: float = 0.1
+) -> List[Shard]:
+	"""
+	Partition testbenches into *shardCount* shards with balanced durations.
+
+	Durations are taken from *durations* (by testbench name, e.g. from
+	:meth:`~pyEDAA.ProjectModel.Scheduling.DurationDatabase.GetTestDuration`). Testbenches without known duration are
+	estimated by the total size of their transitive inputs.
+
+	The assignment is sticky: each testbench ranks all shards by a hash of its name and the shard index (rendezvous
+	hashing) and is assigned, longest first, to the highest ranked shard with enough capacity left. A shard's capacity
+	is the average duration per shard increased by *tolerance*. Thus, adding or removing a testbench or a shard (or
+	slightly changed durations) moves only a few other testbenches, which keeps the nodes' build directories warm. If
+	no shard has enough capacity left (e.g. for a testbench longer than the average), the least loaded shard is used.
+
+	The assignment only depends on the set of testbenches and their durations, not on the order of *testbenches*, so
+	all CI nodes compute the same shards independently.
+
+	:arg index:          Test impact index providing the testbenches' transitive inputs.
+	:arg shardCount:     Number of shards.
+	:arg testbenches:    Testbenches to distribute (e.g. affected testbenches). Default: all testbenches of the index.
+	:arg durations:      Optional dictionary of testbench names and durations in seconds.
+	:arg secondsPerByte: Estimated duration per byte of input files for testbenches without duration.
+	:arg tolerance:      Fraction a shard's duration may exceed the average duration per shard.
+	:returns:            List of shards.
+	"""
+	if shardCount < 1:
+		raise ValueError("Parameter 'shardCount' must be at least 1.")
+	elif tolerance < 0.0:
+		raise ValueError("Parameter 'tolerance' must not be negative.")
+
+	testbenches = sorted(index.Testbenches if testbenches is None else testbenches, key=lambda testbench: testbench.Name)
+	durations = {} if durations is None else durations
+
+	estimates: Dict[Testbench, float] = {}
+	for testbench in testbenches:
+		if (duration := durations.get(testbench.Name)) is None:
+			duration = 0.0
+			for file in index.TransitiveInputs(testbench):
+				try:
+					duration += file.ResolvedPath.stat().st_size * secondsPerByte
+				except OSError:
+					pass
+		estimates[testbench] = duration
+
+	capacity = (1.0 + tolerance) * sum(estimates.values()) / shardCount
+	loads = [0.0] * shardCount
+	assignment: Dict[Testbench, int] = {}
+	for testbench in sorted(testbenches, key=lambda testbench: -estimates[testbench]):
+		duration = estimates[testbench]
+		ranking = _RankShards(testbench.Name, shardCount)
+		for shardIndex in ranking:
+			if loads[shardIndex] + duration <= capacity:
+				break
+		else:
+			shardIndex = min(ranking, key=loads.__getitem__)
+		assignment[testbench] = shardIndex
+		loads[shardIndex] += duration
+
+	shards = []
+	for shardIndex in range(shardCount):
+		shardTestbenches = [testbench for testbench in testbenches if assignment[testbench] == shardIndex]
+		shards.append(Shard(
+			shardIndex,
+			shardTestbenches,
+			sum(estimates[testbench] for testbench in shardTestbenches),
+			index.TransitiveInputsOf(shardTestbenches)
+		))
+
+	return shards
+
+
+def _RankShards(name: str, shardCount: int) -> List[int]:
+	"""Return the shard indices ordered by preference of a testbench (highest random weight first)."""
+	weights = [int.from_bytes(sha256(f"{name}\0{shardIndex}".encode("utf-8")).digest()[:8], "big") for shardIndex in range(shardCount)]
+	return sorted(range(shardCount), key=lambda shardIndex: -weights[shardIndex])
@@ -0,0 +1,182 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+A cross-language symbol table for mixed VHDL and Verilog designs.
+
+Entity declarations of VHDL files and module declarations of (System)Verilog files are collected by a quick
+declaration scan into a single hash index. References (instantiated entities, modules and components) are resolved
+against this index to add cross-language edges to :attr:`Design._fileDependencyGraph`.
+"""
+from enum    import Enum
+from typing  import Dict, List, Optional as Nullable
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.ProjectModel         import Design, File, VHDLSourceFile, VerilogBaseFile, VerilogHeaderFile, SystemVerilogHeaderFile
+from pyEDAA.ProjectModel.VHDL    import ScanDesignUnits
+from pyEDAA.ProjectModel.Verilog import ScanModules
+
+
+@export
+class CaseFolding(Enum):
+	"""
+	Rules for matching names across languages.
+
+	VHDL identifiers are case-insensitive, thus VHDL names are always folded to lower case.
+	"""
+
+	Insensitive = 0  #: All names are folded to lower case (e.g. a VHDL component ``FIFO`` matches a Verilog module ``Fifo``).
+	Sensitive =   1  #: Names are matched exactly, thus only lower-case Verilog names match VHDL names.
+
+
+@export
+class SymbolTable(metaclass=ExtendedType, slots=True):
+	"""
+	A hash index mapping entity, module and component names to the files declaring them.
+
+	The index is built once by scanning all VHDL and (System)Verilog source files of a design and registered as
+	:attr:`Design.SymbolTable`. If a name is declared by multiple files, the first file (in design order) wins and the
+	other files are reported by :attr:`Duplicates`.
+	"""
+
+	_design:      Design
+	_caseFolding: CaseFolding
+	_symbols:     Dict[str, File]
+	_duplicates:  Dict[str, List[File]]
+	_references:  Dict[File, List[str]]
+
+	def __init__(self, design: Design, caseFolding: CaseFolding = CaseFolding.Insensitive) -> None:
+		"""
+		Initializes and builds a symbol table for a design.
+
+		:arg design:      The design to scan.
+		:arg caseFolding: Rule for matching names.
+		"""
+		self._design =      design
+		self._caseFolding = caseFolding
+		self._symbols =     {}
+		self._duplicates =  {}
+		self._references =  {}
+
+		for file in design.Files():
+			if isinstance(file, VHDLSourceFile):
+				scan = ScanDesignUnits
+			elif isinstance(file, VerilogBaseFile) and not isinstance(file, (VerilogHeaderFile, SystemVerilogHeaderFile)):
+				scan = ScanModules
+			else:
+				continue
+
+			try:
+				declarations, references = scan(file.ResolvedPath)
+			except OSError:
+				continue
+
+			for declaration in declarations:
+				name = self._Fold(declaration.Name)
+				if name not in self._symbols:
+					self._symbols[name] = file
+				elif self._symbols[name] is not file:
+					self._duplicates.setdefault(name, [self._symbols[name]]).append(file)
+			self._references[file] = [self._Fold(reference) for reference in references]
+
+		design._symbolTable = self
+
+	def _Fold(self, name: str) -> str:
+		return name.lower() if self._caseFolding is CaseFolding.Insensitive else name
+
+	@property
+	def Design(self) -> Design:
+		return self._design
+
+	@property
+	def CaseFolding(self) -> CaseFolding:
+		return self._caseFolding
+
+	@property
+	def Duplicates(self) -> Dict[str, List[File]]:
+		"""Read-only property returning names declared by multiple files and these files."""
+		return self._duplicates
+
+	def __len__(self) -> int:
+		"""Returns the number of declared names."""
+		return len(self._symbols)
+
+	def __contains__(self, name: str) -> bool:
+		return self._Fold(name) in self._symbols
+
+	def Resolve(self, name: str) -> Nullable[File]:
+		"""
+		Return the file declaring an entity or module.
+
+		:arg name: Name of the entity, module or component.
+		:returns:  The declaring file, or ``None``.
+		"""
+		return self._symbols.get(self._Fold(name))
+
+	def References(self, file: File) -> List[str]:
+		"""
+		Return the names referenced (instantiated) by a file.
+
+		:arg file: The file.
+		:returns:  List of (folded) names.
+		"""
+		return self._references.get(file, [])
+
+	@property
+	def UnresolvedReferences(self) -> Dict[File, List[str]]:
+		"""Read-only property returning references per file, which aren't declared in the design (e.g. vendor primitives)."""
+		unresolved = {}
+		for file, references in self._references.items():
+			if len(names := [name for name in references if name not in self._symbols]) > 0:
+				unresolved[file] = names
+		return unresolved
+
+	def AddDependencies(self, crossLanguageOnly: bool = True) -> int:
+		"""
+		Add file dependencies for resolved references to the design's file dependency graph.
+
+		:arg crossLanguageOnly: If true, only edges between VHDL and (System)Verilog files are added.
+		:returns:               Number of added edges.
+		"""
+		graph = self._design._fileDependencyGraph
+		edgeCount = graph.EdgeCount
+		for file, references in self._references.items():
+			isVHDL = isinstance(file, VHDLSourceFile)
+			for name in references:
+				if (dependency := self._symbols.get(name)) is None or dependency is file:
+					continue
+				elif crossLanguageOnly and isinstance(dependency, VHDLSourceFile) is isVHDL:
+					continue
+
+				self._design.AddFileDependency(file, dependency)
+
+		return graph.EdgeCount - edgeCount
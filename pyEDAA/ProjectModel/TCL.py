@@ -0,0 +1,567 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+A minimal TCL reader to extract file lists and settings from tool scripts.
+
+Many EDA tools describe projects as TCL scripts (e.g. Vivado non-project scripts or Quartus ``*.qip`` files). This
+module splits such scripts into commands and evaluates the small subset of TCL needed to compute file paths: variables,
+backslash sequences and commands like ``glob`` or ``file join``.
+"""
+from os      import environ
+from pathlib import Path, PurePosixPath
+from typing  import Callable, Dict, Generator, Iterable, List, Optional as Nullable, Tuple
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+
+@export
+class TCLEvaluator(metaclass=ExtendedType, slots=True):
+	"""
+	A minimal TCL evaluator for tool scripts.
+
+	All values are strings like in TCL. Lists are formatted and split with TCL's list syntax. Word evaluations and glob
+	results are cached. The word cache is invalidated whenever a variable is changed.
+
+	If the value of a ``set`` command can't be evaluated (e.g. ``set part [get_parts ...]`` calls a command, which isn't
+	supported), the variable becomes unknown instead of failing the whole script. Only using an unknown variable raises
+	an exception.
+
+	:arg directory: Working directory used to resolve relative paths (e.g. in ``glob``).
+	:arg variables: Predefined variables.
+	"""
+
+	_directory:  Path
+	_scriptPath: Nullable[Path]
+	_variables:  Dict[str, str]
+	_unknown:    Dict[str, str]
+	_commands:   Dict[str, Callable[[List[str]], str]]
+	_wordCache:  Dict[str, str]
+	_globCache:  Dict[Tuple[Path, str], List[str]]
+
+	def __init__(self, directory: Path, variables: Nullable[Dict[str, str]] = None) -> None:
+		self._directory =  directory
+		self._scriptPath = None
+		self._variables =  {} if variables is None else dict(variables)
+		self._unknown =    {}
+		self._wordCache =  {}
+		self._globCache =  {}
+		self._commands =   {
+			"concat": lambda arguments: " ".join(argument.strip() for argument in arguments),
+			"file":   self._File,
+			"glob":   self._Glob,
+			"info":   self._Info,
+			"list":   FormatList,
+			"pwd":    lambda _: self._directory.as_posix(),
+			"set":    self._Set,
+		}
+
+	@property
+	def Directory(self) -> Path:
+		"""Property setting or returning the working directory."""
+		return self._directory
+
+	@Directory.setter
+	def Directory(self, value: Path) -> None:
+		self._directory = value
+		self._wordCache.clear()
+
+	@property
+	def ScriptPath(self) -> Nullable[Path]:
+		"""Property setting or returning the path of the currently evaluated script (see ``info script``)."""
+		return self._scriptPath
+
+	@ScriptPath.setter
+	def ScriptPath(self, value: Nullable[Path]) -> None:
+		self._scriptPath = value
+		self._wordCache.clear()
+
+	def __getitem__(self, name: str) -> str:
+		"""Returns the value of a variable."""
+		return self._variables[name.lstrip(":")]
+
+	def __setitem__(self, name: str, value: str) -> None:
+		"""Sets the value of a variable."""
+		name = name.lstrip(":")
+		self._variables[name] = value
+		self._unknown.pop(name, None)
+		self._wordCache.clear()
+
+	def __contains__(self, name: str) -> bool:
+		"""Returns true, if the variable is defined."""
+		return name.lstrip(":") in self._variables
+
+	def IsUnknown(self, name: str) -> bool:
+		"""Returns true, if the variable was set to a value, which couldn't be evaluated."""
+		return name.lstrip(":") in self._unknown
+
+	def RegisterCommand(self, name: str, handler: Callable[[List[str]], str]) -> None:
+		"""
+		Register a handler for a command used in command substitutions (``[...]``) or :meth:`Execute`.
+
+		:arg name:    The command's name.
+		:arg handler: A callable receiving the evaluated arguments and returning the command's result.
+		"""
+		self._commands[name] = handler
+
+	def IterateCommands(self, lines: Iterable[str]) -> Generator[Tuple[int, List[str]], None, None]:
+		"""
+		Split a script into commands in a single streaming pass.
+
+		Commands can span multiple lines by line continuation or braces. Comments are skipped.
+
+		:arg lines: An iterable of lines, e.g. an opened file.
+		:returns:   A generator of tuples of line number and the command's unevaluated words.
+		"""
+		buffer = ""
+		startLine = 0
+		for lineNumber, line in enumerate(lines, start=1):
+			if buffer == "":
+				stripped = line.lstrip()
+				if stripped == "" or stripped.startswith("#") and not line.rstrip("\r\n").endswith("\\"):
+					continue
+				startLine = lineNumber
+
+			buffer += line
+			if buffer.rstrip("\r\n").endswith("\\") or (commands := SplitCommands(buffer)) is None:
+				continue
+
+			buffer = ""
+			for words in commands:
+				yield startLine, words
+
+		if buffer != "":
+			raise Exception(f"Incomplete TCL command starting in line {startLine}.")
+
+	def Evaluate(self, word: str) -> str:
+		"""
+		Evaluate a single word by applying brace quoting or variable, command and backslash substitution.
+
+		:arg word: The unevaluated word.
+		:returns:  The word's value.
+		"""
+		try:
+			return self._wordCache[word]
+		except KeyError:
+			pass
+
+		if word.startswith("{") and word.endswith("}"):
+			result = word[1:-1]
+		elif word.startswith('"') and word.endswith('"'):
+			result = self._Substitute(word[1:-1])
+		else:
+			result = self._Substitute(word)
+
+		self._wordCache[word] = result
+		return result
+
+	def EvaluateList(self, word: str) -> List[str]:
+		"""
+		Evaluate a single word and split the result as a TCL list.
+
+		:arg word: The unevaluated word.
+		:returns:  The list items.
+		"""
+		return SplitList(self.Evaluate(word))
+
+	def Execute(self, words: List[str]) -> str:
+		"""
+		Execute a command with a registered handler.
+
+		:arg words:     The command's unevaluated words.
+		:returns:       The command's result.
+		:raises Exception: When the command is not supported.
+		"""
+		name = self.Evaluate(words[0])
+		if name == "set" and len(words) == 3:
+			return self._ExecuteSet(words[1], words[2])
+
+		try:
+			handler = self._commands[name]
+		except KeyError as ex:
+			raise Exception(f"Unsupported TCL command '{name}'.") from ex
+
+		return handler([self.Evaluate(word) for word in words[1:]])
+
+	def _ExecuteSet(self, nameWord: str, valueWord: str) -> str:
+		name = self.Evaluate(nameWord).lstrip(":")
+		try:
+			value = self.Evaluate(valueWord)
+		except Exception as ex:
+			# Mark the variable as unknown. Using it later raises an exception with the original cause.
+			self._variables.pop(name, None)
+			self._unknown[name] = str(ex)
+			self._wordCache.clear()
+			return ""
+
+		self[name] = value
+		return value
+
+	def _Substitute(self, text: str) -> str:
+		if "$" not in text and "[" not in text and "\\" not in text:
+			return text
+
+		result = []
+		i = 0
+		length = len(text)
+		while i < length:
+			c = text[i]
+			if c == "\\":
+				nextChar = text[i + 1] if i + 1 < length else ""
+				result.append(_ESCAPES.get(nextChar, nextChar))
+				i += 2
+			elif c == "[":
+				end = _MatchBracket(text, i)
+				if end < 0:
+					raise Exception(f"Missing closing bracket in '{text}'.")
+				result.append(self._EvaluateScript(text[i + 1:end]))
+				i = end + 1
+			elif c == "$":
+				name, i = _ParseVariableName(text, i + 1)
+				if name == "":
+					result.append("$")
+				else:
+					result.append(self._GetVariable(name))
+			else:
+				result.append(c)
+				i += 1
+
+		return "".join(result)
+
+	def _EvaluateScript(self, script: str) -> str:
+		commands = SplitCommands(script)
+		if commands is None:
+			raise Exception(f"Incomplete TCL command '{script}'.")
+
+		result = ""
+		for words in commands:
+			result = self.Execute(words)
+		return result
+
+	def _GetVariable(self, name: str) -> str:
+		name = name.lstrip(":")
+		if name.startswith("env(") and name.endswith(")"):
+			try:
+				return environ[name[4:-1]]
+			except KeyError as ex:
+				raise Exception(f"Environment variable '{name[4:-1]}' is not defined.") from ex
+
+		try:
+			return self._variables[name]
+		except KeyError as ex:
+			if name in self._unknown:
+				raise Exception(f"TCL variable '{name}' is unknown, because its value couldn't be evaluated: {self._unknown[name]}") from ex
+			raise Exception(f"TCL variable '{name}' is not defined.") from ex
+
+	def _Set(self, arguments: List[str]) -> str:
+		if len(arguments) == 1:
+			return self._GetVariable(arguments[0])
+		elif len(arguments) == 2:
+			self[arguments[0]] = arguments[1]
+			return arguments[1]
+
+		raise Exception(f"Wrong number of arguments for TCL command 'set'.")
+
+	def _Glob(self, arguments: List[str]) -> str:
+		directory = None
+		noComplain = False
+		patterns = []
+		iterator = iter(arguments)
+		for argument in iterator:
+			if argument == "-directory":
+				directory = next(iterator)
+			elif argument == "-nocomplain":
+				noComplain = True
+			elif argument == "-types":
+				next(iterator)
+			elif argument == "--":
+				patterns.extend(iterator)
+			else:
+				patterns.append(argument)
+
+		results = []
+		for pattern in patterns:
+			if directory is not None:
+				base = self._directory / directory
+				prefix = PurePosixPath(directory)
+			elif PurePosixPath(pattern).is_absolute():
+				prefix = PurePosixPath(PurePosixPath(pattern).anchor)
+				base = Path(prefix)
+				pattern = pattern[len(prefix.as_posix()):]
+			else:
+				base = self._directory
+				prefix = None
+
+			key = (base, pattern)
+			try:
+				matches = self._globCache[key]
+			except KeyError:
+				matches = sorted(path.relative_to(base).as_posix() for path in base.glob(pattern))
+				self._globCache[key] = matches
+
+			results.extend(matches if prefix is None else ((prefix / match).as_posix() for match in matches))
+
+		if len(results) == 0 and not noComplain:
+			raise Exception(f"No files matched glob pattern(s) '{' '.join(patterns)}'.")
+
+		return FormatList(results)
+
+	def _File(self, arguments: List[str]) -> str:
+		subCommand = arguments[0]
+		if subCommand == "join":
+			return PurePosixPath(*arguments[1:]).as_posix()
+		elif subCommand == "dirname":
+			return PurePosixPath(arguments[1]).parent.as_posix()
+		elif subCommand == "tail":
+			return PurePosixPath(arguments[1]).name
+		elif subCommand == "rootname":
+			path = arguments[1]
+			suffix = PurePosixPath(path).suffix
+			return path[:-len(suffix)] if suffix != "" else path
+		elif subCommand == "extension":
+			return PurePosixPath(arguments[1]).suffix
+		elif subCommand == "normalize":
+			return (self._directory / arguments[1]).resolve().as_posix()
+		elif subCommand == "exists":
+			return "1" if (self._directory / arguments[1]).exists() else "0"
+
+		raise Exception(f"Unsupported TCL command 'file {subCommand}'.")
+
+	def _Info(self, arguments: List[str]) -> str:
+		subCommand = arguments[0]
+		if subCommand == "script":
+			return "" if self._scriptPath is None else self._scriptPath.as_posix()
+		elif subCommand == "exists":
+			return "1" if arguments[1] in self else "0"
+
+		raise Exception(f"Unsupported TCL command 'info {subCommand}'.")
+
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "\n": " ", "": "\\"}
+
+
+@export
+def SplitCommands(script: str) -> Nullable[List[List[str]]]:
+	"""
+	Split a TCL script into commands and commands into unevaluated words.
+
+	:arg script: The script to split.
+	:returns:    A list of commands or ``None``, if the script ends inside of braces, brackets or quotes.
+	"""
+	commands = []
+	words = []
+	i = 0
+	length = len(script)
+	while i < length:
+		c = script[i]
+		if c in " \t\r":
+			i += 1
+		elif c == "\n" or c == ";":
+			if len(words) > 0:
+				commands.append(words)
+				words = []
+			i += 1
+		elif c == "\\" and script[i + 1:i + 2] == "\n":
+			i += 2
+		elif c == "#" and len(words) == 0:
+			while i < length and script[i] != "\n":
+				i += 2 if script[i] == "\\" else 1
+		else:
+			start = i
+			if c == "{":
+				end = _MatchBrace(script, i)
+			elif c == '"':
+				end = _MatchQuote(script, i)
+			else:
+				end = _MatchBareWord(script, i)
+
+			if end < 0:
+				return None
+
+			i = end + 1
+			words.append(script[start:i])
+
+	if len(words) > 0:
+		commands.append(words)
+
+	return commands
+
+
+@export
+def SplitList(value: str) -> List[str]:
+	"""
+	Split a string as TCL list.
+
+	:arg value: The list formatted as a string.
+	:returns:   The list items.
+	"""
+	items = []
+	i = 0
+	length = len(value)
+	while i < length:
+		c = value[i]
+		if c.isspace():
+			i += 1
+			continue
+		elif c == "{":
+			end = _MatchBrace(value, i)
+			item = value[i + 1:end]
+		elif c == '"':
+			end = _MatchQuote(value, i)
+			item = value[i + 1:end]
+		else:
+			end = i
+			while end + 1 < length and not value[end + 1].isspace():
+				end += 1
+			item = value[i:end + 1]
+
+		if end < 0:
+			raise Exception(f"Value '{value}' is not a valid TCL list.")
+
+		items.append(item)
+		i = end + 1
+
+	return items
+
+
+@export
+def FormatList(items: Iterable[str]) -> str:
+	"""
+	Format items as a TCL list.
+
+	:arg items: The list items.
+	:returns:   The list formatted as a string.
+	"""
+	return " ".join(f"{{{item}}}" if item == "" or any(c in item for c in " \t\n;{}[]$\"\\") else item for item in items)
+
+
+def _MatchBrace(text: str, start: int) -> int:
+	depth = 0
+	i = start
+	length = len(text)
+	while i < length:
+		c = text[i]
+		if c == "\\":
+			i += 1
+		elif c == "{":
+			depth += 1
+		elif c == "}":
+			depth -= 1
+			if depth == 0:
+				return i
+		i += 1
+
+	return -1
+
+
+def _MatchQuote(text: str, start: int) -> int:
+	i = start + 1
+	length = len(text)
+	while i < length:
+		c = text[i]
+		if c == "\\":
+			i += 1
+		elif c == "[":
+			i = _MatchBracket(text, i)
+			if i < 0:
+				return -1
+		elif c == '"':
+			return i
+		i += 1
+
+	return -1
+
+
+def _MatchBracket(text: str, start: int) -> int:
+	depth = 0
+	i = start
+	length = len(text)
+	while i < length:
+		c = text[i]
+		if c == "\\":
+			i += 1
+		elif c == "{":
+			i = _MatchBrace(text, i)
+			if i < 0:
+				return -1
+		elif c == '"':
+			i = _MatchQuote(text, i)
+			if i < 0:
+				return -1
+		elif c == "[":
+			depth += 1
+		elif c == "]":
+			depth -= 1
+			if depth == 0:
+				return i
+		i += 1
+
+	return -1
+
+
+def _MatchBareWord(text: str, start: int) -> int:
+	i = start
+	length = len(text)
+	while i < length:
+		c = text[i]
+		if c in " \t\r\n;":
+			return i - 1
+		elif c == "\\":
+			if text[i + 1:i + 2] == "\n":
+				return i - 1
+			i += 1
+		elif c == "[":
+			i = _MatchBracket(text, i)
+			if i < 0:
+				return -1
+		i += 1
+
+	return length - 1
+
+
+def _ParseVariableName(text: str, start: int) -> Tuple[str, int]:
+	if text[start:start + 1] == "{":
+		end = text.find("}", start)
+		if end < 0:
+			raise Exception(f"Missing closing brace in variable reference in '{text}'.")
+		return text[start + 1:end], end + 1
+
+	i = start
+	length = len(text)
+	while i < length and (text[i].isalnum() or text[i] in "_:"):
+		i += 1
+	if i < length and text[i] == "(" and i > start:
+		end = text.find(")", i)
+		if end < 0:
+			raise Exception(f"Missing closing parenthesis in variable reference in '{text}'.")
+		return text[start:end + 1], end + 1
+
+	return text[start:i], i
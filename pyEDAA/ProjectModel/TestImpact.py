@@ -0,0 +1,292 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Test impact analysis: map changed files to the testbenches which need to be rerun.
+
+Testbenches are identified by :func:`IdentifyTestbenches`. A :class:`TestImpactIndex` precomputes the transitive inputs
+of each testbench from the design's file dependency graph, so queries for a set of changed files are answered with a
+few bitset operations instead of graph traversals.
+"""
+from pathlib import Path
+from re      import compile as re_compile, IGNORECASE
+from typing  import Dict, Iterable, List, Optional as Nullable, Tuple, Union
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.ProjectModel              import Project, Design, FileSet, File, Testbench, VHDLSourceFile, _IterateFileSets
+from pyEDAA.ProjectModel.Reachability import IterateStronglyConnectedComponents
+from pyEDAA.ProjectModel.VHDL         import ScanEntities
+
+
+#: Names of simulation filesets, e.g. ``sim``, ``sim_1`` (Vivado) or ``Simulation`` (ISE).
+_SIMULATION_FILESET = re_compile(r"sim(?:_\w+)?|simulation", IGNORECASE)
+
+
+@export
+def IdentifyTestbenches(design: Design, scanEntities: bool = True) -> List[Testbench]:
+	"""
+	Identify the testbenches of a design.
+
+	Testbenches are collected from:
+
+	* testbenches registered in the design's filesets (e.g. ``RunTest`` and ``simulate`` in OSVVM scripts),
+	* top-levels (:attr:`FileSet.TopLevel`) of simulation filesets (filesets named like ``sim_1`` or ``Simulation``,
+	  incl. their sub-filesets), except the design's top-level,
+	* top-levels of other filesets, if the top-level is a VHDL entity without ports, and
+	* VHDL entities without ports, if *scanEntities* is true.
+
+	Newly identified testbenches are added to the fileset declaring the top-level, respectively to the fileset owning the
+	declaring file. Thus, repeated calls return the same testbench objects. Testbenches without known file are resolved
+	by name using the entities found in the design's VHDL files.
+
+	:arg design:       Design to analyze.
+	:arg scanEntities: If true, scan VHDL files for entities (required to find port-less entities).
+	:returns:          List of testbenches, each name reported once (case-insensitive).
+	"""
+	if scanEntities:
+		entities, portLess = _ScanDesignEntities(design)
+	else:
+		entities, portLess = {}, []
+
+	return _IdentifyTestbenches(design, entities, portLess)
+
+
+def _ScanDesignEntities(design: Design) -> Tuple[Dict[str, VHDLSourceFile], List[str]]:
+	"""Scan all VHDL files of a design and return a map of entity names to files and the names of port-less entities."""
+	entities: Dict[str, VHDLSourceFile] = {}
+	portLess: List[str] = []
+	for file in design.Files(VHDLSourceFile):
+		try:
+			declarations = ScanEntities(file.ResolvedPath)
+		except OSError:
+			continue
+
+		for entity in declarations:
+			entities.setdefault(entity.Name, file)
+			if not entity.HasPorts:
+				portLess.append(entity.Name)
+
+	return entities, portLess
+
+
+def _IdentifyTestbenches(design: Design, entities: Dict[str, VHDLSourceFile], portLess: List[str]) -> List[Testbench]:
+	testbenches: Dict[str, Testbench] = {}
+	for testbench in design.IterateTestbenches():
+		if testbench.File is None and (file := entities.get(testbench.Name.lower())) is not None:
+			testbench.File = file
+		testbenches.setdefault(testbench.Name.lower(), testbench)
+
+	portLessNames = set(portLess)
+	for fileSet in _IterateFileSets(design.FileSets.values()):
+		topLevel = fileSet.TopLevel
+		if topLevel is None or topLevel == design.TopLevel or topLevel.lower() in testbenches:
+			continue
+		elif _IsSimulationFileSet(fileSet) or topLevel.lower() in portLessNames:
+			testbenches[topLevel.lower()] = _RegisterTestbench(fileSet, topLevel, entities.get(topLevel.lower()))
+
+	for name in portLess:
+		if name not in testbenches:
+			file = entities[name]
+			testbenches[name] = _RegisterTestbench(file.FileSet, name, file)
+
+	return list(testbenches.values())
+
+
+def _IsSimulationFileSet(fileSet: FileSet) -> bool:
+	"""Return true, if the fileset or one of its parents is named like a simulation fileset (e.g. ``sim_1``)."""
+	while fileSet is not None:
+		if _SIMULATION_FILESET.fullmatch(fileSet.Name) is not None:
+			return True
+		fileSet = fileSet.Parent
+
+	return False
+
+
+def _RegisterTestbench(fileSet: Nullable[FileSet], name: str, file: Nullable[File]) -> Testbench:
+	if fileSet is None:
+		return Testbench(name, file)
+	elif (testbench := fileSet.Testbenches.get(name)) is not None:
+		if testbench.File is None:
+			testbench.File = file
+		return testbench
+
+	return Testbench(name, file, fileSet)
+
+
+@export
+class TestImpactIndex(metaclass=ExtendedType, slots=True):
+	"""
+	A precomputed index of the transitive inputs of testbenches.
+
+	Each file is assigned a bit. The transitive inputs of a testbench (its file and all files it depends on according to
+	the file dependency graph) are stored as a bitset (a Python integer). Thus, the query for affected testbenches is a
+	bitwise ``and`` per testbench.
+
+	Bitsets are computed once per strongly connected component in reverse topological order, and intermediate bitsets
+	are released as soon as all dependent components are processed. Use
+	:class:`~pyEDAA.ProjectModel.Reachability.ReachabilityIndex` for general, incrementally updated reachability queries.
+
+	The index reflects the dependency graph at construction time. It needs to be recreated after the graph was modified.
+	"""
+
+	_files:       List[File]
+	_bits:        Dict[File, int]
+	_paths:       Dict[Path, File]
+	_testbenches: List[Testbench]
+	_closures:    Dict[Testbench, Nullable[int]]
+
+	def __init__(self, design: Union[Design, Project], testbenches: Nullable[Iterable[Testbench]] = None) -> None:
+		"""
+		Initializes a test impact index.
+
+		:arg design:      A design or a project (all designs).
+		:arg testbenches: Testbenches to index. Default: testbenches identified by :func:`IdentifyTestbenches`.
+		"""
+		designs = list(design.Designs.values()) if isinstance(design, Project) else [design]
+		if testbenches is None:
+			testbenches = [testbench for design in designs for testbench in IdentifyTestbenches(design)]
+
+		self._files = [file for design in designs for file in design.Files()]
+		self._bits =  {file: 1 << index for index, file in enumerate(self._files)}
+		self._paths = {}
+		self._testbenches = list(testbenches)
+
+		targets = {testbench.File for testbench in self._testbenches if testbench.File is not None}
+		closures = _ComputeClosures(self._bits, targets)
+		self._closures = {testbench: None if testbench.File is None else closures[testbench.File] for testbench in self._testbenches}
+
+	@property
+	def Testbenches(self) -> List[Testbench]:
+		return self._testbenches
+
+	def _GetFile(self, file: Union[File, Path]) -> Nullable[File]:
+		if isinstance(file, File):
+			return file
+
+		if len(self._paths) == 0:
+			self._paths = {f.ResolvedPath.resolve(): f for f in self._files}
+		return self._paths.get(file.resolve())
+
+	def AffectedTestbenches(self, changedFiles: Iterable[Union[File, Path]]) -> List[Testbench]:
+		"""
+		Return the testbenches affected by changed files.
+
+		A testbench is affected, if any changed file is among its transitive inputs. Testbenches without known file are
+		always reported, as their inputs are unknown. Changed files not part of the indexed designs are ignored.
+
+		:arg changedFiles: Changed files given as :class:`File` objects or paths.
+		:returns:          Affected testbenches in index order.
+		"""
+		mask = 0
+		for changedFile in changedFiles:
+			if (file := self._GetFile(changedFile)) is not None:
+				mask |= self._bits.get(file, 0)
+
+		return [testbench for testbench, closure in self._closures.items() if closure is None or closure & mask != 0]
+
+	def TransitiveInputs(self, testbench: Testbench) -> List[File]:
+		"""
+		Return the transitive inputs of a testbench (incl. its own file).
+
+		:arg testbench: An indexed testbench.
+		:returns:       Files in design order.
+		"""
+		return self.TransitiveInputsOf((testbench, ))
+
+	def TransitiveInputsOf(self, testbenches: Iterable[Testbench]) -> List[File]:
+		"""
+		Return the union of the transitive inputs of multiple testbenches.
+
+		:arg testbenches: Indexed testbenches.
+		:returns:         Files in design order.
+		"""
+		closure = 0
+		for testbench in testbenches:
+			closure |= self._closures[testbench] or 0
+
+		files = []
+		while closure != 0:
+			lowest = closure & -closure
+			files.append(self._files[lowest.bit_length() - 1])
+			closure ^= lowest
+		return files
+
+
+def _ComputeClosures(bits: Dict[File, int], targets: Iterable[File]) -> Dict[File, int]:
+	"""
+	Compute the transitive-input bitsets for all *targets*.
+
+	Strongly connected components along dependency edges are completed in reverse topological order (dependencies first),
+	so a component's bitset is the union of its members' bits and the bitsets of the components it depends on. A
+	component's bitset is released, when all edges from dependent components have been processed, unless it contains a
+	target.
+	"""
+	targets = list(targets)
+	targetSet = set(targets)
+	componentClosure: Dict[int, int] = {}   # component id -> bitset
+	retained = set()                        # component ids containing targets
+	pendingEdges: Dict[int, int] = {}       # component id -> number of not yet processed edges from dependents
+	component: Dict[File, int] = {}         # file -> component id
+
+	def successors(file: File) -> List[File]:
+		vertex = file._dependencyNode
+		return [] if vertex is None else [v.Value for v in vertex.IterateSuccessorVertices() if v.Value in bits]
+
+	def predecessors(file: File) -> List[File]:
+		vertex = file._dependencyNode
+		return [] if vertex is None else [v.Value for v in vertex.IteratePredecessorVertices() if v.Value in bits]
+
+	for componentId, members in enumerate(IterateStronglyConnectedComponents(targets, successors)):
+		for member in members:
+			component[member] = componentId
+
+		closure = 0
+		used = []
+		for member in members:
+			closure |= bits[member]
+			for successor in successors(member):
+				if (dependencyId := component[successor]) != componentId:
+					closure |= componentClosure[dependencyId]
+					used.append(dependencyId)
+
+		componentClosure[componentId] = closure
+		pendingEdges[componentId] = sum(1 for member in members for predecessor in predecessors(member) if component.get(predecessor) != componentId)
+		if any(member in targetSet for member in members):
+			retained.add(componentId)
+
+		for dependencyId in used:
+			pendingEdges[dependencyId] -= 1
+			if pendingEdges[dependencyId] == 0 and dependencyId not in retained:
+				# Release intermediate bitsets no longer needed.
+				del componentClosure[dependencyId]
+
+	return {target: componentClosure[component[target]] for target in targets}
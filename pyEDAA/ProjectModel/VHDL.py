@@ -0,0 +1,120 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Quick declaration scanning of VHDL source files without a full VHDL parser."""
+from pathlib import Path
+from re      import compile as re_compile, IGNORECASE, DOTALL
+from typing  import List, Tuple
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+
+@export
+class EntityDeclaration(metaclass=ExtendedType, slots=True):
+	"""An entity declaration found by :func:`ScanEntities`."""
+
+	_name:     str
+	_hasPorts: bool
+
+	def __init__(self, name: str, hasPorts: bool) -> None:
+		self._name =     name
+		self._hasPorts = hasPorts
+
+	@property
+	def Name(self) -> str:
+		"""Read-only property returning the entity's name (lower case)."""
+		return self._name
+
+	@property
+	def HasPorts(self) -> bool:
+		"""Read-only property returning true, if the entity has a port clause."""
+		return self._hasPorts
+
+	def __repr__(self) -> str:
+		return f"EntityDeclaration({self._name}, hasPorts={self._hasPorts})"
+
+
+_COMMENTS = re_compile(r"--[^\n]*|/\*.*?\*/", DOTALL)
+_ENTITY =   re_compile(r"\bentity\s+(\w+)\s+is\b(.*?)\bend\b", IGNORECASE | DOTALL)
+_PORT =     re_compile(r"\bport\s*\(", IGNORECASE)
+
+# Component declarations and instantiations ('component name is', 'label : component name').
+_COMPONENT =             re_compile(r"\bcomponent\s+(\w+)\b(?!\s*;)", IGNORECASE)
+# Direct entity instantiations ('label : entity lib.name').
+_ENTITY_INSTANTIATION =  re_compile(r":\s*entity\s+(?:\w+\s*\.\s*)?(\w+)", IGNORECASE)
+# Component instantiations without keyword ('label : name port map').
+_INSTANTIATION =         re_compile(r"\b\w+\s*:\s*(\w+)\s+(?:generic|port)\s+map\b", IGNORECASE)
+
+
+@export
+def RemoveComments(content: str) -> str:
+	"""Remove line comments and (VHDL-2008) block comments from VHDL source code."""
+	return _COMMENTS.sub(" ", content)
+
+
+@export
+def ScanEntities(path: Path) -> List[EntityDeclaration]:
+	"""
+	Scan a VHDL source file for entity declarations.
+
+	The scanner uses regular expressions on the source text (without comments) instead of a VHDL parser. It doesn't
+	handle string literals containing comment delimiters or keywords.
+
+	:arg path: Path of the VHDL source file.
+	:returns:  List of entity declarations in order of appearance.
+	"""
+	content = RemoveComments(path.read_text(encoding="utf-8", errors="replace"))
+	return [EntityDeclaration(match[1].lower(), _PORT.search(match[2]) is not None) for match in _ENTITY.finditer(content)]
+
+
+@export
+def ScanDesignUnits(path: Path) -> Tuple[List[EntityDeclaration], List[str]]:
+	"""
+	Scan a VHDL source file for entity declarations and references to other design units.
+
+	References are names of declared or instantiated components and of directly instantiated entities (the library
+	prefix is ignored). Like :func:`ScanEntities`, the scanner uses regular expressions instead of a VHDL parser.
+
+	:arg path: Path of the VHDL source file.
+	:returns:  A tuple of entity declarations and referenced names (lower case, each name once, excl. own entities).
+	"""
+	content = RemoveComments(path.read_text(encoding="utf-8", errors="replace"))
+	entities = [EntityDeclaration(match[1].lower(), _PORT.search(match[2]) is not None) for match in _ENTITY.finditer(content)]
+
+	declared = {entity.Name for entity in entities}
+	references = {}
+	for pattern in (_COMPONENT, _ENTITY_INSTANTIATION, _INSTANTIATION):
+		for match in pattern.finditer(content):
+			name = match[1].lower()
+			if name not in declared:
+				references[name] = None
+
+	return entities, list(references)
@@ -29,11 +29,405 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for Verilog."""
-from pyTooling.Decorators import export
+from os      import environ
+from os.path import normpath
+from pathlib import Path
+from re      import compile as re_compile, DOTALL
+from typing  import Dict, Iterator, List, Optional as Nullable, Set, Tuple
 
-from pyEDAA.ProjectModel import WaveformExchangeFile
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.ProjectModel import WaveformExchangeFile, ProjectFile, HumanReadableContent, Project, Design, FileSet, Attribute
+from pyEDAA.ProjectModel import File, VerilogSourceFile, SystemVerilogSourceFile, VHDLSourceFile
 
 
 @export
 class ValueChangeDumpFile(WaveformExchangeFile):
 	"""Verilog's waveform file (``*.vcd``) for exchanging value changes as defined by IEEE Std. 1364."""
+
+
+@export
+class IncludeDirectoriesAttribute(Attribute):
+	"""Include directories (``+incdir+``) used to compile the files of a fileset."""
+	KEY = "IncludeDirectories"
+	VALUE_TYPE = List[Path]
+
+
+@export
+class DefinesAttribute(Attribute):
+	"""Macro definitions (``+define+``) used to compile the files of a fileset. Macros without value map to ``None``."""
+	KEY = "Defines"
+	VALUE_TYPE = Dict[str, Nullable[str]]
+
+
+@export
+class LibraryFilesAttribute(Attribute):
+	"""Library files (``-v``) searched for undefined modules."""
+	KEY = "LibraryFiles"
+	VALUE_TYPE = List[Path]
+
+
+@export
+class LibraryDirectoriesAttribute(Attribute):
+	"""Library directories (``-y``) searched for undefined modules."""
+	KEY = "LibraryDirectories"
+	VALUE_TYPE = List[Path]
+
+
+@export
+class LibraryExtensionsAttribute(Attribute):
+	"""File extensions (``+libext+``) used to search library directories."""
+	KEY = "LibraryExtensions"
+	VALUE_TYPE = List[str]
+
+
+@export
+class VerilogCommandFile(ProjectFile, HumanReadableContent):
+	"""
+	A Verilog command file (``*.f``) listing source files and compile options.
+
+	Nested command files are read relative to the directory of the top-level command file (``-f``) or relative to
+	their own directory (``-F``). Source files are added to a fileset; include directories, defines and library options
+	are stored as attributes on that fileset.
+	"""
+
+	_fProject: Nullable[Project]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Nullable[Project] = None,
+		design:  Nullable[Design] =  None,
+		fileSet: Nullable[FileSet] = None
+	) -> None:
+		super().__init__(path, project, design, fileSet)
+
+		self._fProject = None
+
+	@property
+	def ProjectModel(self) -> Project:
+		return self._fProject
+
+	def Parse(self, fileSet: Nullable[FileSet] = None) -> FileSet:
+		"""
+		Read the command file and all nested command files in a single streaming pass.
+
+		:arg fileSet: Fileset to add files and attributes to. If ``None``, a new project is created and its default
+		              fileset is used. Paths are relative to the command file's directory.
+		:returns:     The fileset files were added to.
+		"""
+		if fileSet is None:
+			self._fProject = Project(self._path.stem, rootDirectory=self._path.parent)
+			fileSet = self._fProject.DefaultDesign.DefaultFileSet
+
+		collector = _CommandFileCollector(self._path.parent)
+		collector.Read(Path(self._path.name), Path("."), [])
+		collector.Build(fileSet)
+
+		return fileSet
+
+
+class _CommandFileCollector(metaclass=ExtendedType, slots=True):
+	"""Collects files and options of a command file tree, so they can be added to a fileset in bulk."""
+
+	_rootDirectory:      Path
+	_files:              List[File]
+	_filePaths:          Set[str]
+	_includeDirectories: List[Path]
+	_defines:            Dict[str, Nullable[str]]
+	_libraryFiles:       List[Path]
+	_libraryDirectories: List[Path]
+	_libraryExtensions:  List[str]
+	_read:               Set[Tuple[Path, Path]]
+
+	def __init__(self, rootDirectory: Path) -> None:
+		self._rootDirectory =      rootDirectory
+		self._files =              []
+		self._filePaths =          set()
+		self._includeDirectories = []
+		self._defines =            {}
+		self._libraryFiles =       []
+		self._libraryDirectories = []
+		self._libraryExtensions =  []
+		self._read =               set()
+
+	def Read(self, path: Path, base: Path, stack: List[Path]) -> None:
+		"""
+		Read a command file.
+
+		:arg path:  Path of the command file relative to the root directory.
+		:arg base:  Directory (relative to the root directory) relative paths in this command file are resolved against.
+		:arg stack: Command files currently being read (for cycle detection).
+		"""
+		resolvedPath = (self._rootDirectory / path).resolve()
+		if resolvedPath in stack:
+			chain = " -> ".join(str(item) for item in (*stack[stack.index(resolvedPath):], resolvedPath))
+			raise Exception(f"Cyclic reference between Verilog command files: {chain}")
+
+		# a command file included again with the same base directory can't contribute anything new
+		if (resolvedPath, base) in self._read:
+			return
+		self._read.add((resolvedPath, base))
+
+		stack.append(resolvedPath)
+		tokens = iter(_ReadTokens(resolvedPath))
+		for token in tokens:
+			if "$" in token:
+				token = _VARIABLE_PATTERN.sub(_SubstituteVariable, token)
+
+			try:
+				if token in ("-f", "-F"):
+					nestedPath = self._Path(base, self._Argument(tokens))
+					self.Read(nestedPath, Path(normpath(nestedPath.parent)) if token == "-F" else Path("."), stack)
+				elif token == "-v":
+					self._libraryFiles.append(self._Path(base, self._Argument(tokens)))
+				elif token == "-y":
+					self._libraryDirectories.append(self._Path(base, self._Argument(tokens)))
+				elif token.startswith("+incdir+"):
+					self._includeDirectories.extend(self._Path(base, item) for item in token[8:].split("+") if item != "")
+				elif token.startswith("+define+"):
+					for item in token[8:].split("+"):
+						if item != "":
+							name, separator, value = item.partition("=")
+							self._defines[name] = value if separator != "" else None
+				elif token.startswith("+libext+"):
+					self._libraryExtensions.extend(item for item in token[8:].split("+") if item != "")
+				elif token.startswith(("-", "+")):
+					# other tool options are not part of the project model
+					continue
+				else:
+					self._AddFile(self._Path(base, token))
+			except StopIteration as ex:
+				raise Exception(f"Missing argument for option '{token}' in Verilog command file '{resolvedPath!s}'.") from ex
+		stack.pop()
+
+	@staticmethod
+	def _Argument(tokens: Iterator[str]) -> str:
+		token = next(tokens)
+		if "$" in token:
+			token = _VARIABLE_PATTERN.sub(_SubstituteVariable, token)
+		return token
+
+	@staticmethod
+	def _Path(base: Path, value: str) -> Path:
+		path = Path(value)
+		if path.is_absolute():
+			return path
+		return Path(normpath(base / path))
+
+	def _AddFile(self, path: Path) -> None:
+		key = path.as_posix()
+		if key in self._filePaths:
+			return
+		self._filePaths.add(key)
+
+		self._files.append(_FILE_TYPES.get(path.suffix, File)(path))
+
+	def Build(self, fileSet: FileSet) -> None:
+		fileSet.AddFiles(self._files)
+		fileSet[IncludeDirectoriesAttribute] = self._includeDirectories
+		fileSet[DefinesAttribute] = self._defines
+		fileSet[LibraryFilesAttribute] = self._libraryFiles
+		fileSet[LibraryDirectoriesAttribute] = self._libraryDirectories
+		fileSet[LibraryExtensionsAttribute] = self._libraryExtensions
+
+
+_FILE_TYPES = {
+	".v":    VerilogSourceFile,
+	".sv":   SystemVerilogSourceFile,
+	".vhd":  VHDLSourceFile,
+	".vhdl": VHDLSourceFile
+}
+
+_TOKEN_PATTERN = re_compile(r'"([^"]*)"|(\S+)')
+_VARIABLE_PATTERN = re_compile(r"\$\{(\w+)\}|\$\((\w+)\)|\$(\w+)")
+
+#: Cache of tokenized command files: modification time and tokens.
+_TOKENS: Dict[Path, Tuple[int, List[str]]] = {}
+
+
+def _ReadTokens(path: Path) -> List[str]:
+	"""
+	Return the tokens of a command file with comments removed.
+
+	Tokens are cached per file and reused until the file changes.
+
+	:arg path: Resolved path to the command file.
+	:returns:  List of tokens.
+	"""
+	try:
+		mtime = path.stat().st_mtime_ns
+	except FileNotFoundError as ex:
+		raise Exception(f"Verilog command file '{path!s}' not found.") from ex
+
+	try:
+		cachedMTime, tokens = _TOKENS[path]
+		if cachedMTime == mtime:
+			return tokens
+	except KeyError:
+		pass
+
+	tokens = []
+	inComment = False
+	with path.open("r", encoding="utf-8") as file:
+		for line in file:
+			if inComment:
+				end = line.find("*/")
+				if end < 0:
+					continue
+				line = line[end + 2:]
+				inComment = False
+
+			while (start := line.find("/*")) >= 0:
+				end = line.find("*/", start + 2)
+				if end < 0:
+					line = line[:start]
+					inComment = True
+					break
+				line = line[:start] + " " + line[end + 2:]
+
+			for commentStart in (line.find("//"), line.find("#")):
+				if commentStart >= 0:
+					line = line[:commentStart]
+
+			for match in _TOKEN_PATTERN.finditer(line):
+				token = match.group(1) if match.group(1) is not None else match.group(2)
+				tokens.append(token)
+
+	_TOKENS[path] = (mtime, tokens)
+	return tokens
+
+
+def _SubstituteVariable(match) -> str:
+	name = match.group(1) or match.group(2) or match.group(3)
+	try:
+		return environ[name]
+	except KeyError as ex:
+		raise Exception(f"Environment variable '{name}' is not defined.") from ex
+
+
+@export
+class ModuleDeclaration(metaclass=ExtendedType, slots=True):
+	"""A module declaration (incl. ``program`` and ``interface`` declarations) found by :func:`ScanModules`."""
+
+	_name:     str
+	_hasPorts: bool
+	_kind:     str
+
+	def __init__(self, name: str, hasPorts: bool, kind: str = "module") -> None:
+		self._name =     name
+		self._hasPorts = hasPorts
+		self._kind =     kind
+
+	@property
+	def Name(self) -> str:
+		"""Read-only property returning the module's name (case preserved)."""
+		return self._name
+
+	@property
+	def HasPorts(self) -> bool:
+		"""Read-only property returning true, if the module has a non-empty port list."""
+		return self._hasPorts
+
+	@property
+	def Kind(self) -> str:
+		"""Read-only property returning the declaring keyword (``module``, ``macromodule``, ``program`` or ``interface``)."""
+		return self._kind
+
+	def __repr__(self) -> str:
+		return f"ModuleDeclaration({self._name}, hasPorts={self._hasPorts}, kind={self._kind})"
+
+
+_COMMENTS_AND_STRINGS = re_compile(r'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\])*"', DOTALL)
+_MODULE =               re_compile(r"\b(?:(virtual)\s+)?(module|macromodule|program|interface)\s+(?:(?:static|automatic)\s+)?([A-Za-z_]\w*)\s*(?:import\b[^;]*;\s*)*")
+_SUBROUTINE_HEADER =    re_compile(r"\b(?:function|task)\b[^;(]*")
+_INSTANTIATION =        re_compile(r"\b([A-Za-z_]\w*)\s+([A-Za-z_]\w*)\s*(?:\[[^\]]*\]\s*)?\(")
+
+#: Keywords, which can precede an identifier and an opening parenthesis, but don't start an instantiation.
+_KEYWORDS = frozenset((
+	"always", "always_comb", "always_ff", "always_latch", "and", "assert", "assign", "assume", "automatic", "begin", "bit",
+	"buf", "bufif0", "bufif1", "byte", "case", "casex", "casez", "chandle", "class", "cmos", "const", "cover", "default",
+	"disable", "else", "end", "endcase", "endfunction", "endgenerate", "endmodule", "endtask", "enum", "event", "for",
+	"foreach", "forever", "function", "generate", "genvar", "if", "initial", "inout", "input", "int", "integer", "local",
+	"localparam", "logic", "longint", "macromodule", "module", "nand", "nmos", "nor", "not", "notif0", "notif1", "or",
+	"output", "packed", "parameter", "pmos", "protected", "pure", "rand", "randc", "rcmos", "real", "realtime", "ref",
+	"reg", "repeat", "return", "rnmos", "rpmos", "rtran", "rtranif0", "rtranif1", "shortint", "shortreal", "signed",
+	"static", "string", "struct", "supply0", "supply1", "task", "time", "tran", "tranif0", "tranif1", "tri", "tri0",
+	"tri1", "triand", "trior", "trireg", "type", "typedef", "union", "unsigned", "uwire", "var", "virtual", "void",
+	"wait", "wand", "while", "wire", "wor", "xnor", "xor"
+))
+
+
+def _SkipParentheses(content: str, start: int) -> int:
+	"""Return the index after the parenthesis matching the opening parenthesis at *start*."""
+	depth = 0
+	for index in range(start, len(content)):
+		if content[index] == "(":
+			depth += 1
+		elif content[index] == ")":
+			depth -= 1
+			if depth == 0:
+				return index + 1
+	return len(content)
+
+
+def _RemoveParameterAssignments(content: str) -> str:
+	"""Remove parameter port lists and parameter value assignments (``#( ... )``) incl. nested parentheses."""
+	parts = []
+	position = 0
+	while (index := content.find("#", position)) >= 0:
+		opening = index + 1
+		while opening < len(content) and content[opening].isspace():
+			opening += 1
+		if opening < len(content) and content[opening] == "(":
+			parts.append(content[position:index])
+			parts.append(" ")
+			position = _SkipParentheses(content, opening)
+		else:
+			parts.append(content[position:opening])
+			position = opening
+	parts.append(content[position:])
+
+	return "".join(parts)
+
+
+@export
+def ScanModules(path: Path) -> Tuple[List[ModuleDeclaration], List[str]]:
+	"""
+	Scan a Verilog or SystemVerilog source file for module declarations and module instantiations.
+
+	The scanner uses regular expressions on the source text (without comments, strings and parameter assignments)
+	instead of a Verilog parser. Preprocessor directives aren't evaluated. Instantiations are recognized by the pattern
+	``name instance (`` (optionally with an instance array range), excluding keywords like gate primitives or data
+	types and excluding function and task headers.
+
+	:arg path: Path of the Verilog source file.
+	:returns:  A tuple of module declarations and instantiated names (case preserved, each name once, excl. own modules).
+	"""
+	content = _COMMENTS_AND_STRINGS.sub(" ", path.read_text(encoding="utf-8", errors="replace"))
+	content = _RemoveParameterAssignments(content)
+
+	modules = []
+	for match in _MODULE.finditer(content):
+		# 'virtual interface bus_if vif;' declares a variable referencing an interface.
+		if match[1] is not None:
+			continue
+
+		end = match.end()
+		hasPorts = False
+		if end < len(content) and content[end] == "(":
+			hasPorts = content[end + 1:_SkipParentheses(content, end) - 1].strip() != ""
+		modules.append(ModuleDeclaration(match[3], hasPorts, match[2]))
+
+	# Function and task headers (e.g. 'function automatic logic [7:0] parity(') look like instantiations.
+	content = _SUBROUTINE_HEADER.sub(" ", content)
+
+	declared = {module.Name for module in modules}
+	references = {}
+	for match in _INSTANTIATION.finditer(content):
+		name = match[1]
+		if name not in _KEYWORDS and match[2] not in _KEYWORDS and name not in declared:
+			references[name] = None
+
+	return modules, list(references)
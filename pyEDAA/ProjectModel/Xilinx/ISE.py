@@ -29,16 +29,196 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for Xilinx ISE."""
-from pyTooling.Decorators import export
+from pathlib               import Path
+from typing                import Dict, Iterable, List, Optional as Nullable, Tuple
+from xml.etree.ElementTree import iterparse
 
-from pyEDAA.ProjectModel import ConstraintFile, ProjectFile, HumanReadableContent
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+from pyVHDLModel           import VHDLVersion
+
+from pyEDAA.ProjectModel import ProjectFile, XMLContent, HumanReadableContent, Project, Design, FileSet, Attribute
+from pyEDAA.ProjectModel import VHDLLibrary
+from pyEDAA.ProjectModel import File as Model_File
+from pyEDAA.ProjectModel import ConstraintFile as Model_ConstraintFile
+from pyEDAA.ProjectModel import VerilogSourceFile as Model_VerilogSourceFile
+from pyEDAA.ProjectModel import VHDLSourceFile as Model_VHDLSourceFile
+
+
+_NAMESPACE =   "{http://www.xilinx.com/XMLSchema}"
+_NAME =        f"{_NAMESPACE}name"
+_TYPE =        f"{_NAMESPACE}type"
+_VALUE =       f"{_NAMESPACE}value"
+_FILE =        f"{_NAMESPACE}file"
+_ASSOCIATION = f"{_NAMESPACE}association"
+_LIBRARY =     f"{_NAMESPACE}library"
+_LIBRARIES =   f"{_NAMESPACE}libraries"
+_PROPERTY =    f"{_NAMESPACE}property"
 
 
 @export
-class ISEProjectFile(ProjectFile):
-	pass
+class AssociationAttribute(Attribute):
+	KEY = "Association"
+	VALUE_TYPE = Iterable[str]
+
+
+@export
+class ISEFileMixIn(metaclass=ExtendedType, mixin=True):
+	def _registerAttributes(self) -> None:
+		self._attributes[AssociationAttribute] = []
+
+
+@export
+class File(Model_File):
+	def _registerAttributes(self) -> None:
+		super()._registerAttributes()
+		ISEFileMixIn._registerAttributes(self)
+
+
+@export
+class ConstraintFile(Model_ConstraintFile):
+	def _registerAttributes(self) -> None:
+		super()._registerAttributes()
+		ISEFileMixIn._registerAttributes(self)
+
+
+@export
+class VerilogSourceFile(Model_VerilogSourceFile):
+	def _registerAttributes(self) -> None:
+		super()._registerAttributes()
+		ISEFileMixIn._registerAttributes(self)
+
+
+@export
+class VHDLSourceFile(Model_VHDLSourceFile):
+	def _registerAttributes(self) -> None:
+		super()._registerAttributes()
+		ISEFileMixIn._registerAttributes(self)
 
 
 @export
 class UCFConstraintFile(ConstraintFile, HumanReadableContent):
 	pass
+
+
+@export
+class ISEProjectFile(ProjectFile, XMLContent):
+	"""
+	A Xilinx ISE project file (``*.xise``).
+
+	Files associated with ``Implementation`` are added to fileset ``Implementation``, files only associated with a
+	simulation are added to fileset ``Simulation``. All associations are kept in :class:`AssociationAttribute`.
+	"""
+
+	IMPLEMENTATION_FILESET = "Implementation"  #: Fileset for files associated with the implementation.
+	SIMULATION_FILESET =     "Simulation"      #: Fileset for files only associated with simulations.
+
+	_iseProject: Nullable[Project]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Nullable[Project] = None,
+		design:  Nullable[Design] =  None,
+		fileSet: Nullable[FileSet] = None
+	) -> None:
+		super().__init__(path, project, design, fileSet)
+
+		self._iseProject = None
+
+	@property
+	def ProjectModel(self) -> Project:
+		return self._iseProject
+
+	def Parse(self) -> None:
+		"""Read the project file in a single streaming pass and create a project model."""
+		if not self._path.exists():
+			raise Exception(f"ISE project file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
+
+		self._iseProject = Project(self._path.stem, rootDirectory=self._path.parent)
+		design = self._iseProject.DefaultDesign
+
+		files: Dict[str, List[Model_File]] = {self.IMPLEMENTATION_FILESET: [], self.SIMULATION_FILESET: []}
+		libraries: Dict[Model_File, str] = {}
+		declaredLibraries: List[str] = []
+		properties: Dict[str, str] = {}
+
+		try:
+			for _, element in iterparse(self._path, events=("end", )):
+				tag = element.tag
+				if tag == _FILE:
+					file, fileSetName, libraryName = self._ParseFile(element)
+					files[fileSetName].append(file)
+					if libraryName is not None:
+						libraries[file] = libraryName
+					element.clear()
+				elif tag == _PROPERTY:
+					properties[element.get(_NAME)] = element.get(_VALUE)
+					element.clear()
+				elif tag == _LIBRARIES:
+					declaredLibraries.extend(library.get(_NAME) for library in element)
+					element.clear()
+		except Exception as ex:
+			raise Exception(f"Error while parsing ISE project file '{self._path!s}'.") from ex
+
+		for fileSetName, fileSetFiles in files.items():
+			fileSet = FileSet(fileSetName, design=design)
+			fileSet.AddFiles(fileSetFiles)
+			for file in fileSetFiles:
+				if file in libraries:
+					file.VHDLLibrary = fileSet.GetOrCreateVHDLLibrary(libraries[file])
+
+		for libraryName in declaredLibraries:
+			if libraryName not in design.VHDLLibraries:
+				VHDLLibrary(libraryName, design=design)
+
+		design.DefaultFileSet = self.IMPLEMENTATION_FILESET
+		self._ParseProperties(design, properties)
+
+	def _ParseFile(self, fileElement) -> Tuple[Model_File, str, Nullable[str]]:
+		filePath = Path(fileElement.get(_NAME))
+		fileType = fileElement.get(_TYPE)
+		associations = [child.get(_NAME) for child in fileElement if child.tag == _ASSOCIATION]
+
+		libraryName = None
+		if fileType == "FILE_VHDL":
+			file = VHDLSourceFile(filePath)
+			libraryName = "work"
+			for child in fileElement:
+				if child.tag == _LIBRARY:
+					libraryName = child.get(_NAME)
+		elif fileType == "FILE_VERILOG":
+			file = VerilogSourceFile(filePath)
+		elif fileType == "FILE_UCF":
+			file = UCFConstraintFile(filePath)
+		else:
+			file = File(filePath)
+
+		file[AssociationAttribute] = associations
+		if "Implementation" not in associations and any(association.endswith("Simulation") for association in associations):
+			fileSetName = self.SIMULATION_FILESET
+		else:
+			fileSetName = self.IMPLEMENTATION_FILESET
+
+		return file, fileSetName, libraryName
+
+	def _ParseProperties(self, design: Design, properties: Dict[str, str]) -> None:
+		if (value := properties.get("Implementation Top")) is not None and value != "":
+			# e.g. 'Architecture|toplevel|rtl' or 'Module|toplevel'; otherwise the whole value is the name
+			_, separator, remainder = value.partition("|")
+			design.FileSets[self.IMPLEMENTATION_FILESET].TopLevel = remainder.partition("|")[0] if separator != "" else value
+		if (value := properties.get("Selected Simulation Root Source Node Behavioral")) is not None and value != "":
+			# e.g. 'work.toplevel_tb'
+			design.FileSets[self.SIMULATION_FILESET].TopLevel = value.split(".")[-1]
+		if (value := properties.get("VHDL Source Analysis Standard")) is not None:
+			try:
+				design.VHDLVersion = _VHDL_STANDARDS[value]
+			except KeyError as ex:
+				raise Exception(f"Unknown VHDL standard '{value}' in ISE project file '{self._path!s}'.") from ex
+
+
+_VHDL_STANDARDS = {
+	"VHDL-93":   VHDLVersion.VHDL93,
+	"VHDL-200X": VHDLVersion.VHDL2008,
+	"VHDL-2008": VHDLVersion.VHDL2008
+}
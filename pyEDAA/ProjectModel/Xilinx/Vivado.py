@@ -29,19 +29,27 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for Xilinx Vivado."""
-from pathlib import Path
-from typing  import Iterable, Optional as Nullable
-from xml.dom import minidom, Node
+from concurrent.futures    import Executor, Future, ProcessPoolExecutor
+from json                  import load as json_load, dump as json_dump
+from os.path               import relpath
+from pathlib               import Path
+from typing                import Any, Dict, Generator, Iterable, Iterator, List, Optional as Nullable, Set, TextIO, Tuple, Union
+from xml.dom               import minidom, Node
+from xml.etree.ElementTree import iterparse
+from xml.sax.saxutils      import quoteattr
 
 from pyTooling.Decorators  import export
 from pyTooling.MetaClasses import ExtendedType
 from pyVHDLModel           import VHDLVersion
 
-from pyEDAA.ProjectModel import ProjectFile, XMLFile, XMLContent, SDCContent, Project, FileSet, Attribute, Design
+from pyEDAA.ProjectModel import ProjectFile, XMLFile, XMLContent, SDCContent, TCLContent, Project, FileSet, Attribute, Design
+from pyEDAA.ProjectModel import FileType, FileTypes, VHDLLibrary
 from pyEDAA.ProjectModel import File as Model_File
 from pyEDAA.ProjectModel import ConstraintFile as Model_ConstraintFile
 from pyEDAA.ProjectModel import VerilogSourceFile as Model_VerilogSourceFile
+from pyEDAA.ProjectModel import SystemVerilogSourceFile as Model_SystemVerilogSourceFile
 from pyEDAA.ProjectModel import VHDLSourceFile as Model_VHDLSourceFile
+from pyEDAA.ProjectModel.TCL import TCLEvaluator, FormatList
 
 
 @export
@@ -87,6 +95,13 @@ class VerilogSourceFile(Model_VerilogSourceFile):
 		VivadoFileMixIn._registerAttributes(self)
 
 
+@export
+class SystemVerilogSourceFile(Model_SystemVerilogSourceFile):
+	def _registerAttributes(self) -> None:
+		super()._registerAttributes()
+		VivadoFileMixIn._registerAttributes(self)
+
+
 @export
 class VHDLSourceFile(Model_VHDLSourceFile):
 	def _registerAttributes(self) -> None:
@@ -98,7 +113,9 @@ class VHDLSourceFile(Model_VHDLSourceFile):
 class VivadoProjectFile(ProjectFile, XMLContent):
 	"""A Vivado project file (``*.xpr``)."""
 
-	_xprProject: Project
+	_xprProject:   Project
+	_xprDocument:  Nullable[minidom.Document]
+	_fileNodes:    Dict[Model_File, minidom.Element]
 
 	def __init__(
 		self,
@@ -109,13 +126,24 @@ class VivadoProjectFile(ProjectFile, XMLContent):
 	) -> None:
 		super().__init__(path, project, design, fileSet)
 
-		self._xprProject = None
+		self._xprProject =   None
+		self._xprDocument =  None
+		self._fileNodes =    {}
 
 	@property
 	def ProjectModel(self) -> Project:
 		return self._xprProject
 
-	def Parse(self) -> None:
+	def Parse(self, lazy: bool = False, fileSets: Nullable[Iterable[str]] = None) -> None:
+		"""
+		Parse the Vivado project file and create a project model.
+
+		In lazy mode, only the positions of ``<FileSet>`` elements are recorded. A fileset's files are created when the
+		fileset's files or sub-filesets are accessed the first time (see :class:`VivadoFileSet`).
+
+		:arg lazy:     If true, filesets are materialized on first access.
+		:arg fileSets: Optional names of filesets to load. Other filesets are skipped, but preserved when writing.
+		"""
 		if not self._path.exists():
 			raise Exception(f"Vivado project file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
 
@@ -124,82 +152,674 @@ class VivadoProjectFile(ProjectFile, XMLContent):
 		except Exception as ex:
 			raise Exception(f"Couldn't open '{self._path!s}'.") from ex
 
-		self._xprProject = Project(self._path.stem, rootDirectory=self._path.parent)
-		self._ParseRootElement(root)
+		self._xprDocument =  root.ownerDocument
+		self._xprProject =   Project(self._path.stem, rootDirectory=self._path.parent)
+		self._fileNodes =    {}
+		self._ParseRootElement(root, lazy, None if fileSets is None else set(fileSets))
+
+	def ParseIPCores(self, executor: Nullable[Executor] = None, maxWorkers: Nullable[int] = None) -> None:
+		"""
+		Schedule parsing of all IP core instantiation files (``*.xci``) of the parsed project.
+
+		Each IP file is parsed by a worker process. The results are attached lazily to the :class:`IPCoreInstantiationFile`
+		objects, thus this method returns immediately and only blocks, when an IP core's data is accessed.
+
+		:arg executor:   Optional executor to run the parsers in. If ``None``, a process pool is created.
+		:arg maxWorkers: Number of worker processes, if a process pool is created.
+		"""
+		if self._xprProject is None:
+			raise Exception(f"Vivado project file '{self._path!s}' was not parsed.")
+
+		ipCores = [ipCore for design in self._xprProject.Designs.values() for ipCore in design.Files(IPCoreInstantiationFile)]
+		if len(ipCores) == 0:
+			return
+
+		ownsExecutor = executor is None
+		if ownsExecutor:
+			executor = ProcessPoolExecutor(max_workers=maxWorkers)
+
+		try:
+			for ipCore in ipCores:
+				ipCore._future = executor.submit(_ReadIPCoreInstantiationFile, str(ipCore.ResolvedPath))
+		finally:
+			if ownsExecutor:
+				# Already submitted jobs continue to run in the background.
+				executor.shutdown(wait=False)
+
+	def Write(self, path: Nullable[Path] = None) -> None:
+		"""
+		Write the project model as a Vivado project file.
 
-	def _ParseRootElement(self, root) -> None:
+		Filesets are serialized from the project model with a streaming writer. Sections and XML attributes not represented
+		by the project model (e.g. ``<Configuration>`` or ``<Runs>``) are copied from the parsed document, so a regenerated
+		project file differs only where the model was modified.
+
+		:arg path: Path of the project file to write. Default: the parsed project file.
+		"""
+		if self._xprProject is None:
+			raise Exception(f"Vivado project file '{self._path!s}' was not parsed.")
+
+		path = self._path if path is None else path
+		with path.open("w", encoding="utf-8", newline="\n") as file:
+			write = file.write
+			write('<?xml version="1.0" encoding="UTF-8"?>\n')
+
+			comments = False
+			for node in self._xprDocument.childNodes:
+				if node.nodeType == Node.COMMENT_NODE:
+					write(f"{node.toxml()}\n")
+					comments = True
+				elif node.nodeType == Node.ELEMENT_NODE:
+					if comments:
+						write("\n")
+					self._WriteProjectElement(write, node)
+
+	def _ParseRootElement(self, root, lazy: bool, fileSetNames: Nullable[Set[str]]) -> None:
 		for rootNode in root.childNodes:
 			if rootNode.nodeName == "FileSets":
-				self._ParseFileSets(rootNode)
+				self._ParseFileSets(rootNode, lazy, fileSetNames)
 				break
 
-	def _ParseFileSets(self, filesetsNode) -> None:
+	def _ParseFileSets(self, filesetsNode, lazy: bool, fileSetNames: Nullable[Set[str]]) -> None:
 		for fileSetsNode in filesetsNode.childNodes:
 			if fileSetsNode.nodeType == Node.ELEMENT_NODE and fileSetsNode.tagName == "FileSet":
-				self._ParseFileSet(fileSetsNode)
+				if fileSetNames is None or fileSetsNode.getAttribute("Name") in fileSetNames:
+					self._ParseFileSet(fileSetsNode, lazy)
 
-	def _ParseFileSet(self, filesetNode) -> None:
+	def _ParseFileSet(self, filesetNode, lazy: bool) -> None:
 		filesetName = filesetNode.getAttribute("Name")
-		fileset = FileSet(filesetName, design=self._xprProject.DefaultDesign)
+		fileset = VivadoFileSet(filesetName, self, filesetNode, design=self._xprProject.DefaultDesign)
+		fileset.TopLevel = self._ParseTopModule(filesetNode)
 
+		if not lazy:
+			fileset._Materialize()
+
+	def _ParseFileSetFiles(self, filesetNode, fileset: "VivadoFileSet") -> None:
 		for fileNode in filesetNode.childNodes:
-			if fileNode.nodeType == Node.ELEMENT_NODE:
-				if fileNode.tagName == "File":
-					self._ParseFile(fileNode, fileset)
-				elif fileNode.nodeType == Node.ELEMENT_NODE and fileNode.tagName == "Config":
-					self._ParseFileSetConfig(fileNode, fileset)
+			if fileNode.nodeType == Node.ELEMENT_NODE and fileNode.tagName == "File":
+				self._ParseFile(fileNode, fileset)
 
 	def _ParseFile(self, fileNode, fileset) -> None:
 		croppedPath = fileNode.getAttribute("Path").replace("$PPRDIR/", "")
 		filePath = Path(croppedPath)
 		if filePath.suffix in (".vhd", ".vhdl"):
-			self._ParseVHDLFile(fileNode, filePath, fileset)
+			file = self._ParseVHDLFile(fileNode, filePath, fileset)
 		elif filePath.suffix == ".xdc":
-			self._ParseXDCFile(fileNode, filePath, fileset)
+			file = self._ParseXDCFile(fileNode, filePath, fileset)
 		elif filePath.suffix == ".v":
-			self._ParseVerilogFile(fileNode, filePath, fileset)
+			file = self._ParseVerilogFile(fileNode, filePath, fileset)
 		elif filePath.suffix == ".xci":
-			self._ParseXCIFile(fileNode, filePath, fileset)
+			file = self._ParseXCIFile(fileNode, filePath, fileset)
 		else:
-			self._ParseDefaultFile(fileNode, filePath, fileset)
+			file = self._ParseDefaultFile(fileNode, filePath, fileset)
+
+		self._fileNodes[file] = fileNode
 
-	def _ParseVHDLFile(self, fileNode, path, fileset) -> None:
+	def _ParseVHDLFile(self, fileNode, path, fileset) -> Model_File:
 		vhdlFile = VHDLSourceFile(path)
 		fileset.AddFile(vhdlFile)
-		usedInAttr = vhdlFile[UsedInAttribute]
 
 		for childNode in fileNode.childNodes:
 			if childNode.nodeType == Node.ELEMENT_NODE and childNode.tagName == "FileInfo":
-				if childNode.getAttribute("SFType") == "VHDL2008":
-					vhdlFile.VHDLVersion = VHDLVersion.VHDL2008
-				else:
-					vhdlFile.VHDLVersion = VHDLVersion.VHDL93
+				vhdlFile.VHDLVersion = _SFTYPE_TO_VHDLVERSION.get(childNode.getAttribute("SFType"), VHDLVersion.VHDL93)
 
 				for fileAttribute in childNode.childNodes:
 					if fileAttribute.nodeType == Node.ELEMENT_NODE and fileAttribute.tagName == "Attr":
 						if fileAttribute.getAttribute("Name") == "Library":
 							libraryName = fileAttribute.getAttribute("Val")
 							vhdlFile.VHDLLibrary = fileset.GetOrCreateVHDLLibrary(libraryName)
-						elif fileAttribute.getAttribute("Val") == "UsedIn":
-							usedInAttr.append(fileAttribute.getAttribute("Val"))
 
-	def _ParseDefaultFile(self, _, path, fileset) -> None:
-		File(path, fileSet=fileset)
+		self._ParseFileAttributes(fileNode, vhdlFile)
+		return vhdlFile
+
+	def _ParseDefaultFile(self, _, path, fileset) -> Model_File:
+		return File(path, fileSet=fileset)
+
+	def _ParseXDCFile(self, fileNode, path, fileset) -> Model_File:
+		xdcFile = XDCConstraintFile(path, fileSet=fileset)
+		self._ParseFileAttributes(fileNode, xdcFile)
+		return xdcFile
+
+	def _ParseVerilogFile(self, fileNode, path, fileset) -> Model_File:
+		verilogFile = VerilogSourceFile(path, fileSet=fileset)
+		self._ParseFileAttributes(fileNode, verilogFile)
+		return verilogFile
+
+	def _ParseXCIFile(self, _, path, fileset) -> Model_File:
+		return IPCoreInstantiationFile(path, fileSet=fileset)
+
+	def _ParseFileAttributes(self, fileNode, file: Model_File) -> None:
+		for childNode in fileNode.childNodes:
+			if childNode.nodeType == Node.ELEMENT_NODE and childNode.tagName == "FileInfo":
+				for fileAttribute in childNode.childNodes:
+					if fileAttribute.nodeType == Node.ELEMENT_NODE and fileAttribute.tagName == "Attr":
+						name = fileAttribute.getAttribute("Name")
+						if name == "UsedIn":
+							file[UsedInAttribute].append(fileAttribute.getAttribute("Val"))
+						elif name == "ScopedToRef" and isinstance(file, XDCConstraintFile):
+							file[ScopeToRefAttribute] = fileAttribute.getAttribute("Val")
+						elif name == "ScopedToCell" and isinstance(file, XDCConstraintFile):
+							file[ScopeToCellAttribute] = fileAttribute.getAttribute("Val")
+
+	def _ParseTopModule(self, filesetNode) -> Nullable[str]:
+		for configNode in filesetNode.childNodes:
+			if configNode.nodeType == Node.ELEMENT_NODE and configNode.tagName == "Config":
+				for option in configNode.childNodes:
+					if option.nodeType == Node.ELEMENT_NODE and option.tagName == "Option":
+						if option.getAttribute("Name") == "TopModule":
+							return option.getAttribute("Val")
+
+		return None
+
+	def _WriteProjectElement(self, write, projectNode) -> None:
+		write(f"<{projectNode.tagName}{_XMLAttributes(projectNode)}>")
+		for node in projectNode.childNodes:
+			if node.nodeType == Node.ELEMENT_NODE and node.tagName == "FileSets":
+				self._WriteFileSets(write, node)
+			else:
+				write(node.toxml())
+		write(f"</{projectNode.tagName}>\n")
 
-	def _ParseXDCFile(self, _, path, fileset) -> None:
-		XDCConstraintFile(path, fileSet=fileset)
+	def _WriteFileSets(self, write, fileSetsNode) -> None:
+		write(f"<FileSets{_XMLAttributes(fileSetsNode)}>")
 
-	def _ParseVerilogFile(self, _, path, fileset) -> None:
-		VerilogSourceFile(path, fileSet=fileset)
+		fileSets = {}
+		newFileSets = []
+		for fileSet in self._xprProject.DefaultDesign.FileSets.values():
+			if isinstance(fileSet, VivadoFileSet) and fileSet._fileSetNode is not None:
+				fileSets[fileSet._fileSetNode] = fileSet
+			elif fileSet.FileCount > 0:
+				newFileSets.append(fileSet)
+
+		for fileSetNode in fileSetsNode.childNodes:
+			if fileSetNode.nodeType == Node.ELEMENT_NODE and fileSetNode.tagName == "FileSet":
+				write("\n    ")
+				if (fileSet := fileSets.get(fileSetNode)) is None:
+					# Fileset was skipped while parsing.
+					write(fileSetNode.toxml())
+				else:
+					self._WriteFileSet(write, fileSet)
+		for fileSet in newFileSets:
+			write("\n    ")
+			self._WriteFileSet(write, fileSet)
+
+		write("\n  </FileSets>")
+
+	def _WriteFileSet(self, write, fileSet: FileSet) -> None:
+		fileSetNode = fileSet._fileSetNode if isinstance(fileSet, VivadoFileSet) else None
+		if fileSetNode is not None and not fileSet._materialized and fileSet.Name == fileSetNode.getAttribute("Name"):
+			# An unmaterialized fileset has no modified files, thus it's copied unless its toplevel was changed.
+			if self._ParseTopModule(fileSetNode) == fileSet.TopLevel:
+				write(fileSetNode.toxml())
+				return
+
+		if fileSetNode is None:
+			write(f'<FileSet Name={quoteattr(fileSet.Name)} Type="DesignSrcs" RelSrcDir={quoteattr(f"$PSRCDIR/{fileSet.Name}")}>')
+			childNodes = []
+		else:
+			write(f"<FileSet{_XMLAttributes(fileSetNode, Name=fileSet.Name)}>")
+			childNodes = [node for node in fileSetNode.childNodes if node.nodeType == Node.ELEMENT_NODE]
 
-	def _ParseXCIFile(self, _, path, fileset) -> None:
-		IPCoreInstantiationFile(path, fileSet=fileset)
+		filesWritten = False
+		configWritten = False
+		for childNode in childNodes:
+			if childNode.tagName == "File" or childNode.tagName == "Config":
+				if not filesWritten:
+					for file in fileSet.Files(fileSet=False):
+						self._WriteFile(write, file)
+					filesWritten = True
 
-	def _ParseFileSetConfig(self, fileNode, fileset) -> None:
-		for option in fileNode.childNodes:
-			if option.nodeType == Node.ELEMENT_NODE and option.tagName == "Option":
-				if option.getAttribute("Name") == "TopModule":
-					fileset.TopLevel = option.getAttribute("Val")
+				if childNode.tagName == "Config":
+					self._WriteFileSetConfig(write, fileSet, childNode)
+					configWritten = True
+			else:
+				write(f"\n      {childNode.toxml()}")
+
+		if not filesWritten:
+			for file in fileSet.Files(fileSet=False):
+				self._WriteFile(write, file)
+		if not configWritten and fileSet.TopLevel is not None:
+			self._WriteFileSetConfig(write, fileSet, None)
+
+		write("\n    </FileSet>")
+
+	def _WriteFile(self, write, file: Model_File) -> None:
+		fileNode = self._fileNodes.get(file)
+		fileInfoNode = None
+		childNodes = []
+		if fileNode is not None:
+			for childNode in fileNode.childNodes:
+				if childNode.nodeType == Node.ELEMENT_NODE:
+					if childNode.tagName == "FileInfo":
+						fileInfoNode = childNode
+					else:
+						childNodes.append(childNode)
+
+		if fileNode is not None and Path(fileNode.getAttribute("Path").replace("$PPRDIR/", "")) == file.Path:
+			write(f"\n      <File{_XMLAttributes(fileNode)}")
+		else:
+			path = file.Path.as_posix() if file.Path.is_absolute() else f"$PPRDIR/{file.Path.as_posix()}"
+			write(f"\n      <File Path={quoteattr(path)}")
+
+		# Collect FileInfo attributes and <Attr> entries; values not represented by the model are copied.
+		fileInfo = {} if fileInfoNode is None else {name: value for name, value in fileInfoNode.attributes.items()}
+		attributes = []
+		modeled = set()
+		if isinstance(file, Model_VHDLSourceFile):
+			fileInfo.pop("SFType", None)
+			for sfType, vhdlVersion in _SFTYPE_TO_VHDLVERSION.items():
+				# VHDLVersion is not hashable, thus a reverse dictionary can't be used.
+				if file._vhdlVersion is vhdlVersion:
+					fileInfo = {"SFType": sfType, **fileInfo}
+					break
+			if file._vhdlLibrary is not None:
+				attributes.append(("Library", file._vhdlLibrary.Name))
+			modeled.add("Library")
+		if UsedInAttribute in file._attributes:
+			attributes.extend(("UsedIn", usedIn) for usedIn in file._attributes[UsedInAttribute])
+			modeled.add("UsedIn")
+		if isinstance(file, XDCConstraintFile):
+			if (scopedToRef := file._attributes[ScopeToRefAttribute]) is not None:
+				attributes.append(("ScopedToRef", scopedToRef))
+			if (scopedToCell := file._attributes[ScopeToCellAttribute]) is not None:
+				attributes.append(("ScopedToCell", scopedToCell))
+			modeled.update(("ScopedToRef", "ScopedToCell"))
+		if fileInfoNode is not None:
+			for attributeNode in fileInfoNode.childNodes:
+				if attributeNode.nodeType == Node.ELEMENT_NODE and not (attributeNode.tagName == "Attr" and attributeNode.getAttribute("Name") in modeled):
+					attributes.append(attributeNode)
+
+		if fileInfoNode is None and len(fileInfo) == 0 and len(attributes) == 0 and len(childNodes) == 0:
+			write("/>")
+			return
+
+		write(">")
+		if fileInfoNode is not None or len(fileInfo) > 0 or len(attributes) > 0:
+			infoAttributes = "".join(f" {name}={quoteattr(value)}" for name, value in fileInfo.items())
+			if len(attributes) == 0:
+				write(f"\n        <FileInfo{infoAttributes}/>")
+			else:
+				write(f"\n        <FileInfo{infoAttributes}>")
+				for attribute in attributes:
+					if isinstance(attribute, tuple):
+						write(f"\n          <Attr Name={quoteattr(attribute[0])} Val={quoteattr(attribute[1])}/>")
+					else:
+						write(f"\n          {attribute.toxml()}")
+				write("\n        </FileInfo>")
+		for childNode in childNodes:
+			write(f"\n        {childNode.toxml()}")
+		write("\n      </File>")
+
+	def _WriteFileSetConfig(self, write, fileSet: FileSet, configNode) -> None:
+		write("\n      <Config>")
+		topModuleWritten = False
+		if configNode is not None:
+			for optionNode in configNode.childNodes:
+				if optionNode.nodeType != Node.ELEMENT_NODE:
+					continue
+				elif optionNode.tagName == "Option" and optionNode.getAttribute("Name") == "TopModule":
+					if fileSet.TopLevel is not None:
+						write(f'\n        <Option Name="TopModule" Val={quoteattr(fileSet.TopLevel)}/>')
+					topModuleWritten = True
+				else:
+					write(f"\n        {optionNode.toxml()}")
+		if not topModuleWritten and fileSet.TopLevel is not None:
+			write(f'\n        <Option Name="TopModule" Val={quoteattr(fileSet.TopLevel)}/>')
+		write("\n      </Config>")
+
+
+@export
+class VivadoFileSet(FileSet):
+	"""
+	A fileset of a Vivado project file.
+
+	The fileset's files are created from the ``<FileSet>`` element of the project file when files or sub-filesets are
+	accessed the first time. Thus, a lazily parsed project only materializes the filesets in use.
+
+	:arg name:        Name of this fileset.
+	:arg xprFile:     The Vivado project file this fileset was read from.
+	:arg fileSetNode: The ``<FileSet>`` element describing this fileset.
+	:arg design:      Design the fileset is associated with.
+	"""
+
+	_xprFile:      Nullable[VivadoProjectFile]
+	_fileSetNode:  Nullable[minidom.Element]
+	_materialized: bool
+
+	def __init__(
+		self,
+		name: str,
+		xprFile:     Nullable[VivadoProjectFile] = None,
+		fileSetNode: Nullable[minidom.Element] =   None,
+		design:      Nullable[Design] =            None
+	) -> None:
+		super().__init__(name, design=design)
+
+		self._xprFile =      xprFile
+		self._fileSetNode =  fileSetNode
+		self._materialized = fileSetNode is None
+
+	@property
+	def IsMaterialized(self) -> bool:
+		"""Read-only property returning true, if the fileset's files have been created."""
+		return self._materialized
+
+	def _Materialize(self) -> None:
+		if not self._materialized:
+			self._materialized = True
+			self._xprFile._ParseFileSetFiles(self._fileSetNode, self)
+
+	@property
+	def FileSets(self) -> Dict[str, FileSet]:
+		"""Read-only property returning the dictionary of sub-filesets."""
+		self._Materialize()
+		return self._fileSets
+
+	def Files(self, fileType: FileType = FileTypes.Any, fileSet: Union[bool, str, FileSet] = None) -> Generator[Model_File, None, None]:
+		"""
+		Method returning the files of this fileset. Files are created on first access.
+
+		:arg fileType: A filter for file types. Default: ``Any``.
+		:arg fileSet:  Specifies how to handle sub-filesets.
+		"""
+		self._Materialize()
+		return super().Files(fileType, fileSet)
+
+	def AddFile(self, file: Model_File) -> None:
+		self._Materialize()
+		super().AddFile(file)
+
+	@property
+	def FileCount(self) -> int:
+		"""Returns number of files excl. sub-filesets."""
+		self._Materialize()
+		return len(self._files)
+
+	@property
+	def TotalFileCount(self) -> int:
+		"""Returns number of files incl. the files in sub-filesets."""
+		self._Materialize()
+		return super().TotalFileCount
+
+
+@export
+class VivadoNonProjectScript(ProjectFile, TCLContent):
+	"""
+	A Vivado TCL script (``*.tcl``) for the non-project mode.
+
+	Source files are read from ``read_vhdl``, ``read_verilog``, ``read_xdc`` and ``add_files`` commands. Toplevels are
+	read from ``set_property top`` and ``synth_design -top``. Nested scripts are followed via ``source``. Other commands
+	are ignored.
+	"""
+
+	DEFAULT_VHDL_LIBRARY = "xil_defaultlib"  #: VHDL library used if no ``-library`` option is given.
+	SOURCES_FILESET =      "sources_1"       #: Fileset for HDL sources.
+	CONSTRAINTS_FILESET =  "constrs_1"       #: Fileset for constraint files.
+	SIMULATION_FILESET =   "sim_1"           #: Fileset for simulation sources.
+
+	_scriptProject: Nullable[Project]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Nullable[Project] = None,
+		design:  Nullable[Design] =  None,
+		fileSet: Nullable[FileSet] = None
+	) -> None:
+		super().__init__(path, project, design, fileSet)
+
+		self._scriptProject = None
+
+	@property
+	def ProjectModel(self) -> Project:
+		return self._scriptProject
+
+	def Parse(self, directory: Nullable[Path] = None, variables: Nullable[Dict[str, str]] = None) -> None:
+		"""
+		Read the script in a single streaming pass and create a project model.
+
+		:arg directory: Working directory of the script, used to resolve relative paths. Default: the script's directory.
+		:arg variables: Predefined TCL variables.
+		"""
+		directory = self._path.parent if directory is None else directory
+		self._scriptProject = Project(self._path.stem, rootDirectory=directory)
+
+		evaluator = TCLEvaluator(directory, variables)
+		evaluator.RegisterCommand("current_fileset", self._CurrentFileSet)
+		evaluator.RegisterCommand("get_filesets", lambda arguments: arguments[-1])
+
+		collector = _ScriptCollector(self._scriptProject.DefaultDesign)
+		self._ReadScript(self._path, evaluator, collector, set())
+		collector.Build()
+
+	def _ReadScript(self, path: Path, evaluator: TCLEvaluator, collector: "_ScriptCollector", visited: Set[Path]) -> None:
+		if not path.exists():
+			raise Exception(f"Vivado TCL script '{path!s}' not found.") from FileNotFoundError(f"File '{path!s}' not found.")
+
+		resolvedPath = path.resolve()
+		if resolvedPath in visited:
+			raise Exception(f"Vivado TCL script '{path!s}' is sourced recursively.")
+		visited.add(resolvedPath)
+
+		scriptPath = evaluator.ScriptPath
+		evaluator.ScriptPath = resolvedPath
+		with path.open("r", encoding="utf-8") as file:
+			for line, words in evaluator.IterateCommands(file):
+				command = words[0]
+				try:
+					if command == "read_vhdl":
+						self._ReadVHDL(words, evaluator, collector)
+					elif command == "read_verilog":
+						self._ReadVerilog(words, evaluator, collector)
+					elif command == "read_xdc":
+						self._ReadXDC(words, evaluator, collector)
+					elif command == "add_files":
+						self._AddFiles(words, evaluator, collector)
+					elif command == "set_property":
+						self._SetProperty(words, evaluator, collector)
+					elif command == "synth_design":
+						self._SynthDesign(words, evaluator, collector)
+					elif command == "set":
+						evaluator.Execute(words)
+					elif command == "source":
+						sourcePath = Path(evaluator.Evaluate(words[-1]))
+						self._ReadScript(evaluator.Directory / sourcePath, evaluator, collector, visited)
+				except Exception as ex:
+					raise Exception(f"Error in Vivado TCL script '{path!s}' at line {line}.") from ex
+
+		evaluator.ScriptPath = scriptPath
+		visited.remove(resolvedPath)
+
+	@staticmethod
+	def _CurrentFileSet(arguments: List[str]) -> str:
+		if "-constrset" in arguments:
+			return VivadoNonProjectScript.CONSTRAINTS_FILESET
+		elif "-simset" in arguments:
+			return VivadoNonProjectScript.SIMULATION_FILESET
+		return VivadoNonProjectScript.SOURCES_FILESET
+
+	@staticmethod
+	def _RelativePath(path: str, evaluator: TCLEvaluator) -> Path:
+		"""Returns a path relative to the script's working directory, so the project model stays relocatable."""
+		path = Path(path)
+		if path.is_absolute():
+			return Path(relpath(path, evaluator.Directory.resolve()))
+		return path
+
+	@staticmethod
+	def _SplitOptions(words: List[str], evaluator: TCLEvaluator, valueOptions: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+		options = {}
+		paths = []
+		iterator = iter(words[1:])
+		for word in iterator:
+			value = evaluator.Evaluate(word)
+			if value.startswith("-") and not word.startswith(("{", '"')):
+				options[value] = evaluator.Evaluate(next(iterator)) if value in valueOptions else ""
+			else:
+				paths.extend(evaluator.EvaluateList(word))
+
+		return options, paths
+
+	def _ReadVHDL(self, words: List[str], evaluator: TCLEvaluator, collector: "_ScriptCollector") -> None:
+		options, paths = self._SplitOptions(words, evaluator, ("-library", ))
+		if "-vhdl2019" in options:
+			vhdlVersion = VHDLVersion.VHDL2019
+		elif "-vhdl2008" in options:
+			vhdlVersion = VHDLVersion.VHDL2008
+		else:
+			vhdlVersion = VHDLVersion.VHDL93
+		library = options.get("-library", self.DEFAULT_VHDL_LIBRARY)
+
+		for path in paths:
+			collector.AddVHDLFile(self.SOURCES_FILESET, VHDLSourceFile(self._RelativePath(path, evaluator), vhdlVersion=vhdlVersion), library)
+
+	def _ReadVerilog(self, words: List[str], evaluator: TCLEvaluator, collector: "_ScriptCollector") -> None:
+		options, paths = self._SplitOptions(words, evaluator, ("-library", ))
+		for path in paths:
+			if "-sv" in options:
+				collector.AddFile(self.SOURCES_FILESET, SystemVerilogSourceFile(self._RelativePath(path, evaluator)))
+			else:
+				collector.AddFile(self.SOURCES_FILESET, VerilogSourceFile(self._RelativePath(path, evaluator)))
+
+	def _ReadXDC(self, words: List[str], evaluator: TCLEvaluator, collector: "_ScriptCollector") -> None:
+		options, paths = self._SplitOptions(words, evaluator, ("-ref", "-cell", "-mode"))
+		for path in paths:
+			xdcFile = XDCConstraintFile(self._RelativePath(path, evaluator))
+			xdcFile[ScopeToRefAttribute] = options.get("-ref")
+			xdcFile[ScopeToCellAttribute] = options.get("-cell")
+			collector.AddFile(self.CONSTRAINTS_FILESET, xdcFile)
+
+	def _AddFiles(self, words: List[str], evaluator: TCLEvaluator, collector: "_ScriptCollector") -> None:
+		options, paths = self._SplitOptions(words, evaluator, ("-fileset", "-of_objects", "-copy_to"))
+		fileSetName = options.get("-fileset")
+
+		for path in paths:
+			path = self._RelativePath(path, evaluator)
+			resolvedPath = evaluator.Directory / path
+			if resolvedPath.is_dir():
+				pattern = "*" if "-norecurse" in options else "**/*"
+				filePaths = sorted(path / item.relative_to(resolvedPath) for item in resolvedPath.glob(pattern) if item.suffix in _SUFFIXES)
+			else:
+				filePaths = (path, )
+
+			for filePath in filePaths:
+				file = _SUFFIXES.get(filePath.suffix, File)(filePath)
+				if isinstance(file, ConstraintFile):
+					collector.AddFile(self.CONSTRAINTS_FILESET if fileSetName is None else fileSetName, file)
+				elif isinstance(file, Model_VHDLSourceFile):
+					file.VHDLVersion = VHDLVersion.VHDL93
+					collector.AddVHDLFile(self.SOURCES_FILESET if fileSetName is None else fileSetName, file, self.DEFAULT_VHDL_LIBRARY)
+				else:
+					collector.AddFile(self.SOURCES_FILESET if fileSetName is None else fileSetName, file)
+
+	def _SetProperty(self, words: List[str], evaluator: TCLEvaluator, collector: "_ScriptCollector") -> None:
+		options, arguments = self._SplitOptions(words, evaluator, ("-name", "-value", "-objects"))
+		if "-name" in options:
+			name, value, objects = options["-name"], options.get("-value", ""), options.get("-objects", "")
+		elif len(arguments) >= 3:
+			name, value, objects = arguments[0], arguments[1], arguments[2]
+		else:
+			return
+
+		if name.lower() == "top":
+			collector.SetTopLevel(objects, value)
+
+	def _SynthDesign(self, words: List[str], evaluator: TCLEvaluator, collector: "_ScriptCollector") -> None:
+		options, _ = self._SplitOptions(words, evaluator, ("-top", "-part", "-mode", "-flatten_hierarchy", "-directive", "-include_dirs", "-generic", "-verilog_define"))
+		if "-top" in options:
+			collector.SetTopLevel(self.SOURCES_FILESET, options["-top"])
+
+
+class _ScriptCollector(metaclass=ExtendedType, slots=True):
+	"""Collects files per fileset while reading a script, so they can be added to the project model in bulk."""
+
+	_design:    Design
+	_files:     Dict[str, List[Model_File]]
+	_libraries: List[Tuple[Model_VHDLSourceFile, str]]
+	_topLevels: Dict[str, str]
+
+	def __init__(self, design: Design) -> None:
+		self._design =    design
+		self._files =     {}
+		self._libraries = []
+		self._topLevels = {}
+
+	def AddFile(self, fileSetName: str, file: Model_File) -> None:
+		try:
+			self._files[fileSetName].append(file)
+		except KeyError:
+			self._files[fileSetName] = [file]
+
+	def AddVHDLFile(self, fileSetName: str, file: Model_VHDLSourceFile, libraryName: str) -> None:
+		self.AddFile(fileSetName, file)
+		self._libraries.append((file, libraryName))
+
+	def SetTopLevel(self, fileSetName: str, topLevel: str) -> None:
+		self._topLevels[fileSetName] = topLevel
+
+	def Build(self) -> None:
+		fileSets = {}
+		for fileSetName in (*self._files.keys(), *self._topLevels.keys()):
+			if fileSetName not in fileSets:
+				fileSets[fileSetName] = FileSet(fileSetName, design=self._design)
+
+		for fileSetName, files in self._files.items():
+			fileSets[fileSetName].AddFiles(files)
+		for fileSetName, topLevel in self._topLevels.items():
+			fileSets[fileSetName].TopLevel = topLevel
+
+		libraries = self._design.VHDLLibraries
+		for file, libraryName in self._libraries:
+			try:
+				library = libraries[libraryName]
+			except KeyError:
+				library = VHDLLibrary(libraryName, design=self._design)
+			file.VHDLLibrary = library
+
+
+@export
+def WriteNonProjectScript(stream: TextIO, design: Design, fileSet: Nullable[FileSet] = None) -> None:
+	"""
+	Write a Vivado TCL script reading all source and constraint files of a design in non-project mode.
+
+	Files are written in compile order (see :meth:`~pyEDAA.ProjectModel.Design.IterateCompileOrder`) as ``read_vhdl``,
+	``read_verilog`` and ``read_xdc`` commands. Other files are skipped. The script can be read back by
+	:class:`VivadoNonProjectScript`.
+
+	:arg stream:  Text stream to write to.
+	:arg design:  Design to export.
+	:arg fileSet: Fileset (incl. sub-filesets) to export. Default: all filesets of the design.
+	"""
+	write = stream.write
+	lastVersion = None
+	lastLibrary = None
+	command = None
+	for file, path, library, vhdlVersion in design.IterateCompileOrder(fileSet):
+		if isinstance(file, Model_VHDLSourceFile):
+			if command is None or vhdlVersion is not lastVersion or library is not lastLibrary:
+				lastVersion = vhdlVersion
+				lastLibrary = library
+				libraryName = VivadoNonProjectScript.DEFAULT_VHDL_LIBRARY if library is None else library.Name
+				command = f"read_vhdl -library {FormatList((libraryName, ))}{_VHDLVersionOption(vhdlVersion)}"
+			fileCommand = command
+		elif isinstance(file, Model_SystemVerilogSourceFile):
+			fileCommand = "read_verilog -sv"
+		elif isinstance(file, Model_VerilogSourceFile):
+			fileCommand = "read_verilog"
+		elif isinstance(file, Model_ConstraintFile) and file.Path.suffix == ".xdc":
+			fileCommand = "read_xdc"
+		else:
+			continue
+
+		write(f"{fileCommand} {FormatList((path.as_posix(), ))}\n")
+
+
+def _VHDLVersionOption(vhdlVersion: Nullable[VHDLVersion]) -> str:
+	for sfType, version in _SFTYPE_TO_VHDLVERSION.items():
+		if vhdlVersion is version:
+			return f" -{sfType.lower()}"
+
+	return ""
 
 
 @export
@@ -214,9 +834,469 @@ class XDCConstraintFile(ConstraintFile, SDCContent):
 
 @export
 class IPCoreDescriptionFile(XMLFile):
-	pass
+	"""An IP-XACT component description file (``component.xml``)."""
+
+	_parsed:     bool
+	_vlnv:       Nullable[str]
+	_fileSets:   Dict[str, List[Tuple[str, str, Nullable[str]]]]
+	_ports:      Dict[str, str]
+	_parameters: Dict[str, str]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Nullable[Project] = None,
+		design:  Nullable[Design] =  None,
+		fileSet: Nullable[FileSet] = None
+	) -> None:
+		super().__init__(path, project, design, fileSet)
+
+		self._parsed =     False
+		self._vlnv =       None
+		self._fileSets =   {}
+		self._ports =      {}
+		self._parameters = {}
+
+	@property
+	def IsParsed(self) -> bool:
+		"""Read-only property returning true, if the component description is available."""
+		return self._parsed
+
+	@property
+	def VLNV(self) -> Nullable[str]:
+		"""Read-only property returning the component's identifier as VLNV (vendor:library:name:version)."""
+		self._EnsureParsed()
+		return self._vlnv
+
+	@property
+	def FileSets(self) -> Dict[str, List[Tuple[str, str, Nullable[str]]]]:
+		"""Read-only property returning the component's filesets as lists of ``(path, fileType, logicalName)`` tuples."""
+		self._EnsureParsed()
+		return self._fileSets
+
+	@property
+	def Ports(self) -> Dict[str, str]:
+		"""Read-only property returning the component's ports and their directions."""
+		self._EnsureParsed()
+		return self._ports
+
+	@property
+	def Parameters(self) -> Dict[str, str]:
+		"""Read-only property returning the component's parameters and their default values."""
+		self._EnsureParsed()
+		return self._parameters
+
+	def Parse(self) -> None:
+		"""Parse the component description with a streaming XML reader."""
+		self._Apply(_ReadIPCoreDescriptionFile(str(self.ResolvedPath)))
+
+	def _EnsureParsed(self) -> None:
+		if not self._parsed:
+			self.Parse()
+
+	def _Apply(self, result: Dict[str, Any]) -> None:
+		self._vlnv =       result["VLNV"]
+		self._fileSets =   {name: [tuple(file) for file in files] for name, files in result["FileSets"].items()}
+		self._ports =      result["Ports"]
+		self._parameters = result["Parameters"]
+		self._parsed =     True
+
+
+@export
+class IPRepository(metaclass=ExtendedType, slots=True):
+	"""
+	An index of all IP-XACT component descriptions (``component.xml``) in an IP repository.
+
+	The index is persisted as a JSON file. When refreshed, only component descriptions with a changed modification time
+	are parsed again. Resolving an IP core by VLNV is a dictionary lookup.
+
+	:arg directory: Root directory of the IP repository.
+	:arg indexFile: Path to the persistent index. Default: ``<directory>/.ipxact-index.json``.
+	"""
+
+	INDEX_FILENAME = ".ipxact-index.json"  #: Default filename of the persistent index.
+	INDEX_VERSION =  1                     #: Format version of the persistent index.
+
+	_directory:  Path
+	_indexFile:  Path
+	_entries:    Dict[str, Dict[str, Any]]
+	_vlnvs:      Dict[str, str]
+
+	def __init__(self, directory: Path, indexFile: Nullable[Path] = None) -> None:
+		self._directory = directory
+		self._indexFile = directory / self.INDEX_FILENAME if indexFile is None else indexFile
+		self._entries =   {}
+		self._vlnvs =     {}
+
+		self._Load()
+
+	@property
+	def Directory(self) -> Path:
+		"""Read-only property returning the repository's root directory."""
+		return self._directory
+
+	@property
+	def IndexFile(self) -> Path:
+		"""Read-only property returning the path to the persistent index."""
+		return self._indexFile
+
+	def Refresh(self) -> Tuple[int, int]:
+		"""
+		Update the index from the repository and save it.
+
+		New or modified component descriptions are parsed, removed ones are dropped from the index.
+
+		:returns: Tuple of number of parsed and removed component descriptions.
+		"""
+		found = {}
+		for path in self._directory.rglob("component.xml"):
+			found[path.relative_to(self._directory).as_posix()] = path.stat().st_mtime_ns
+
+		removed = [key for key in self._entries if key not in found]
+		for key in removed:
+			del self._entries[key]
+
+		parsed = 0
+		for key, modificationTime in found.items():
+			entry = self._entries.get(key)
+			if entry is None or entry["ModificationTime"] != modificationTime:
+				entry = _ReadIPCoreDescriptionFile(str(self._directory / key))
+				entry["ModificationTime"] = modificationTime
+				self._entries[key] = entry
+				parsed += 1
+
+		self._vlnvs = {entry["VLNV"]: key for key, entry in self._entries.items()}
+		if parsed > 0 or len(removed) > 0 or not self._indexFile.exists():
+			self.Save()
+
+		return parsed, len(removed)
+
+	def Save(self) -> None:
+		"""Write the index to the index file."""
+		with self._indexFile.open("w", encoding="utf-8") as file:
+			json_dump({"Version": self.INDEX_VERSION, "Components": self._entries}, file)
+
+	def _Load(self) -> None:
+		if not self._indexFile.exists():
+			return
+
+		try:
+			with self._indexFile.open("r", encoding="utf-8") as file:
+				index = json_load(file)
+		except Exception:
+			# A corrupted index is rebuilt by the next refresh.
+			return
+
+		if index.get("Version") == self.INDEX_VERSION:
+			self._entries = index["Components"]
+			self._vlnvs = {entry["VLNV"]: key for key, entry in self._entries.items()}
+
+	def Resolve(self, vlnv: str) -> IPCoreDescriptionFile:
+		"""
+		Lookup an IP core by VLNV.
+
+		:arg vlnv:      The IP core's identifier (vendor:library:name:version).
+		:returns:       The component description, populated from the index.
+		:raises KeyError: When no component with this VLNV is in the index.
+		"""
+		key = self._vlnvs[vlnv]
+		descriptionFile = IPCoreDescriptionFile(self._directory / key)
+		descriptionFile._Apply(self._entries[key])
+
+		return descriptionFile
+
+	def __contains__(self, vlnv: str) -> bool:
+		return vlnv in self._vlnvs
+
+	def __len__(self) -> int:
+		"""Returns number of indexed component descriptions."""
+		return len(self._entries)
+
+	def __iter__(self) -> Iterator[str]:
+		"""Iterates all indexed VLNVs."""
+		return iter(self._vlnvs)
 
 
 @export
 class IPCoreInstantiationFile(XMLFile):
 	"""A Vivado IP core instantiation file (Xilinx IPCore Instance; ``*.xci``)."""
+
+	_future:             Nullable[Future]
+	_parsed:             bool
+	_instanceName:       Nullable[str]
+	_componentReference: Nullable[str]
+	_targetLanguage:     Nullable[str]
+	_parameters:         Dict[str, str]
+	_modelParameters:    Dict[str, str]
+	_outputDirectory:    Nullable[Path]
+	_outputProducts:     List[Path]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Nullable[Project] = None,
+		design:  Nullable[Design] =  None,
+		fileSet: Nullable[FileSet] = None
+	) -> None:
+		super().__init__(path, project, design, fileSet)
+
+		self._future =             None
+		self._parsed =             False
+		self._instanceName =       None
+		self._componentReference = None
+		self._targetLanguage =     None
+		self._parameters =         {}
+		self._modelParameters =    {}
+		self._outputDirectory =    None
+		self._outputProducts =     []
+
+	@property
+	def IsParsed(self) -> bool:
+		"""Read-only property returning true, if the IP core instantiation data is available."""
+		return self._parsed
+
+	@property
+	def InstanceName(self) -> Nullable[str]:
+		"""Read-only property returning the IP core's instance name."""
+		self._EnsureParsed()
+		return self._instanceName
+
+	@property
+	def ComponentReference(self) -> Nullable[str]:
+		"""Read-only property returning the instantiated IP core as VLNV (vendor:library:name:version)."""
+		self._EnsureParsed()
+		return self._componentReference
+
+	@property
+	def TargetLanguage(self) -> Nullable[str]:
+		"""Read-only property returning the target language of generated output products (e.g. ``VHDL`` or ``Verilog``)."""
+		self._EnsureParsed()
+		return self._targetLanguage
+
+	@property
+	def Parameters(self) -> Dict[str, str]:
+		"""Read-only property returning the IP core's user parameters."""
+		self._EnsureParsed()
+		return self._parameters
+
+	@property
+	def ModelParameters(self) -> Dict[str, str]:
+		"""Read-only property returning the IP core's model parameters (HDL generics)."""
+		self._EnsureParsed()
+		return self._modelParameters
+
+	@property
+	def OutputDirectory(self) -> Nullable[Path]:
+		"""Read-only property returning the directory of generated output products."""
+		self._EnsureParsed()
+		return self._outputDirectory
+
+	@property
+	def OutputProducts(self) -> List[Path]:
+		"""Read-only property returning the list of generated output products."""
+		self._EnsureParsed()
+		return self._outputProducts
+
+	def Parse(self) -> None:
+		"""Parse the IP core instantiation file in the current process."""
+		self._Apply(_ReadIPCoreInstantiationFile(str(self.ResolvedPath)))
+
+	def _EnsureParsed(self) -> None:
+		if self._parsed:
+			return
+		elif self._future is not None:
+			future = self._future
+			self._future = None
+			self._Apply(future.result())
+		else:
+			self.Parse()
+
+	def _Apply(self, result: Dict[str, Any]) -> None:
+		self._instanceName =       result["InstanceName"]
+		self._componentReference = result["ComponentReference"]
+		self._targetLanguage =     result["TargetLanguage"]
+		self._parameters =         result["Parameters"]
+		self._modelParameters =    result["ModelParameters"]
+		self._outputDirectory =    None if result["OutputDirectory"] is None else Path(result["OutputDirectory"])
+		self._outputProducts =     [Path(product) for product in result["OutputProducts"]]
+		self._parsed =             True
+
+
+_SUFFIXES = {
+	".vhd":  VHDLSourceFile,
+	".vhdl": VHDLSourceFile,
+	".v":    VerilogSourceFile,
+	".sv":   SystemVerilogSourceFile,
+	".xdc":  XDCConstraintFile,
+	".xci":  IPCoreInstantiationFile
+}
+
+_SFTYPE_TO_VHDLVERSION = {
+	"VHDL2008": VHDLVersion.VHDL2008,
+	"VHDL2019": VHDLVersion.VHDL2019
+}
+
+
+def _XMLAttributes(node, **replacements: str) -> str:
+	"""Format an element's XML attributes in document order, optionally replacing some values."""
+	return "".join(f" {name}={quoteattr(replacements.get(name, value))}" for name, value in node.attributes.items())
+
+
+def _ReadIPCoreInstantiationFile(path: str) -> Dict[str, Any]:
+	"""
+	Read an IP core instantiation file (``*.xci``) in XML or JSON format.
+
+	This function is executed in worker processes, therefore it returns only picklable builtin types.
+	"""
+	xciPath = Path(path)
+	if not xciPath.exists():
+		raise Exception(f"IP core instantiation file '{xciPath}' not found.") from FileNotFoundError(f"File '{xciPath}' not found.")
+
+	with xciPath.open("r", encoding="utf-8") as file:
+		content = file.read(256).lstrip()
+		file.seek(0)
+
+		try:
+			if content.startswith("{"):
+				result = _ReadJSONInstantiation(json_load(file))
+			else:
+				result = _ReadXMLInstantiation(minidom.parse(file).documentElement)
+		except Exception as ex:
+			raise Exception(f"Couldn't parse IP core instantiation file '{xciPath}'.") from ex
+
+	outputDirectory = result["OutputDirectory"]
+	if outputDirectory is not None:
+		xciPath = xciPath.resolve()
+		outputDirectory = (xciPath.parent / outputDirectory).resolve()
+		result["OutputDirectory"] = str(outputDirectory)
+		if outputDirectory.is_dir():
+			result["OutputProducts"] = sorted(str(item) for item in outputDirectory.rglob("*") if item.is_file() and item != xciPath)
+
+	return result
+
+
+def _ReadXMLInstantiation(root) -> Dict[str, Any]:
+	result = {
+		"InstanceName":       None,
+		"ComponentReference": None,
+		"TargetLanguage":     None,
+		"Parameters":         {},
+		"ModelParameters":    {},
+		"OutputDirectory":    None,
+		"OutputProducts":     []
+	}
+
+	for instanceNode in root.getElementsByTagNameNS("*", "componentInstance"):
+		for childNode in instanceNode.childNodes:
+			if childNode.nodeType != Node.ELEMENT_NODE:
+				continue
+			elif childNode.localName == "instanceName":
+				result["InstanceName"] = None if childNode.firstChild is None else childNode.firstChild.data.strip()
+			elif childNode.localName == "componentRef":
+				attributes = {attribute.localName: attribute.value for attribute in childNode.attributes.values()}
+				result["ComponentReference"] = ":".join(attributes.get(key, "") for key in ("vendor", "library", "name", "version"))
+
+		for valueNode in instanceNode.getElementsByTagNameNS("*", "configurableElementValue"):
+			referenceID = valueNode.getAttributeNS(valueNode.namespaceURI, "referenceId")
+			value = "" if valueNode.firstChild is None else valueNode.firstChild.data
+			kind, _, name = referenceID.partition(".")
+			if kind == "PARAM_VALUE":
+				result["Parameters"][name] = value
+			elif kind == "MODELPARAM_VALUE":
+				result["ModelParameters"][name] = value
+			elif kind == "RUNTIME_PARAM":
+				if name == "TARGETLANGUAGE":
+					result["TargetLanguage"] = value
+				elif name == "OUTPUTDIR":
+					result["OutputDirectory"] = value
+
+		break
+
+	return result
+
+
+def _ReadJSONInstantiation(root: Dict[str, Any]) -> Dict[str, Any]:
+	def values(parameters: Dict[str, List[Dict[str, Any]]]) -> Dict[str, str]:
+		return {name: str(entries[0].get("value", "")) for name, entries in parameters.items() if len(entries) > 0}
+
+	instance =          root["ip_inst"]
+	parameters =        instance.get("parameters", {})
+	runtimeParameters = values(parameters.get("runtime_parameters", {}))
+
+	return {
+		"InstanceName":       instance.get("xci_name"),
+		"ComponentReference": instance.get("component_reference"),
+		"TargetLanguage":     runtimeParameters.get("TARGETLANGUAGE"),
+		"Parameters":         values(parameters.get("component_parameters", {})),
+		"ModelParameters":    values(parameters.get("model_parameters", {})),
+		"OutputDirectory":    runtimeParameters.get("OUTPUTDIR", instance.get("gen_directory")),
+		"OutputProducts":     []
+	}
+
+
+def _ReadIPCoreDescriptionFile(path: str) -> Dict[str, Any]:
+	"""Read an IP-XACT component description (IEEE 1685-2009 or 1685-2014) with a streaming XML reader."""
+	vlnv =       {"vendor": "", "library": "", "name": "", "version": ""}
+	fileSets =   {}
+	ports =      {}
+	parameters = {}
+
+	stack: List[str] = []
+	fileSetName = file = portName = portDirection = parameterName = parameterValue = None
+
+	try:
+		for event, element in iterparse(path, events=("start", "end")):
+			localName = element.tag.rpartition("}")[2]
+			if event == "start":
+				stack.append(localName)
+				if localName == "fileSet":
+					fileSetName = None
+				elif localName == "file":
+					file = ["", "", None]
+				elif localName == "port":
+					portName = portDirection = None
+				elif localName == "parameter":
+					parameterName = parameterValue = None
+				continue
+
+			stack.pop()
+			parent = stack[-1] if len(stack) > 0 else None
+			text = (element.text or "").strip()
+
+			if len(stack) == 1 and localName in vlnv:
+				vlnv[localName] = text
+			elif parent == "fileSet" and localName == "name":
+				fileSetName = text
+				fileSets.setdefault(fileSetName, [])
+			elif parent == "file":
+				if localName == "name":
+					file[0] = text
+				elif localName == "fileType" or (localName == "userFileType" and file[1] == ""):
+					file[1] = text
+				elif localName == "logicalName":
+					file[2] = text
+			elif localName == "file" and parent == "fileSet":
+				fileSets.setdefault(fileSetName, []).append(file)
+			elif parent == "port" and localName == "name":
+				portName = text
+			elif parent == "wire" and localName == "direction":
+				portDirection = text
+			elif localName == "port":
+				ports[portName] = portDirection
+			elif parent == "parameter" and localName == "name":
+				parameterName = text
+			elif parent == "parameter" and localName == "value":
+				parameterValue = text
+			elif localName == "parameter" and parent == "parameters" and len(stack) == 2:
+				parameters[parameterName] = parameterValue
+
+			element.clear()
+	except Exception as ex:
+		raise Exception(f"Couldn't parse IP-XACT component description '{path}'.") from ex
+
+	return {
+		"VLNV":       ":".join(vlnv.values()),
+		"FileSets":   fileSets,
+		"Ports":      ports,
+		"Parameters": parameters
+	}
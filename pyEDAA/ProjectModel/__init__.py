@@ -115,12 +115,13 @@ class File(metaclass=FileType, slots=True):
 	:arg fileSet: Fileset the file is associated with.
 	"""
 
-	_path:       pathlib_Path
-	_fileType:   'FileType'
-	_project:    Nullable['Project']
-	_design:     Nullable['Design']
-	_fileSet:    Nullable['FileSet']
-	_attributes: Dict[Type[Attribute], typing_Any]
+	_path:           pathlib_Path
+	_fileType:       'FileType'
+	_project:        Nullable['Project']
+	_design:         Nullable['Design']
+	_fileSet:        Nullable['FileSet']
+	_attributes:     Dict[Type[Attribute], typing_Any]
+	_dependencyNode: Nullable[Vertex]
 
 	def __init__(
 		self,
@@ -129,8 +130,9 @@ class File(metaclass=FileType, slots=True):
 		design:  Nullable["Design"] =  None,
 		fileSet: Nullable["FileSet"] = None
 	) -> None:
-		self._fileType =  getattr(FileTypes, self.__class__.__name__)
-		self._path =      path
+		self._fileType =       getattr(FileTypes, self.__class__.__name__)
+		self._path =           path
+		self._dependencyNode = None
 		if project is not None:
 			self._project = project
 			self._design =  design
@@ -655,6 +657,53 @@ class WaveformExchangeFile(File):
 	"""Base-class of all tool-independent waveform exchange files."""
 
 
+@export
+class Testbench(metaclass=ExtendedType, slots=True):
+	"""
+	A :term:`Testbench` represents a simulation top-level.
+
+	:arg name:    Name of the testbench's top-level (e.g. an entity or module name).
+	:arg file:    The file declaring the top-level, if known.
+	:arg fileSet: The fileset owning the testbench.
+	"""
+
+	_name:    str
+	_file:    Nullable[File]
+	_fileSet: Nullable['FileSet']
+
+	def __init__(self, name: str, file: Nullable[File] = None, fileSet: Nullable['FileSet'] = None) -> None:
+		self._name =    name
+		self._file =    file
+		self._fileSet = None
+		if fileSet is not None:
+			fileSet.AddTestbench(self)
+
+	@property
+	def Name(self) -> str:
+		"""Read-only property returning the testbench's name."""
+		return self._name
+
+	@property
+	def File(self) -> Nullable[File]:
+		"""Property setting or returning the file declaring the testbench's top-level."""
+		return self._file
+
+	@File.setter
+	def File(self, value: File) -> None:
+		self._file = value
+
+	@property
+	def FileSet(self) -> Nullable['FileSet']:
+		"""Read-only property returning the fileset owning this testbench."""
+		return self._fileSet
+
+	def __repr__(self) -> str:
+		return f"Testbench({self._name})"
+
+	def __str__(self) -> str:
+		return self._name
+
+
 @export
 class FileSet(metaclass=ExtendedType, slots=True):
 	"""
@@ -687,6 +736,7 @@ class FileSet(metaclass=ExtendedType, slots=True):
 	_fileSets:        Dict[str, 'FileSet']
 	_files:           List[File]
 	_set:             Set
+	_testbenches:     Dict[str, Testbench]
 	_attributes:      Dict[Type[Attribute], typing_Any]
 	_vhdlLibraries:   Dict[str, 'VHDLLibrary']
 	_vhdlLibrary:     'VHDLLibrary'
@@ -726,6 +776,7 @@ class FileSet(metaclass=ExtendedType, slots=True):
 		self._fileSets =  {}
 		self._files =     []
 		self._set =     set()
+		self._testbenches = {}
 
 		if design is not None:
 			design._fileSets[name] = self
@@ -938,6 +989,27 @@ class FileSet(metaclass=ExtendedType, slots=True):
 		for file in files:
 			self.AddFile(file)
 
+	@property
+	def Testbenches(self) -> Dict[str, Testbench]:
+		"""Read-only property returning the dictionary of testbenches owned by this fileset (excl. sub-filesets)."""
+		return self._testbenches
+
+	def AddTestbench(self, testbench: Testbench) -> None:
+		"""
+		Method to add a testbench to this fileset.
+
+		:arg testbench: A testbench owned by this fileset.
+		"""
+		if not isinstance(testbench, Testbench):
+			raise TypeError("Parameter 'testbench' is not of type ProjectModel.Testbench.")
+		elif testbench._fileSet is not None:
+			raise ValueError(f"Testbench '{testbench.Name}' is already part of fileset '{testbench._fileSet.Name}'.")
+		elif testbench.Name in self._testbenches:
+			raise ValueError(f"Fileset '{self._name}' already contains a testbench named '{testbench.Name}'.")
+
+		self._testbenches[testbench.Name] = testbench
+		testbench._fileSet = self
+
 	@property
 	def FileCount(self) -> int:
 		"""Returns number of files excl. sub-filesets."""
@@ -1251,7 +1323,31 @@ class VHDLLibrary(metaclass=ExtendedType, slots=True):
 		self._vhdlVersion = value
 
 	def AddDependency(self, library: 'VHDLLibrary') -> None:
-		library.parent = self
+		"""
+		Method to add a dependency to another VHDL library of the same design.
+
+		Dependencies added by hand carry no edge value. An existing dependency inferred from file dependencies (see
+		:class:`~pyEDAA.ProjectModel.LibraryInference.LibraryDependencyInference`) is converted to a manual dependency, so
+		it's kept even if no file dependency supports it anymore.
+
+		:arg library: The VHDL library this library depends on.
+		"""
+		if not isinstance(library, VHDLLibrary):
+			ex = TypeError(f"Parameter 'library' is not a 'VHDLLibrary'.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(library)}'.")
+			raise ex
+		elif self._dependencyNode is None or library._dependencyNode is None:
+			raise Exception(f"VHDL library '{self._name}' or '{library._name}' is not part of a design.")
+		elif self._dependencyNode.Graph is not library._dependencyNode.Graph:
+			raise Exception(f"VHDL libraries '{self._name}' and '{library._name}' are not part of the same design.")
+
+		for edge in self._dependencyNode.IterateOutboundEdges():
+			if edge.Destination is library._dependencyNode:
+				edge.Value = None
+				break
+		else:
+			self._dependencyNode.EdgeToVertex(library._dependencyNode)
 
 	def AddFile(self, vhdlFile: VHDLSourceFile) -> None:
 		if not isinstance(vhdlFile, VHDLSourceFile):
@@ -1326,6 +1422,40 @@ class VHDLLibrary(metaclass=ExtendedType, slots=True):
 		return self._name
 
 
+@export
+class ExternalVHDLLibrary(metaclass=ExtendedType, slots=True):
+	"""
+	An external VHDL library is a precompiled VHDL library used by a design, e.g. vendor primitives or simulation models.
+
+	:arg name: The VHDL libraries' name.
+	:arg path: Path to the precompiled VHDL library.
+	"""
+
+	_name: str
+	_path: pathlib_Path
+
+	def __init__(self, name: str, path: pathlib_Path) -> None:
+		self._name = name
+		self._path = path
+
+	@property
+	def Name(self) -> str:
+		"""Read-only property returning the VHDL libraries' name."""
+		return self._name
+
+	@property
+	def Path(self) -> pathlib_Path:
+		"""Read-only property returning the path to the precompiled VHDL library."""
+		return self._path
+
+	def __repr__(self) -> str:
+		return f"<External VHDL library: '{self._name}'; path: '{self._path!s}'>"
+
+	def __str__(self) -> str:
+		"""Returns the VHDL library's name."""
+		return self._name
+
+
 @export
 class Design(metaclass=ExtendedType, slots=True):
 	"""
@@ -1358,10 +1488,11 @@ class Design(metaclass=ExtendedType, slots=True):
 	_verilogVersion:        SystemVerilogVersion
 	_svVersion:             SystemVerilogVersion
 	_srdlVersion:           SystemRDLVersion
-	_externalVHDLLibraries: List
+	_externalVHDLLibraries: List[ExternalVHDLLibrary]
 
 	_vhdlLibraryDependencyGraph: Graph
 	_fileDependencyGraph:        Graph
+	_symbolTable:                Nullable['SymbolTable']
 
 	def __init__(
 		self,
@@ -1392,6 +1523,7 @@ class Design(metaclass=ExtendedType, slots=True):
 
 		self._vhdlLibraryDependencyGraph = Graph()
 		self._fileDependencyGraph = Graph()
+		self._symbolTable = None
 
 	@property
 	def Name(self) -> str:
@@ -1495,6 +1627,98 @@ class Design(metaclass=ExtendedType, slots=True):
 			for file in fileSet.Files(fileType):
 				yield file
 
+	def IterateTestbenches(self) -> Generator[Testbench, None, None]:
+		"""
+		Method returning the testbenches registered in all filesets (incl. sub-filesets) of this design.
+
+		.. seealso::
+
+		   :func:`pyEDAA.ProjectModel.TestImpact.IdentifyTestbenches`
+		     Identify testbenches also from fileset top-levels and port-less entities.
+		"""
+		for fileSet in _IterateFileSets(self._fileSets.values()):
+			yield from fileSet._testbenches.values()
+
+	def GetFileVertex(self, file: File) -> Vertex:
+		"""
+		Method returning the vertex of a file in this design's file dependency graph.
+
+		The vertex is created on first access.
+
+		:arg file: The file.
+		:returns:  The file's vertex.
+		"""
+		if file._dependencyNode is None:
+			file._dependencyNode = Vertex(value=file, graph=self._fileDependencyGraph)
+		elif file._dependencyNode.Graph is not self._fileDependencyGraph:
+			raise Exception(f"File '{file.Path!s}' is already part of another design's file dependency graph.")
+
+		return file._dependencyNode
+
+	def AddFileDependency(self, file: File, dependency: File) -> None:
+		"""
+		Method to add a dependency between two files, e.g. a VHDL file using a package declared in another file.
+
+		:arg file:       The dependent file.
+		:arg dependency: The file *file* depends on.
+		"""
+		vertex = self.GetFileVertex(file)
+		dependencyVertex = self.GetFileVertex(dependency)
+		if not vertex.HasEdgeToDestination(dependencyVertex):
+			vertex.EdgeToVertex(dependencyVertex)
+
+	def IterateCompileOrder(self, fileSet: Nullable[FileSet] = None) -> Generator[Tuple[File, pathlib_Path, Nullable[VHDLLibrary], Nullable[VHDLVersion]], None, None]:
+		"""
+		Method returning the files of this design in compile order.
+
+		VHDL source files are grouped by VHDL library and libraries are ordered by the VHDL library dependency graph
+		(dependencies first). All other files follow in fileset order. A fileset's resolved path and VHDL version are
+		computed once per fileset instead of once per file.
+
+		:arg fileSet: Fileset (incl. sub-filesets) to iterate. Default: all filesets of this design.
+		:returns:     A generator of tuples of file, resolved path, VHDL library and VHDL version. VHDL library and VHDL
+		              version are ``None`` for non-VHDL files or if not set.
+		"""
+		vhdlFiles: Dict[Nullable[VHDLLibrary], List[Tuple[File, pathlib_Path, Nullable[VHDLLibrary], Nullable[VHDLVersion]]]] = {}
+		otherFiles: List[Tuple[File, pathlib_Path, Nullable[VHDLLibrary], Nullable[VHDLVersion]]] = []
+
+		for currentFileSet in _IterateFileSets(self._fileSets.values() if fileSet is None else (fileSet, )):
+			# Use the public accessors, so lazily populated filesets (e.g. Vivado filesets) are materialized.
+			files = list(currentFileSet.Files(fileSet=False))
+			if len(files) == 0:
+				continue
+
+			directory = currentFileSet.ResolvedPath
+			fileSetVersion = _UNRESOLVED
+			for file in files:
+				path = file._path if file._path.is_absolute() else directory / file._path
+				if isinstance(file, VHDLSourceFile):
+					vhdlVersion = file._vhdlVersion
+					if vhdlVersion is None:
+						if fileSetVersion is _UNRESOLVED:
+							try:
+								fileSetVersion = currentFileSet.VHDLVersion
+							except Exception:
+								fileSetVersion = None
+						vhdlVersion = fileSetVersion
+
+					library = file._vhdlLibrary
+					try:
+						vhdlFiles[library].append((file, path, library, vhdlVersion))
+					except KeyError:
+						vhdlFiles[library] = [(file, path, library, vhdlVersion)]
+				else:
+					otherFiles.append((file, path, None, None))
+
+		if self._vhdlLibraryDependencyGraph.VertexCount > 0:
+			for vertex in self._vhdlLibraryDependencyGraph.IterateTopologically():
+				if (files := vhdlFiles.pop(vertex.Value, None)) is not None:
+					yield from files
+		# libraries not registered in this design's dependency graph and files without library
+		for files in vhdlFiles.values():
+			yield from files
+		yield from otherFiles
+
 	def Validate(self) -> None:
 		"""Validate this design."""
 		if self._name is None or self._name == "":
@@ -1581,9 +1805,21 @@ class Design(metaclass=ExtendedType, slots=True):
 		self._srdlVersion = value
 
 	@property
-	def ExternalVHDLLibraries(self) -> List:
+	def ExternalVHDLLibraries(self) -> List[ExternalVHDLLibrary]:
 		return self._externalVHDLLibraries
 
+	@property
+	def SymbolTable(self) -> Nullable['SymbolTable']:
+		"""
+		Read-only property returning the design's cross-language symbol table, if built.
+
+		.. seealso::
+
+		   :class:`pyEDAA.ProjectModel.Symbols.SymbolTable`
+		     Build a symbol table of entity and module names for a design.
+		"""
+		return self._symbolTable
+
 	def AddFileSet(self, fileSet: FileSet) -> None:
 		if not isinstance(fileSet, FileSet):
 			raise ValueError("Parameter 'fileSet' is not of type ProjectModel.FileSet.")
@@ -1683,6 +1919,16 @@ class Design(metaclass=ExtendedType, slots=True):
 		return self._name
 
 
+_UNRESOLVED = object()
+
+
+def _IterateFileSets(fileSets: Iterable[FileSet]) -> Generator[FileSet, None, None]:
+	"""Iterate filesets and their sub-filesets in the order used by :meth:`FileSet.Files` (sub-filesets first)."""
+	for fileSet in fileSets:
+		yield from _IterateFileSets(fileSet.FileSets.values())
+		yield fileSet
+
+
 @export
 class Project(metaclass=ExtendedType, slots=True):
 	"""
@@ -1783,6 +2029,11 @@ class Project(metaclass=ExtendedType, slots=True):
 		for design in self._designs.values():
 			design.Validate()
 
+	def IterateTestbenches(self) -> Generator[Testbench, None, None]:
+		"""Method returning the testbenches registered in all designs of this project."""
+		for design in self._designs.values():
+			yield from design.IterateTestbenches()
+
 	@property
 	def DesignCount(self) -> int:
 		"""Returns number of designs."""
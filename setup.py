@@ -47,6 +47,7 @@ setup(
 		gitHubNamespace=gitHubNamespace,
 		additionalRequirements={
 			"osvvm": ["pyEDAA.OSVVM ~= 0.6"],
+			"fusesoc": ["PyYAML ~= 6.0"],
 		},
 		sourceFileWithVersion=packageInformationFile,
 		classifiers=list(DEFAULT_CLASSIFIERS) + [
@@ -0,0 +1,4 @@
+# paths are relative to the top-level file list
+common/fifo.sv
+rtl/counter.v
+-f common/nested.f
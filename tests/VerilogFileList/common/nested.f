@@ -0,0 +1 @@
+"common/sync cells.v"
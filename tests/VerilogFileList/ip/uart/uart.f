@@ -0,0 +1,3 @@
++incdir+include
+rtl/uart_pkg.sv
+rtl/uart.sv
@@ -0,0 +1,12 @@
+// top-level file list
++incdir+rtl
++define+SYNTHESIS+WIDTH=8
+-sv
+rtl/top.sv
+rtl/counter.v
+-F ip/uart/uart.f    // paths relative to ip/uart/
+-f common/common.f   /* paths relative to this directory */
+-F ip/uart/uart.f
+-v $PRIMITIVES/cells.v
+-y lib
++libext+.v+.sv
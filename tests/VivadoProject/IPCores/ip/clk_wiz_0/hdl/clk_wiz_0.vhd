@@ -0,0 +1 @@
+-- Generated output product (test fixture).
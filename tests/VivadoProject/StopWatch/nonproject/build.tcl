@@ -0,0 +1,19 @@
+# Vivado non-project build script for the StopWatch example
+set root [file dirname [file dirname [info script]]]
+set srcDir $root/src
+
+read_vhdl -library lib_Utilities -vhdl2008 $srcDir/Utilities.pkg.vhdl
+read_vhdl -vhdl2008 [list \
+	$srcDir/StopWatch.pkg.vhdl \
+	$srcDir/Counter.vhdl \
+	$srcDir/Debouncer.vhdl \
+]
+read_vhdl [glob -directory $srcDir seg7_*.vhdl]
+read_vhdl -vhdl2008 ${srcDir}/StopWatch.vhdl ${srcDir}/toplevel.StopWatch.vhdl
+
+source [file join [file dirname [info script]] constraints.tcl]
+
+add_files -fileset sim_1 -norecurse $root/tb
+set_property top toplevel_tb [get_filesets sim_1]
+
+synth_design -top toplevel -part xc7a100tcsg324-1
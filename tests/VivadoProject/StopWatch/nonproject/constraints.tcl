@@ -0,0 +1,9 @@
+# Constraints are read in a separate script
+set xdcDir "$root/xdc"
+
+foreach xdc {Clock Reset} {
+	puts $xdc
+}
+read_xdc $xdcDir/Clock.xdc
+read_xdc -ref seg7_Display $xdcDir/Display.xdc
+add_files [glob $xdcDir/Button.xdc $xdcDir/Switch*.xdc]
@@ -0,0 +1,168 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the analysis result cache."""
+from concurrent.futures import ThreadPoolExecutor
+from os                 import utime
+from pathlib            import Path
+from sys                import executable
+from tempfile           import TemporaryDirectory
+from unittest           import TestCase
+
+from pyEDAA.ProjectModel           import Project, VHDLSourceFile
+from pyEDAA.ProjectModel.Caching   import AnalysisCache, CacheBackend, LocalCacheBackend
+from pyEDAA.ProjectModel.Execution import CreateAnalysisJobs, JobState, ParallelExecutor
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+# A stub analyzer writing 'out/<stem>.o'.
+STUB = "import sys, pathlib; out = pathlib.Path('out'); out.mkdir(exist_ok=True); (out / (sys.argv[1] + '.o')).write_text(sys.argv[2])"
+
+
+class MissingBackend(CacheBackend):
+	def Load(self, key: str, directory: Path) -> bool:
+		return False
+
+	def Save(self, key: str, directory: Path, artifacts) -> None:
+		pass
+
+
+class Cache(TestCase):
+	def _Run(self, directory: Path, cache: AnalysisCache):
+		project = Project("project", rootDirectory=directory)
+		fileSet = project.DefaultDesign.DefaultFileSet
+		library = fileSet.GetOrCreateVHDLLibrary("lib")
+		for name in ("a", "b", "c"):
+			fileSet.AddFile(VHDLSourceFile(Path(f"{name}.vhdl"), vhdlLibrary=library))
+
+		jobs = CreateAnalysisJobs(
+			project.DefaultDesign,
+			{VHDLSourceFile: [executable, "-c", STUB, "{stem}", "{path}"]},
+			outputs={VHDLSourceFile: ["out/{stem}.o"]}
+		)
+		ParallelExecutor(workingDirectory=directory, cache=cache).Run(jobs)
+		return {job.Path.name: job.State for job in jobs}
+
+	def test_Executor(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			for name in ("a", "b", "c"):
+				(directory / f"{name}.vhdl").write_text(f"entity {name} is end entity;\n")
+			backend = LocalCacheBackend(directory / "cache")
+
+			cache = AnalysisCache(backend, "ghdl 4.1.0")
+			self.assertSetEqual({JobState.Passed}, set(self._Run(directory, cache).values()))
+			self.assertEqual(3, cache.Misses)
+			self.assertEqual(3, len(backend))
+
+			# Unchanged files: outputs are restored without running the analyzer.
+			(directory / "out" / "a.o").unlink()
+			cache = AnalysisCache(backend, "ghdl 4.1.0")
+			self.assertSetEqual({JobState.Cached}, set(self._Run(directory, cache).values()))
+			self.assertEqual(3, cache.Hits)
+			self.assertEqual(str(directory / "a.vhdl"), (directory / "out" / "a.o").read_text())
+
+			# A modified file invalidates itself and all dependents (compile order within a library).
+			(directory / "b.vhdl").write_text("entity b is end entity b;\n")
+			states = self._Run(directory, AnalysisCache(LocalCacheBackend(directory / "cache"), "ghdl 4.1.0"))
+			self.assertDictEqual({"a.vhdl": JobState.Cached, "b.vhdl": JobState.Passed, "c.vhdl": JobState.Passed}, states)
+
+			# Another tool version doesn't share entries.
+			states = self._Run(directory, AnalysisCache(backend, "ghdl 5.0.0"))
+			self.assertSetEqual({JobState.Passed}, set(states.values()))
+
+	def test_Eviction(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "artifact.o").write_bytes(b"x" * 1000)
+			backend = LocalCacheBackend(directory / "cache", maxSize=2500)
+
+			backend.Save("aa01", directory, [Path("artifact.o")])
+			backend.Save("bb02", directory, [Path("artifact.o")])
+			self.assertTrue(backend.Load("aa01", directory / "restored"))
+			backend.Save("cc03", directory, [Path("artifact.o")])
+
+			self.assertNotIn("bb02", backend)
+			self.assertIn("aa01", backend)
+			self.assertIn("cc03", backend)
+			self.assertLessEqual(backend.Size, 2500)
+			self.assertFalse(backend.Load("bb02", directory))
+			self.assertEqual(1000, (directory / "restored" / "artifact.o").stat().st_size)
+
+			self.assertEqual(2, len(LocalCacheBackend(directory / "cache", maxSize=2500)))
+
+	def test_TemporaryDirectories(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			stale = directory / "tmp-stale"
+			(stale / "out").mkdir(parents=True)
+			(stale / "artifact.o").write_bytes(b"x")
+			utime(stale, (0, 0))
+			inFlight = directory / "tmp-inflight"
+			(inFlight / "out").mkdir(parents=True)
+
+			backend = LocalCacheBackend(directory)
+
+			self.assertFalse(stale.exists())
+			self.assertTrue((inFlight / "out").exists())
+			self.assertEqual(0, len(backend))
+
+	def test_MissingArtifact(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			backend = LocalCacheBackend(directory / "cache")
+			backend.Save("aa01", directory, [Path("missing.o")])
+
+			self.assertEqual(0, len(backend))
+			self.assertListEqual([], list((directory / "cache").iterdir()))
+			with self.assertRaises(Exception):
+				backend.Save("aa01", directory, [directory / "missing.o"])
+
+	def test_ConcurrentStatistics(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			project = Project("project", rootDirectory=directory)
+			fileSet = project.DefaultDesign.DefaultFileSet
+			for index in range(20):
+				(directory / f"f{index}.vhdl").write_text(f"entity f{index} is end entity;\n")
+				fileSet.AddFile(VHDLSourceFile(Path(f"f{index}.vhdl")))
+			jobs = CreateAnalysisJobs(project.DefaultDesign, {VHDLSourceFile: "ghdl -a {path}"}, outputs={VHDLSourceFile: ["{stem}.o"]})
+
+			cache = AnalysisCache(MissingBackend(), "ghdl 4.1.0")
+			with ThreadPoolExecutor(max_workers=8) as executor:
+				results = list(executor.map(lambda job: cache.Restore(job, directory), jobs * 50))
+
+			self.assertNotIn(True, results)
+			self.assertEqual(len(jobs) * 50, cache.Misses)
+			self.assertEqual(len(jobs), len({cache.Key(job) for job in jobs}))
@@ -0,0 +1,125 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for compile order and compile-script generation."""
+from io       import StringIO
+from pathlib  import Path
+from unittest import TestCase
+
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel                         import Design, VerilogSourceFile, ConstraintFile
+from pyEDAA.ProjectModel.GHDL                    import WriteAnalysisScript
+from pyEDAA.ProjectModel.MentorGraphics.ModelSim import WriteCompileScript
+from pyEDAA.ProjectModel.Xilinx.Vivado           import WriteNonProjectScript
+
+from tests.unit import CreateDesign
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class CompileOrder(TestCase):
+	def test_IterateCompileOrder(self) -> None:
+		design = CreateDesign()
+
+		order = [(path.as_posix(), None if library is None else library.Name, version) for _, path, library, version in design.IterateCompileOrder()]
+		self.assertEqual(8, len(order))
+
+		libraries = [library for _, library, _ in order[:4]]
+		self.assertLess(libraries.index("util_lib"), libraries.index("top_lib"))
+		self.assertLess(libraries.index("ip_lib"), libraries.index("top_lib"))
+		self.assertEqual(("/project/src/top.vhdl", "top_lib", VHDLVersion.VHDL2008), order[3])
+		self.assertIn(("/opt/ip/fifo.vhdl", "ip_lib", VHDLVersion.VHDL2008), order)
+		self.assertIn(("/project/ip/ram.vhdl", "ip_lib", VHDLVersion.VHDL2008), order)
+		self.assertIn(("/project/src/util.vhdl", "util_lib", VHDLVersion.VHDL93), order)
+		self.assertListEqual(
+			["/project/src/wrapper.v", "/project/src/tb.sv", "/project/xdc/top.xdc", "/project/README.md"],
+			[path for path, _, _ in order[4:]]
+		)
+
+	def test_FileSet(self) -> None:
+		design = CreateDesign()
+
+		paths = [path.as_posix() for _, path, _, _ in design.IterateCompileOrder(design.FileSets["ip"])]
+		self.assertListEqual(["/opt/ip/fifo.vhdl", "/project/ip/ram.vhdl"], paths)
+
+
+	def test_WithoutVHDLLibraries(self) -> None:
+		design = Design("design", directory=Path("/project"))
+		design.DefaultFileSet.AddFiles((VerilogSourceFile(Path("top.v")), ConstraintFile(Path("top.xdc"))))
+
+		self.assertListEqual(["top.v", "top.xdc"], [file.Path.name for file, _, _, _ in design.IterateCompileOrder()])
+
+
+class Scripts(TestCase):
+	def test_GHDL(self) -> None:
+		stream = StringIO()
+		WriteAnalysisScript(stream, CreateDesign(), options=("--workdir=build", ))
+		lines = stream.getvalue().splitlines()
+
+		self.assertEqual("#! /usr/bin/env bash", lines[0])
+		self.assertIn("ghdl -a --workdir=build --std=93 --work=util_lib /project/src/util.vhdl", lines)
+		self.assertEqual("ghdl -a --workdir=build --std=08 --work=top_lib /project/src/top.vhdl", lines[-1])
+		self.assertEqual(7, len(lines))
+
+	def test_ModelSim(self) -> None:
+		stream = StringIO()
+		WriteCompileScript(stream, CreateDesign(), mapLibraries=False)
+		lines = stream.getvalue().splitlines()
+
+		self.assertIn("vlib util_lib", lines)
+		self.assertIn("vcom -93 -work util_lib /project/src/util.vhdl", lines)
+		self.assertLess(lines.index("vlib ip_lib"), lines.index("vcom -2008 -work ip_lib /opt/ip/fifo.vhdl"))
+		self.assertListEqual([
+				"vcom -2008 -work top_lib /project/src/top.vhdl",
+				"vlib work",
+				"vlog -work work /project/src/wrapper.v",
+				"vlog -sv -work work /project/src/tb.sv"
+			],
+			lines[-4:]
+		)
+
+	def test_Vivado(self) -> None:
+		stream = StringIO()
+		WriteNonProjectScript(stream, CreateDesign())
+		lines = stream.getvalue().splitlines()
+
+		self.assertIn("read_vhdl -library util_lib /project/src/util.vhdl", lines)
+		self.assertListEqual([
+				"read_vhdl -library top_lib -vhdl2008 /project/src/top.vhdl",
+				"read_verilog /project/src/wrapper.v",
+				"read_verilog -sv /project/src/tb.sv",
+				"read_xdc /project/xdc/top.xdc"
+			],
+			lines[-4:]
+		)
@@ -0,0 +1,134 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for dependency cycle detection."""
+from unittest import TestCase
+
+from pyTooling.Graph import Vertex
+
+from pyEDAA.ProjectModel.Cycles import DependencyCycle, FindCycles, FindDesignCycles, CycleDetector
+
+from tests.unit import CreateDesign, CreateGraph
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def Values(cycle: DependencyCycle):
+	return sorted(cycle.Values)
+
+
+class Static(TestCase):
+	def test_Acyclic(self) -> None:
+		graph, _ = CreateGraph([("a", "b"), ("b", "c"), ("a", "c")])
+		self.assertListEqual([], FindCycles(graph))
+
+	def test_Cycles(self) -> None:
+		graph, _ = CreateGraph([("a", "b"), ("b", "c"), ("c", "d"), ("d", "b"), ("c", "b"), ("e", "e"), ("f", "a")])
+		cycles = FindCycles(graph)
+
+		self.assertEqual(2, len(cycles))
+		# Dependencies first
+		self.assertListEqual(["b", "c", "d"], sorted(vertex.Value for vertex in cycles[0].Component))
+		self.assertListEqual(["b", "c"], Values(cycles[0]))
+		self.assertListEqual(["e"], Values(cycles[1]))
+		self.assertEqual("e -> e", str(cycles[1]))
+
+	def test_Witness(self) -> None:
+		graph, _ = CreateGraph([("a", "b"), ("b", "c"), ("c", "a")])
+		cycle = FindCycles(graph)[0]
+
+		values = cycle.Values
+		self.assertEqual(3, len(cycle))
+		for source, destination in zip(cycle.Vertices, cycle.Vertices[1:] + cycle.Vertices[:1]):
+			self.assertTrue(source.HasEdgeToDestination(destination))
+		self.assertEqual(" -> ".join(values + values[:1]), str(cycle))
+
+	def test_Design(self) -> None:
+		design = CreateDesign()
+		self.assertListEqual([], FindDesignCycles(design))
+
+		libraries = design.VHDLLibraries
+		libraries["util_lib"]._dependencyNode.EdgeToVertex(libraries["top_lib"]._dependencyNode)
+		files = {file.Path.name: file for file in design.DefaultFileSet.Files()}
+		design.AddFileDependency(files["top.vhdl"], files["util.vhdl"])
+		design.AddFileDependency(files["util.vhdl"], files["top.vhdl"])
+
+		libraryCycle, fileCycle = FindDesignCycles(design)
+		self.assertListEqual(["top_lib", "util_lib"], sorted(library.Name for library in libraryCycle.Values))
+		self.assertIn("top_lib -> util_lib", str(libraryCycle) + " -> " + str(libraryCycle))
+		self.assertIn("src/top.vhdl (top_lib)", str(fileCycle))
+		self.assertIn("src/util.vhdl (util_lib)", str(fileCycle))
+
+
+class Incremental(TestCase):
+	def test_AddEdge(self) -> None:
+		graph, vertices = CreateGraph([("a", "b"), ("b", "c"), ("c", "d"), ("a", "d")])
+		detector = CycleDetector(graph)
+
+		self.assertIsNone(detector.AddEdge(vertices["b"], vertices["d"]))
+		self.assertIsNone(detector.WouldCreateCycle(vertices["a"], vertices["c"]))
+
+		cycle = detector.WouldCreateCycle(vertices["d"], vertices["a"])
+		self.assertListEqual(["d", "a"], cycle.Values)
+		self.assertListEqual(["a", "b", "c", "d"], sorted(vertex.Value for vertex in cycle.Component))
+		self.assertFalse(vertices["d"].HasEdgeToDestination(vertices["a"]))
+
+		cycle = detector.AddEdge(vertices["c"], vertices["b"])
+		self.assertListEqual(["c", "b"], cycle.Values)
+		self.assertTrue(vertices["c"].HasEdgeToDestination(vertices["b"]))
+		self.assertEqual(1, len(detector.FindCycles()))
+
+		self.assertEqual(1, len(detector.WouldCreateCycle(vertices["a"], vertices["a"])))
+
+	def test_RejectCycles(self) -> None:
+		graph, vertices = CreateGraph([("a", "b"), ("b", "c")])
+		detector = CycleDetector(graph)
+
+		with self.assertRaises(Exception) as context:
+			detector.AddEdge(vertices["c"], vertices["a"], rejectCycles=True)
+		self.assertEqual("Dependency would create a cycle: c -> a -> b -> c", str(context.exception))
+		self.assertEqual(2, graph.EdgeCount)
+
+		# New vertices and edges added outside the detector
+		d = Vertex(value="d", graph=graph)
+		vertices["c"].EdgeToVertex(d)
+		self.assertListEqual(["d", "a", "b", "c"], detector.WouldCreateCycle(d, vertices["a"]).Values)
+
+	def test_Design(self) -> None:
+		design = CreateDesign()
+		libraries = design.VHDLLibraries
+		detector = CycleDetector(design._vhdlLibraryDependencyGraph)
+
+		self.assertIsNone(detector.AddEdge(libraries["util_lib"], libraries["ip_lib"]))
+		cycle = detector.WouldCreateCycle(libraries["ip_lib"], libraries["top_lib"])
+		self.assertEqual("ip_lib -> top_lib -> ip_lib", str(cycle))
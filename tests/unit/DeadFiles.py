@@ -0,0 +1,159 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for top-level detection and dead-file analysis."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyEDAA.ProjectModel           import Design, FileSet, ConstraintFile, VerilogSourceFile, VHDLSourceFile
+from pyEDAA.ProjectModel.DeadFiles import DeadFileAnalysis
+
+from tests.unit import CreateTestbenchProject
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def Names(files):
+	return [file.Path.name for file in files]
+
+
+class Analysis(TestCase):
+	def _CreateDesign(self, directory: Path) -> Design:
+		design = CreateTestbenchProject(directory).DefaultDesign
+		files = {file.Path.name: file for file in design.Files()}
+
+		(directory / "old_counter.vhdl").write_text("entity old_counter is\n  port (clk : in bit);\nend entity;\n")
+		(directory / "old_pkg.vhdl").write_text("package old_pkg is\nend package;\n")
+		for name in ("old_counter.vhdl", "old_pkg.vhdl"):
+			files[name] = VHDLSourceFile(Path(name))
+			design.DefaultFileSet.AddFile(files[name])
+		files["top.v"] = VerilogSourceFile(Path("top.v"))
+		files["top.xdc"] = ConstraintFile(Path("top.xdc"))
+		design.DefaultFileSet.AddFiles((files["top.v"], files["top.xdc"]))
+
+		design.AddFileDependency(files["old_counter.vhdl"], files["old_pkg.vhdl"])
+		design.AddFileDependency(files["old_counter.vhdl"], files["pkg.vhdl"])
+		design.AddFileDependency(files["top.v"], files["counter.vhdl"])
+
+		return design
+
+	def test_TopLevelAndTestbenches(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = self._CreateDesign(Path(tempDirectory))
+			design.TopLevel = "top"
+			analysis = DeadFileAnalysis(design)
+
+			self.assertListEqual(["top", "tb_counter", "tb_timer"], list(analysis.TopLevels.keys()))
+			self.assertListEqual(["top.v"], Names(analysis.TopLevels["top"]))
+			self.assertListEqual([], analysis.UnresolvedTopLevels)
+			self.assertListEqual(["tb_counter.vhdl", "tb_timer.vhdl", "old_counter.vhdl", "top.v"], Names(analysis.RootFiles))
+			self.assertListEqual(["old_counter.vhdl"], Names(analysis.UndeclaredRootFiles))
+			self.assertListEqual(["old_counter.vhdl", "old_pkg.vhdl"], Names(analysis.UnreachableFiles))
+			self.assertListEqual(["pkg.vhdl", "counter.vhdl", "timer.vhdl", "tb_counter.vhdl", "tb_timer.vhdl", "top.v"], Names(analysis.ReachableFiles))
+
+	def test_FileSetTopLevels(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			design = Design("design", directory=directory)
+			files = {}
+			for fileSetName in ("encoder", "display"):
+				fileSet = FileSet(f"src_{fileSetName}", directory=Path(fileSetName), topLevel="toplevel", design=design)
+				(directory / fileSetName).mkdir()
+				for name, content in (("toplevel", "entity toplevel is\n  port (clk : in bit);\nend entity;\n"), ("pkg", "package pkg is\nend package;\n")):
+					(directory / fileSetName / f"{name}.vhdl").write_text(content)
+					files[f"{fileSetName}/{name}"] = VHDLSourceFile(Path(f"{name}.vhdl"))
+					fileSet.AddFile(files[f"{fileSetName}/{name}"])
+				design.AddFileDependency(files[f"{fileSetName}/toplevel"], files[f"{fileSetName}/pkg"])
+			(directory / "unused.vhdl").write_text("entity unused is\n  port (clk : in bit);\nend entity;\n")
+			design.DefaultFileSet.AddFile(VHDLSourceFile(Path("unused.vhdl")))
+
+			analysis = DeadFileAnalysis(design)
+
+			self.assertListEqual([files["encoder/toplevel"], files["display/toplevel"]], analysis.TopLevels["toplevel"])
+			self.assertListEqual(["unused.vhdl"], Names(analysis.UnreachableFiles))
+			self.assertEqual(4, len(list(analysis.IterateCompileOrder())))
+
+	def test_UnknownDependencies(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "top.vhdl").write_text("entity top is\n  port (clk : in bit);\nend entity;\n")
+			(directory / "pkg.vhdl").write_text("package pkg is\nend package;\n")
+			design = Design("design", directory=directory)
+			design.DefaultFileSet.AddFiles((VHDLSourceFile(Path("top.vhdl")), VHDLSourceFile(Path("pkg.vhdl"))))
+			design.TopLevel = "top"
+
+			analysis = DeadFileAnalysis(design)
+
+			self.assertListEqual(["top.vhdl"], Names(analysis.TopLevels["top"]))
+			self.assertListEqual([], analysis.UnreachableFiles)
+
+	def test_SelectedTopLevels(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = self._CreateDesign(Path(tempDirectory))
+			analysis = DeadFileAnalysis(design, topLevels=["Counter"])
+
+			self.assertListEqual(["counter.vhdl"], Names(analysis.TopLevels["Counter"]))
+			self.assertListEqual(["pkg.vhdl", "counter.vhdl"], Names(analysis.ReachableFiles))
+			with self.assertRaises(ValueError):
+				DeadFileAnalysis(design, topLevels=["Counter", "missing"])
+
+	def test_UnresolvedTopLevel(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = self._CreateDesign(Path(tempDirectory))
+			design.TopLevel = "missing"
+			analysis = DeadFileAnalysis(design, includeTestbenches=False)
+
+			self.assertDictEqual({}, analysis.TopLevels)
+			self.assertListEqual(["missing"], analysis.UnresolvedTopLevels)
+			self.assertListEqual([], analysis.UnreachableFiles)
+			self.assertEqual(len(list(design.Files())), len(list(analysis.IterateCompileOrder())))
+
+	def test_NoTopLevels(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = self._CreateDesign(Path(tempDirectory))
+			analysis = DeadFileAnalysis(design, includeTestbenches=False)
+
+			self.assertDictEqual({}, analysis.TopLevels)
+			self.assertListEqual([], analysis.UnreachableFiles)
+
+	def test_Prune(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = self._CreateDesign(Path(tempDirectory))
+			design.TopLevel = "top"
+			analysis = DeadFileAnalysis(design, includeTestbenches=False)
+
+			pruned = Names(entry[0] for entry in analysis.IterateCompileOrder())
+			self.assertListEqual(["pkg.vhdl", "counter.vhdl", "top.v", "top.xdc"], pruned)
+			self.assertEqual(len(list(design.Files())), len(list(analysis.IterateCompileOrder(prune=False))))
+			self.assertTrue(analysis.IsReachable(next(design.Files(ConstraintFile))))
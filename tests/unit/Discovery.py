@@ -0,0 +1,132 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for testbench discovery."""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib            import Path
+from tempfile           import TemporaryDirectory
+from unittest           import TestCase
+
+# Aliases prevent pytest from collecting 'Testbench' and 'TestbenchDiscovery' as test classes.
+from pyEDAA.ProjectModel           import Project, FileSet, CocotbPythonFile, SystemVerilogSourceFile, VHDLSourceFile, Testbench as TB
+from pyEDAA.ProjectModel.Discovery import FindCocotbTests, TestbenchDiscovery as Discovery
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+SOURCES = {
+	"counter.vhdl":    "entity counter is\n  port (clk : in bit);\nend entity;\n",
+	"tb_counter.vhdl": "entity tb_counter is\nend entity;\n",
+	"fifo.sv":         "module fifo(input clk);\nendmodule\ninterface fifo_if;\nendinterface\nprogram fifo_checker;\nendprogram\n",
+	"tb_fifo.sv":      "module tb_fifo();\n  fifo dut(.clk(clk));\nendmodule\n",
+	"test_fifo.py": (
+		"import cocotb\n"
+		"from cocotb import test as cocotb_test\n\n"
+		"@cocotb.test()\nasync def test_reset(dut):\n  pass\n\n"
+		"@cocotb_test\nasync def test_write(dut):\n  pass\n\n"
+		"async def helper(dut):\n  pass\n"
+	),
+	"model.py":        "def model():\n  pass\n"
+}
+
+
+class Cocotb(TestCase):
+	def test_FindTests(self) -> None:
+		self.assertListEqual(["test_reset", "test_write"], FindCocotbTests(SOURCES["test_fifo.py"]))
+		self.assertListEqual([], FindCocotbTests(SOURCES["model.py"]))
+		self.assertListEqual([], FindCocotbTests("def broken(:\n"))
+		self.assertListEqual(["a"], FindCocotbTests("import cocotb as cb\n@cb.test(timeout_time=10)\ndef a(dut):\n  pass\n"))
+
+
+class Discover(TestCase):
+	def _CreateDesign(self, directory: Path):
+		for name, content in SOURCES.items():
+			(directory / name).write_text(content)
+
+		design = Project("project", rootDirectory=directory).DefaultDesign
+		simFileSet = FileSet("sim", design=design)
+		design.DefaultFileSet.AddFiles((VHDLSourceFile(Path("counter.vhdl")), SystemVerilogSourceFile(Path("fifo.sv"))))
+		simFileSet.AddFiles((
+			VHDLSourceFile(Path("tb_counter.vhdl")),
+			SystemVerilogSourceFile(Path("tb_fifo.sv")),
+			CocotbPythonFile(Path("test_fifo.py")),
+			CocotbPythonFile(Path("model.py"))
+		))
+
+		return design
+
+	def test_ProcessPool(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = self._CreateDesign(Path(tempDirectory))
+			discovery = Discovery()
+			testbenches = discovery.Discover(design, maxWorkers=2)
+
+			self.assertListEqual(["tb_counter", "tb_fifo", "test_fifo"], [testbench.Name for testbench in testbenches])
+			self.assertTrue(all(testbench.FileSet is design.FileSets["sim"] for testbench in testbenches))
+			self.assertListEqual(["tb_counter", "tb_fifo", "test_fifo"], list(design.FileSets["sim"].Testbenches))
+			self.assertEqual("tb_fifo.sv", testbenches[1].File.Path.name)
+			self.assertListEqual(["test_reset", "test_write"], discovery.TestCases(testbenches[2]))
+			self.assertListEqual([], discovery.TestCases(testbenches[0]))
+			self.assertEqual(6, discovery.ScannedFiles)
+
+	def test_Cache(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			cacheFile = directory / "discovery.json"
+			design = self._CreateDesign(directory)
+			discovery = Discovery(cacheFile)
+			with ThreadPoolExecutor() as executor:
+				discovery.Discover(design, executor)
+			discovery.Save()
+
+			design = self._CreateDesign(directory)
+			(directory / "tb_fifo.sv").write_text("module tb_fifo2;\nendmodule\n")
+			discovery = Discovery(cacheFile)
+			with ThreadPoolExecutor() as executor:
+				testbenches = discovery.Discover(design, executor)
+
+			self.assertEqual(1, discovery.ScannedFiles)
+			self.assertEqual(5, discovery.CachedFiles)
+			self.assertListEqual(["tb_counter", "tb_fifo2", "test_fifo"], [testbench.Name for testbench in testbenches])
+
+	def test_ExistingTestbench(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = self._CreateDesign(Path(tempDirectory))
+			existing = TB("tb_counter", fileSet=design.FileSets["sim"])
+			with ThreadPoolExecutor() as executor:
+				testbenches = Discovery().Discover(design, executor)
+				self.assertIs(existing, testbenches[0])
+				self.assertEqual("tb_counter.vhdl", existing.File.Path.name)
+
+				# Re-discovery doesn't duplicate testbenches.
+				self.assertListEqual(testbenches, Discovery().Discover(design, executor))
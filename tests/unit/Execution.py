@@ -0,0 +1,123 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the parallel analysis executor."""
+from unittest import TestCase
+
+from pyEDAA.ProjectModel           import VHDLSourceFile, VerilogSourceFile
+from pyEDAA.ProjectModel.Execution import CreateAnalysisJobs, JobState, ParallelExecutor
+
+from tests.unit import CreateDesign, CreateJobs
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Jobs(TestCase):
+	def test_Commands(self) -> None:
+		jobs = CreateJobs()
+
+		self.assertEqual(5, len(jobs))
+		self.assertListEqual(["/project/src/util.vhdl", "--work=util_lib", "--std=93", "pass"], jobs[0].Command[3:])
+		self.assertListEqual(["/project/src/wrapper.v", "pass"], jobs[-1].Command[3:])
+
+	def test_CommandString(self) -> None:
+		jobs = CreateAnalysisJobs(CreateDesign(), {VHDLSourceFile: "ghdl -a --std={std} --work={library} '{path}'"})
+
+		self.assertEqual(4, len(jobs))
+		self.assertListEqual(["ghdl", "-a", "--std=08", "--work=top_lib", "/project/src/top.vhdl"], jobs[-1].Command)
+
+	def test_Dependencies(self) -> None:
+		jobs = {job.Path.name: job for job in CreateJobs()}
+
+		self.assertListEqual([], jobs["util.vhdl"].Dependencies)
+		self.assertListEqual([jobs["fifo.vhdl"]], jobs["ram.vhdl"].Dependencies)
+		self.assertSetEqual({jobs["util.vhdl"], jobs["ram.vhdl"]}, set(jobs["top.vhdl"].Dependencies))
+		self.assertListEqual([], jobs["wrapper.v"].Dependencies)
+
+	def test_FileDependencies(self) -> None:
+		design = CreateDesign()
+		files = {file.Path.name: file for file in design.DefaultFileSet.Files()}
+		design.AddFileDependency(files["wrapper.v"], files["top.vhdl"])
+		jobs = {job.Path.name: job for job in CreateAnalysisJobs(design, {VHDLSourceFile: "a", VerilogSourceFile: "b"})}
+
+		self.assertListEqual([jobs["top.vhdl"]], jobs["wrapper.v"].Dependencies)
+		self.assertListEqual([jobs["wrapper.v"]], jobs["top.vhdl"].Dependents)
+
+
+class Executor(TestCase):
+	def test_Run(self) -> None:
+		lines = []
+		jobs = CreateJobs()
+		timings = ParallelExecutor(workers=3, outputHandler=lambda job, line: lines.append(line)).Run(jobs)
+
+		self.assertEqual(5, len(timings))
+		self.assertTrue(all(job.State is JobState.Passed and job.ReturnCode == 0 for job in jobs))
+		self.assertTrue(all(duration > 0.0 for duration in timings.values()))
+		self.assertIn("/project/src/top.vhdl --work=top_lib --std=08 pass", lines)
+		for job in jobs:
+			self.assertEqual(1, len(job.Output))
+			for dependency in job.Dependencies:
+				self.assertGreaterEqual(job.StartTime, dependency.StartTime + dependency.Duration)
+
+	def test_InputOrder(self) -> None:
+		jobs = CreateJobs()
+		jobs = [jobs[4], *jobs[:4]]
+		ParallelExecutor(workers=1).Run(jobs)
+
+		self.assertListEqual(jobs, sorted(jobs, key=lambda job: job.StartTime))
+
+	def test_StopOnFailure(self) -> None:
+		jobs = {job.Path.name: job for job in CreateJobs("fail")}
+		timings = ParallelExecutor(workers=1).Run(list(jobs.values()))
+
+		self.assertEqual(1, len(timings))
+		self.assertIs(JobState.Failed, jobs["util.vhdl"].State)
+		self.assertEqual(1, jobs["util.vhdl"].ReturnCode)
+		self.assertTrue(all(job.State is JobState.Skipped for name, job in jobs.items() if name != "util.vhdl"))
+
+	def test_KeepGoing(self) -> None:
+		jobs = {job.Path.name: job for job in CreateJobs("fail")}
+		timings = ParallelExecutor(workers=2, keepGoing=True).Run(list(jobs.values()))
+
+		self.assertEqual(4, len(timings))
+		self.assertIs(JobState.Failed, jobs["util.vhdl"].State)
+		self.assertIs(JobState.Skipped, jobs["top.vhdl"].State)
+		self.assertIs(JobState.Passed, jobs["ram.vhdl"].State)
+		self.assertIs(JobState.Passed, jobs["wrapper.v"].State)
+
+	def test_MissingExecutable(self) -> None:
+		jobs = CreateAnalysisJobs(CreateDesign(), {VerilogSourceFile: "/nonexisting/analyzer {path}"})
+		ParallelExecutor().Run(jobs)
+
+		self.assertIs(JobState.Failed, jobs[0].State)
+		self.assertIsNone(jobs[0].ReturnCode)
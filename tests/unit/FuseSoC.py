@@ -0,0 +1,137 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Instantiation tests for the project model."""
+from io       import StringIO
+from json     import loads as json_loads
+from pathlib  import Path
+from unittest import TestCase
+
+from pytest      import mark
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel         import Project, FileSet, VHDLSourceFile, VerilogSourceFile, VerilogHeaderFile, SystemVerilogSourceFile
+from pyEDAA.ProjectModel.FuseSoC import FuseSoCCoreFile, XDCConstraintFile, SDCConstraintFile, WriteEDAM, withYAML
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+@mark.skipif(withYAML is False, reason="No 'PyYAML' package found.")
+class CoreFile(TestCase):
+	def test_Parsing(self) -> None:
+		coreFile = FuseSoCCoreFile(Path("tests/FuseSoC/uart.core"))
+		coreFile.Parse()
+
+		self.assertEqual("::uart:1.0.0", coreFile.CoreName)
+		self.assertDictEqual({
+				"default": (["rtl", "verilog", "constraints"], "uart"),
+				"sim":     (["rtl", "verilog", "tb"], "uart_tb")
+			},
+			coreFile.Targets
+		)
+
+		design = coreFile.ProjectModel.DefaultDesign
+		self.assertEqual("uart", design.TopLevel)
+
+		rtl = list(design.FileSets["rtl"].Files())
+		self.assertEqual(4, len(rtl))
+		for file in rtl:
+			self.assertIsInstance(file, VHDLSourceFile)
+			self.assertTrue(file.ResolvedPath.exists())
+			self.assertEqual("uart_lib", file.VHDLLibrary.Name)
+		self.assertIs(VHDLVersion.VHDL2008, rtl[0].VHDLVersion)
+		self.assertIs(VHDLVersion.VHDL93, rtl[2].VHDLVersion)
+
+		verilog = list(design.FileSets["verilog"].Files())
+		self.assertIsInstance(verilog[0], VerilogHeaderFile)
+		self.assertIsInstance(verilog[1], VerilogSourceFile)
+
+		constraints = list(design.FileSets["constraints"].Files())
+		self.assertIsInstance(constraints[0], XDCConstraintFile)
+		self.assertIsInstance(constraints[1], SDCConstraintFile)
+
+		self.assertIsInstance(next(design.FileSets["tb"].Files()), SystemVerilogSourceFile)
+
+
+class EDAM(TestCase):
+	def test_Export(self) -> None:
+		project = Project("project", rootDirectory=Path("/project"), vhdlVersion=VHDLVersion.VHDL2008)
+		design = project.DefaultDesign
+		design.TopLevel = "top"
+		fileSet = design.DefaultFileSet
+		fileSet.AddFiles((
+			VHDLSourceFile(Path("pkg.vhdl"), vhdlVersion=VHDLVersion.VHDL93),
+			VHDLSourceFile(Path("top.vhdl")),
+			VerilogHeaderFile(Path("defs.vh")),
+			SystemVerilogSourceFile(Path("tb \"quoted\".sv"))
+		))
+		for file in fileSet.Files(VHDLSourceFile):
+			file.VHDLLibrary = fileSet.GetOrCreateVHDLLibrary("lib")
+		FileSet("rtl", directory=Path("src/rtl"), design=design).AddFile(VerilogSourceFile(Path("a.v")))
+
+		stream = StringIO()
+		WriteEDAM(stream, design, relativeTo=Path("/project"))
+		edam = json_loads(stream.getvalue())
+
+		self.assertEqual("default", edam["name"])
+		self.assertEqual("top", edam["toplevel"])
+		self.assertListEqual([
+				{"name": "pkg.vhdl", "file_type": "vhdlSource-93", "logical_name": "lib"},
+				{"name": "top.vhdl", "file_type": "vhdlSource-2008", "logical_name": "lib"},
+				{"name": "defs.vh", "file_type": "verilogSource", "is_include_file": True},
+				{"name": "tb \"quoted\".sv", "file_type": "systemVerilogSource"},
+				{"name": "src/rtl/a.v", "file_type": "verilogSource"}
+			],
+			edam["files"]
+		)
+
+		stream = StringIO()
+		WriteEDAM(stream, design, fileSet=design.FileSets["rtl"])
+		self.assertEqual("/project/src/rtl/a.v", json_loads(stream.getvalue())["files"][0]["name"])
+
+	@mark.skipif(withYAML is False, reason="No 'PyYAML' package found.")
+	def test_RoundTrip(self) -> None:
+		coreFile = FuseSoCCoreFile(Path("tests/FuseSoC/uart.core"))
+		coreFile.Parse()
+		design = coreFile.ProjectModel.DefaultDesign
+
+		stream = StringIO()
+		WriteEDAM(stream, design, name="uart", fileSet=design.FileSets["rtl"])
+		edam = json_loads(stream.getvalue())
+
+		self.assertEqual("uart", edam["name"])
+		self.assertNotIn("toplevel", edam)
+		self.assertListEqual(
+			["vhdlSource-2008", "vhdlSource-2008", "vhdlSource-93", "vhdlSource-2008"],
+			[entry["file_type"] for entry in edam["files"]]
+		)
@@ -0,0 +1,95 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Instantiation tests for the project model."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel.Xilinx.ISE import ISEProjectFile, VHDLSourceFile, UCFConstraintFile, AssociationAttribute
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class FileSets(TestCase):
+	def test_Parsing(self) -> None:
+		iseProjectFile = ISEProjectFile(Path("tests/ISEProject/StopWatch.xise"))
+		iseProjectFile.Parse()
+
+		project = iseProjectFile.ProjectModel
+		self.assertEqual("StopWatch", project.Name)
+
+		design = project.DefaultDesign
+		implementation = design.FileSets["Implementation"]
+		simulation = design.FileSets["Simulation"]
+
+		self.assertIs(implementation, design.DefaultFileSet)
+		self.assertEqual("toplevel", implementation.TopLevel)
+		self.assertEqual("toplevel_tb", simulation.TopLevel)
+		self.assertEqual(5, implementation.FileCount)
+		self.assertEqual(1, simulation.FileCount)
+
+		files = list(implementation.Files(fileSet=False))
+		for file in files[:4]:
+			self.assertIsInstance(file, VHDLSourceFile)
+			self.assertTrue(file.ResolvedPath.exists())
+			self.assertIs(VHDLVersion.VHDL2008, file.VHDLVersion)
+			self.assertListEqual(["BehavioralSimulation", "Implementation"], file[AssociationAttribute])
+		self.assertIsInstance(files[4], UCFConstraintFile)
+		self.assertListEqual(["Implementation"], files[4][AssociationAttribute])
+
+		self.assertEqual("lib_Utilities", files[0].VHDLLibrary.Name)
+		self.assertEqual("work", files[1].VHDLLibrary.Name)
+
+		testbench = next(simulation.Files(fileSet=False))
+		self.assertEqual(Path("../VivadoProject/StopWatch/tb/toplevel.StopWatch.tb.vhdl"), testbench.Path)
+		self.assertIs(design.VHDLLibraries["work"], testbench.VHDLLibrary)
+
+		self.assertListEqual(["lib_Utilities", "work", "lib_Unused"], list(design.VHDLLibraries.keys()))
+
+	def test_MissingFile(self) -> None:
+		with self.assertRaises(Exception):
+			ISEProjectFile(Path("tests/ISEProject/Missing.xise")).Parse()
+
+	def test_ImplementationTop(self) -> None:
+		content = Path("tests/ISEProject/StopWatch.xise").read_text(encoding="utf-8")
+		for value, expected in (("", None), ("toplevel", "toplevel"), ("Module|top", "top")):
+			with TemporaryDirectory() as tempDirectory:
+				path = Path(tempDirectory) / "StopWatch.xise"
+				path.write_text(content.replace('"Architecture|toplevel|rtl"', f'"{value}"'), encoding="utf-8")
+				iseProjectFile = ISEProjectFile(path)
+				iseProjectFile.Parse()
+
+				self.assertEqual(expected, iseProjectFile.ProjectModel.DefaultDesign.FileSets["Implementation"].TopLevel)
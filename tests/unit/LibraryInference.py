@@ -0,0 +1,147 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the VHDL library dependency inference."""
+from pathlib  import Path
+from unittest import TestCase
+
+from pyEDAA.ProjectModel                  import Design, FileSet, VHDLLibrary, VHDLSourceFile, VerilogSourceFile
+from pyEDAA.ProjectModel.LibraryInference import LibraryDependencyInference
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def Edges(design):
+	return sorted((edge.Source.Value.Name, edge.Destination.Value.Name) for edge in design._vhdlLibraryDependencyGraph.IterateEdges())
+
+
+class Inference(TestCase):
+	def _CreateDesign(self):
+		design = Design("design", directory=Path("/project"))
+		libraries = {name: VHDLLibrary(name, design=design) for name in ("top", "util", "ip")}
+
+		files = {}
+		for name, library in (("top.vhdl", "top"), ("util.vhdl", "util"), ("pkg.vhdl", "util"), ("fifo.vhdl", "ip")):
+			files[name] = VHDLSourceFile(Path(name))
+			design.DefaultFileSet.AddFile(files[name])
+			files[name].VHDLLibrary = libraries[library]
+
+		# Files inherit the library of their fileset.
+		ipFileSet = FileSet("ip", design=design)
+		ipFileSet.VHDLLibrary = libraries["ip"]
+		files["ram.vhdl"] = VHDLSourceFile(Path("ram.vhdl"))
+		ipFileSet.AddFile(files["ram.vhdl"])
+		files["wrapper.v"] = VerilogSourceFile(Path("wrapper.v"))
+		design.DefaultFileSet.AddFile(files["wrapper.v"])
+
+		return design, libraries, files
+
+	def test_Collapse(self) -> None:
+		design, libraries, files = self._CreateDesign()
+		design.AddFileDependency(files["top.vhdl"], files["util.vhdl"])
+		design.AddFileDependency(files["top.vhdl"], files["pkg.vhdl"])
+		design.AddFileDependency(files["util.vhdl"], files["pkg.vhdl"])
+		design.AddFileDependency(files["util.vhdl"], files["ram.vhdl"])
+		design.AddFileDependency(files["wrapper.v"], files["top.vhdl"])
+
+		inference = LibraryDependencyInference(design)
+
+		self.assertListEqual([("top", "util"), ("util", "ip")], Edges(design))
+		self.assertListEqual(
+			[(files["top.vhdl"], files["util.vhdl"]), (files["top.vhdl"], files["pkg.vhdl"])],
+			inference.SupportingFileDependencies(libraries["top"], libraries["util"])
+		)
+		libraryOrder = []
+		for _, _, library, _ in design.IterateCompileOrder():
+			if library is not None and library not in libraryOrder:
+				libraryOrder.append(library)
+		self.assertListEqual([libraries["ip"], libraries["util"], libraries["top"]], libraryOrder)
+
+	def test_AddFileDependency(self) -> None:
+		design, libraries, files = self._CreateDesign()
+		inference = LibraryDependencyInference(design)
+		self.assertListEqual([], Edges(design))
+
+		inference.AddFileDependency(files["top.vhdl"], files["fifo.vhdl"])
+		inference.AddFileDependency(files["top.vhdl"], files["ram.vhdl"])
+		inference.AddFileDependency(files["util.vhdl"], files["pkg.vhdl"])
+		self.assertListEqual([("top", "ip")], Edges(design))
+		self.assertListEqual([(libraries["top"], libraries["ip"])], inference.Dependencies)
+
+	def test_UpdateFile(self) -> None:
+		design, libraries, files = self._CreateDesign()
+		design.AddFileDependency(files["top.vhdl"], files["util.vhdl"])
+		inference = LibraryDependencyInference(design)
+
+		# Moving a file into the dependent's library removes the library edge.
+		files["util.vhdl"].VHDLLibrary = libraries["top"]
+		inference.UpdateFile(files["util.vhdl"])
+		self.assertListEqual([], Edges(design))
+
+		files["util.vhdl"].VHDLLibrary = libraries["ip"]
+		inference.UpdateFile(files["util.vhdl"])
+		self.assertListEqual([("top", "ip")], Edges(design))
+
+	def test_Update(self) -> None:
+		design, libraries, files = self._CreateDesign()
+		design.AddFileDependency(files["top.vhdl"], files["util.vhdl"])
+		design.AddFileDependency(files["util.vhdl"], files["fifo.vhdl"])
+		libraries["top"].AddDependency(libraries["ip"])
+		inference = LibraryDependencyInference(design)
+		self.assertListEqual([("top", "ip"), ("top", "util"), ("util", "ip")], Edges(design))
+
+		# Changes made to the design directly
+		files["fifo.vhdl"].VHDLLibrary = libraries["util"]
+		design.AddFileDependency(files["ram.vhdl"], files["top.vhdl"])
+		inference.Update()
+
+		# Declared dependencies are kept.
+		self.assertListEqual([("ip", "top"), ("top", "ip"), ("top", "util")], Edges(design))
+
+
+	def test_ManualDependency(self) -> None:
+		design, libraries, files = self._CreateDesign()
+		design.AddFileDependency(files["top.vhdl"], files["util.vhdl"])
+		design.AddFileDependency(files["top.vhdl"], files["fifo.vhdl"])
+		inference = LibraryDependencyInference(design)
+
+		# An inferred dependency declared by hand afterwards becomes a manual dependency.
+		libraries["top"].AddDependency(libraries["util"])
+		self.assertEqual(2, len(list(design._vhdlLibraryDependencyGraph.IterateEdges())))
+
+		files["util.vhdl"].VHDLLibrary = libraries["top"]
+		files["fifo.vhdl"].VHDLLibrary = libraries["top"]
+		inference.UpdateFile(files["util.vhdl"])
+		inference.UpdateFile(files["fifo.vhdl"])
+		self.assertListEqual([], inference.Dependencies)
+		self.assertListEqual([("top", "util")], Edges(design))
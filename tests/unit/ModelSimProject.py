@@ -0,0 +1,124 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Instantiation tests for the project model."""
+from os       import utime
+from pathlib  import Path
+from shutil   import copytree
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel                          import Project, VHDLSourceFile
+from pyEDAA.ProjectModel.MentorGraphics.ModelSim  import ModelSimProjectFile, ModelSimINIFile
+from pyEDAA.ProjectModel.MentorGraphics.QuestaSim import ModelSimINIFile as QuestaSim_ModelSimINIFile
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class ProjectFile(TestCase):
+	def test_Parsing(self) -> None:
+		projectFile = ModelSimProjectFile(Path("tests/ModelSimProject/StopWatch.mpf"))
+		projectFile.Parse()
+
+		design = projectFile.ProjectModel.DefaultDesign
+		files = list(design.DefaultFileSet.Files())
+
+		self.assertListEqual(
+			["Utilities.pkg.vhdl", "StopWatch.pkg.vhdl", "Counter.vhdl", "toplevel.StopWatch.tb.vhdl"],
+			[file.Path.name for file in files]
+		)
+		for file in files:
+			self.assertIsInstance(file, VHDLSourceFile)
+			self.assertTrue(file.ResolvedPath.exists())
+
+		self.assertEqual("lib_Utilities", files[0].VHDLLibrary.Name)
+		self.assertEqual("work", files[3].VHDLLibrary.Name)
+		self.assertIs(VHDLVersion.VHDL2008, files[0].VHDLVersion)
+		self.assertIs(VHDLVersion.VHDL2002, files[1].VHDLVersion)
+
+		external = {library.Name: library.Path for library in design.ExternalVHDLLibraries}
+		self.assertListEqual(["ieee", "secureip", "std", "unimacro", "unisim", "vital2000"], sorted(external.keys()))
+		self.assertEqual(Path("tests/ModelSimProject/vendor/unisim").resolve(), external["unisim"])
+		self.assertEqual(Path("/opt/xilinx/secureip"), external["secureip"])
+
+
+class INIFile(TestCase):
+	def test_Chaining(self) -> None:
+		iniFile = ModelSimINIFile(Path("tests/ModelSimProject/vendor/modelsim.ini"))
+		mappings = iniFile.LibraryMappings
+
+		self.assertEqual(Path("tests/ModelSimProject/vendor/unisim").resolve(), mappings["unisim"])
+		self.assertEqual(Path("$MODEL_TECH/../ieee"), mappings["ieee"])
+		self.assertEqual(6, len(mappings))
+
+	def test_ExternalVHDLLibraries(self) -> None:
+		project = Project("project")
+		project.DefaultDesign.DefaultFileSet.GetOrCreateVHDLLibrary("unisim")
+
+		iniFile = QuestaSim_ModelSimINIFile(Path("tests/ModelSimProject/vendor/modelsim.ini"))
+		iniFile.AddExternalVHDLLibraries(project.DefaultDesign)
+		iniFile.AddExternalVHDLLibraries(project.DefaultDesign)
+
+		names = [library.Name for library in project.DefaultDesign.ExternalVHDLLibraries]
+		self.assertListEqual(["std", "ieee", "vital2000", "unimacro", "secureip"], names)
+
+	def test_Cache(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory) / "ModelSimProject"
+			copytree("tests/ModelSimProject", directory)
+			vendorINI = directory / "vendor" / "modelsim.ini"
+
+			mappings = ModelSimINIFile(vendorINI).LibraryMappings
+			self.assertIs(mappings, ModelSimINIFile(vendorINI).LibraryMappings)
+
+			# a change of a chained file invalidates the cached mappings
+			chainedINI = directory / "modelsim.ini"
+			chainedINI.write_text("[Library]\nfoo = foo\n")
+			stat = chainedINI.stat()
+			utime(chainedINI, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+			mappings = ModelSimINIFile(vendorINI).LibraryMappings
+			self.assertIn("foo", mappings)
+			self.assertNotIn("ieee", mappings)
+
+	def test_Cycle(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "a.ini").write_text("[Library]\nothers = b.ini\n")
+			(directory / "b.ini").write_text("[Library]\nothers = a.ini\n")
+
+			with self.assertRaises(Exception) as context:
+				_ = ModelSimINIFile(directory / "a.ini").LibraryMappings
+			self.assertIn("Cyclic", str(context.exception))
@@ -0,0 +1,120 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for Ninja build file generation."""
+from io       import StringIO
+from pathlib  import Path
+from unittest import TestCase
+
+from pyEDAA.ProjectModel       import Design, VHDLSourceFile, VerilogSourceFile, SystemVerilogSourceFile
+from pyEDAA.ProjectModel.Ninja import WriteNinjaFile
+
+from tests.unit import CreateDesign
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+RULES = {
+	VHDLSourceFile:          "ghdl -a --std=$std --work=$library $in && touch $out",
+	VerilogSourceFile:       "iverilog -c $in && touch $out",
+	SystemVerilogSourceFile: "iverilog -g2012 -c $in && touch $out"
+}
+
+
+class Ninja(TestCase):
+	def _GetBuilds(self, design: Design):
+		stream = StringIO()
+		WriteNinjaFile(stream, design, RULES)
+		content = stream.getvalue()
+
+		builds = {}
+		for line in content.splitlines():
+			if line.startswith("build "):
+				outputs, _, inputs = line[6:].partition(": ")
+				builds[outputs] = inputs
+
+		return content, builds
+
+	def test_Rules(self) -> None:
+		content, builds = self._GetBuilds(CreateDesign())
+
+		self.assertIn("rule analyze_VHDLSourceFile\n  command = ghdl -a --std=$std --work=$library $in && touch $out\n", content)
+		self.assertIn("  restat = 1\n", content)
+		self.assertIn("  library = util_lib\n  vhdlversion = 1993\n  std = 93\n", content)
+		self.assertTrue(content.endswith("default all\n"))
+
+		# 4 VHDL files, a Verilog and a SystemVerilog file; constraints and text files have no rule.
+		stamps = builds["all"].split(" ")[1:]
+		self.assertEqual(6, len(stamps))
+		self.assertTrue(all(stamp.startswith("stamps/") and stamp.endswith(".stamp") for stamp in stamps))
+
+	def test_LibraryDependencies(self) -> None:
+		_, builds = self._GetBuilds(CreateDesign())
+
+		topStamp = [stamp for stamp, inputs in builds.items() if " /project/src/top.vhdl" in inputs][0]
+		self.assertTrue(builds[topStamp].endswith("| library_util_lib library_ip_lib") or builds[topStamp].endswith("| library_ip_lib library_util_lib"))
+		ipStamps = builds["library_ip_lib"].split(" ")[1:]
+		self.assertEqual(2, len(ipStamps))
+		self.assertTrue(builds[ipStamps[1]].endswith(f"| {ipStamps[0]}"))
+
+	def test_FileDependencies(self) -> None:
+		design = CreateDesign()
+		files = {file.Path.name: file for file in design.DefaultFileSet.Files()}
+		design.AddFileDependency(files["top.vhdl"], files["util.vhdl"])
+		design.AddFileDependency(files["top.vhdl"], files["util.vhdl"])
+		design.AddFileDependency(files["wrapper.v"], files["top.vhdl"])
+		self.assertEqual(1, len(list(files["top.vhdl"]._dependencyNode.IterateSuccessorVertices())))
+
+		_, builds = self._GetBuilds(design)
+		stamps = {inputs.split(" ")[1]: stamp for stamp, inputs in builds.items() if not inputs.startswith("phony")}
+		self.assertTrue(builds[stamps["/project/src/top.vhdl"]].endswith(f"| {stamps['/project/src/util.vhdl']}"))
+		self.assertTrue(builds[stamps["/project/src/wrapper.v"]].endswith(f"| {stamps['/project/src/top.vhdl']}"))
+		self.assertEqual("analyze_SystemVerilogSourceFile /project/src/tb.sv", builds[stamps["/project/src/tb.sv"]])
+
+	def test_Escape(self) -> None:
+		design = CreateDesign()
+		design.DefaultFileSet.AddFile(VHDLSourceFile(Path("my dir/c:$x.vhdl")))
+		content, _ = self._GetBuilds(design)
+
+		self.assertIn("/project/my$ dir/c$:$$x.vhdl", content)
+
+	def test_FileSetFilter(self) -> None:
+		design = CreateDesign()
+		stream = StringIO()
+		WriteNinjaFile(stream, design, RULES, fileSet=design.DefaultFileSet)
+		content = stream.getvalue()
+
+		# ip_lib is in another fileset, thus not exported and not referenced.
+		self.assertNotIn("library_ip_lib", content)
+		self.assertIn("| library_util_lib\n", content)
+		self.assertIn("build library_util_lib: phony ", content)
@@ -0,0 +1,165 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for design partitioning."""
+from pathlib  import Path
+from unittest import TestCase
+
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel              import Project, Design, FileSet, VHDLLibrary, VHDLSourceFile, VerilogSourceFile
+from pyEDAA.ProjectModel.Partitioning import PartitionDesign
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def Names(partition):
+	return sorted(unit.Name for unit in partition.VHDLLibraries)
+
+
+class Partitioning(TestCase):
+	def _CreateDesign(self, *dependencies) -> Design:
+		project = Project("project", rootDirectory=Path("/project"), vhdlVersion=VHDLVersion.VHDL2008)
+		design = project.DefaultDesign
+		fileSet = design.DefaultFileSet
+		for name in "abcd":
+			library = fileSet.GetOrCreateVHDLLibrary(name)
+			for i in range(2):
+				file = VHDLSourceFile(Path(f"{name}/{name}{i}.vhdl"))
+				fileSet.AddFile(file)
+				file.VHDLLibrary = library
+
+		for library, dependency in dependencies:
+			design.VHDLLibraries[library]._dependencyNode.EdgeToVertex(design.VHDLLibraries[dependency]._dependencyNode)
+
+		return design
+
+	def test_Independent(self) -> None:
+		design = self._CreateDesign(("a", "b"), ("c", "d"))
+		partitions = PartitionDesign(design, 2, weights={file: 1.0 for file in design.Files()})
+
+		self.assertListEqual([["a", "b"], ["c", "d"]], sorted(Names(partition) for partition in partitions))
+		self.assertListEqual([4.0, 4.0], [partition.Weight for partition in partitions])
+		self.assertTrue(all(len(partition.Imports) == 0 for partition in partitions))
+		self.assertTrue(all(len(partition.DependsOn) == 0 for partition in partitions))
+		self.assertEqual(4, len(partitions[0].Files))
+
+	def test_Imports(self) -> None:
+		design = self._CreateDesign(("a", "b"), ("c", "d"), ("b", "d"))
+		partitions = PartitionDesign(design, 2, weights={file: 1.0 for file in design.Files()})
+
+		partitionAB = [partition for partition in partitions if "a" in Names(partition)][0]
+		partitionCD = [partition for partition in partitions if "c" in Names(partition)][0]
+		self.assertListEqual(["a", "b"], Names(partitionAB))
+		self.assertListEqual(["d"], [unit.Name for unit in partitionAB.Imports])
+		self.assertListEqual([partitionCD.Index], partitionAB.DependsOn)
+		self.assertListEqual([], partitionCD.Imports)
+
+	def test_Acyclic(self) -> None:
+		design = self._CreateDesign(("a", "b"), ("c", "d"), ("a", "c"), ("d", "b"))
+		partitions = PartitionDesign(design, 2, weights={file: 1.0 for file in design.Files()})
+
+		self.assertFalse(partitions[0].Index in partitions[1].DependsOn and partitions[1].Index in partitions[0].DependsOn)
+		self.assertEqual(8, sum(len(partition.Files) for partition in partitions))
+
+	def test_FileDependencies(self) -> None:
+		design = self._CreateDesign(("a", "b"), ("c", "d"))
+		verilogFile = VerilogSourceFile(Path("top.v"))
+		design.DefaultFileSet.AddFile(verilogFile)
+		cFile = design.VHDLLibraries["c"]._files[0]
+		design.AddFileDependency(verilogFile, cFile)
+
+		partitions = PartitionDesign(design, 2, weights={file: 1.0 for file in design.Files()}, imbalance=0.5)
+		partition = [partition for partition in partitions if verilogFile in partition.Units][0]
+		self.assertIn(design.VHDLLibraries["c"], partition.Units)
+
+	def test_CreateDesign(self) -> None:
+		design = self._CreateDesign(("a", "b"), ("c", "d"), ("b", "d"))
+		partitions = PartitionDesign(design, 2, weights={file: 1.0 for file in design.Files()})
+		partitionAB = [partition for partition in partitions if "a" in Names(partition)][0]
+
+		subDesign = partitionAB.CreateDesign(importDirectory=Path("/build"))
+		self.assertEqual(f"default_{partitionAB.Index}", subDesign.Name)
+		self.assertListEqual(["a", "b"], sorted(subDesign.VHDLLibraries))
+		self.assertListEqual([("d", Path("/build/d"))], [(library.Name, library.Path) for library in subDesign.ExternalVHDLLibraries])
+
+		compileOrder = [(path.as_posix(), library.Name) for _, path, library, _ in subDesign.IterateCompileOrder()]
+		self.assertListEqual([
+				("/project/b/b0.vhdl", "b"),
+				("/project/b/b1.vhdl", "b"),
+				("/project/a/a0.vhdl", "a"),
+				("/project/a/a1.vhdl", "a")
+			],
+			compileOrder
+		)
+		# Files of the original design are unchanged.
+		self.assertEqual(8, len(list(design.Files())))
+
+	def test_FileSetLibraries(self) -> None:
+		design = Design("design", directory=Path("/project"), vhdlVersion=VHDLVersion.VHDL2008)
+		for name in "AB":
+			fileSet = FileSet(f"fs{name}", design=design)
+			fileSet.VHDLLibrary = VHDLLibrary(f"lib{name}", design=design)
+			fileSet.AddFiles([VHDLSourceFile(Path(f"{name.lower()}{i}.vhdl")) for i in range(2)])
+
+		partitions = PartitionDesign(design, 2, weights={file: 1.0 for file in design.Files()})
+		self.assertListEqual([["libA"], ["libB"]], sorted(Names(partition) for partition in partitions))
+		self.assertTrue(all(len(partition.Units) == 1 and len(partition.Files) == 2 for partition in partitions))
+
+		partitionA = [partition for partition in partitions if "libA" in Names(partition)][0]
+		compileOrder = [(path.as_posix(), library.Name) for _, path, library, _ in partitionA.CreateDesign().IterateCompileOrder()]
+		self.assertListEqual([("/project/a0.vhdl", "libA"), ("/project/a1.vhdl", "libA")], compileOrder)
+
+	def test_ManyUnits(self) -> None:
+		design = Design("design", directory=Path("/project"))
+		files = [VerilogSourceFile(Path(f"m{i}.v")) for i in range(1000)]
+		design.DefaultFileSet.AddFiles(files)
+		for i, file in enumerate(files):
+			for distance in (1, 7, 31):
+				if i >= distance:
+					design.AddFileDependency(file, files[i - distance])
+
+		partitions = PartitionDesign(design, 4, weights={file: 1.0 for file in files})
+		self.assertEqual(1000, sum(len(partition.Units) for partition in partitions))
+		self.assertTrue(all(partition.Weight <= 275.0 for partition in partitions))
+
+		# The partition graph has a topological order.
+		compiled = set()
+		while len(compiled) < len(partitions):
+			ready = [partition.Index for partition in partitions if partition.Index not in compiled and set(partition.DependsOn) <= compiled]
+			self.assertNotEqual([], ready)
+			compiled.update(ready)
+
+	def test_InvalidCount(self) -> None:
+		with self.assertRaises(ValueError):
+			PartitionDesign(self._CreateDesign(), 0)
@@ -0,0 +1,152 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Instantiation tests for the project model."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel                    import Project as Model_Project, VHDLSourceFile, VerilogSourceFile
+from pyEDAA.ProjectModel.Intel.QuartusPrime import QuartusProjectFile, QuartusSettingsFile, QIPFile, QIPResolver, SDCConstraintFile
+from pyEDAA.ProjectModel.Intel.QuartusPrime import SearchPathsAttribute
+from pyEDAA.ProjectModel.Altera.Quartus     import QuartusSettingsFile as Altera_QuartusSettingsFile
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Settings(TestCase):
+	_qsfPath = Path("tests/QuartusProject/StopWatch.qsf")
+
+	def test_Parsing(self) -> None:
+		settingsFile = QuartusSettingsFile(self._qsfPath)
+		settingsFile.Parse()
+
+		design = settingsFile.ProjectModel.DefaultDesign
+		fileSet = design.DefaultFileSet
+
+		self.assertEqual("toplevel", fileSet.TopLevel)
+		self.assertEqual("Cyclone V", settingsFile.GlobalAssignments["FAMILY"])
+		self.assertListEqual([Path("../VivadoProject/StopWatch/src")], settingsFile.SearchPaths)
+		self.assertListEqual([Path("../VivadoProject/StopWatch/src")], fileSet[SearchPathsAttribute])
+		self.assertEqual(7, fileSet.FileCount)
+
+		files = list(fileSet.Files(fileSet=False))
+		for file in files[:4]:
+			self.assertIsInstance(file, VHDLSourceFile)
+			self.assertTrue(file.ResolvedPath.exists())
+		self.assertIsInstance(files[4], SDCConstraintFile)
+
+		self.assertEqual("lib_Utilities", files[0].VHDLLibrary.Name)
+		self.assertEqual("work", files[2].VHDLLibrary.Name)
+		self.assertIs(VHDLVersion.VHDL2008, files[0].VHDLVersion)
+		self.assertIs(VHDLVersion.VHDL93, files[2].VHDLVersion)
+		self.assertEqual(Path("../VivadoProject/StopWatch/src/toplevel.StopWatch.vhdl"), files[3].Path)
+
+	def test_LazyAssignments(self) -> None:
+		settingsFile = QuartusSettingsFile(self._qsfPath)
+		settingsFile.Parse()
+
+		self.assertIsNone(settingsFile._pinAssignments)
+		self.assertDictEqual({"Clock": "PIN_AF14", "Reset": "PIN_AA14"}, settingsFile.PinAssignments)
+		self.assertDictEqual({"IO_STANDARD": "3.3-V LVTTL", "WEAK_PULL_UP_RESISTOR": "ON"}, settingsFile.InstanceAssignments["Reset"])
+		self.assertEqual("root_partition", settingsFile.InstanceAssignments["|"]["PARTITION_HIERARCHY"])
+
+	def test_Altera(self) -> None:
+		settingsFile = Altera_QuartusSettingsFile(self._qsfPath)
+		settingsFile.Parse()
+
+		self.assertEqual(7, settingsFile.ProjectModel.DefaultDesign.DefaultFileSet.FileCount)
+
+
+class Project(TestCase):
+	def test_Revisions(self) -> None:
+		projectFile = QuartusProjectFile(Path("tests/QuartusProject/StopWatch.qpf"))
+		projectFile.Parse()
+
+		self.assertListEqual(["StopWatch"], projectFile.Revisions)
+
+		design = projectFile.ProjectModel.Designs["StopWatch"]
+		self.assertEqual("toplevel", design.DefaultFileSet.TopLevel)
+		self.assertEqual(7, design.DefaultFileSet.FileCount)
+
+
+class IPFiles(TestCase):
+	def test_NestedFileSets(self) -> None:
+		settingsFile = QuartusSettingsFile(Path("tests/QuartusProject/StopWatch.qsf"))
+		settingsFile.Parse()
+
+		design = settingsFile.ProjectModel.DefaultDesign
+		fileSet = design.DefaultFileSet
+		self.assertListEqual(["ip/system/system.qip"], list(fileSet.FileSets.keys()))
+
+		system = fileSet.FileSets["ip/system/system.qip"]
+		self.assertEqual(5, system.FileCount)
+		systemFiles = list(system.Files(fileSet=False))
+		self.assertEqual(Path("tests/QuartusProject/ip/system/system.vhd"), systemFiles[0].ResolvedPath.relative_to(Path.cwd()))
+		self.assertEqual("system", systemFiles[0].VHDLLibrary.Name)
+		self.assertIsInstance(systemFiles[4], QIPFile)
+
+		pll = system.FileSets["../pll/pll.qip"]
+		pllFiles = list(pll.Files(fileSet=False))
+		self.assertEqual(2, len(pllFiles))
+		self.assertIsInstance(pllFiles[1], VerilogSourceFile)
+		self.assertEqual(Path("tests/QuartusProject/ip/pll/pll/pll_0002.v"), pllFiles[1].ResolvedPath.relative_to(Path.cwd()))
+		self.assertEqual("work", pllFiles[0].VHDLLibrary.Name)
+
+		self.assertEqual(14, len(list(fileSet.Files())))
+
+	def test_Memoization(self) -> None:
+		resolver = QIPResolver()
+		for _ in range(2):
+			settingsFile = QuartusSettingsFile(Path("tests/QuartusProject/StopWatch.qsf"))
+			settingsFile.Parse(resolver=resolver)
+
+			self.assertEqual(2, resolver.CachedFileCount)
+			self.assertIn("ip/system/system.qip", settingsFile.ProjectModel.DefaultDesign.DefaultFileSet.FileSets)
+
+	def test_Cycle(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "a.qip").write_text("set_global_assignment -name QIP_FILE [file join $::quartus(qip_path) b.qip]\n")
+			(directory / "b.qip").write_text("set_global_assignment -name QIP_FILE [file join $::quartus(qip_path) a.qip]\n")
+
+			project = Model_Project("cycle", rootDirectory=directory)
+			fileSet = project.DefaultDesign.DefaultFileSet
+			qipFile = QIPFile(Path("a.qip"))
+			fileSet.AddFile(qipFile)
+
+			with self.assertRaises(Exception) as context:
+				QIPResolver().Resolve(qipFile)
+			self.assertIn("Cyclic reference", str(context.exception))
@@ -0,0 +1,136 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the reachability index."""
+from pathlib  import Path
+from random   import Random
+from unittest import TestCase
+
+from pyTooling.Graph import Vertex
+
+from pyEDAA.ProjectModel              import VHDLSourceFile
+from pyEDAA.ProjectModel.Reachability import ReachabilityIndex
+
+from tests.unit import CreateDesign, CreateGraph
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def Values(vertices):
+	return sorted(vertex.Value for vertex in vertices)
+
+
+class Index(TestCase):
+	def test_Queries(self) -> None:
+		graph, vertices = CreateGraph([("a", "b"), ("b", "c"), ("d", "b")])
+		index = ReachabilityIndex(graph)
+
+		self.assertListEqual(["b", "c"], Values(index.Dependencies(vertices["a"])))
+		self.assertListEqual(["a", "b", "d"], Values(index.Dependents(vertices["c"])))
+		self.assertTrue(index.DependsOn(vertices["a"], vertices["c"]))
+		self.assertFalse(index.DependsOn(vertices["c"], vertices["a"]))
+		self.assertFalse(index.DependsOn(vertices["a"], vertices["a"]))
+		self.assertEqual(2, index.DependencyCount(vertices["d"]))
+		self.assertEqual(3, index.DependentCount(vertices["c"]))
+		self.assertListEqual(["a", "d"], Values(index.DependentsOfAny([vertices["b"]])))
+
+	def test_Cycle(self) -> None:
+		graph, vertices = CreateGraph([("a", "b"), ("b", "c"), ("c", "b"), ("d", "d")])
+		index = ReachabilityIndex(graph)
+
+		self.assertListEqual(["b", "c"], Values(index.Dependencies(vertices["a"])))
+		self.assertListEqual(["b", "c"], Values(index.Dependencies(vertices["b"])))
+		self.assertListEqual(["a", "b", "c"], Values(index.Dependents(vertices["c"])))
+		self.assertTrue(index.DependsOn(vertices["d"], vertices["d"]))
+
+	def test_AddEdge(self) -> None:
+		graph, vertices = CreateGraph([("a", "b"), ("c", "d")])
+		index = ReachabilityIndex(graph)
+
+		index.AddEdge(vertices["b"], vertices["c"])
+		self.assertEqual(3, graph.EdgeCount)
+		self.assertListEqual(["b", "c", "d"], Values(index.Dependencies(vertices["a"])))
+		self.assertListEqual(["a", "b", "c"], Values(index.Dependents(vertices["d"])))
+
+		# Creating a cycle
+		index.AddEdge(vertices["d"], vertices["a"])
+		self.assertTrue(all(index.DependsOn(vertices[x], vertices[y]) for x in "abcd" for y in "abcd"))
+
+		# A new vertex
+		e = Vertex(value="e", graph=graph)
+		index.AddEdge(e, vertices["a"])
+		self.assertEqual(4, index.DependencyCount(e))
+		self.assertEqual(0, index.DependentCount(e))
+
+	def test_Rebuild(self) -> None:
+		design = CreateDesign()
+		files = {file.Path.name: file for file in design.DefaultFileSet.Files()}
+		design.AddFileDependency(files["top.vhdl"], files["util.vhdl"])
+		index = ReachabilityIndex(design._fileDependencyGraph)
+		self.assertListEqual([files["util.vhdl"]._dependencyNode], index.Dependencies(files["top.vhdl"]))
+
+		# Edges added to the design directly are detected.
+		design.AddFileDependency(files["wrapper.v"], files["top.vhdl"])
+		self.assertTrue(index.DependsOn(files["wrapper.v"], files["util.vhdl"]))
+
+		with self.assertRaises(Exception):
+			index.Dependencies(VHDLSourceFile(Path("other.vhdl")))
+
+	def test_VHDLLibraries(self) -> None:
+		design = CreateDesign()
+		index = ReachabilityIndex(design._vhdlLibraryDependencyGraph)
+		libraries = design.VHDLLibraries
+
+		self.assertTrue(index.DependsOn(libraries["top_lib"], libraries["ip_lib"]))
+		self.assertListEqual(["top_lib"], [vertex.Value.Name for vertex in index.Dependents(libraries["util_lib"])])
+
+	def test_RandomGraph(self) -> None:
+		random = Random(42)
+		edges = [(random.randrange(300), random.randrange(300)) for _ in range(600)]
+		graph, vertices = CreateGraph(edges[:400])
+		index = ReachabilityIndex(graph)
+		for source, destination in edges[400:]:
+			for name in (source, destination):
+				if name not in vertices:
+					vertices[name] = Vertex(value=name, graph=graph)
+			index.AddEdge(vertices[source], vertices[destination])
+
+		for name, vertex in vertices.items():
+			expected = set()
+			stack = list(vertex.IterateSuccessorVertices())
+			while len(stack) > 0:
+				successor = stack.pop()
+				if successor not in expected:
+					expected.add(successor)
+					stack.extend(successor.IterateSuccessorVertices())
+			self.assertSetEqual(expected, set(index.Dependencies(vertex)), f"Vertex {name}")
@@ -0,0 +1,140 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for duration-based scheduling."""
+from pathlib  import Path
+from sys      import executable
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyEDAA.ProjectModel            import Project, VHDLSourceFile
+from pyEDAA.ProjectModel.Execution  import AnalysisJob, CreateAnalysisJobs, ParallelExecutor
+from pyEDAA.ProjectModel.Scheduling import DurationDatabase, EstimateDurations, CriticalPathOrder, CriticalPath, PackBins
+
+from tests.unit import CreateJobs
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Database(TestCase):
+	def test_FileDurations(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			path = directory / "a.vhdl"
+			path.write_text("entity a is end entity;\n")
+
+			with DurationDatabase(directory / "durations.db") as database:
+				self.assertIsNone(database.GetFileDuration(path))
+				database.AddFileDuration(path, 2.0)
+				database.AddFileDuration(path, 4.0)
+				self.assertEqual(3.0, database.GetFileDuration(path))
+
+			# Persisted and keyed by content: a renamed file keeps its duration, a modified file doesn't.
+			path = path.rename(directory / "b.vhdl")
+			with DurationDatabase(directory / "durations.db") as database:
+				self.assertEqual(3.0, database.GetFileDuration(path))
+				path.write_text("entity b is end entity;\n")
+				self.assertIsNone(database.GetFileDuration(path))
+
+	def test_TestDurations(self) -> None:
+		with DurationDatabase() as database:
+			database.AddTestDuration("tb_counter", 10.0)
+			self.assertEqual(10.0, database.GetTestDuration("tb_counter"))
+			self.assertIsNone(database.GetTestDuration("tb_timer"))
+
+	def test_AddTimings(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			project = Project("project", rootDirectory=directory)
+			for name in ("a", "b"):
+				(directory / f"{name}.vhdl").write_text(f"entity {name} is end entity;\n")
+				project.DefaultDesign.DefaultFileSet.AddFile(VHDLSourceFile(Path(f"{name}.vhdl")))
+
+			jobs = CreateAnalysisJobs(project.DefaultDesign, {VHDLSourceFile: [executable, "-c", "pass"]})
+			timings = ParallelExecutor().Run(jobs)
+
+			with DurationDatabase() as database:
+				database.AddTimings(timings)
+				for job in jobs:
+					self.assertEqual(timings[job], database.GetFileDuration(job.Path))
+
+				durations = EstimateDurations(jobs, database)
+				self.assertDictEqual(timings, durations)
+
+
+class Scheduling(TestCase):
+	def test_EstimateDurations(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "a.vhdl"
+			path.write_text("-" * 1000)
+			jobs = [AnalysisJob(None, path, ["true"]), AnalysisJob(None, Path(tempDirectory) / "missing.vhdl", ["true"])]
+
+			durations = EstimateDurations(jobs, secondsPerByte=0.001)
+			self.assertListEqual([1.0, 0.0], list(durations.values()))
+
+	def test_CriticalPathOrder(self) -> None:
+		jobs = {job.Path.name: job for job in CreateJobs()}
+		durations = {
+			jobs["util.vhdl"]: 1.0,
+			jobs["fifo.vhdl"]: 1.0,
+			jobs["ram.vhdl"]:  1.0,
+			jobs["top.vhdl"]:  5.0,
+			jobs["wrapper.v"]: 3.0
+		}
+
+		order = [job.Path.name for job in CriticalPathOrder(list(jobs.values()), durations)]
+		self.assertListEqual(["fifo.vhdl", "util.vhdl", "ram.vhdl", "top.vhdl", "wrapper.v"], order)
+
+		path = [job.Path.name for job in CriticalPath(list(jobs.values()), durations)]
+		self.assertListEqual(["fifo.vhdl", "ram.vhdl", "top.vhdl"], path)
+
+	def test_Cycle(self) -> None:
+		a = AnalysisJob(None, Path("a.vhdl"), ["true"])
+		b = AnalysisJob(None, Path("b.vhdl"), ["true"])
+		a.AddDependency(b)
+		b.AddDependency(a)
+
+		with self.assertRaises(Exception) as context:
+			CriticalPathOrder([a, b], {a: 1.0, b: 1.0})
+		self.assertIn("Cyclic", str(context.exception))
+
+	def test_PackBins(self) -> None:
+		durations = {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 2.0, "f": 1.0}
+
+		bins = PackBins(durations.keys(), 3, durations)
+		self.assertListEqual([["a", "f"], ["b", "e"], ["c", "d"]], bins)
+		self.assertListEqual(bins, PackBins(durations.keys(), 3, durations))
+		self.assertListEqual([list(durations.keys())], PackBins(durations.keys(), 1, durations))
+
+		with self.assertRaises(ValueError):
+			PackBins(durations.keys(), 0, durations)
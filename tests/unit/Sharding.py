@@ -0,0 +1,103 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for testbench sharding."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyEDAA.ProjectModel            import Testbench as TB
+from pyEDAA.ProjectModel.Sharding   import ShardTestbenches
+from pyEDAA.ProjectModel.TestImpact import TestImpactIndex as Index
+
+from tests.unit import CreateTestbenchProject, TESTBENCH_SOURCES
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Sharding(TestCase):
+	def test_Durations(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			project = CreateTestbenchProject(Path(tempDirectory))
+			index = Index(project)
+
+			shards = ShardTestbenches(index, 2, durations={"tb_counter": 5.0, "tb_timer": 3.0})
+			self.assertListEqual([["tb_counter"], ["tb_timer"]], [[testbench.Name for testbench in shard.Testbenches] for shard in shards])
+			self.assertListEqual([5.0, 3.0], [shard.Duration for shard in shards])
+			self.assertListEqual(["pkg.vhdl", "counter.vhdl", "tb_counter.vhdl"], [file.Path.name for file in shards[0].Files])
+			self.assertListEqual(["pkg.vhdl", "timer.vhdl", "tb_timer.vhdl"], [file.Path.name for file in shards[1].Files])
+
+			compileOrder = [path.name for _, path, _, _ in shards[1].IterateCompileOrder(project.DefaultDesign)]
+			self.assertListEqual(["pkg.vhdl", "timer.vhdl", "tb_timer.vhdl"], compileOrder)
+
+			# The assignment doesn't depend on the order of testbenches.
+			reordered = ShardTestbenches(index, 2, list(reversed(index.Testbenches)), durations={"tb_counter": 5.0, "tb_timer": 3.0})
+			self.assertListEqual([shard.Testbenches for shard in shards], [shard.Testbenches for shard in reordered])
+
+	def test_Estimates(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			index = Index(CreateTestbenchProject(Path(tempDirectory)))
+
+			shards = ShardTestbenches(index, 1, secondsPerByte=1.0)
+			self.assertEqual(1, len(shards))
+			# Each testbench is estimated by its transitive inputs, thus the shared package is counted twice.
+			self.assertEqual(float(sum(len(content) for content in TESTBENCH_SOURCES.values()) + len(TESTBENCH_SOURCES["pkg.vhdl"])), shards[0].Duration)
+			self.assertEqual(5, len(shards[0].Files))
+
+	def test_MoreShardsThanTestbenches(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			index = Index(CreateTestbenchProject(Path(tempDirectory)))
+
+			shards = ShardTestbenches(index, 3, index.Testbenches[:1])
+			self.assertListEqual([1, 0, 0], [len(shard.Testbenches) for shard in shards])
+			self.assertListEqual([], shards[2].Files)
+			self.assertEqual(0.0, shards[2].Duration)
+
+	def test_Sticky(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = CreateTestbenchProject(Path(tempDirectory)).DefaultDesign
+			testbenches = [TB(f"tb_{i:02}") for i in range(40)]
+			durations = {testbench.Name: 1.0 + (i % 3) for i, testbench in enumerate(testbenches)}
+			durations["tb_new"] = 2.0
+
+			shards = ShardTestbenches(Index(design, testbenches), 4, durations=durations)
+			self.assertTrue(all(shard.Duration <= 1.1 * 79.0 / 4 for shard in shards))
+
+			# Adding one testbench and removing another one moves only a few other testbenches.
+			before = {testbench.Name: shard.Index for shard in shards for testbench in shard.Testbenches}
+			shards = ShardTestbenches(Index(design, testbenches[1:] + [TB("tb_new")]), 4, durations=durations)
+			after = {testbench.Name: shard.Index for shard in shards for testbench in shard.Testbenches}
+			self.assertLessEqual(sum(1 for name in after if name in before and before[name] != after[name]), 2)
+
+			with self.assertRaises(ValueError):
+				ShardTestbenches(Index(design, testbenches), 0)
@@ -0,0 +1,186 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for declaration scanners and the cross-language symbol table."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyEDAA.ProjectModel         import Project, VHDLSourceFile, VerilogSourceFile, SystemVerilogSourceFile
+from pyEDAA.ProjectModel.Symbols import CaseFolding, SymbolTable
+from pyEDAA.ProjectModel.VHDL    import ScanDesignUnits
+from pyEDAA.ProjectModel.Verilog import ScanModules
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+SOURCES = {
+	"top.vhdl": (
+		"library ieee;\n"
+		"entity Top is\n  port (clk : in bit);\nend entity;\n"
+		"architecture rtl of top is\n"
+		"  component Fifo is\n    port (clk : in bit);\n  end component;\n"
+		"begin\n"
+		"  u_fifo : Fifo port map (clk => clk);\n"
+		"  u_core : entity work.core port map (clk => clk);\n"
+		"  u_ram  : component ram_sp generic map (8) port map (clk);\n"
+		"  -- u_old : old_unit port map (clk);\n"
+		"end architecture;\n"
+	),
+	"core.vhdl": "entity core is\n  port (clk : in bit);\nend entity;\n",
+	"fifo.v": (
+		"// module commented(a);\n"
+		"module Fifo #(parameter W = (4*2)) (input clk);\n"
+		"  and g1 (x, clk, clk);\n"
+		"  DSP48E1 #(.AREG(1)) u_dsp [1:0] (.CLK(clk));\n"
+		"  assign y = f(x);\n"
+		"endmodule\n"
+	),
+	"ram_sp.v": "module ram_sp(input clk);\nendmodule\n",
+	"tb.sv": "module tb;\n  top dut (.clk(clk));\n  initial $display(\"core u (x\");\nendmodule\n"
+}
+
+
+class Scanner(TestCase):
+	def test_VHDL(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			for name, content in SOURCES.items():
+				(Path(tempDirectory) / name).write_text(content)
+			entities, references = ScanDesignUnits(Path(tempDirectory) / "top.vhdl")
+
+			self.assertListEqual(["top"], [entity.Name for entity in entities])
+			self.assertListEqual(["fifo", "ram_sp", "core"], references)
+
+	def test_Verilog(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			for name, content in SOURCES.items():
+				(Path(tempDirectory) / name).write_text(content)
+			modules, references = ScanModules(Path(tempDirectory) / "fifo.v")
+
+			self.assertListEqual(["Fifo"], [module.Name for module in modules])
+			self.assertTrue(modules[0].HasPorts)
+			self.assertListEqual(["DSP48E1"], references)
+
+			modules, references = ScanModules(Path(tempDirectory) / "tb.sv")
+			self.assertFalse(modules[0].HasPorts)
+			self.assertListEqual(["top"], references)
+
+	def test_SystemVerilogSubroutines(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "checker.sv"
+			path.write_text(
+				"module checker(input logic clk);\n"
+				"  function automatic logic foo(input logic a);\n    return a;\n  endfunction\n"
+				"  task static bar(int count);\n  endtask\n"
+				"  Fifo fifo (.clk(clk));\n"
+				"endmodule\n"
+			)
+			_, references = ScanModules(path)
+
+			self.assertListEqual(["Fifo"], references)
+
+	def test_VirtualInterfaces(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "driver.sv"
+			path.write_text(
+				"interface bus_if(input logic clk);\n  logic valid;\nendinterface\n"
+				"program driver;\n  virtual interface bus_if vif;\n  virtual bus_if vif2;\nendprogram\n"
+			)
+			modules, _ = ScanModules(path)
+
+			self.assertListEqual([("bus_if", "interface"), ("driver", "program")], [(module.Name, module.Kind) for module in modules])
+
+
+class Symbols(TestCase):
+	def _CreateDesign(self, directory: Path):
+		for name, content in SOURCES.items():
+			(directory / name).write_text(content)
+
+		design = Project("project", rootDirectory=directory).DefaultDesign
+		files = {}
+		for name in SOURCES:
+			if name.endswith(".vhdl"):
+				files[name] = VHDLSourceFile(Path(name))
+			elif name.endswith(".sv"):
+				files[name] = SystemVerilogSourceFile(Path(name))
+			else:
+				files[name] = VerilogSourceFile(Path(name))
+			design.DefaultFileSet.AddFile(files[name])
+
+		return design, files
+
+	def test_Resolve(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design, files = self._CreateDesign(Path(tempDirectory))
+			symbols = SymbolTable(design)
+
+			self.assertIs(symbols, design.SymbolTable)
+			self.assertEqual(5, len(symbols))
+			self.assertIs(files["fifo.v"], symbols.Resolve("FIFO"))
+			self.assertIs(files["top.vhdl"], symbols.Resolve("Top"))
+			self.assertIn("ram_sp", symbols)
+			self.assertListEqual(["fifo", "ram_sp", "core"], symbols.References(files["top.vhdl"]))
+			self.assertDictEqual({files["fifo.v"]: ["dsp48e1"]}, symbols.UnresolvedReferences)
+
+	def test_CaseSensitive(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design, files = self._CreateDesign(Path(tempDirectory))
+			symbols = SymbolTable(design, caseFolding=CaseFolding.Sensitive)
+
+			self.assertIsNone(symbols.Resolve("fifo"))
+			self.assertIs(files["fifo.v"], symbols.Resolve("Fifo"))
+			self.assertListEqual(["fifo"], symbols.UnresolvedReferences[files["top.vhdl"]])
+
+	def test_AddDependencies(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design, files = self._CreateDesign(Path(tempDirectory))
+			symbols = SymbolTable(design)
+
+			self.assertEqual(3, symbols.AddDependencies())
+			self.assertTrue(files["top.vhdl"]._dependencyNode.HasEdgeToDestination(files["fifo.v"]._dependencyNode))
+			self.assertTrue(files["top.vhdl"]._dependencyNode.HasEdgeToDestination(files["ram_sp.v"]._dependencyNode))
+			self.assertTrue(files["tb.sv"]._dependencyNode.HasEdgeToDestination(files["top.vhdl"]._dependencyNode))
+			self.assertIsNone(files["core.vhdl"]._dependencyNode)
+
+			self.assertEqual(1, symbols.AddDependencies(crossLanguageOnly=False))
+			self.assertTrue(files["top.vhdl"]._dependencyNode.HasEdgeToDestination(files["core.vhdl"]._dependencyNode))
+
+	def test_Duplicates(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design, files = self._CreateDesign(Path(tempDirectory))
+			(Path(tempDirectory) / "core.v").write_text("module core(input clk);\nendmodule\n")
+			design.DefaultFileSet.AddFile(VerilogSourceFile(Path("core.v")))
+			symbols = SymbolTable(design)
+
+			self.assertIs(files["core.vhdl"], symbols.Resolve("core"))
+			self.assertListEqual(["core.vhdl", "core.v"], [file.Path.name for file in symbols.Duplicates["core"]])
@@ -0,0 +1,99 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the TCL subset evaluator."""
+from pathlib  import Path
+from unittest import TestCase
+
+from pyEDAA.ProjectModel.TCL import TCLEvaluator, SplitCommands, SplitList, FormatList
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Lists(TestCase):
+	def test_SplitList(self) -> None:
+		self.assertListEqual(["a", "b c", "d"], SplitList('a {b c} "d"'))
+		self.assertListEqual([], SplitList("   "))
+
+	def test_FormatList(self) -> None:
+		self.assertEqual("a {b c} {}", FormatList(["a", "b c", ""]))
+		self.assertListEqual(["a", "b c", ""], SplitList(FormatList(["a", "b c", ""])))
+
+	def test_SplitCommands(self) -> None:
+		commands = SplitCommands("set a 1; # comment\nread_vhdl -library lib {a b.vhdl}\n")
+		self.assertListEqual([["set", "a", "1"], ["read_vhdl", "-library", "lib", "{a b.vhdl}"]], commands)
+		self.assertIsNone(SplitCommands("set a {1"))
+
+
+class Evaluator(TestCase):
+	def test_Variables(self) -> None:
+		evaluator = TCLEvaluator(Path("."), {"root": "src"})
+		evaluator.Execute(["set", "lib", "$root/lib"])
+
+		self.assertEqual("src/lib", evaluator["lib"])
+		self.assertEqual("src/lib/a.vhdl", evaluator.Evaluate("${lib}/a.vhdl"))
+		self.assertEqual("src/lib/b.vhdl", evaluator.Evaluate("[file join $lib b.vhdl]"))
+		self.assertEqual("$lib", evaluator.Evaluate("{$lib}"))
+
+	def test_IterateCommands(self) -> None:
+		lines = ["set a \\\n", "  1\n", "# comment\n", "foo {\n", "bar}\n"]
+		commands = list(TCLEvaluator(Path(".")).IterateCommands(lines))
+
+		self.assertEqual(2, len(commands))
+		self.assertEqual(1, commands[0][0])
+		self.assertEqual(["set", "a", "1"], commands[0][1])
+		self.assertEqual("foo", commands[1][1][0])
+
+	def test_Glob(self) -> None:
+		evaluator = TCLEvaluator(Path("tests/VivadoProject/StopWatch"))
+		files = evaluator.EvaluateList("[glob -directory src seg7_*.vhdl]")
+
+		self.assertListEqual(["src/seg7_Display.vhdl", "src/seg7_Encoder.vhdl"], files)
+
+	def test_UnknownCommand(self) -> None:
+		with self.assertRaises(Exception):
+			TCLEvaluator(Path(".")).Evaluate("[puts hello]")
+
+	def test_UnevaluableSet(self) -> None:
+		evaluator = TCLEvaluator(Path("."))
+		evaluator.Execute(["set", "part", "[get_parts xc7a35t]"])
+
+		self.assertNotIn("part", evaluator)
+		self.assertTrue(evaluator.IsUnknown("part"))
+		with self.assertRaises(Exception) as context:
+			evaluator.Evaluate("$part")
+		self.assertIn("get_parts", str(context.exception))
+
+		evaluator.Execute(["set", "part", "xc7a35t"])
+		self.assertFalse(evaluator.IsUnknown("part"))
+		self.assertEqual("xc7a35t", evaluator.Evaluate("$part"))
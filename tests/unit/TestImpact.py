@@ -0,0 +1,184 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for testbench identification and test impact analysis."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+# Aliases prevent pytest from collecting 'Testbench' and 'TestImpactIndex' as test classes.
+from pyEDAA.ProjectModel            import FileSet, Testbench as TB
+from pyEDAA.ProjectModel.OSVVM      import OSVVMProjectFile
+from pyEDAA.ProjectModel.TestImpact import IdentifyTestbenches, TestImpactIndex as Index
+from pyEDAA.ProjectModel.VHDL       import ScanEntities
+
+from tests.unit import CreateTestbenchProject
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Scanner(TestCase):
+	def test_ScanEntities(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			CreateTestbenchProject(Path(tempDirectory))
+
+			entities = ScanEntities(Path(tempDirectory) / "counter.vhdl")
+			self.assertEqual(1, len(entities))
+			self.assertEqual("counter", entities[0].Name)
+			self.assertTrue(entities[0].HasPorts)
+			self.assertFalse(ScanEntities(Path(tempDirectory) / "tb_timer.vhdl")[0].HasPorts)
+			self.assertListEqual([], ScanEntities(Path(tempDirectory) / "pkg.vhdl"))
+
+
+class Testbenches(TestCase):
+	def test_PortLessEntities(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = CreateTestbenchProject(Path(tempDirectory)).DefaultDesign
+			testbenches = IdentifyTestbenches(design)
+
+			self.assertListEqual(["tb_counter", "tb_timer"], [testbench.Name for testbench in testbenches])
+			self.assertEqual("tb_counter.vhdl", testbenches[0].File.Path.name)
+			self.assertIs(design.DefaultFileSet, testbenches[0].FileSet)
+			self.assertListEqual(testbenches, list(design.IterateTestbenches()))
+			self.assertListEqual(testbenches, IdentifyTestbenches(design))
+
+	def test_TopLevel(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = CreateTestbenchProject(Path(tempDirectory)).DefaultDesign
+			design.TopLevel = "counter"
+			design.DefaultFileSet.TopLevel = "counter"
+			FileSet("sim", topLevel="Timer", design=design)
+			FileSet("synthesis", topLevel="Counter", design=design)
+			TB("tb_counter", fileSet=design.FileSets["sim"])
+
+			testbenches = IdentifyTestbenches(design, scanEntities=False)
+			self.assertListEqual(["tb_counter", "Timer"], [testbench.Name for testbench in testbenches])
+			self.assertIsNone(testbenches[1].File)
+			self.assertIs(design.FileSets["sim"], testbenches[1].FileSet)
+
+			testbenches = IdentifyTestbenches(design)
+			self.assertListEqual(["tb_counter", "Timer", "tb_timer"], [testbench.Name for testbench in testbenches])
+			self.assertEqual("timer.vhdl", testbenches[1].File.Path.name)
+
+	def test_NonSimulationFileSets(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = CreateTestbenchProject(Path(tempDirectory)).DefaultDesign
+			FileSet("simple_uart_rtl", topLevel="counter", design=design)
+			FileSet("crypto_asim", topLevel="timer", design=design)
+			FileSet("Simulation", topLevel="Timer", design=design)
+
+			testbenches = IdentifyTestbenches(design, scanEntities=False)
+			self.assertListEqual(["Timer"], [testbench.Name for testbench in testbenches])
+			self.assertDictEqual({}, design.FileSets["simple_uart_rtl"].Testbenches)
+			self.assertDictEqual({}, design.FileSets["crypto_asim"].Testbenches)
+
+	def test_PortLessTopLevel(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = CreateTestbenchProject(Path(tempDirectory)).DefaultDesign
+			FileSet("verification", topLevel="tb_timer", design=design)
+
+			testbenches = IdentifyTestbenches(design)
+			self.assertListEqual(["tb_timer", "tb_counter"], [testbench.Name for testbench in testbenches])
+			self.assertIs(design.FileSets["verification"], testbenches[0].FileSet)
+			self.assertEqual("tb_timer.vhdl", testbenches[0].File.Path.name)
+
+	def test_OSVVM(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "tests.pro").write_text("analyze counter.vhdl\nRunTest tb_counter.vhdl\nsimulate tb_timer [generic N 8]\nsimulate tb_timer\n")
+
+			projectFile = OSVVMProjectFile(directory / "tests.pro")
+			projectFile.Parse()
+			design = projectFile.ProjectModel.DefaultDesign
+
+			self.assertListEqual(["counter.vhdl", "tb_counter.vhdl"], [file.Path.name for file in design.Files()])
+			testbenches = list(projectFile.ProjectModel.IterateTestbenches())
+			self.assertListEqual(["tb_counter", "tb_timer"], [testbench.Name for testbench in testbenches])
+			self.assertEqual("tb_counter.vhdl", testbenches[0].File.Path.name)
+			self.assertIsNone(testbenches[1].File)
+
+	def test_OSVVMMissingTestbench(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "tests.pro").write_text("analyze counter.vhdl\nsimulate\n")
+
+			with self.assertRaises(Exception) as context:
+				OSVVMProjectFile(directory / "tests.pro").Parse()
+			self.assertIsInstance(context.exception.__cause__, ValueError)
+
+	def test_Duplicate(self) -> None:
+		fileSet = FileSet("sim")
+		TB("tb", fileSet=fileSet)
+		with self.assertRaises(ValueError):
+			TB("tb", fileSet=fileSet)
+
+
+class Impact(TestCase):
+	def test_AffectedTestbenches(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			project = CreateTestbenchProject(directory)
+			files = {file.Path.name: file for file in project.DefaultDesign.Files()}
+			index = Index(project)
+
+			def affected(*names):
+				return [testbench.Name for testbench in index.AffectedTestbenches(files[name] for name in names)]
+
+			self.assertListEqual(["tb_counter", "tb_timer"], affected("pkg.vhdl"))
+			self.assertListEqual(["tb_timer"], affected("timer.vhdl"))
+			self.assertListEqual(["tb_counter"], affected("tb_counter.vhdl"))
+			self.assertListEqual([], affected())
+			self.assertListEqual(["tb_timer"], [testbench.Name for testbench in index.AffectedTestbenches([directory / "timer.vhdl"])])
+			self.assertListEqual([], index.AffectedTestbenches([directory / "unknown.vhdl"]))
+
+			inputs = index.TransitiveInputs(index.Testbenches[0])
+			self.assertListEqual(["pkg.vhdl", "counter.vhdl", "tb_counter.vhdl"], [file.Path.name for file in inputs])
+
+	def test_Cycle(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			project = CreateTestbenchProject(Path(tempDirectory))
+			design = project.DefaultDesign
+			files = {file.Path.name: file for file in design.Files()}
+			design.AddFileDependency(files["pkg.vhdl"], files["timer.vhdl"])
+			index = Index(design)
+
+			self.assertListEqual(["tb_counter", "tb_timer"], [testbench.Name for testbench in index.AffectedTestbenches([files["timer.vhdl"]])])
+			self.assertEqual(4, len(index.TransitiveInputs(index.Testbenches[0])))
+
+	def test_UnknownFile(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			design = CreateTestbenchProject(Path(tempDirectory)).DefaultDesign
+			index = Index(design, [TB("tb_external")])
+
+			self.assertEqual(1, len(index.AffectedTestbenches([])))
+			self.assertListEqual([], index.TransitiveInputs(index.Testbenches[0]))
@@ -103,3 +103,19 @@ class Instantiate(TestCase):
 		library = VHDLLibrary("library", design=design)
 
 		self.assertEqual(vhdlVersion, library.VHDLVersion)
+
+	def test_VHDLLibraryAddDependency(self) -> None:
+		design = Design("design")
+		library = VHDLLibrary("library", design=design)
+		dependency = VHDLLibrary("dependency", design=design)
+
+		library.AddDependency(dependency)
+		library.AddDependency(dependency)
+
+		self.assertEqual(1, design._vhdlLibraryDependencyGraph.EdgeCount)
+		self.assertTrue(library._dependencyNode.HasEdgeToDestination(dependency._dependencyNode))
+
+		with self.assertRaises(Exception):
+			library.AddDependency(VHDLLibrary("other", design=Design("other")))
+		with self.assertRaises(TypeError):
+			library.AddDependency("dependency")
@@ -0,0 +1,95 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2026 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Instantiation tests for the project model."""
+from os            import environ
+from pathlib       import Path
+from tempfile      import TemporaryDirectory
+from unittest      import TestCase
+from unittest.mock import patch
+
+from pyEDAA.ProjectModel         import Project, VerilogSourceFile, SystemVerilogSourceFile
+from pyEDAA.ProjectModel.Verilog import VerilogCommandFile, IncludeDirectoriesAttribute, DefinesAttribute
+from pyEDAA.ProjectModel.Verilog import LibraryFilesAttribute, LibraryDirectoriesAttribute, LibraryExtensionsAttribute
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class CommandFile(TestCase):
+	def test_Parsing(self) -> None:
+		commandFile = VerilogCommandFile(Path("tests/VerilogFileList/top.f"))
+		with patch.dict(environ, {"PRIMITIVES": "/opt/cells"}):
+			fileSet = commandFile.Parse()
+
+		self.assertIs(fileSet, commandFile.ProjectModel.DefaultDesign.DefaultFileSet)
+
+		files = list(fileSet.Files())
+		self.assertListEqual([
+				Path("rtl/top.sv"),
+				Path("rtl/counter.v"),
+				Path("ip/uart/rtl/uart_pkg.sv"),
+				Path("ip/uart/rtl/uart.sv"),
+				Path("common/fifo.sv"),
+				Path("common/sync cells.v")
+			],
+			[file.Path for file in files]
+		)
+		for file in files:
+			self.assertTrue(file.ResolvedPath.exists())
+		self.assertIsInstance(files[0], SystemVerilogSourceFile)
+		self.assertIsInstance(files[1], VerilogSourceFile)
+
+		self.assertListEqual([Path("rtl"), Path("ip/uart/include")], fileSet[IncludeDirectoriesAttribute])
+		self.assertDictEqual({"SYNTHESIS": None, "WIDTH": "8"}, fileSet[DefinesAttribute])
+		self.assertListEqual([Path("/opt/cells/cells.v")], fileSet[LibraryFilesAttribute])
+		self.assertListEqual([Path("lib")], fileSet[LibraryDirectoriesAttribute])
+		self.assertListEqual([".v", ".sv"], fileSet[LibraryExtensionsAttribute])
+
+	def test_ExistingFileSet(self) -> None:
+		project = Project("project", rootDirectory=Path("tests/VerilogFileList/ip/uart"))
+		fileSet = project.DefaultDesign.DefaultFileSet
+
+		commandFile = VerilogCommandFile(Path("tests/VerilogFileList/ip/uart/uart.f"))
+		self.assertIs(fileSet, commandFile.Parse(fileSet))
+		self.assertIsNone(commandFile.ProjectModel)
+		self.assertEqual(2, fileSet.FileCount)
+
+	def test_Cycle(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "a.f").write_text("-F b.f\n")
+			(directory / "b.f").write_text("-F a.f\n")
+
+			with self.assertRaises(Exception) as context:
+				VerilogCommandFile(directory / "a.f").Parse()
+			self.assertIn("Cyclic", str(context.exception))
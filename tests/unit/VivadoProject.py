@@ -29,10 +29,17 @@
 # ==================================================================================================================== #
 #
 """Instantiation tests for the project model."""
-from pathlib import Path
-from unittest import TestCase
+from os            import environ, utime
+from pathlib       import Path
+from shutil        import copytree
+from tempfile      import TemporaryDirectory
+from unittest      import TestCase
+from unittest.mock import patch
 
-from pyEDAA.ProjectModel.Xilinx.Vivado import VivadoProjectFile
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel.Xilinx.Vivado import VivadoProjectFile, VivadoNonProjectScript, IPCoreInstantiationFile, IPCoreDescriptionFile, IPRepository
+from pyEDAA.ProjectModel.Xilinx.Vivado import VHDLSourceFile, SystemVerilogSourceFile, XDCConstraintFile, UsedInAttribute, ScopeToRefAttribute, VivadoFileSet
 
 if __name__ == "__main__": # pragma: no cover
 	print("ERROR: you called a testcase declaration file as an executable module.")
@@ -74,3 +81,260 @@ class FileSets(TestCase):
 		# 		print(f"    FileSet: {fileSetName}")
 		# 		for file in fileSet.Files():
 		# 			print(f"        {file.ResolvedPath}")
+
+
+class LazyFileSets(TestCase):
+	_xprPath = Path.cwd() / "tests/VivadoProject/StopWatch/project/StopWatch.xpr"
+
+	def test_LazyParsing(self) -> None:
+		xprFile = VivadoProjectFile(self._xprPath)
+		xprFile.Parse(lazy=True)
+
+		fileSets = xprFile.ProjectModel.DefaultDesign.FileSets
+		simFileSet = fileSets["sim_StopWatch"]
+		self.assertIsInstance(simFileSet, VivadoFileSet)
+		self.assertEqual("toplevel_tb", simFileSet.TopLevel)
+		self.assertFalse(simFileSet.IsMaterialized)
+		self.assertFalse(fileSets["src_StopWatch"].IsMaterialized)
+
+		files = list(simFileSet.Files())
+		self.assertTrue(simFileSet.IsMaterialized)
+		self.assertFalse(fileSets["src_StopWatch"].IsMaterialized)
+		self.assertEqual(1, len(files))
+		self.assertEqual("lib_Test", files[0].VHDLLibrary.Name)
+
+		self.assertEqual(8, fileSets["src_StopWatch"].FileCount)
+		self.assertTrue(fileSets["src_StopWatch"].IsMaterialized)
+
+	def test_LazyCompileOrder(self) -> None:
+		xprFile = VivadoProjectFile(self._xprPath)
+		xprFile.Parse()
+		expected = [path for _, path, _, _ in xprFile.ProjectModel.DefaultDesign.IterateCompileOrder()]
+
+		xprFile = VivadoProjectFile(self._xprPath)
+		xprFile.Parse(lazy=True)
+		self.assertNotEqual(0, len(expected))
+		self.assertListEqual(expected, [path for _, path, _, _ in xprFile.ProjectModel.DefaultDesign.IterateCompileOrder()])
+
+	def test_FileSetFilter(self) -> None:
+		xprFile = VivadoProjectFile(self._xprPath)
+		xprFile.Parse(fileSets=("sim_StopWatch", "const_StopWatch"))
+
+		self.assertSequenceEqual(("default", "const_StopWatch", "sim_StopWatch"), tuple(xprFile.ProjectModel.DefaultDesign.FileSets.keys()))
+		self.assertTrue(xprFile.ProjectModel.DefaultDesign.FileSets["sim_StopWatch"].IsMaterialized)
+
+		with TemporaryDirectory() as tempDirectory:
+			outputPath = Path(tempDirectory) / "StopWatch.xpr"
+			xprFile.Write(outputPath)
+
+			self.assertEqual(self._xprPath.read_text(encoding="utf-8"), outputPath.read_text(encoding="utf-8"))
+
+
+class Writer(TestCase):
+	_xprPath = Path.cwd() / "tests/VivadoProject/StopWatch/project/StopWatch.xpr"
+
+	def test_RoundTrip(self) -> None:
+		xprFile = VivadoProjectFile(self._xprPath)
+		xprFile.Parse()
+
+		with TemporaryDirectory() as tempDirectory:
+			outputPath = Path(tempDirectory) / "StopWatch.xpr"
+			xprFile.Write(outputPath)
+
+			self.assertEqual(self._xprPath.read_text(encoding="utf-8"), outputPath.read_text(encoding="utf-8"))
+
+	def test_ModifiedProject(self) -> None:
+		xprFile = VivadoProjectFile(self._xprPath)
+		xprFile.Parse()
+
+		fileSet = xprFile.ProjectModel.DefaultDesign.FileSets["sim_StopWatch"]
+		fileSet.TopLevel = "toplevel_tb2"
+		generatedFile = VHDLSourceFile(Path("../gen/Generated.vhdl"), vhdlVersion=VHDLVersion.VHDL2008)
+		fileSet.AddFile(generatedFile)
+		generatedFile.VHDLLibrary = fileSet.GetOrCreateVHDLLibrary("lib_Test")
+		generatedFile[UsedInAttribute].append("simulation")
+
+		with TemporaryDirectory() as tempDirectory:
+			outputPath = Path(tempDirectory) / "StopWatch.xpr"
+			xprFile.Write(outputPath)
+
+			content = outputPath.read_text(encoding="utf-8")
+			self.assertIn('<File Path="$PPRDIR/../gen/Generated.vhdl">\n        <FileInfo SFType="VHDL2008">\n          <Attr Name="Library" Val="lib_Test"/>\n          <Attr Name="UsedIn" Val="simulation"/>', content)
+			self.assertIn('<Option Name="TopModule" Val="toplevel_tb2"/>', content)
+			self.assertIn('<Option Name="TopLib" Val="lib_Test"/>', content)
+
+			rereadFile = VivadoProjectFile(outputPath)
+			rereadFile.Parse()
+			rereadFileSet = rereadFile.ProjectModel.DefaultDesign.FileSets["sim_StopWatch"]
+			self.assertEqual("toplevel_tb2", rereadFileSet.TopLevel)
+			self.assertEqual(2, rereadFileSet.FileCount)
+
+			rereadGeneratedFile = list(rereadFileSet.Files())[1]
+			self.assertEqual(Path("../gen/Generated.vhdl"), rereadGeneratedFile.Path)
+			self.assertEqual(VHDLVersion.VHDL2008, rereadGeneratedFile.VHDLVersion)
+			self.assertEqual("lib_Test", rereadGeneratedFile.VHDLLibrary.Name)
+			self.assertListEqual(["simulation"], rereadGeneratedFile[UsedInAttribute])
+
+
+class NonProjectScript(TestCase):
+	_scriptPath = Path("tests/VivadoProject/StopWatch/nonproject/build.tcl")
+
+	def test_Parsing(self) -> None:
+		script = VivadoNonProjectScript(self._scriptPath)
+		script.Parse()
+
+		design = script.ProjectModel.DefaultDesign
+		sources = design.FileSets["sources_1"]
+		constraints = design.FileSets["constrs_1"]
+		simulation = design.FileSets["sim_1"]
+
+		self.assertEqual("toplevel", sources.TopLevel)
+		self.assertEqual("toplevel_tb", simulation.TopLevel)
+		self.assertEqual(8, sources.FileCount)
+		self.assertEqual(5, constraints.FileCount)
+		self.assertEqual(1, simulation.FileCount)
+		self.assertListEqual(["lib_Utilities", "xil_defaultlib"], list(design.VHDLLibraries.keys()))
+
+		vhdlFiles = list(sources.Files(fileSet=False))
+		self.assertEqual(Path("../src/Utilities.pkg.vhdl"), vhdlFiles[0].Path)
+		self.assertEqual("lib_Utilities", vhdlFiles[0].VHDLLibrary.Name)
+		self.assertIs(VHDLVersion.VHDL2008, vhdlFiles[0].VHDLVersion)
+		self.assertEqual(Path("../src/seg7_Display.vhdl"), vhdlFiles[4].Path)
+		self.assertIs(VHDLVersion.VHDL93, vhdlFiles[4].VHDLVersion)
+		for file in vhdlFiles:
+			self.assertIsInstance(file, VHDLSourceFile)
+			self.assertTrue(file.ResolvedPath.exists())
+
+		xdcFiles = list(constraints.Files(fileSet=False))
+		for file in xdcFiles:
+			self.assertIsInstance(file, XDCConstraintFile)
+		self.assertEqual("seg7_Display", xdcFiles[1][ScopeToRefAttribute])
+		self.assertIsNone(xdcFiles[0][ScopeToRefAttribute])
+
+	def test_Variables(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "rtl").mkdir()
+			(directory / "rtl" / "top.sv").touch()
+			(directory / "rtl" / "core.v").touch()
+			(directory / "run.tcl").write_text(
+				"set part [get_parts xc7a35t]\n"
+				"read_verilog -sv $::env(RTL)/top.sv\n"
+				"read_verilog ${rtlDir}/core.v\n"
+				"set_property -name top -value top -objects [current_fileset]\n"
+			)
+
+			script = VivadoNonProjectScript(directory / "run.tcl")
+			with patch.dict(environ, {"RTL": "rtl"}):
+				script.Parse(variables={"rtlDir": "rtl"})
+
+		sources = script.ProjectModel.DefaultDesign.FileSets["sources_1"]
+		self.assertEqual("top", sources.TopLevel)
+		self.assertListEqual([Path("rtl/top.sv"), Path("rtl/core.v")], [file.Path for file in sources.Files(fileSet=False)])
+		self.assertIsInstance(next(sources.Files(fileSet=False)), SystemVerilogSourceFile)
+
+
+class IPCores(TestCase):
+	_ipCoreDirectory = Path.cwd() / "tests/VivadoProject/IPCores"
+
+	def test_XMLInstantiationFile(self) -> None:
+		xciFile = IPCoreInstantiationFile(self._ipCoreDirectory / "ip/clk_wiz_0/clk_wiz_0.xci")
+		self.assertFalse(xciFile.IsParsed)
+
+		xciFile.Parse()
+
+		self.assertTrue(xciFile.IsParsed)
+		self.assertEqual("clk_wiz_0", xciFile.InstanceName)
+		self.assertEqual("xilinx.com:ip:clk_wiz:6.0", xciFile.ComponentReference)
+		self.assertEqual("VHDL", xciFile.TargetLanguage)
+		self.assertEqual("100.000", xciFile.Parameters["CLKOUT1_REQUESTED_OUT_FREQ"])
+		self.assertEqual("50.0", xciFile.ModelParameters["C_CLKOUT1_DUTY_CYCLE"])
+		self.assertEqual((self._ipCoreDirectory / "ip/clk_wiz_0").resolve(), xciFile.OutputDirectory)
+		self.assertListEqual([(self._ipCoreDirectory / "ip/clk_wiz_0/hdl/clk_wiz_0.vhd").resolve()], xciFile.OutputProducts)
+
+	def test_EmptyInstanceName(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "empty.xci"
+			path.write_text(
+				'<?xml version="1.0" encoding="UTF-8"?>\n'
+				'<spirit:design xmlns:spirit="http://www.spiritconsortium.org/XMLSchema/SPIRIT/1685-2009">\n'
+				'  <spirit:componentInstances>\n'
+				'    <spirit:componentInstance>\n'
+				'      <spirit:instanceName/>\n'
+				'    </spirit:componentInstance>\n'
+				'  </spirit:componentInstances>\n'
+				'</spirit:design>\n'
+			)
+			xciFile = IPCoreInstantiationFile(path)
+			xciFile.Parse()
+
+		self.assertIsNone(xciFile.InstanceName)
+
+	def test_JSONInstantiationFile(self) -> None:
+		xciFile = IPCoreInstantiationFile(self._ipCoreDirectory / "ip/fifo_0/fifo_0.xci")
+
+		# Properties trigger parsing on first access.
+		self.assertEqual("fifo_0", xciFile.InstanceName)
+		self.assertTrue(xciFile.IsParsed)
+		self.assertEqual("xilinx.com:ip:fifo_generator:13.2", xciFile.ComponentReference)
+		self.assertEqual("Verilog", xciFile.TargetLanguage)
+		self.assertEqual("1024", xciFile.Parameters["Input_Depth"])
+		self.assertEqual("18", xciFile.ModelParameters["C_DIN_WIDTH"])
+		self.assertEqual((self._ipCoreDirectory / "gen/fifo_0").resolve(), xciFile.OutputDirectory)
+		self.assertListEqual([], xciFile.OutputProducts)
+
+	def test_ParseIPCores(self) -> None:
+		xprFile = VivadoProjectFile(self._ipCoreDirectory / "IPCores.xpr")
+		xprFile.Parse()
+		xprFile.ParseIPCores(maxWorkers=2)
+
+		ipCores = {ipCore.Path.name: ipCore for ipCore in xprFile.ProjectModel.DefaultDesign.Files(IPCoreInstantiationFile)}
+		self.assertEqual(2, len(ipCores))
+		self.assertEqual("xilinx.com:ip:clk_wiz:6.0", ipCores["clk_wiz_0.xci"].ComponentReference)
+		self.assertEqual("xilinx.com:ip:fifo_generator:13.2", ipCores["fifo_0.xci"].ComponentReference)
+
+
+class IPXACT(TestCase):
+	_repositoryDirectory = Path.cwd() / "tests/VivadoProject/IPRepository"
+
+	def test_ComponentDescription(self) -> None:
+		componentFile = IPCoreDescriptionFile(self._repositoryDirectory / "counter_v1_0/component.xml")
+		componentFile.Parse()
+
+		self.assertEqual("example.com:user:counter:1.0", componentFile.VLNV)
+		self.assertDictEqual({"Clock": "in", "Value": "out"}, componentFile.Ports)
+		self.assertDictEqual({"BITS": "8"}, componentFile.Parameters)
+		self.assertListEqual(["xilinx_anylanguagesynthesis_view_fileset", "xilinx_xpgui_view_fileset"], list(componentFile.FileSets.keys()))
+		self.assertListEqual([("src/Counter.vhdl", "vhdlSource", "lib_Counter")], componentFile.FileSets["xilinx_anylanguagesynthesis_view_fileset"])
+		self.assertListEqual([("xgui/counter_v1_0.tcl", "tclSource", None)], componentFile.FileSets["xilinx_xpgui_view_fileset"])
+
+	def test_Repository(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory) / "repository"
+			copytree(self._repositoryDirectory, directory)
+
+			repository = IPRepository(directory)
+			self.assertEqual(0, len(repository))
+			self.assertTupleEqual((2, 0), repository.Refresh())
+			self.assertTrue(repository.IndexFile.exists())
+			self.assertIn("example.com:user:uart:2.1", repository)
+
+			uart = repository.Resolve("example.com:user:uart:2.1")
+			self.assertTrue(uart.IsParsed)
+			self.assertDictEqual({"TX": "out"}, uart.Ports)
+			self.assertDictEqual({"BAUDRATE": "115200"}, uart.Parameters)
+
+			# A new instance loads the persistent index; unchanged files are not parsed again.
+			repository = IPRepository(directory)
+			self.assertEqual(2, len(repository))
+			self.assertTupleEqual((0, 0), repository.Refresh())
+
+			counterPath = directory / "counter_v1_0/component.xml"
+			utime(counterPath, ns=(0, 1_000_000_000))
+			self.assertTupleEqual((1, 0), repository.Refresh())
+
+			(directory / "uart_v2_1/component.xml").unlink()
+			self.assertTupleEqual((0, 1), repository.Refresh())
+			self.assertNotIn("example.com:user:uart:2.1", repository)
+			with self.assertRaises(KeyError):
+				repository.Resolve("example.com:user:uart:2.1")
@@ -29,3 +29,106 @@
 # ==================================================================================================================== #
 #
 """Package containing unit tests."""
+from pathlib import Path
+from sys     import executable
+from typing  import Dict, Hashable, Iterable, List, Tuple
+
+from pyTooling.Graph import Graph, Vertex
+from pyVHDLModel     import VHDLVersion
+
+# Test modules like 'Design' or 'Project' become attributes of this package, thus model classes aren't imported by name.
+from pyEDAA                        import ProjectModel
+from pyEDAA.ProjectModel.Execution import AnalysisJob, CreateAnalysisJobs
+
+
+#: Sources of :func:`CreateTestbenchProject`: a package, two entities and their testbenches.
+TESTBENCH_SOURCES = {
+	"pkg.vhdl":        "package pkg is\nend package;\n",
+	"counter.vhdl":    "-- entity comment is\nentity Counter is\n  port (\n    clk : in bit\n  );\nend entity;\n",
+	"timer.vhdl":      "entity timer is\n  generic (N : natural);\n  port (clk : in bit);\nend entity;\n",
+	"tb_counter.vhdl": "entity tb_counter is\nend entity;\narchitecture tb of tb_counter is\nbegin\nend architecture;\n",
+	"tb_timer.vhdl":   "entity tb_timer is\n  generic (N : natural := 4);\nend entity;\n"
+}
+
+#: A stub analyzer: prints its arguments and fails for files named 'util.vhdl', if requested.
+ANALYZER_STUB = (
+	"import sys; print(' '.join(sys.argv[1:])); "
+	"sys.exit(int(sys.argv[-1] == 'fail' and sys.argv[1].endswith('util.vhdl')))"
+)
+
+
+def CreateDesign() -> ProjectModel.Design:
+	"""
+	Create a design with VHDL files in three VHDL libraries, Verilog, SystemVerilog, constraint and text files.
+
+	The files aren't written to disk. ``top_lib`` depends on ``util_lib`` and ``ip_lib``.
+	"""
+	project = ProjectModel.Project("project", rootDirectory=Path("/project"), vhdlVersion=VHDLVersion.VHDL2008)
+	design = project.DefaultDesign
+
+	fileSet = design.DefaultFileSet
+	fileSet.AddFiles((
+		ProjectModel.VHDLSourceFile(Path("src/top.vhdl")),
+		ProjectModel.VerilogSourceFile(Path("src/wrapper.v")),
+		ProjectModel.VHDLSourceFile(Path("src/util.vhdl"), vhdlVersion=VHDLVersion.VHDL93),
+		ProjectModel.SystemVerilogSourceFile(Path("src/tb.sv")),
+		ProjectModel.ConstraintFile(Path("xdc/top.xdc")),
+		ProjectModel.TextFile(Path("README.md"))
+	))
+	ipFileSet = ProjectModel.FileSet("ip", directory=Path("ip"), design=design)
+	ipFileSet.AddFile(ProjectModel.VHDLSourceFile(Path("/opt/ip/fifo.vhdl")))
+	ipFileSet.AddFile(ProjectModel.VHDLSourceFile(Path("ram.vhdl")))
+
+	files = list(fileSet.Files(ProjectModel.VHDLSourceFile))
+	topLibrary = fileSet.GetOrCreateVHDLLibrary("top_lib")
+	utilLibrary = fileSet.GetOrCreateVHDLLibrary("util_lib")
+	ipLibrary = ipFileSet.GetOrCreateVHDLLibrary("ip_lib")
+	files[0].VHDLLibrary = topLibrary
+	files[1].VHDLLibrary = utilLibrary
+	for file in ipFileSet.Files():
+		file.VHDLLibrary = ipLibrary
+
+	topLibrary._dependencyNode.EdgeToVertex(utilLibrary._dependencyNode)
+	topLibrary._dependencyNode.EdgeToVertex(ipLibrary._dependencyNode)
+
+	return design
+
+
+def CreateJobs(mode: str = "pass") -> List[AnalysisJob]:
+	"""Create analysis jobs for :func:`CreateDesign` running :data:`ANALYZER_STUB` with *mode* as last argument."""
+	analyzer = [executable, "-c", ANALYZER_STUB, "{path}"]
+	return CreateAnalysisJobs(CreateDesign(), {
+		ProjectModel.VHDLSourceFile:    [*analyzer, "--work={library}", "--std={std}", mode],
+		ProjectModel.VerilogSourceFile: [*analyzer, mode]
+	})
+
+
+def CreateTestbenchProject(directory: Path) -> ProjectModel.Project:
+	"""Write :data:`TESTBENCH_SOURCES` to *directory* and create a project with their file dependencies."""
+	for name, content in TESTBENCH_SOURCES.items():
+		(directory / name).write_text(content)
+
+	project = ProjectModel.Project("project", rootDirectory=directory)
+	design = project.DefaultDesign
+	files = {}
+	for name in TESTBENCH_SOURCES:
+		files[name] = ProjectModel.VHDLSourceFile(Path(name))
+		design.DefaultFileSet.AddFile(files[name])
+
+	design.AddFileDependency(files["counter.vhdl"], files["pkg.vhdl"])
+	design.AddFileDependency(files["timer.vhdl"], files["pkg.vhdl"])
+	design.AddFileDependency(files["tb_counter.vhdl"], files["counter.vhdl"])
+	design.AddFileDependency(files["tb_timer.vhdl"], files["timer.vhdl"])
+	return project
+
+
+def CreateGraph(edges: Iterable[Tuple[Hashable, Hashable]]) -> Tuple[Graph, Dict[Hashable, Vertex]]:
+	"""Create a graph from *edges* (pairs of vertex values) and return it with a mapping from values to vertices."""
+	graph = Graph()
+	vertices = {}
+	for source, destination in edges:
+		for name in (source, destination):
+			if name not in vertices:
+				vertices[name] = Vertex(value=name, graph=graph)
+		vertices[source].EdgeToVertex(vertices[destination])
+	return graph, vertices